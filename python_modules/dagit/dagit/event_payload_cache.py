@@ -0,0 +1,178 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from dagster import check
+from dagster.seven import json
+
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+
+def get_event_payload_cache_dir() -> Optional[str]:
+    return os.getenv("DAGIT_EVENT_PAYLOAD_CACHE_DIR")
+
+
+def get_event_payload_cache_max_bytes() -> int:
+    return int(os.getenv("DAGIT_EVENT_PAYLOAD_CACHE_MAX_BYTES", str(DEFAULT_MAX_BYTES)))
+
+
+class CachedEventChunk(NamedTuple):
+    """A rendered subscription payload for the events of a run between two cursors, inclusive."""
+
+    start: int
+    end: int
+    is_last: bool
+    path: str
+
+
+class RunEventPayloadCache:
+    """On-disk cache of the rendered GraphQL payloads of the event log subscription, for runs that
+    have finished and whose events can therefore no longer change.
+
+    Every payload holds the events of a run between two cursors, and is stored as the JSON text that
+    is sent to the client, so that it can be sent again without converting and resolving the events.
+    Payloads are grouped by the run and by a hash of the subscription query, since the selected
+    fields determine the payload. The least recently used payloads are evicted once the cache grows
+    beyond ``max_bytes``.
+    """
+
+    def __init__(self, base_dir: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self._base_dir = check.str_param(base_dir, "base_dir")
+        self._max_bytes = check.int_param(max_bytes, "max_bytes")
+        self._lock = threading.Lock()
+
+        # (run_id, query_hash) -> start cursor -> chunk
+        self._chunks: Dict[Tuple[str, str], Dict[int, CachedEventChunk]] = {}
+        # path -> size, in least recently used order
+        self._sizes: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+
+        os.makedirs(self._base_dir, exist_ok=True)
+        self._load_index()
+
+    @staticmethod
+    def query_hash(
+        query: str, variables: Optional[dict], operation_name: Optional[str], chunk_size: int
+    ) -> str:
+        return hashlib.sha1(
+            json.dumps([query, variables, operation_name, chunk_size], sort_keys=True).encode()
+        ).hexdigest()
+
+    def _load_index(self):
+        entries = []
+        for run_id in _list_dirs(self._base_dir):
+            for query_hash in _list_dirs(os.path.join(self._base_dir, run_id)):
+                query_dir = os.path.join(self._base_dir, run_id, query_hash)
+                for filename in os.listdir(query_dir):
+                    chunk = _chunk_from_filename(os.path.join(query_dir, filename))
+                    if chunk:
+                        stat = os.stat(chunk.path)
+                        entries.append((stat.st_mtime, stat.st_size, run_id, query_hash, chunk))
+
+        for _, size, run_id, query_hash, chunk in sorted(entries, key=lambda entry: entry[0]):
+            self._chunks.setdefault((run_id, query_hash), {})[chunk.start] = chunk
+            self._sizes[chunk.path] = size
+            self._total_bytes += size
+
+    def get_chunks(self, run_id: str, query_hash: str, after_cursor: int) -> Optional[List[bytes]]:
+        """Return the payloads covering every event of the run after ``after_cursor``, in order, or
+        None unless all of them are cached."""
+        with self._lock:
+            chunks_by_start = self._chunks.get((run_id, query_hash), {})
+            chunks = []
+            start = after_cursor + 1
+            while start in chunks_by_start:
+                chunk = chunks_by_start[start]
+                chunks.append(chunk)
+                if chunk.is_last:
+                    break
+                start = chunk.end + 1
+            else:
+                return None
+
+            for chunk in chunks:
+                self._sizes.move_to_end(chunk.path)
+
+        payloads = []
+        for chunk in chunks:
+            try:
+                with open(chunk.path, "rb") as f:
+                    payloads.append(f.read())
+                os.utime(chunk.path)
+            except OSError:
+                # evicted in the meantime
+                return None
+        return payloads
+
+    def put_chunk(
+        self, run_id: str, query_hash: str, start: int, end: int, is_last: bool, payload: bytes
+    ):
+        query_dir = os.path.join(self._base_dir, run_id, query_hash)
+        os.makedirs(query_dir, exist_ok=True)
+        path = os.path.join(query_dir, _chunk_filename(start, end, is_last))
+
+        # write to a temporary file first, so that readers never see a partial payload
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(payload)
+        os.replace(temp_path, path)
+
+        with self._lock:
+            if path in self._sizes:
+                self._total_bytes -= self._sizes.pop(path)
+            self._chunks.setdefault((run_id, query_hash), {})[start] = CachedEventChunk(
+                start, end, is_last, path
+            )
+            self._sizes[path] = len(payload)
+            self._total_bytes += len(payload)
+            self._evict()
+
+    def _evict(self):
+        while self._total_bytes > self._max_bytes and self._sizes:
+            path, size = self._sizes.popitem(last=False)
+            self._total_bytes -= size
+
+            chunk = _chunk_from_filename(path)
+            run_id, query_hash = _run_id_and_query_hash_from_path(path)
+            chunks_by_start = self._chunks.get((run_id, query_hash), {})
+            chunks_by_start.pop(chunk.start, None)
+            if not chunks_by_start:
+                self._chunks.pop((run_id, query_hash), None)
+
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+
+def _list_dirs(path: str) -> List[str]:
+    return [name for name in os.listdir(path) if os.path.isdir(os.path.join(path, name))]
+
+
+def _chunk_filename(start: int, end: int, is_last: bool) -> str:
+    return f"{start}-{end}{'-last' if is_last else ''}.json"
+
+
+def _chunk_from_filename(path: str) -> Optional[CachedEventChunk]:
+    filename = os.path.basename(path)
+    if not filename.endswith(".json"):
+        return None
+
+    parts = filename[: -len(".json")].split("-")
+    if len(parts) not in (2, 3) or not all(part.isdigit() for part in parts[:2]):
+        return None
+
+    return CachedEventChunk(
+        start=int(parts[0]), end=int(parts[1]), is_last=len(parts) == 3, path=path
+    )
+
+
+def _run_id_and_query_hash_from_path(path: str) -> Tuple[str, str]:
+    query_dir = os.path.dirname(path)
+    return os.path.basename(os.path.dirname(query_dir)), os.path.basename(query_dir)
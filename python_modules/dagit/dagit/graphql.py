@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from asyncio import Queue, Task, get_event_loop
 from enum import Enum
-from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple, Union
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
 from dagit.templates.playground import TEMPLATE
 from graphene import Schema
@@ -209,6 +209,7 @@ def execute_graphql_subscription(
         query: str,
         variables: Optional[Dict[str, Any]],
         operation_name: Optional[str],
+        on_payload: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
     ) -> Tuple[Optional[Task], Optional[Dict[str, Any]]]:
         request_context = self.make_request_context(websocket)
         try:
@@ -232,7 +233,7 @@ def execute_graphql_subscription(
         # in the future we should get back async gen directly, back compat for now
         disposable, async_gen = _disposable_and_async_gen_from_obs(async_result, get_event_loop())
         task = get_event_loop().create_task(
-            _handle_async_results(async_gen, operation_id, websocket)
+            _handle_async_results(async_gen, operation_id, websocket, on_payload)
         )
         task.add_done_callback(lambda _: disposable.dispose())
 
@@ -249,7 +250,12 @@ def create_asgi_app(
         )
 
 
-async def _handle_async_results(results: AsyncGenerator, operation_id: str, websocket: WebSocket):
+async def _handle_async_results(
+    results: AsyncGenerator,
+    operation_id: str,
+    websocket: WebSocket,
+    on_payload: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
+):
     try:
         async for result in results:
             payload = {"data": result.data}
@@ -257,6 +263,9 @@ async def _handle_async_results(results: AsyncGenerator, operation_id: str, webs
             if result.errors:
                 payload["errors"] = [format_graphql_error(err) for err in result.errors]
 
+            if on_payload:
+                await on_payload(payload)
+
             await _send_message(websocket, GraphQLWS.DATA, payload, operation_id)
     except Exception as error:
         if not isinstance(error, GraphQLError):
@@ -290,6 +299,21 @@ async def _send_message(
     return await websocket.send_json(data)
 
 
+async def send_serialized_data_messages(
+    websocket: WebSocket, serialized_payloads: List[bytes], operation_id: str
+) -> None:
+    """Send data messages whose payloads were already serialized to JSON, e.g. by a previous
+    execution of the same subscription."""
+    for serialized_payload in serialized_payloads:
+        await websocket.send_text(
+            '{{"type": {type_}, "id": {operation_id}, "payload": {payload}}}'.format(
+                type_=json.dumps(GraphQLWS.DATA.value),
+                operation_id=json.dumps(operation_id),
+                payload=serialized_payload.decode(),
+            )
+        )
+
+
 def _disposable_and_async_gen_from_obs(obs: Observable, loop):
     """
     Compatability layer for legacy Observable to async generator
@@ -1,15 +1,21 @@
 import gzip
 import io
 import uuid
+from asyncio import Event, Task, get_event_loop
 from os import path
-from typing import List
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
 
 import nbformat
 from dagster_graphql import __version__ as dagster_graphql_version
+from dagster_graphql.implementation.pipeline_run_storage import get_chunk_size
 from dagster_graphql.schema import create_schema
 from graphene import Schema
+from graphql import parse
+from graphql.error import GraphQLError
+from graphql.language import ast
 from nbconvert import HTMLExporter
 from starlette.datastructures import MutableHeaders
+from starlette.concurrency import run_in_threadpool
 from starlette.exceptions import HTTPException
 from starlette.middleware import Middleware
 from starlette.requests import HTTPConnection, Request
@@ -24,6 +30,7 @@
 from starlette.routing import Mount, Route, WebSocketRoute
 from starlette.staticfiles import StaticFiles
 from starlette.types import Message
+from starlette.websockets import WebSocket
 
 from dagster import __version__ as dagster_version
 from dagster import check
@@ -33,7 +40,12 @@
 from dagster.seven import json
 from dagster.utils import Counter, traced_counter
 
-from .graphql import GraphQLServer
+from .event_payload_cache import (
+    RunEventPayloadCache,
+    get_event_payload_cache_dir,
+    get_event_payload_cache_max_bytes,
+)
+from .graphql import GraphQLServer, GraphQLWS, _send_message, send_serialized_data_messages
 from .version import __version__
 
 ROOT_ADDRESS_STATIC_RESOURCES = [
@@ -52,6 +64,15 @@
 class DagitWebserver(GraphQLServer):
     def __init__(self, process_context: WorkspaceProcessContext, app_path_prefix: str = ""):
         self._process_context = process_context
+
+        # opt-in, since the cached payloads can take up a lot of disk space
+        event_payload_cache_dir = get_event_payload_cache_dir()
+        self._event_payload_cache = (
+            RunEventPayloadCache(event_payload_cache_dir, get_event_payload_cache_max_bytes())
+            if event_payload_cache_dir
+            else None
+        )
+
         super().__init__(app_path_prefix)
 
     def build_graphql_schema(self) -> Schema:
@@ -69,6 +90,104 @@ def make_request_context(self, conn: HTTPConnection) -> WorkspaceRequestContext:
     def build_middleware(self) -> List[Middleware]:
         return [Middleware(DagsterTracedCounterMiddleware)]
 
+    def execute_graphql_subscription(
+        self,
+        websocket: WebSocket,
+        operation_id: str,
+        query: str,
+        variables: Optional[Dict[str, Any]],
+        operation_name: Optional[str],
+        on_payload: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
+    ) -> Tuple[Optional[Task], Optional[Dict[str, Any]]]:
+        run_logs_subscription = (
+            get_run_logs_subscription(query, variables, operation_name)
+            if self._event_payload_cache and not on_payload
+            else None
+        )
+        if not run_logs_subscription:
+            return super().execute_graphql_subscription(
+                websocket, operation_id, query, variables, operation_name, on_payload
+            )
+
+        task = get_event_loop().create_task(
+            self._execute_run_logs_subscription(
+                websocket,
+                operation_id,
+                query,
+                variables,
+                operation_name,
+                run_logs_subscription,
+            )
+        )
+        return task, None
+
+    async def _execute_run_logs_subscription(
+        self,
+        websocket: WebSocket,
+        operation_id: str,
+        query: str,
+        variables: Optional[Dict[str, Any]],
+        operation_name: Optional[str],
+        run_logs_subscription: "RunLogsSubscription",
+    ):
+        run_id = run_logs_subscription.run_id
+        # the run and its cached payloads are read on a worker thread, so that the storage and
+        # disk reads don't hold up the event loop
+        run = await run_in_threadpool(self._process_context.instance.get_run_by_id, run_id)
+
+        # the events of finished runs can't change, so their rendered payloads can be reused
+        if not run or not run.is_finished:
+            await self._execute_subscription_task(
+                websocket, operation_id, query, variables, operation_name
+            )
+            return
+
+        query_hash = RunEventPayloadCache.query_hash(
+            query, run_logs_subscription.variables_without_cursor, operation_name, get_chunk_size()
+        )
+        serialized_payloads = await run_in_threadpool(
+            self._event_payload_cache.get_chunks,
+            run_id,
+            query_hash,
+            run_logs_subscription.after_cursor,
+        )
+        if serialized_payloads is not None:
+            await _send_cached_run_logs(websocket, serialized_payloads, operation_id)
+            return
+
+        await self._execute_subscription_task(
+            websocket,
+            operation_id,
+            query,
+            variables,
+            operation_name,
+            on_payload=RunLogsPayloadRecorder(
+                self._event_payload_cache,
+                run_id,
+                query_hash,
+                run_logs_subscription.after_cursor,
+                run_logs_subscription.response_key,
+            ),
+        )
+
+    async def _execute_subscription_task(
+        self,
+        websocket: WebSocket,
+        operation_id: str,
+        query: str,
+        variables: Optional[Dict[str, Any]],
+        operation_name: Optional[str],
+        on_payload: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
+    ):
+        task, error_payload = super().execute_graphql_subscription(
+            websocket, operation_id, query, variables, operation_name, on_payload
+        )
+        if error_payload:
+            await _send_message(websocket, GraphQLWS.ERROR, error_payload, operation_id)
+            return
+
+        await task
+
     async def dagit_info_endpoint(self, _request: Request):
         return JSONResponse(
             {
@@ -244,6 +363,135 @@ def _redirect(_):
             return routes
 
 
+class RunLogsSubscription(NamedTuple):
+    run_id: str
+    after_cursor: int
+    # the subscription variables, except for the cursor
+    variables_without_cursor: Dict[str, Any]
+    # the key of the subscription field in the payloads, which may be aliased
+    response_key: str
+
+
+def get_run_logs_subscription(
+    query: str, variables: Optional[Dict[str, Any]], operation_name: Optional[str]
+) -> Optional[RunLogsSubscription]:
+    """If the query subscribes to the logs of a single run and to nothing else, return the run and
+    the cursor it subscribes from."""
+    try:
+        document = parse(query)
+    except GraphQLError:
+        return None
+
+    operations = [
+        definition
+        for definition in document.definitions
+        if isinstance(definition, ast.OperationDefinition)
+        and (operation_name is None or getattr(definition.name, "value", None) == operation_name)
+    ]
+    if len(operations) != 1 or operations[0].operation != "subscription":
+        return None
+
+    selections = operations[0].selection_set.selections
+    if (
+        len(selections) != 1
+        or not isinstance(selections[0], ast.Field)
+        or selections[0].name.value != "pipelineRunLogs"
+    ):
+        return None
+
+    field = selections[0]
+    variables = variables or {}
+    arguments = {}
+    cursor_variable_name = None
+    for argument in field.arguments:
+        if isinstance(argument.value, ast.Variable):
+            arguments[argument.name.value] = variables.get(argument.value.name.value)
+            if argument.name.value == "after":
+                cursor_variable_name = argument.value.name.value
+        elif isinstance(argument.value, (ast.StringValue, ast.IntValue)):
+            arguments[argument.name.value] = argument.value.value
+        else:
+            return None
+
+    run_id = arguments.get("runId")
+    after_cursor = arguments.get("after")
+    if not isinstance(run_id, str):
+        return None
+    try:
+        after_cursor = int(after_cursor) if after_cursor is not None else -1
+    except ValueError:
+        return None
+
+    return RunLogsSubscription(
+        run_id=run_id,
+        after_cursor=after_cursor,
+        variables_without_cursor={
+            name: value for name, value in variables.items() if name != cursor_variable_name
+        },
+        response_key=field.alias.value if field.alias else field.name.value,
+    )
+
+
+class RunLogsPayloadRecorder:
+    """Stores the payloads sent for a subscription to the logs of a finished run in the event
+    payload cache, chunk by chunk, until the run's history has been sent in full."""
+
+    def __init__(
+        self,
+        cache: RunEventPayloadCache,
+        run_id: str,
+        query_hash: str,
+        after_cursor: int,
+        response_key: str,
+    ):
+        self._cache = cache
+        self._run_id = run_id
+        self._query_hash = query_hash
+        self._cursor = after_cursor
+        self._response_key = response_key
+        self._recording = True
+
+    async def __call__(self, payload: Dict[str, Any]):
+        if not self._recording:
+            return
+
+        run_logs = (payload.get("data") or {}).get(self._response_key) or {}
+        messages = run_logs.get("messages")
+        has_more_past_events = run_logs.get("hasMorePastEvents")
+
+        # only the payloads whose events can be counted and whose position in the history is
+        # known can be reused
+        if payload.get("errors") or messages is None or has_more_past_events is None:
+            self._recording = False
+            return
+
+        start = self._cursor + 1
+        self._cursor += len(messages)
+        # the payload is serialized and written on a worker thread, so that the disk writes don't
+        # hold up the event loop
+        await run_in_threadpool(
+            self._cache.put_chunk,
+            self._run_id,
+            self._query_hash,
+            start,
+            self._cursor,
+            not has_more_past_events,
+            json.dumps(payload).encode(),
+        )
+
+        if not has_more_past_events:
+            self._recording = False
+
+
+async def _send_cached_run_logs(
+    websocket: WebSocket, serialized_payloads: List[bytes], operation_id: str
+):
+    await send_serialized_data_messages(websocket, serialized_payloads, operation_id)
+
+    # like the subscription it replaces, stay open until the client stops it
+    await Event().wait()
+
+
 class DagsterTracedCounterMiddleware:
     """Middleware for counting traced dagster calls
     Args:
@@ -0,0 +1,55 @@
+import tempfile
+
+from dagit.event_payload_cache import RunEventPayloadCache
+
+
+def test_event_payload_cache_chunks():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = RunEventPayloadCache(temp_dir)
+        query_hash = RunEventPayloadCache.query_hash("query", {"runId": "foo"}, None, 2)
+
+        cache.put_chunk("foo", query_hash, 0, 1, False, b'{"first": 1}')
+        # the history is incomplete until the last chunk is cached
+        assert cache.get_chunks("foo", query_hash, -1) is None
+
+        cache.put_chunk("foo", query_hash, 2, 3, False, b'{"second": 1}')
+        cache.put_chunk("foo", query_hash, 4, 4, True, b'{"third": 1}')
+        assert cache.get_chunks("foo", query_hash, -1) == [
+            b'{"first": 1}',
+            b'{"second": 1}',
+            b'{"third": 1}',
+        ]
+        assert cache.get_chunks("foo", query_hash, 1) == [b'{"second": 1}', b'{"third": 1}']
+
+        # no chunk starts right after this cursor
+        assert cache.get_chunks("foo", query_hash, 0) is None
+        assert cache.get_chunks("bar", query_hash, -1) is None
+        assert cache.get_chunks("foo", "other_hash", -1) is None
+
+        # the index is rebuilt from disk
+        assert RunEventPayloadCache(temp_dir).get_chunks("foo", query_hash, -1) == [
+            b'{"first": 1}',
+            b'{"second": 1}',
+            b'{"third": 1}',
+        ]
+
+
+def test_event_payload_cache_eviction():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = RunEventPayloadCache(temp_dir, max_bytes=25)
+
+        cache.put_chunk("foo", "hash", 0, 0, True, b"0123456789")
+        cache.put_chunk("bar", "hash", 0, 0, True, b"0123456789")
+        assert cache.total_bytes == 20
+
+        # reading a run's chunks makes them the most recently used ones
+        assert cache.get_chunks("foo", "hash", -1) == [b"0123456789"]
+
+        cache.put_chunk("baz", "hash", 0, 0, True, b"0123456789")
+        assert cache.total_bytes == 20
+        assert cache.get_chunks("bar", "hash", -1) is None
+        assert cache.get_chunks("foo", "hash", -1) == [b"0123456789"]
+        assert cache.get_chunks("baz", "hash", -1) == [b"0123456789"]
+
+        # evicted payloads are removed from disk as well
+        assert RunEventPayloadCache(temp_dir, max_bytes=25).total_bytes == 20
@@ -1,4 +1,6 @@
 import gc
+import os
+import tempfile
 from contextlib import contextmanager
 from unittest import mock
 
@@ -21,6 +23,23 @@
     }
 """
 
+RUN_LOGS_SUBSCRIPTION = """
+    subscription PipelineRunLogsSubscription($runId: ID!, $after: Cursor) {
+        pipelineRunLogs(runId: $runId, after: $after) {
+            __typename
+            ... on PipelineRunLogsSubscriptionSuccess {
+                messages {
+                    __typename
+                    ... on MessageEvent {
+                        message
+                    }
+                }
+                hasMorePastEvents
+            }
+        }
+    }
+"""
+
 COMPUTE_LOG_SUBSCRIPTION = """
     subscription ComputeLogsSubscription(
         $runId: ID!
@@ -112,6 +131,46 @@ def test_event_log_subscription_chunked():
                 end_subscription(ws)
 
 
+def _get_run_logs_payloads(instance, run_id):
+    with create_asgi_client(instance) as client:
+        # pylint: disable=not-context-manager
+        with client.websocket_connect("/graphql", GraphQLWS.PROTOCOL) as ws:
+            send_subscription_message(ws, GraphQLWS.CONNECTION_INIT)
+            ws.receive_json()
+            send_subscription_message(
+                ws,
+                GraphQLWS.START,
+                {"query": RUN_LOGS_SUBSCRIPTION, "variables": {"runId": run_id}},
+            )
+
+            payloads = []
+            while not payloads or payloads[-1]["data"]["pipelineRunLogs"]["hasMorePastEvents"]:
+                message = ws.receive_json()
+                assert message["type"] == GraphQLWS.DATA
+                payloads.append(message["payload"])
+
+            end_subscription(ws)
+            return payloads
+
+
+def test_event_log_subscription_payload_cache():
+    with instance_for_test() as instance, tempfile.TemporaryDirectory() as cache_dir, environ(
+        {"DAGIT_EVENT_LOAD_CHUNK_SIZE": "2", "DAGIT_EVENT_PAYLOAD_CACHE_DIR": cache_dir}
+    ):
+        run = execute_pipeline(example_pipeline, instance=instance)
+        assert run.success
+
+        payloads = _get_run_logs_payloads(instance, run.run_id)
+        assert len(payloads) > 1
+        assert os.listdir(os.path.join(cache_dir, run.run_id))
+
+        # the cached payloads are sent as they are, without converting any event
+        with mock.patch(
+            "dagster_graphql.implementation.events.from_event_record", side_effect=Exception
+        ):
+            assert _get_run_logs_payloads(instance, run.run_id) == payloads
+
+
 @mock.patch(
     "dagster.core.storage.local_compute_log_manager.LocalComputeLogManager.is_watch_completed"
 )
@@ -1,11 +1,15 @@
 import os
+from collections import deque
 from enum import Enum
-from threading import Event, Thread
+from itertools import islice
+from threading import Event, Lock, RLock, Thread
 from time import sleep
+from typing import Callable, Deque, Dict, List, Set, Tuple
 
 import gevent
 
 from dagster import check
+from dagster.core.events.log import EventLogEntry
 
 
 class State(Enum):
@@ -21,8 +25,157 @@ def get_chunk_size() -> int:
     return int(os.getenv("DAGIT_EVENT_LOAD_CHUNK_SIZE", "10000"))
 
 
+def get_buffer_size() -> int:
+    return int(os.getenv("DAGIT_EVENT_BUFFER_SIZE", "100000"))
+
+
+class RunEventBuffer:
+    """The most recent events of a single run, shared by all of the subscriptions to its logs.
+
+    The events are loaded from storage and deserialized once, as the first subscription pages
+    through them, and then kept up to date by a single watch on the event log. Each subscription
+    reads from the buffer at its own cursor. Only the last ``max_size`` events are kept; reads of
+    older events go to the storage directly.
+
+    Cursors are the same as for ``DagsterInstance.logs_after``: the index of the last event seen,
+    with -1 meaning no event has been seen yet.
+    """
+
+    def __init__(self, instance, run_id: str, max_size: int):
+        self._instance = instance
+        self._run_id = run_id
+        self._events: Deque[EventLogEntry] = deque(maxlen=max_size)
+        # index in the run's event log of the first buffered event
+        self._start = 0
+        self._watching = False
+        self._closed = False
+        self._subscribers: List[Callable[[], None]] = []
+        self._lock = RLock()
+
+    @property
+    def _end(self) -> int:
+        return self._start + len(self._events)
+
+    def events_after(self, cursor: int, limit: int) -> List[EventLogEntry]:
+        """Return up to ``limit`` events of the run with an index greater than ``cursor``."""
+        start = cursor + 1
+        with self._lock:
+            if not self._watching and not self._closed:
+                if not self._events:
+                    self._start = start
+                if start == self._end:
+                    # the buffer has not caught up with the storage yet, load the next chunk
+                    self._load(limit)
+
+            if self._start <= start < self._end:
+                offset = start - self._start
+                return list(islice(self._events, offset, offset + limit))
+
+            if start >= self._end and (self._watching or self._closed):
+                return []
+
+        # the events were evicted from the buffer, or have not been loaded into it
+        return self._instance.logs_after(
+            self._run_id,
+            cursor,
+            limit=min(limit, self._start - start) if start < self._start else limit,
+        )
+
+    def _load(self, limit: int):
+        events = self._instance.logs_after(self._run_id, self._end - 1, limit=limit)
+        self._append(events)
+
+        if len(events) < limit:
+            self._watching = True
+            self._instance.watch_event_logs(self._run_id, self._end - 1, self._handle_new_event)
+
+    def _append(self, events: List[EventLogEntry]):
+        num_evicted = max(0, len(self._events) + len(events) - self._events.maxlen)
+        self._events.extend(events)
+        self._start += num_evicted
+
+    def add_subscriber(self, callback: Callable[[], None]):
+        """Call ``callback`` whenever new events are added to the buffer. Makes sure that the buffer
+        watches the event log for new events."""
+        with self._lock:
+            self._subscribers.append(callback)
+            if not self._watching and not self._closed:
+                self._watching = True
+                self._instance.watch_event_logs(self._run_id, self._end - 1, self._handle_new_event)
+
+    def remove_subscriber(self, callback: Callable[[], None]):
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def _handle_new_event(self, new_event: EventLogEntry):
+        with self._lock:
+            self._append([new_event])
+            subscribers = list(self._subscribers)
+
+        for callback in subscribers:
+            callback()
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            self._subscribers = []
+            self._events.clear()
+            was_watching = self._watching
+            self._watching = False
+
+        # outside of the lock, since the watcher may be waiting on it to deliver an event
+        if was_watching:
+            self._instance.end_watch_event_logs(self._run_id, self._handle_new_event)
+
+
+class RunEventHub:
+    """Process-wide registry of the event buffers of the runs whose logs are being subscribed to.
+
+    Buffers are reference counted, and dropped once the last subscription to their run goes away.
+    """
+
+    def __init__(self):
+        self._buffers: Dict[Tuple[int, str], RunEventBuffer] = {}
+        self._ref_counts: Dict[Tuple[int, str], int] = {}
+        self._lock = Lock()
+
+    def acquire(self, instance, run_id: str) -> RunEventBuffer:
+        # the buffer holds on to the instance, so its id can not be reused while the buffer exists
+        key = (id(instance), run_id)
+        with self._lock:
+            if key not in self._buffers:
+                self._buffers[key] = RunEventBuffer(instance, run_id, get_buffer_size())
+                self._ref_counts[key] = 0
+            self._ref_counts[key] += 1
+            return self._buffers[key]
+
+    def release(self, instance, run_id: str):
+        key = (id(instance), run_id)
+        with self._lock:
+            self._ref_counts[key] -= 1
+            if self._ref_counts[key]:
+                return
+            del self._ref_counts[key]
+            run_buffer = self._buffers.pop(key)
+
+        run_buffer.close()
+
+    @property
+    def run_ids(self) -> Set[str]:
+        with self._lock:
+            return {run_id for _, run_id in self._buffers}
+
+
+_run_event_hub = RunEventHub()
+
+
+def get_run_event_hub() -> RunEventHub:
+    return _run_event_hub
+
+
 class PipelineRunObservableSubscribe:
-    def __init__(self, instance, run_id, after_cursor=None):
+    def __init__(self, instance, run_id, after_cursor=None, event_hub=None):
         self.instance = instance
         self.run_id = run_id
         self.observer = None
@@ -30,12 +183,18 @@ def __init__(self, instance, run_id, after_cursor=None):
         self.stopping = None
         self.stopped = None
         self.after_cursor = after_cursor if after_cursor is not None else -1
+        self.event_hub = check.opt_inst_param(
+            event_hub, "event_hub", RunEventHub, default=get_run_event_hub()
+        )
+        self.run_events = None
+        self.delivery_lock = Lock()
 
     def __call__(self, observer):
         self.observer = observer
         check.invariant(self.state is State.NULL, f"unexpected state {self.state}")
+        self.run_events = self.event_hub.acquire(self.instance, self.run_id)
         chunk_size = get_chunk_size()
-        events = self.instance.logs_after(self.run_id, self.after_cursor, limit=chunk_size)
+        events = self.run_events.events_after(self.after_cursor, chunk_size)
         done_loading = len(events) < chunk_size
 
         if events:
@@ -70,13 +229,15 @@ def load_events(self):
 
     def watch_events(self):
         self.state = State.WATCHING
-        self.instance.watch_event_logs(self.run_id, self.after_cursor, self.handle_new_event)
+        self.run_events.add_subscriber(self.handle_new_events)
+        # deliver anything that was stored since the last chunk was loaded
+        self.handle_new_events()
 
     def background_event_loading(self, sleep_fn):
         chunk_size = get_chunk_size()
 
         while not self.stopping.is_set():
-            events = self.instance.logs_after(self.run_id, self.after_cursor, limit=chunk_size)
+            events = self.run_events.events_after(self.after_cursor, chunk_size)
             if self.observer is None:
                 break
 
@@ -103,10 +264,21 @@ def dispose(self):
         self.observer = None
 
         if self.state is State.WATCHING:
-            self.instance.end_watch_event_logs(self.run_id, self.handle_new_event)
+            self.run_events.remove_subscriber(self.handle_new_events)
         elif self.state is State.LOADING:
             self.stopping.set()
 
-    def handle_new_event(self, new_event):
-        if self.observer:
-            self.observer.on_next(([new_event], False))
+        if self.run_events:
+            self.event_hub.release(self.instance, self.run_id)
+
+    def handle_new_events(self):
+        # each subscription reads the shared buffer from its own cursor, so that it neither skips
+        # nor repeats events no matter when it was notified
+        with self.delivery_lock:
+            chunk_size = get_chunk_size()
+            while self.observer:
+                events = self.run_events.events_after(self.after_cursor, chunk_size)
+                if not events:
+                    break
+                self.observer.on_next((events, False))
+                self.after_cursor = len(events) + int(self.after_cursor)
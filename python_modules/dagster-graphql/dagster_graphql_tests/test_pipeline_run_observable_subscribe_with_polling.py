@@ -2,10 +2,14 @@
 import time
 from collections import namedtuple
 from contextlib import contextmanager
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
-from dagster_graphql.implementation.pipeline_run_storage import PipelineRunObservableSubscribe
+from dagster_graphql.implementation.pipeline_run_storage import (
+    PipelineRunObservableSubscribe,
+    RunEventHub,
+    State,
+)
 from dagster_tests.core_tests.storage_tests.test_polling_event_watcher import (
     SqlitePollingEventLogStorage,
 )
@@ -13,7 +17,7 @@
 from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster.core.events.log import EventLogEntry
 from dagster.core.storage.event_log import SqlEventLogStorage
-from dagster.core.test_utils import instance_for_test
+from dagster.core.test_utils import environ, instance_for_test
 
 
 @contextmanager
@@ -114,3 +118,57 @@ def test_using_instance(before_watch_config: NumEventsAndCursor, num_events_afte
                 total_num_events + 1,
             )
         )
+
+
+def _received_messages(observable_subscribe):
+    return [
+        int(event_record.user_message)
+        for call in observable_subscribe.observer.on_next.call_args_list
+        for event_record in call[0][0][0]
+    ]
+
+
+@pytest.mark.parametrize("buffer_size", ["3", "100"])
+def test_shared_run_event_buffer(buffer_size: str):
+    with create_test_instance_and_storage() as (instance, storage), environ(
+        {"DAGIT_EVENT_LOAD_CHUNK_SIZE": "2", "DAGIT_EVENT_BUFFER_SIZE": buffer_size}
+    ):
+        event_hub = RunEventHub()
+        event_storer = EventStorer(storage)
+        event_storer.store_n_events(5)
+
+        with patch.object(instance, "logs_after", wraps=instance.logs_after) as logs_after:
+            subscribes = [
+                PipelineRunObservableSubscribe(
+                    instance, RUN_ID, after_cursor=after_cursor, event_hub=event_hub
+                )
+                for after_cursor in [-1, -1, 2]
+            ]
+            for observable_subscribe in subscribes:
+                observable_subscribe(Mock())
+                while observable_subscribe.state is not State.WATCHING:
+                    time.sleep(0.01)
+
+            if buffer_size == "100":
+                # the events are loaded once, and then read from the buffer by every subscription
+                assert logs_after.call_count == 3
+
+        assert event_hub.run_ids == {RUN_ID}
+
+        event_storer.store_n_events(3)
+        attempts = 20
+        while (
+            any(_received_messages(subscribe)[-1:] != [8] for subscribe in subscribes)
+            and attempts > 0
+        ):
+            time.sleep(0.1)
+            attempts -= 1
+
+        for observable_subscribe, first_message in zip(subscribes, [1, 1, 4]):
+            assert _received_messages(observable_subscribe) == list(range(first_message, 9))
+
+        for observable_subscribe in subscribes:
+            observable_subscribe.dispose()
+
+        # runs without any subscriptions are dropped from the hub
+        assert event_hub.run_ids == set()
@@ -1,265 +1,547 @@
 import sys
 import typing
+from importlib import import_module
 
 from pep562 import pep562
 
-from dagster.builtins import Any, Bool, Float, Int, Nothing, String
-from dagster.config import Enum, EnumValue, Field, Map, Permissive, Selector, Shape
-from dagster.config.config_schema import ConfigSchema
-from dagster.config.config_type import Array, Noneable, ScalarUnion
-from dagster.core.asset_defs import (
-    AssetGroup,
-    AssetIn,
-    AssetsDefinition,
-    SourceAsset,
-    asset,
-    build_assets_job,
-    multi_asset,
-)
-from dagster.core.definitions import (
-    AssetKey,
-    AssetMaterialization,
-    AssetObservation,
-    AssetSensorDefinition,
-    CompositeSolidDefinition,
-    ConfigMapping,
-    DagsterAssetMetadataValue,
-    DagsterPipelineRunMetadataValue,
-    DailyPartitionsDefinition,
-    DefaultScheduleStatus,
-    DefaultSensorStatus,
-    DependencyDefinition,
-    DynamicOut,
-    DynamicOutput,
-    DynamicOutputDefinition,
-    DynamicPartitionsDefinition,
-    ExecutorDefinition,
-    ExecutorRequirement,
-    ExpectationResult,
-    Failure,
-    FloatMetadataValue,
-    GraphDefinition,
-    GraphIn,
-    GraphOut,
-    HookDefinition,
-    HourlyPartitionsDefinition,
-    In,
-    InputDefinition,
-    InputMapping,
-    IntMetadataValue,
-    JobDefinition,
-    JsonMetadataValue,
-    LoggerDefinition,
-    MarkdownMetadataValue,
-    Materialization,
-    MetadataEntry,
-    MetadataValue,
-    ModeDefinition,
-    MonthlyPartitionsDefinition,
-    MultiDependencyDefinition,
-    NodeInvocation,
-    OpDefinition,
-    Out,
-    Output,
-    OutputDefinition,
-    OutputMapping,
-    Partition,
-    PartitionScheduleDefinition,
-    PartitionSetDefinition,
-    PartitionedConfig,
-    PartitionsDefinition,
-    PathMetadataValue,
-    PipelineDefinition,
-    PipelineFailureSensorContext,
-    PresetDefinition,
-    PythonArtifactMetadataValue,
-    RepositoryData,
-    RepositoryDefinition,
-    ResourceDefinition,
-    RetryRequested,
-    RunFailureSensorContext,
-    RunRequest,
-    RunStatusSensorContext,
-    RunStatusSensorDefinition,
-    ScheduleDefinition,
-    ScheduleEvaluationContext,
-    ScheduleExecutionContext,
-    SensorDefinition,
-    SensorEvaluationContext,
-    SensorExecutionContext,
-    SkipReason,
-    SolidDefinition,
-    SolidInvocation,
-    StaticPartitionsDefinition,
-    TableColumn,
-    TableColumnConstraints,
-    TableConstraints,
-    TableMetadataValue,
-    TableRecord,
-    TableSchema,
-    TableSchemaMetadataValue,
-    TextMetadataValue,
-    TypeCheck,
-    UrlMetadataValue,
-    WeeklyPartitionsDefinition,
-    asset_sensor,
-    build_init_logger_context,
-    build_reconstructable_job,
-    build_schedule_from_partitioned_job,
-    composite_solid,
-    config_mapping,
-    daily_partitioned_config,
-    daily_schedule,
-    default_executors,
-    dynamic_partitioned_config,
-    executor,
-    failure_hook,
-    graph,
-    hourly_partitioned_config,
-    hourly_schedule,
-    in_process_executor,
-    job,
-    lambda_solid,
-    logger,
-    make_values_resource,
-    monthly_partitioned_config,
-    monthly_schedule,
-    multiple_process_executor_requirements,
-    multiprocess_executor,
-    op,
-    pipeline,
-    pipeline_failure_sensor,
-    reconstructable,
-    repository,
-    resource,
-    run_failure_sensor,
-    run_status_sensor,
-    schedule,
-    schedule_from_partitions,
-    sensor,
-    solid,
-    static_partitioned_config,
-    success_hook,
-    weekly_partitioned_config,
-    weekly_schedule,
-)
-from dagster.core.definitions.configurable import configured
-from dagster.core.definitions.policy import Backoff, Jitter, RetryPolicy
-from dagster.core.definitions.run_status_sensor_definition import build_run_status_sensor_context
-from dagster.core.definitions.schedule_definition import build_schedule_context
-from dagster.core.definitions.sensor_definition import build_sensor_context
-from dagster.core.definitions.utils import (
-    config_from_files,
-    config_from_pkg_resources,
-    config_from_yaml_strings,
-)
-from dagster.core.definitions.version_strategy import SourceHashVersionStrategy, VersionStrategy
-from dagster.core.errors import (
-    DagsterConfigMappingFunctionError,
-    DagsterError,
-    DagsterEventLogInvalidForRun,
-    DagsterExecutionStepExecutionError,
-    DagsterExecutionStepNotFoundError,
-    DagsterInvalidConfigDefinitionError,
-    DagsterInvalidConfigError,
-    DagsterInvalidDefinitionError,
-    DagsterInvariantViolationError,
-    DagsterResourceFunctionError,
-    DagsterRunNotFoundError,
-    DagsterStepOutputNotFoundError,
-    DagsterSubprocessError,
-    DagsterTypeCheckDidNotPass,
-    DagsterTypeCheckError,
-    DagsterUnknownPartitionError,
-    DagsterUnknownResourceError,
-    DagsterUnmetExecutorRequirementsError,
-    DagsterUserCodeExecutionError,
-)
-from dagster.core.events import DagsterEvent, DagsterEventType
-from dagster.core.execution.api import (
-    execute_pipeline,
-    execute_pipeline_iterator,
-    reexecute_pipeline,
-    reexecute_pipeline_iterator,
-)
-from dagster.core.execution.build_resources import build_resources
-from dagster.core.execution.context.compute import OpExecutionContext, SolidExecutionContext
-from dagster.core.execution.context.hook import HookContext, build_hook_context
-from dagster.core.execution.context.init import InitResourceContext, build_init_resource_context
-from dagster.core.execution.context.input import InputContext, build_input_context
-from dagster.core.execution.context.invocation import build_op_context, build_solid_context
-from dagster.core.execution.context.logger import InitLoggerContext
-from dagster.core.execution.context.output import OutputContext, build_output_context
-from dagster.core.execution.context.system import TypeCheckContext
-from dagster.core.execution.execute_in_process_result import ExecuteInProcessResult
-from dagster.core.execution.results import (
-    CompositeSolidExecutionResult,
-    PipelineExecutionResult,
-    SolidExecutionResult,
-)
-from dagster.core.execution.validate_run_config import validate_run_config
-from dagster.core.executor.base import Executor
-from dagster.core.executor.init import InitExecutorContext
-from dagster.core.instance import DagsterInstance
-from dagster.core.launcher import DefaultRunLauncher
-from dagster.core.log_manager import DagsterLogManager
-from dagster.core.storage.event_log import (
-    EventLogEntry,
-    EventLogRecord,
-    EventRecordsFilter,
-    RunShardedEventsCursor,
-)
-from dagster.core.storage.file_manager import FileHandle, LocalFileHandle, local_file_manager
-from dagster.core.storage.fs_asset_io_manager import fs_asset_io_manager
-from dagster.core.storage.fs_io_manager import custom_path_fs_io_manager, fs_io_manager
-from dagster.core.storage.io_manager import IOManager, IOManagerDefinition, io_manager
-from dagster.core.storage.mem_io_manager import mem_io_manager
-from dagster.core.storage.memoizable_io_manager import MemoizableIOManager
-from dagster.core.storage.pipeline_run import (
-    DagsterRun,
-    DagsterRunStatus,
-    PipelineRun,
-    PipelineRunStatus,
-)
-from dagster.core.storage.root_input_manager import (
-    RootInputManager,
-    RootInputManagerDefinition,
-    root_input_manager,
-)
-from dagster.core.storage.tags import MEMOIZED_RUN_TAG
-from dagster.core.types.config_schema import (
-    DagsterTypeLoader,
-    DagsterTypeMaterializer,
-    dagster_type_loader,
-    dagster_type_materializer,
-)
-from dagster.core.types.dagster_type import DagsterType, List, Optional, PythonObjectDagsterType
-from dagster.core.types.decorator import (
-    make_python_type_usable_as_dagster_type,
-    usable_as_dagster_type,
-)
-from dagster.core.types.python_dict import Dict
-from dagster.core.types.python_set import Set
-from dagster.core.types.python_tuple import Tuple
-from dagster.utils import file_relative_path
-from dagster.utils.alert import make_email_on_run_failure_sensor
-from dagster.utils.backcompat import ExperimentalWarning, rename_warning
-from dagster.utils.log import get_dagster_logger
-from dagster.utils.partitions import (
-    create_offset_partition_selector,
-    date_partition_range,
-    identity_partition_selector,
-)
-from dagster.utils.test import (
-    check_dagster_type,
-    execute_solid,
-    execute_solid_within_pipeline,
-    execute_solids_within_pipeline,
-)
-
 from .version import __version__
 
-from dagster.config.source import BoolSource, StringSource, IntSource  # isort:skip
+# The public API is loaded lazily: each name below is imported from its module the first time it is
+# accessed, e.g. by `from dagster import job`. This keeps processes that only need a few symbols,
+# like `dagster api` subprocesses, from importing every backend (sqlalchemy, alembic, grpc...) on
+# startup.
+#
+# The imports in this block are the same as in _LAZY_IMPORTS, for the benefit of type checkers and
+# other static analysis.
+
+if typing.TYPE_CHECKING:
+    # pylint: disable=unused-import
+    from dagster.builtins import Any, Bool, Float, Int, Nothing, String
+    from dagster.config import Enum, EnumValue, Field, Map, Permissive, Selector, Shape
+    from dagster.config.config_schema import ConfigSchema
+    from dagster.config.config_type import Array, Noneable, ScalarUnion
+    from dagster.core.asset_defs import (
+        AssetGroup,
+        AssetIn,
+        AssetsDefinition,
+        SourceAsset,
+        asset,
+        build_assets_job,
+        multi_asset,
+    )
+    from dagster.core.definitions import (
+        AssetKey,
+        AssetMaterialization,
+        AssetObservation,
+        AssetSensorDefinition,
+        CompositeSolidDefinition,
+        ConfigMapping,
+        DagsterAssetMetadataValue,
+        DagsterPipelineRunMetadataValue,
+        DailyPartitionsDefinition,
+        DefaultScheduleStatus,
+        DefaultSensorStatus,
+        DependencyDefinition,
+        DynamicOut,
+        DynamicOutput,
+        DynamicOutputDefinition,
+        DynamicPartitionsDefinition,
+        ExecutorDefinition,
+        ExecutorRequirement,
+        ExpectationResult,
+        Failure,
+        FloatMetadataValue,
+        GraphDefinition,
+        GraphIn,
+        GraphOut,
+        HookDefinition,
+        HourlyPartitionsDefinition,
+        In,
+        InputDefinition,
+        InputMapping,
+        IntMetadataValue,
+        JobDefinition,
+        JsonMetadataValue,
+        LoggerDefinition,
+        MarkdownMetadataValue,
+        Materialization,
+        MetadataEntry,
+        MetadataValue,
+        ModeDefinition,
+        MonthlyPartitionsDefinition,
+        MultiDependencyDefinition,
+        NodeInvocation,
+        OpDefinition,
+        Out,
+        Output,
+        OutputDefinition,
+        OutputMapping,
+        Partition,
+        PartitionScheduleDefinition,
+        PartitionSetDefinition,
+        PartitionedConfig,
+        PartitionsDefinition,
+        PathMetadataValue,
+        PipelineDefinition,
+        PipelineFailureSensorContext,
+        PresetDefinition,
+        PythonArtifactMetadataValue,
+        RepositoryData,
+        RepositoryDefinition,
+        ResourceDefinition,
+        RetryRequested,
+        RunFailureSensorContext,
+        RunRequest,
+        RunStatusSensorContext,
+        RunStatusSensorDefinition,
+        ScheduleDefinition,
+        ScheduleEvaluationContext,
+        ScheduleExecutionContext,
+        SensorDefinition,
+        SensorEvaluationContext,
+        SensorExecutionContext,
+        SkipReason,
+        SolidDefinition,
+        SolidInvocation,
+        StaticPartitionsDefinition,
+        TableColumn,
+        TableColumnConstraints,
+        TableConstraints,
+        TableMetadataValue,
+        TableRecord,
+        TableSchema,
+        TableSchemaMetadataValue,
+        TextMetadataValue,
+        TypeCheck,
+        UrlMetadataValue,
+        WeeklyPartitionsDefinition,
+        asset_sensor,
+        async_in_process_executor,
+        build_init_logger_context,
+        build_reconstructable_job,
+        build_schedule_from_partitioned_job,
+        composite_solid,
+        config_mapping,
+        daily_partitioned_config,
+        daily_schedule,
+        default_executors,
+        dynamic_partitioned_config,
+        executor,
+        failure_hook,
+        graph,
+        hourly_partitioned_config,
+        hourly_schedule,
+        in_process_executor,
+        job,
+        lambda_solid,
+        logger,
+        make_values_resource,
+        monthly_partitioned_config,
+        monthly_schedule,
+        multiple_process_executor_requirements,
+        multiprocess_executor,
+        op,
+        pipeline,
+        pipeline_failure_sensor,
+        reconstructable,
+        repository,
+        resource,
+        run_failure_sensor,
+        run_status_sensor,
+        schedule,
+        schedule_from_partitions,
+        sensor,
+        solid,
+        static_partitioned_config,
+        success_hook,
+        threaded_executor,
+        weekly_partitioned_config,
+        weekly_schedule,
+    )
+    from dagster.core.definitions.configurable import configured
+    from dagster.core.definitions.policy import Backoff, Jitter, RetryPolicy
+    from dagster.core.definitions.run_status_sensor_definition import build_run_status_sensor_context
+    from dagster.core.definitions.schedule_definition import build_schedule_context
+    from dagster.core.definitions.sensor_definition import build_sensor_context
+    from dagster.core.definitions.utils import (
+        config_from_files,
+        config_from_pkg_resources,
+        config_from_yaml_strings,
+    )
+    from dagster.core.definitions.version_strategy import SourceHashVersionStrategy, VersionStrategy
+    from dagster.core.errors import (
+        DagsterConfigMappingFunctionError,
+        DagsterError,
+        DagsterEventLogInvalidForRun,
+        DagsterExecutionStepExecutionError,
+        DagsterExecutionStepNotFoundError,
+        DagsterInvalidConfigDefinitionError,
+        DagsterInvalidConfigError,
+        DagsterInvalidDefinitionError,
+        DagsterInvariantViolationError,
+        DagsterResourceFunctionError,
+        DagsterRunNotFoundError,
+        DagsterStepOutputNotFoundError,
+        DagsterSubprocessError,
+        DagsterTypeCheckDidNotPass,
+        DagsterTypeCheckError,
+        DagsterUnknownPartitionError,
+        DagsterUnknownResourceError,
+        DagsterUnmetExecutorRequirementsError,
+        DagsterUserCodeExecutionError,
+    )
+    from dagster.core.events import DagsterEvent, DagsterEventType
+    from dagster.core.execution.api import (
+        execute_pipeline,
+        execute_pipeline_iterator,
+        reexecute_pipeline,
+        reexecute_pipeline_iterator,
+    )
+    from dagster.core.execution.build_resources import build_resources
+    from dagster.core.execution.context.compute import OpExecutionContext, SolidExecutionContext
+    from dagster.core.execution.context.hook import HookContext, build_hook_context
+    from dagster.core.execution.context.init import InitResourceContext, build_init_resource_context
+    from dagster.core.execution.context.input import InputContext, build_input_context
+    from dagster.core.execution.context.invocation import build_op_context, build_solid_context
+    from dagster.core.execution.context.logger import InitLoggerContext
+    from dagster.core.execution.context.output import OutputContext, build_output_context
+    from dagster.core.execution.context.system import TypeCheckContext
+    from dagster.core.execution.execute_in_process_result import ExecuteInProcessResult
+    from dagster.core.execution.results import (
+        CompositeSolidExecutionResult,
+        PipelineExecutionResult,
+        SolidExecutionResult,
+    )
+    from dagster.core.execution.validate_run_config import validate_run_config
+    from dagster.core.executor.base import Executor
+    from dagster.core.executor.init import InitExecutorContext
+    from dagster.core.instance import DagsterInstance
+    from dagster.core.launcher import DefaultRunLauncher
+    from dagster.core.log_manager import DagsterLogManager
+    from dagster.core.storage.event_log import (
+        EventLogEntry,
+        EventLogRecord,
+        EventRecordsFilter,
+        RunShardedEventsCursor,
+    )
+    from dagster.core.storage.file_manager import FileHandle, LocalFileHandle, local_file_manager
+    from dagster.core.storage.fs_asset_io_manager import fs_asset_io_manager
+    from dagster.core.storage.fs_io_manager import custom_path_fs_io_manager, fs_io_manager
+    from dagster.core.storage.io_manager import IOManager, IOManagerDefinition, io_manager
+    from dagster.core.storage.mem_io_manager import mem_io_manager
+    from dagster.core.storage.memoizable_io_manager import MemoizableIOManager
+    from dagster.core.storage.pipeline_run import (
+        DagsterRun,
+        DagsterRunStatus,
+        PipelineRun,
+        PipelineRunStatus,
+    )
+    from dagster.core.storage.root_input_manager import (
+        RootInputManager,
+        RootInputManagerDefinition,
+        root_input_manager,
+    )
+    from dagster.core.storage.tags import MEMOIZED_RUN_TAG
+    from dagster.core.types.config_schema import (
+        DagsterTypeLoader,
+        DagsterTypeMaterializer,
+        dagster_type_loader,
+        dagster_type_materializer,
+    )
+    from dagster.core.types.dagster_type import DagsterType, List, Optional, PythonObjectDagsterType
+    from dagster.core.types.decorator import (
+        make_python_type_usable_as_dagster_type,
+        usable_as_dagster_type,
+    )
+    from dagster.core.types.python_dict import Dict
+    from dagster.core.types.python_set import Set
+    from dagster.core.types.python_tuple import Tuple
+    from dagster.utils import file_relative_path
+    from dagster.utils.alert import make_email_on_run_failure_sensor
+    from dagster.utils.backcompat import ExperimentalWarning
+    from dagster.utils.log import get_dagster_logger
+    from dagster.utils.partitions import (
+        create_offset_partition_selector,
+        date_partition_range,
+        identity_partition_selector,
+    )
+    from dagster.utils.test import (
+        check_dagster_type,
+        execute_solid,
+        execute_solid_within_pipeline,
+        execute_solids_within_pipeline,
+    )
+    from dagster.config.source import BoolSource, IntSource, StringSource
+
+    # pylint: enable=unused-import
+
+_LAZY_IMPORTS: typing.Dict[str, typing.List[str]] = {
+    "dagster.builtins": ["Any", "Bool", "Float", "Int", "Nothing", "String"],
+    "dagster.config": ["Enum", "EnumValue", "Field", "Map", "Permissive", "Selector", "Shape"],
+    "dagster.config.config_schema": ["ConfigSchema"],
+    "dagster.config.config_type": ["Array", "Noneable", "ScalarUnion"],
+    "dagster.core.asset_defs": [
+        "AssetGroup",
+        "AssetIn",
+        "AssetsDefinition",
+        "SourceAsset",
+        "asset",
+        "build_assets_job",
+        "multi_asset",
+    ],
+    "dagster.core.definitions": [
+        "AssetKey",
+        "AssetMaterialization",
+        "AssetObservation",
+        "AssetSensorDefinition",
+        "CompositeSolidDefinition",
+        "ConfigMapping",
+        "DagsterAssetMetadataValue",
+        "DagsterPipelineRunMetadataValue",
+        "DailyPartitionsDefinition",
+        "DefaultScheduleStatus",
+        "DefaultSensorStatus",
+        "DependencyDefinition",
+        "DynamicOut",
+        "DynamicOutput",
+        "DynamicOutputDefinition",
+        "DynamicPartitionsDefinition",
+        "ExecutorDefinition",
+        "ExecutorRequirement",
+        "ExpectationResult",
+        "Failure",
+        "FloatMetadataValue",
+        "GraphDefinition",
+        "GraphIn",
+        "GraphOut",
+        "HookDefinition",
+        "HourlyPartitionsDefinition",
+        "In",
+        "InputDefinition",
+        "InputMapping",
+        "IntMetadataValue",
+        "JobDefinition",
+        "JsonMetadataValue",
+        "LoggerDefinition",
+        "MarkdownMetadataValue",
+        "Materialization",
+        "MetadataEntry",
+        "MetadataValue",
+        "ModeDefinition",
+        "MonthlyPartitionsDefinition",
+        "MultiDependencyDefinition",
+        "NodeInvocation",
+        "OpDefinition",
+        "Out",
+        "Output",
+        "OutputDefinition",
+        "OutputMapping",
+        "Partition",
+        "PartitionScheduleDefinition",
+        "PartitionSetDefinition",
+        "PartitionedConfig",
+        "PartitionsDefinition",
+        "PathMetadataValue",
+        "PipelineDefinition",
+        "PipelineFailureSensorContext",
+        "PresetDefinition",
+        "PythonArtifactMetadataValue",
+        "RepositoryData",
+        "RepositoryDefinition",
+        "ResourceDefinition",
+        "RetryRequested",
+        "RunFailureSensorContext",
+        "RunRequest",
+        "RunStatusSensorContext",
+        "RunStatusSensorDefinition",
+        "ScheduleDefinition",
+        "ScheduleEvaluationContext",
+        "ScheduleExecutionContext",
+        "SensorDefinition",
+        "SensorEvaluationContext",
+        "SensorExecutionContext",
+        "SkipReason",
+        "SolidDefinition",
+        "SolidInvocation",
+        "StaticPartitionsDefinition",
+        "TableColumn",
+        "TableColumnConstraints",
+        "TableConstraints",
+        "TableMetadataValue",
+        "TableRecord",
+        "TableSchema",
+        "TableSchemaMetadataValue",
+        "TextMetadataValue",
+        "TypeCheck",
+        "UrlMetadataValue",
+        "WeeklyPartitionsDefinition",
+        "asset_sensor",
+        "async_in_process_executor",
+        "build_init_logger_context",
+        "build_reconstructable_job",
+        "build_schedule_from_partitioned_job",
+        "composite_solid",
+        "config_mapping",
+        "daily_partitioned_config",
+        "daily_schedule",
+        "default_executors",
+        "dynamic_partitioned_config",
+        "executor",
+        "failure_hook",
+        "graph",
+        "hourly_partitioned_config",
+        "hourly_schedule",
+        "in_process_executor",
+        "job",
+        "lambda_solid",
+        "logger",
+        "make_values_resource",
+        "monthly_partitioned_config",
+        "monthly_schedule",
+        "multiple_process_executor_requirements",
+        "multiprocess_executor",
+        "op",
+        "pipeline",
+        "pipeline_failure_sensor",
+        "reconstructable",
+        "repository",
+        "resource",
+        "run_failure_sensor",
+        "run_status_sensor",
+        "schedule",
+        "schedule_from_partitions",
+        "sensor",
+        "solid",
+        "static_partitioned_config",
+        "success_hook",
+        "threaded_executor",
+        "weekly_partitioned_config",
+        "weekly_schedule",
+    ],
+    "dagster.core.definitions.configurable": ["configured"],
+    "dagster.core.definitions.policy": ["Backoff", "Jitter", "RetryPolicy"],
+    "dagster.core.definitions.run_status_sensor_definition": ["build_run_status_sensor_context"],
+    "dagster.core.definitions.schedule_definition": ["build_schedule_context"],
+    "dagster.core.definitions.sensor_definition": ["build_sensor_context"],
+    "dagster.core.definitions.utils": [
+        "config_from_files",
+        "config_from_pkg_resources",
+        "config_from_yaml_strings",
+    ],
+    "dagster.core.definitions.version_strategy": ["SourceHashVersionStrategy", "VersionStrategy"],
+    "dagster.core.errors": [
+        "DagsterConfigMappingFunctionError",
+        "DagsterError",
+        "DagsterEventLogInvalidForRun",
+        "DagsterExecutionStepExecutionError",
+        "DagsterExecutionStepNotFoundError",
+        "DagsterInvalidConfigDefinitionError",
+        "DagsterInvalidConfigError",
+        "DagsterInvalidDefinitionError",
+        "DagsterInvariantViolationError",
+        "DagsterResourceFunctionError",
+        "DagsterRunNotFoundError",
+        "DagsterStepOutputNotFoundError",
+        "DagsterSubprocessError",
+        "DagsterTypeCheckDidNotPass",
+        "DagsterTypeCheckError",
+        "DagsterUnknownPartitionError",
+        "DagsterUnknownResourceError",
+        "DagsterUnmetExecutorRequirementsError",
+        "DagsterUserCodeExecutionError",
+    ],
+    "dagster.core.events": ["DagsterEvent", "DagsterEventType"],
+    "dagster.core.execution.api": [
+        "execute_pipeline",
+        "execute_pipeline_iterator",
+        "reexecute_pipeline",
+        "reexecute_pipeline_iterator",
+    ],
+    "dagster.core.execution.build_resources": ["build_resources"],
+    "dagster.core.execution.context.compute": ["OpExecutionContext", "SolidExecutionContext"],
+    "dagster.core.execution.context.hook": ["HookContext", "build_hook_context"],
+    "dagster.core.execution.context.init": ["InitResourceContext", "build_init_resource_context"],
+    "dagster.core.execution.context.input": ["InputContext", "build_input_context"],
+    "dagster.core.execution.context.invocation": ["build_op_context", "build_solid_context"],
+    "dagster.core.execution.context.logger": ["InitLoggerContext"],
+    "dagster.core.execution.context.output": ["OutputContext", "build_output_context"],
+    "dagster.core.execution.context.system": ["TypeCheckContext"],
+    "dagster.core.execution.execute_in_process_result": ["ExecuteInProcessResult"],
+    "dagster.core.execution.results": [
+        "CompositeSolidExecutionResult",
+        "PipelineExecutionResult",
+        "SolidExecutionResult",
+    ],
+    "dagster.core.execution.validate_run_config": ["validate_run_config"],
+    "dagster.core.executor.base": ["Executor"],
+    "dagster.core.executor.init": ["InitExecutorContext"],
+    "dagster.core.instance": ["DagsterInstance"],
+    "dagster.core.launcher": ["DefaultRunLauncher"],
+    "dagster.core.log_manager": ["DagsterLogManager"],
+    "dagster.core.storage.event_log": [
+        "EventLogEntry",
+        "EventLogRecord",
+        "EventRecordsFilter",
+        "RunShardedEventsCursor",
+    ],
+    "dagster.core.storage.file_manager": ["FileHandle", "LocalFileHandle", "local_file_manager"],
+    "dagster.core.storage.fs_asset_io_manager": ["fs_asset_io_manager"],
+    "dagster.core.storage.fs_io_manager": ["custom_path_fs_io_manager", "fs_io_manager"],
+    "dagster.core.storage.io_manager": ["IOManager", "IOManagerDefinition", "io_manager"],
+    "dagster.core.storage.mem_io_manager": ["mem_io_manager"],
+    "dagster.core.storage.memoizable_io_manager": ["MemoizableIOManager"],
+    "dagster.core.storage.pipeline_run": [
+        "DagsterRun",
+        "DagsterRunStatus",
+        "PipelineRun",
+        "PipelineRunStatus",
+    ],
+    "dagster.core.storage.root_input_manager": [
+        "RootInputManager",
+        "RootInputManagerDefinition",
+        "root_input_manager",
+    ],
+    "dagster.core.storage.tags": ["MEMOIZED_RUN_TAG"],
+    "dagster.core.types.config_schema": [
+        "DagsterTypeLoader",
+        "DagsterTypeMaterializer",
+        "dagster_type_loader",
+        "dagster_type_materializer",
+    ],
+    "dagster.core.types.dagster_type": [
+        "DagsterType",
+        "List",
+        "Optional",
+        "PythonObjectDagsterType",
+    ],
+    "dagster.core.types.decorator": [
+        "make_python_type_usable_as_dagster_type",
+        "usable_as_dagster_type",
+    ],
+    "dagster.core.types.python_dict": ["Dict"],
+    "dagster.core.types.python_set": ["Set"],
+    "dagster.core.types.python_tuple": ["Tuple"],
+    "dagster.utils": ["file_relative_path"],
+    "dagster.utils.alert": ["make_email_on_run_failure_sensor"],
+    "dagster.utils.backcompat": ["ExperimentalWarning"],
+    "dagster.utils.log": ["get_dagster_logger"],
+    "dagster.utils.partitions": [
+        "create_offset_partition_selector",
+        "date_partition_range",
+        "identity_partition_selector",
+    ],
+    "dagster.utils.test": [
+        "check_dagster_type",
+        "execute_solid",
+        "execute_solid_within_pipeline",
+        "execute_solids_within_pipeline",
+    ],
+    "dagster.config.source": ["BoolSource", "StringSource", "IntSource"],
+}
+
+_LAZY_IMPORT_MODULES: typing.Dict[str, str] = {
+    name: module_name for module_name, names in _LAZY_IMPORTS.items() for name in names
+}
 
 # ########################
 # ##### DEPRECATED ALIASES
@@ -293,40 +575,35 @@
     # pylint:enable=reimported
 
 _DEPRECATED = {
-    "EventMetadataEntry": (MetadataEntry, "0.15.0"),
-    "EventMetadata": (MetadataValue, "0.15.0"),
-    "TextMetadataEntryData": (TextMetadataValue, "0.15.0"),
-    "UrlMetadataEntryData": (UrlMetadataValue, "0.15.0"),
-    "PathMetadataEntryData": (PathMetadataValue, "0.15.0"),
-    "JsonMetadataEntryData": (JsonMetadataValue, "0.15.0"),
-    "MarkdownMetadataEntryData": (MarkdownMetadataValue, "0.15.0"),
-    "PythonArtifactMetadataEntryData": (
-        PythonArtifactMetadataValue,
-        "0.15.0",
-    ),
-    "FloatMetadataEntryData": (FloatMetadataValue, "0.15.0"),
-    "IntMetadataEntryData": (IntMetadataValue, "0.15.0"),
-    "DagsterPipelineRunMetadataEntryData": (
-        DagsterPipelineRunMetadataValue,
-        "0.15.0",
-    ),
-    "DagsterAssetMetadataEntryData": (
-        DagsterAssetMetadataValue,
-        "0.15.0",
-    ),
-    "TableMetadataEntryData": (TableMetadataValue, "0.15.0"),
-    "TableSchemaMetadataEntryData": (
-        TableSchemaMetadataValue,
-        "0.15.0",
-    ),
+    "EventMetadataEntry": ("MetadataEntry", "0.15.0"),
+    "EventMetadata": ("MetadataValue", "0.15.0"),
+    "TextMetadataEntryData": ("TextMetadataValue", "0.15.0"),
+    "UrlMetadataEntryData": ("UrlMetadataValue", "0.15.0"),
+    "PathMetadataEntryData": ("PathMetadataValue", "0.15.0"),
+    "JsonMetadataEntryData": ("JsonMetadataValue", "0.15.0"),
+    "MarkdownMetadataEntryData": ("MarkdownMetadataValue", "0.15.0"),
+    "PythonArtifactMetadataEntryData": ("PythonArtifactMetadataValue", "0.15.0"),
+    "FloatMetadataEntryData": ("FloatMetadataValue", "0.15.0"),
+    "IntMetadataEntryData": ("IntMetadataValue", "0.15.0"),
+    "DagsterPipelineRunMetadataEntryData": ("DagsterPipelineRunMetadataValue", "0.15.0"),
+    "DagsterAssetMetadataEntryData": ("DagsterAssetMetadataValue", "0.15.0"),
+    "TableMetadataEntryData": ("TableMetadataValue", "0.15.0"),
+    "TableSchemaMetadataEntryData": ("TableSchemaMetadataValue", "0.15.0"),
 }
 
 
 def __getattr__(name):
     if name in _DEPRECATED:
-        value, breaking_version = _DEPRECATED[name]
+        from dagster.utils.backcompat import rename_warning
+
+        new_name, breaking_version = _DEPRECATED[name]
         stacklevel = 3 if sys.version_info >= (3, 7) else 4
-        rename_warning(value.__name__, name, breaking_version, stacklevel=stacklevel)
+        rename_warning(new_name, name, breaking_version, stacklevel=stacklevel)
+        return __getattr__(new_name)
+    elif name in _LAZY_IMPORT_MODULES:
+        value = getattr(import_module(_LAZY_IMPORT_MODULES[name]), name)
+        # later accesses find the value on the module without going through __getattr__
+        globals()[name] = value
         return value
     else:
         raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
@@ -476,6 +753,8 @@ def __dir__():
     "validate_run_config",
     "execute_solid_within_pipeline",
     "in_process_executor",
+    "async_in_process_executor",
+    "threaded_executor",
     "multiprocess_executor",
     "multiple_process_executor_requirements",
     "build_reconstructable_job",
@@ -622,3 +901,9 @@ def __dir__():
     "MemoizableIOManager",
     "SourceHashVersionStrategy",
 ]
+
+# The definition modules import each other circularly, and only resolve when they are loaded in
+# this order. They are loaded up front so that any dagster submodule can be imported first.
+import_module("dagster.builtins")
+import_module("dagster.config")
+import_module("dagster.core.asset_defs")
@@ -12,11 +12,24 @@
 def sync_get_streaming_external_repositories_data_grpc(
     api_client: "DagsterGrpcClient", repository_location: "RepositoryLocation"
 ) -> Mapping[str, ExternalRepositoryData]:
+    return {
+        repository_name: deserialize_as(serialized_repository_data, ExternalRepositoryData)
+        for repository_name, serialized_repository_data in (
+            sync_get_streaming_serialized_external_repositories_data_grpc(
+                api_client, repository_location
+            ).items()
+        )
+    }
+
+
+def sync_get_streaming_serialized_external_repositories_data_grpc(
+    api_client: "DagsterGrpcClient", repository_location: "RepositoryLocation"
+) -> Mapping[str, str]:
     from dagster.core.host_representation import ExternalRepositoryOrigin, RepositoryLocation
 
     check.inst_param(repository_location, "repository_location", RepositoryLocation)
 
-    repo_datas = {}
+    serialized_repo_datas = {}
     for repository_name in repository_location.repository_names:  # type: ignore
         external_repository_chunks = list(
             api_client.streaming_external_repository(
@@ -27,15 +40,7 @@ def sync_get_streaming_external_repositories_data_grpc(
             )
         )
 
-        external_repository_data = deserialize_as(
-            "".join(
-                [
-                    chunk["serialized_external_repository_chunk"]
-                    for chunk in external_repository_chunks
-                ]
-            ),
-            ExternalRepositoryData,
+        serialized_repo_datas[repository_name] = "".join(
+            [chunk["serialized_external_repository_chunk"] for chunk in external_repository_chunks]
         )
-
-        repo_datas[repository_name] = external_repository_data
-    return repo_datas
+    return serialized_repo_datas
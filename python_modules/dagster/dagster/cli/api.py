@@ -14,6 +14,7 @@
 from dagster.core.errors import DagsterExecutionInterruptedError
 from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster.core.execution.api import create_execution_plan, execute_plan_iterator
+from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.execution.run_cancellation_thread import start_run_cancellation_thread
 from dagster.core.instance import DagsterInstance
 from dagster.core.origin import DEFAULT_DAGSTER_ENTRY_POINT, get_python_environment_entry_point
@@ -352,13 +353,19 @@ def _execute_step_command_body(
             args.pipeline_origin
         ).subset_for_execution_from_existing_pipeline(pipeline_run.solids_to_execute)
 
-        execution_plan = create_execution_plan(
-            recon_pipeline,
-            run_config=pipeline_run.run_config,
-            step_keys_to_execute=args.step_keys_to_execute,
-            mode=pipeline_run.mode,
-            known_state=args.known_state,
-        )
+        if args.execution_plan_snapshot:
+            execution_plan = ExecutionPlan.rebuild_from_snapshot(
+                pipeline_run.pipeline_name, args.execution_plan_snapshot
+            )
+        else:
+            execution_plan = create_execution_plan(
+                recon_pipeline,
+                run_config=pipeline_run.run_config,
+                step_keys_to_execute=args.step_keys_to_execute,
+                mode=pipeline_run.mode,
+                known_state=args.known_state,
+                scoped=True,
+            )
 
         yield from execute_plan_iterator(
             execution_plan,
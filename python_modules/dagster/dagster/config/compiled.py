@@ -0,0 +1,466 @@
+"""
+Compiled config validation and post-processing.
+
+The interpretive traversals in validate.py and post_process.py rebuild a schema snapshot and a
+traversal context for every node of every config value they visit, which dominates the cost of
+processing the run config of large jobs. Here a schema is instead compiled once into a tree of
+closures, one per config type key, that only check and shape values.
+
+The compiled functions only cover the success path: as soon as a compiled validator finds an
+invalid value, or a post-processor raises, the caller falls back to the interpretive traversal
+so that the resulting errors are exactly the ones it has always produced.
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from dagster import check
+from dagster.utils import ensure_single_item, frozendict, frozenlist
+
+from .config_type import ConfigScalarKind, ConfigType, ConfigTypeKind
+from .iterate_types import config_schema_snapshot_from_config_type
+from .snap import ConfigSchemaSnapshot, ConfigTypeSnap
+
+CompiledFn = Callable[[Any], Any]
+
+# at most this many compiled validators are kept for snapshots that are not backed by a
+# ConfigType, e.g. the config schema snapshots of external pipelines
+MAX_CACHED_SNAPSHOT_VALIDATORS = 64
+
+
+class CompiledConfigInvalid(Exception):
+    """Raised by a compiled validator when a config value does not validate. Carries no error
+    information: callers rerun the interpretive validation to build the evaluation errors."""
+
+
+def _invalid():
+    raise CompiledConfigInvalid()
+
+
+class _ValidatorCompiler:
+    def __init__(self, config_schema_snapshot: ConfigSchemaSnapshot):
+        self._snapshot = config_schema_snapshot
+        self._compiled: Dict[str, CompiledFn] = {}
+
+    def compile(self, config_type_key: str) -> CompiledFn:
+        if config_type_key not in self._compiled:
+            self._compiled[config_type_key] = self._compile_snap(
+                self._snapshot.get_config_snap(config_type_key)
+            )
+        return self._compiled[config_type_key]
+
+    def _compile_snap(self, snap: ConfigTypeSnap) -> CompiledFn:
+        kind = snap.kind
+        if kind == ConfigTypeKind.NONEABLE:
+            return self._compile_noneable(snap)
+        elif kind == ConfigTypeKind.ANY:
+            return lambda value: value
+        elif kind == ConfigTypeKind.SCALAR:
+            return _compile_scalar(snap)
+        elif kind == ConfigTypeKind.SELECTOR:
+            return self._compile_selector(snap)
+        elif ConfigTypeKind.is_shape(kind):
+            return self._compile_shape(snap)
+        elif kind == ConfigTypeKind.MAP:
+            return self._compile_map(snap)
+        elif kind == ConfigTypeKind.ARRAY:
+            return self._compile_array(snap)
+        elif kind == ConfigTypeKind.ENUM:
+            return _compile_enum(snap)
+        elif kind == ConfigTypeKind.SCALAR_UNION:
+            return self._compile_scalar_union(snap)
+        else:
+            check.failed("Unsupported ConfigTypeKind {}".format(kind))
+
+    def _compile_noneable(self, snap: ConfigTypeSnap) -> CompiledFn:
+        inner = self.compile(snap.inner_type_key)
+
+        def _validate(value):
+            return value if value is None else inner(value)
+
+        return _validate
+
+    def _compile_selector(self, snap: ConfigTypeSnap) -> CompiledFn:
+        field_snaps = check.not_none(snap.fields)
+        children = {
+            field_snap.name: (
+                self.compile(field_snap.type_key),
+                ConfigTypeKind.has_fields(self._snapshot.get_config_snap(field_snap.type_key).kind),
+            )
+            for field_snap in field_snaps
+        }
+        empty_is_valid = len(field_snaps) == 1 and not field_snaps[0].is_required
+
+        def _validate(value):
+            if value is None:
+                _invalid()
+            if value == {}:
+                if not empty_is_valid:
+                    _invalid()
+                return {}
+            if not isinstance(value, dict) or len(value) > 1:
+                _invalid()
+
+            field_name, field_value = ensure_single_item(value)
+            child = children.get(field_name)
+            if child is None:
+                _invalid()
+
+            validate_child, child_has_fields = child
+            return frozendict(
+                {
+                    field_name: validate_child(
+                        {} if field_value is None and child_has_fields else field_value
+                    )
+                }
+            )
+
+        return _validate
+
+    def _compile_shape(self, snap: ConfigTypeSnap) -> CompiledFn:
+        field_aliases = snap.field_aliases or {}
+        field_snaps = check.not_none(snap.fields)
+        fields: List[Tuple[str, Optional[str], CompiledFn]] = [
+            (field_snap.name, field_aliases.get(field_snap.name), self.compile(field_snap.type_key))
+            for field_snap in field_snaps
+        ]
+        required_fields = [
+            (name, alias)
+            for name, alias, _ in fields
+            if check.not_none(snap.get_field(name)).is_required
+        ]
+        defined_field_names = {name for name, _, _ in fields}.union(field_aliases.values())
+        check_for_extra_incoming_fields = snap.kind == ConfigTypeKind.STRICT_SHAPE
+
+        def _validate(value):
+            if value is None or not isinstance(value, dict):
+                _invalid()
+
+            if check_for_extra_incoming_fields:
+                for incoming_field_name in value:
+                    if incoming_field_name not in defined_field_names:
+                        _invalid()
+
+            for name, alias in required_fields:
+                if name not in value and (alias is None or alias not in value):
+                    _invalid()
+
+            for name, alias, validate_field in fields:
+                if name in value:
+                    if alias is not None and alias in value:
+                        _invalid()
+                    validate_field(value[name])
+                elif alias is not None and alias in value:
+                    validate_field(value[alias])
+
+            # like the interpretive validation, the shape keeps the incoming field values
+            return frozendict(value)
+
+        return _validate
+
+    def _compile_map(self, snap: ConfigTypeSnap) -> CompiledFn:
+        validate_key = self.compile(snap.key_type_key)
+        validate_item = self.compile(snap.inner_type_key)
+
+        def _validate(value):
+            if value is None or not isinstance(value, dict):
+                _invalid()
+            for key, item in value.items():
+                validate_key(key)
+                validate_item(item)
+            return frozendict(value)
+
+        return _validate
+
+    def _compile_array(self, snap: ConfigTypeSnap) -> CompiledFn:
+        validate_item = self.compile(snap.inner_type_key)
+
+        def _validate(value):
+            if value is None or not isinstance(value, list):
+                _invalid()
+            return [validate_item(item) for item in value]
+
+        return _validate
+
+    def _compile_scalar_union(self, snap: ConfigTypeSnap) -> CompiledFn:
+        validate_scalar = self.compile(snap.scalar_type_key)
+        validate_non_scalar = self.compile(snap.non_scalar_type_key)
+
+        def _validate(value):
+            if value is None:
+                _invalid()
+            if isinstance(value, (dict, list)):
+                return validate_non_scalar(value)
+            return validate_scalar(value)
+
+        return _validate
+
+
+def _compile_scalar(snap: ConfigTypeSnap) -> CompiledFn:
+    scalar_kind = snap.scalar_kind
+
+    if scalar_kind == ConfigScalarKind.INT:
+        is_valid = lambda value: not isinstance(value, bool) and isinstance(value, int)
+    elif scalar_kind == ConfigScalarKind.STRING:
+        is_valid = lambda value: isinstance(value, str)
+    elif scalar_kind == ConfigScalarKind.BOOL:
+        is_valid = lambda value: isinstance(value, bool)
+    elif scalar_kind == ConfigScalarKind.FLOAT:
+        is_valid = lambda value: isinstance(value, (int, float))
+    elif scalar_kind is None:
+        # historical snapshot without scalar kind. do no validation
+        is_valid = lambda value: True
+    else:
+        # leave it to the interpretive validation to fail on the unsupported scalar
+        is_valid = lambda value: False
+
+    def _validate(value):
+        if value is None or not is_valid(value):
+            _invalid()
+        return value
+
+    return _validate
+
+
+def _compile_enum(snap: ConfigTypeSnap) -> CompiledFn:
+    enum_values = [enum_value.value for enum_value in check.not_none(snap.enum_values)]
+
+    def _validate(value):
+        if not isinstance(value, str) or value not in enum_values:
+            _invalid()
+        return value
+
+    return _validate
+
+
+def compile_validator(
+    config_schema_snapshot: ConfigSchemaSnapshot, config_type_key: str
+) -> CompiledFn:
+    """Compile the validation of values of the given config type into a function that returns the
+    validated value, or raises CompiledConfigInvalid."""
+    check.inst_param(config_schema_snapshot, "config_schema_snapshot", ConfigSchemaSnapshot)
+    check.str_param(config_type_key, "config_type_key")
+    return _ValidatorCompiler(config_schema_snapshot).compile(config_type_key)
+
+
+class _PostProcessorCompiler:
+    def __init__(self):
+        self._compiled: Dict[str, CompiledFn] = {}
+
+    def compile(self, config_type: ConfigType) -> CompiledFn:
+        if config_type.key not in self._compiled:
+            resolve = self._compile_resolve_defaults(config_type)
+            if type(config_type).post_process is ConfigType.post_process:
+                self._compiled[config_type.key] = resolve
+            else:
+                post_process = config_type.post_process
+                self._compiled[config_type.key] = lambda value: post_process(resolve(value))
+        return self._compiled[config_type.key]
+
+    def _compile_resolve_defaults(self, config_type: ConfigType) -> CompiledFn:
+        kind = config_type.kind
+        if kind in (ConfigTypeKind.SCALAR, ConfigTypeKind.ENUM, ConfigTypeKind.ANY):
+            return lambda value: value
+        elif kind == ConfigTypeKind.SELECTOR:
+            return self._compile_selector(config_type)
+        elif ConfigTypeKind.is_shape(kind):
+            return self._compile_shape(config_type)
+        elif kind == ConfigTypeKind.ARRAY:
+            return self._compile_array(config_type)
+        elif kind == ConfigTypeKind.MAP:
+            return self._compile_map(config_type)
+        elif kind == ConfigTypeKind.NONEABLE:
+            inner = self.compile(config_type.inner_type)  # type: ignore
+            return lambda value: None if value is None else inner(value)
+        elif kind == ConfigTypeKind.SCALAR_UNION:
+            return self._compile_scalar_union(config_type)
+        else:
+            check.failed(f"Unsupported type {config_type.key}")
+
+    def _compile_selector(self, config_type: ConfigType) -> CompiledFn:
+        fields = config_type.fields  # type: ignore
+        children = {
+            field_name: (
+                self.compile(field_def.config_type),
+                ConfigTypeKind.has_fields(field_def.config_type.kind),
+            )
+            for field_name, field_def in fields.items()
+        }
+
+        def _process(value):
+            if value:
+                check.invariant(len(value) == 1)
+                field_name, field_value = ensure_single_item(value)
+            else:
+                field_name, field_def = ensure_single_item(fields)
+                field_value = field_def.default_value if field_def.default_provided else None
+
+            process_child, child_has_fields = children[field_name]
+            return frozendict(
+                {
+                    field_name: process_child(
+                        {} if field_value is None and child_has_fields else field_value
+                    )
+                }
+            )
+
+        return _process
+
+    def _compile_shape(self, config_type: ConfigType) -> CompiledFn:
+        field_aliases = getattr(config_type, "field_aliases", None) or {}
+        fields = [
+            (name, field_aliases.get(name), field_def, self.compile(field_def.config_type))
+            for name, field_def in config_type.fields.items()  # type: ignore
+        ]
+        defined_field_names = {name for name, _, _, _ in fields}
+        is_permissive = config_type.kind == ConfigTypeKind.PERMISSIVE_SHAPE
+
+        def _process(value):
+            value = check.opt_dict_param(value, "config_value", key_type=str)
+
+            processed = {}
+            for name, alias, field_def, process_field in fields:
+                if name in value:
+                    processed[name] = process_field(value[name])
+                elif alias is not None and alias in value:
+                    processed[name] = process_field(value[alias])
+                elif field_def.default_provided:
+                    processed[name] = process_field(field_def.default_value)
+                elif field_def.is_required:
+                    check.failed("Missing required composite member not caught in validation")
+
+            # For permissive composite fields, we skip applying defaults because these fields
+            # are unknown to us
+            if is_permissive:
+                for incoming_field_name, incoming_value in value.items():
+                    if incoming_field_name not in defined_field_names:
+                        processed[incoming_field_name] = incoming_value
+
+            return frozendict(processed)
+
+        return _process
+
+    def _compile_array(self, config_type: ConfigType) -> CompiledFn:
+        inner_type = config_type.inner_type  # type: ignore
+        process_item = self.compile(inner_type)
+        items_nullable = inner_type.kind == ConfigTypeKind.NONEABLE
+
+        def _process(value):
+            if not value:
+                return []
+            if not items_nullable and any(item is None for item in value):
+                check.failed("Null array member not caught in validation")
+            return frozenlist([process_item(item) for item in value])
+
+        return _process
+
+    def _compile_map(self, config_type: ConfigType) -> CompiledFn:
+        process_item = self.compile(config_type.inner_type)  # type: ignore
+        items_nullable = config_type.inner_type.kind == ConfigTypeKind.NONEABLE  # type: ignore
+
+        def _process(value):
+            if not value:
+                return {}
+            if any(key is None for key in value.keys()):
+                check.failed("Null map key not caught in validation")
+            if not items_nullable and any(item is None for item in value.values()):
+                check.failed("Null map member not caught in validation")
+            return frozendict({key: process_item(item) for key, item in value.items()})
+
+        return _process
+
+    def _compile_scalar_union(self, config_type: ConfigType) -> CompiledFn:
+        process_scalar = self.compile(config_type.scalar_type)  # type: ignore
+        process_non_scalar = self.compile(config_type.non_scalar_type)  # type: ignore
+
+        def _process(value):
+            if isinstance(value, (dict, list)):
+                return process_non_scalar(value)
+            return process_scalar(value)
+
+        return _process
+
+
+def compile_post_processor(config_type: ConfigType) -> CompiledFn:
+    """Compile default resolution and post-processing of validated values of the given config
+    type into a function that returns the processed value. Errors raised by ``post_process``,
+    including PostProcessingError, propagate to the caller."""
+    check.inst_param(config_type, "config_type", ConfigType)
+    return _PostProcessorCompiler().compile(config_type)
+
+
+class CompiledConfigType:
+    """The compiled validator and post-processor of a ConfigType, along with the schema snapshot
+    they were compiled from. Each is compiled on first use."""
+
+    def __init__(self, config_type: ConfigType):
+        self._config_type = check.inst_param(config_type, "config_type", ConfigType)
+        self._lock = threading.Lock()
+        self._config_schema_snapshot: Optional[ConfigSchemaSnapshot] = None
+        self._validator: Optional[CompiledFn] = None
+        self._post_processor: Optional[CompiledFn] = None
+
+    @property
+    def config_schema_snapshot(self) -> ConfigSchemaSnapshot:
+        if self._config_schema_snapshot is None:
+            with self._lock:
+                if self._config_schema_snapshot is None:
+                    self._config_schema_snapshot = config_schema_snapshot_from_config_type(
+                        self._config_type
+                    )
+        return self._config_schema_snapshot
+
+    @property
+    def validator(self) -> CompiledFn:
+        if self._validator is None:
+            self._validator = compile_validator(
+                self.config_schema_snapshot, self._config_type.key
+            )
+        return self._validator
+
+    @property
+    def post_processor(self) -> CompiledFn:
+        if self._post_processor is None:
+            self._post_processor = compile_post_processor(self._config_type)
+        return self._post_processor
+
+
+def get_compiled_config_type(config_type: ConfigType) -> CompiledConfigType:
+    """The compiled form of a config type is cached on the type itself, so that e.g. the run
+    config schema type of a job is compiled once for the lifetime of the job definition."""
+    compiled = getattr(config_type, "_compiled_config_type", None)
+    if compiled is None:
+        compiled = CompiledConfigType(config_type)
+        config_type._compiled_config_type = compiled  # pylint: disable=protected-access
+    return compiled
+
+
+_snapshot_validators_lock = threading.Lock()
+_snapshot_validators: "OrderedDict[Tuple[int, str], Tuple[ConfigSchemaSnapshot, CompiledFn]]" = (
+    OrderedDict()
+)
+
+
+def get_compiled_validator_for_snap(
+    config_schema_snapshot: ConfigSchemaSnapshot, config_type_key: str
+) -> CompiledFn:
+    """Snapshots are immutable tuples that cannot be weakly referenced, so validators compiled
+    from them are kept in a small LRU cache keyed by the identity of the snapshot. Callers that
+    validate against the same snapshot object repeatedly, like the config schema snapshot of an
+    external pipeline, only compile it once."""
+    cache_key = (id(config_schema_snapshot), config_type_key)
+    with _snapshot_validators_lock:
+        # the snapshot is held by the cache, so its id cannot be reused while the entry exists
+        cached = _snapshot_validators.get(cache_key)
+        if cached is not None:
+            _snapshot_validators.move_to_end(cache_key)
+            return cached[1]
+
+    validator = compile_validator(config_schema_snapshot, config_type_key)
+
+    with _snapshot_validators_lock:
+        _snapshot_validators[cache_key] = (config_schema_snapshot, validator)
+        while len(_snapshot_validators) > MAX_CACHED_SNAPSHOT_VALIDATORS:
+            _snapshot_validators.popitem(last=False)
+
+    return validator
@@ -73,6 +73,11 @@ def __init__(
             if type_params
             else None
         )
+        # set by dagster.config.compiled and dagster.config.snap on first use. memoized types like
+        # Shape are re-initialized in place, which also drops whatever was built from their old
+        # state
+        self._compiled_config_type: typing.Any = None
+        self._config_type_snap: typing.Any = None
 
     @property
     def description(self) -> Optional[str]:
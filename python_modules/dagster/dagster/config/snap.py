@@ -1,7 +1,7 @@
 from typing import Any, Dict, List, NamedTuple, Optional, Set, cast
 
 from dagster import check
-from dagster.serdes import DefaultNamedTupleSerializer, whitelist_for_serdes
+from dagster.serdes import TrustedNamedTupleSerializer, whitelist_for_serdes
 
 from .config_type import ConfigScalarKind, ConfigType, ConfigTypeKind
 from .field import Field
@@ -22,7 +22,7 @@ def get_recursive_type_keys(
     return result_keys
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class ConfigSchemaSnapshot(
     NamedTuple("_ConfigSchemaSnapshot", [("all_config_snaps_by_key", Dict[str, "ConfigTypeSnap"])])
 ):
@@ -50,11 +50,16 @@ def has_config_snap(self, key: str) -> bool:
         return key in self.all_config_snaps_by_key
 
 
-class ConfigTypeSnapSerializer(DefaultNamedTupleSerializer):
+class ConfigTypeSnapSerializer(TrustedNamedTupleSerializer):
     @classmethod
     def skip_when_empty(cls) -> Set[str]:
         return {"field_aliases"}  # Maintain stable snapshot ID for back-compat purposes
 
+    @classmethod
+    def value_from_trusted_unpacked(cls, unpacked_dict, klass):
+        unpacked_dict.setdefault("field_aliases", {})
+        return super().value_from_trusted_unpacked(unpacked_dict, klass)
+
 
 @whitelist_for_serdes(serializer=ConfigTypeSnapSerializer)
 class ConfigTypeSnap(
@@ -194,7 +199,7 @@ def has_enum_value(self, value: object) -> bool:
         return False
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class ConfigEnumValueSnap(
     NamedTuple("_ConfigEnumValueSnap", [("value", str), ("description", Optional[str])])
 ):
@@ -206,7 +211,7 @@ def __new__(cls, value: str, description: Optional[str]):
         )
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class ConfigFieldSnap(
     NamedTuple(
         "_ConfigFieldSnap",
@@ -254,6 +259,16 @@ def snap_from_field(name, field):
 # type-ignores here are temporary until config type system overhauled
 def snap_from_config_type(config_type: ConfigType) -> ConfigTypeSnap:
     check.inst_param(config_type, "config_type", ConfigType)
+    # the snap is kept on the type, so that the snapshots of every pipeline that shares a config
+    # type share its snap, along with anything cached on it
+    config_type_snap = getattr(config_type, "_config_type_snap", None)
+    if config_type_snap is None:
+        config_type_snap = _build_snap_from_config_type(config_type)
+        config_type._config_type_snap = config_type_snap  # pylint: disable=protected-access
+    return config_type_snap
+
+
+def _build_snap_from_config_type(config_type: ConfigType) -> ConfigTypeSnap:
     return ConfigTypeSnap(
         key=config_type.key,
         given_name=config_type.given_name,
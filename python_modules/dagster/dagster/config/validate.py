@@ -3,9 +3,15 @@
 from dagster import check
 from dagster.utils import ensure_single_item, frozendict
 
+from .compiled import (
+    CompiledConfigInvalid,
+    get_compiled_config_type,
+    get_compiled_validator_for_snap,
+)
 from .config_type import ConfigScalarKind, ConfigType, ConfigTypeKind
 from .errors import (
     EvaluationError,
+    PostProcessingError,
     create_array_error,
     create_dict_type_mismatch_error,
     create_enum_type_mismatch_error,
@@ -25,7 +31,6 @@
 )
 from .evaluate_value_result import EvaluateValueResult
 from .field import resolve_to_config_type
-from .iterate_types import config_schema_snapshot_from_config_type
 from .post_process import post_process_config
 from .snap import ConfigFieldSnap, ConfigSchemaSnapshot, ConfigTypeSnap
 from .stack import EvaluationStack
@@ -59,13 +64,13 @@ def validate_config(config_schema: object, config_value: object) -> EvaluateValu
     config_type = resolve_to_config_type(config_schema)
     config_type = check.inst(cast(ConfigType, config_type), ConfigType)
 
-    config_schema_snapshot = config_schema_snapshot_from_config_type(config_type)
-
-    return validate_config_from_snap(
-        config_schema_snapshot=config_schema_snapshot,
-        config_type_key=config_type.key,
-        config_value=config_value,
-    )
+    compiled = get_compiled_config_type(config_type)
+    try:
+        return EvaluateValueResult.for_value(compiled.validator(config_value))
+    except CompiledConfigInvalid:
+        return _validate_config_from_snap(
+            compiled.config_schema_snapshot, config_type.key, config_value
+        )
 
 
 def validate_config_from_snap(
@@ -73,6 +78,18 @@ def validate_config_from_snap(
 ) -> EvaluateValueResult[T]:
     check.inst_param(config_schema_snapshot, "config_schema_snapshot", ConfigSchemaSnapshot)
     check.str_param(config_type_key, "config_type_key")
+    validator = get_compiled_validator_for_snap(config_schema_snapshot, config_type_key)
+    try:
+        return EvaluateValueResult.for_value(validator(config_value))
+    except CompiledConfigInvalid:
+        return _validate_config_from_snap(config_schema_snapshot, config_type_key, config_value)
+
+
+def _validate_config_from_snap(
+    config_schema_snapshot: ConfigSchemaSnapshot, config_type_key: str, config_value: T
+) -> EvaluateValueResult[T]:
+    # the compiled validators only cover valid config, so the errors for invalid config are
+    # always those of the interpretive validation
     return _validate_config(
         ValidationContext(
             config_schema_snapshot=config_schema_snapshot,
@@ -428,4 +445,10 @@ def process_config(config_type: object, config_dict: Dict) -> EvaluateValueResul
     if not validate_evr.success:
         return validate_evr
 
-    return post_process_config(config_type, validate_evr.value)
+    try:
+        return EvaluateValueResult.for_value(
+            get_compiled_config_type(config_type).post_processor(validate_evr.value)
+        )
+    except PostProcessingError:
+        # let the interpretive traversal build the error, with the path to the failing value
+        return post_process_config(config_type, validate_evr.value)
@@ -46,11 +46,13 @@
 from .executor_definition import (
     ExecutorDefinition,
     ExecutorRequirement,
+    async_in_process_executor,
     default_executors,
     executor,
     in_process_executor,
     multiple_process_executor_requirements,
     multiprocess_executor,
+    threaded_executor,
 )
 from .graph_definition import GraphDefinition
 from .hook_definition import HookDefinition
@@ -19,7 +19,7 @@
 from dagster.core.definitions.policy import RetryPolicy
 from dagster.core.errors import DagsterInvalidDefinitionError
 from dagster.serdes.serdes import (
-    DefaultNamedTupleSerializer,
+    TrustedNamedTupleSerializer,
     WhitelistMap,
     register_serdes_tuple_fallbacks,
     whitelist_for_serdes,
@@ -241,7 +241,7 @@ def retry_policy(self) -> Optional[RetryPolicy]:
         return self._retry_policy
 
 
-class NodeHandleSerializer(DefaultNamedTupleSerializer):
+class NodeHandleSerializer(TrustedNamedTupleSerializer):
     @classmethod
     def value_to_storage_dict(
         cls,
@@ -253,6 +253,117 @@ def execute_in_process_executor(_):
     )
 
 
+THREADED_CONFIG = {
+    "max_concurrent": Field(
+        Int,
+        is_required=False,
+        default_value=0,
+        description="The maximum number of steps to run at the same time. Defaults to the "
+        "number of CPUs.",
+    ),
+    "retries": get_retries_config(),
+}
+
+
+@executor(
+    name="threaded",
+    config_schema=THREADED_CONFIG,
+)
+def threaded_executor(init_context):
+    """The threaded executor executes steps concurrently on a pool of threads within a single
+    process.
+
+    Steps that are ready to run are started as soon as their upstream steps have finished, up to
+    ``max_concurrent`` at a time. Steps share the run's initialized resources and pass outputs to
+    each other without serializing them, so in-memory IO managers like :py:func:`mem_io_manager`
+    can be used. This makes it a cheap way to run in parallel ops whose work releases the GIL, e.g.
+    ops calling into NumPy, Arrow or database drivers. Ops that hold the GIL will not run any
+    faster than with the :py:func:`in_process_executor`, and resources must be safe to use from
+    multiple threads.
+
+    To select it, include a fragment such as the following in your config:
+
+    .. code-block:: yaml
+
+        execution:
+          threaded:
+            config:
+              max_concurrent: 4
+
+    The ``max_concurrent`` arg is optional and tells the execution engine how many threads may run
+    steps concurrently. By default, or if you set ``max_concurrent`` to be 0, this is the return
+    value of :py:func:`python:multiprocessing.cpu_count`.
+
+    Since steps run at the same time, the stdout and stderr of all steps are captured together.
+    Python logs are captured by the step that logged them. Python logs from threads started by an
+    op are only captured while no other step is running, unless the thread runs in a copy of the
+    op's context, e.g. ``threading.Thread(target=contextvars.copy_context().run, args=(fn,))``.
+
+    Execution priority can be configured using the ``dagster/priority`` tag via op metadata,
+    where the higher the number the higher the priority. 0 is the default and both positive
+    and negative numbers can be used.
+    """
+    from dagster.core.executor.threaded import ThreadedExecutor
+
+    config = init_context.executor_config
+    return ThreadedExecutor(
+        retries=RetryMode.from_config(config["retries"]),
+        max_concurrent=config["max_concurrent"],
+    )
+
+
+ASYNC_IN_PROC_CONFIG = {
+    "max_concurrent": Field(
+        Int,
+        is_required=False,
+        default_value=32,
+        description="The maximum number of steps to run at the same time.",
+    ),
+    "retries": get_retries_config(),
+}
+
+
+@executor(
+    name="async_in_process",
+    config_schema=ASYNC_IN_PROC_CONFIG,
+)
+def async_in_process_executor(init_context):
+    """The async in-process executor executes steps concurrently within a single process.
+
+    Steps that are ready to run are started as soon as their upstream steps have finished, up to
+    ``max_concurrent`` at a time. The async compute functions of all running ops are scheduled on
+    one shared event loop, and everything else, including ops with regular compute functions, runs
+    on a pool of threads. Steps share the run's initialized resources, so in-memory IO managers can
+    be used, and jobs made of I/O-bound async ops run concurrently without the overhead of a
+    process per step. CPU-bound ops that hold the GIL will not run any faster.
+
+    To select it, include a fragment such as the following in your config:
+
+    .. code-block:: yaml
+
+        execution:
+          async_in_process:
+            config:
+              max_concurrent: 32
+
+    Since steps run at the same time, the stdout and stderr of all steps are captured together.
+    Python logs are captured by the step that logged them. Python logs from threads started by an
+    op are only captured while no other step is running, unless the thread runs in a copy of the
+    op's context, e.g. ``threading.Thread(target=contextvars.copy_context().run, args=(fn,))``.
+
+    Execution priority can be configured using the ``dagster/priority`` tag via op metadata,
+    where the higher the number the higher the priority. 0 is the default and both positive
+    and negative numbers can be used.
+    """
+    from dagster.core.executor.async_in_process import AsyncInProcessExecutor
+
+    config = init_context.executor_config
+    return AsyncInProcessExecutor(
+        retries=RetryMode.from_config(config["retries"]),
+        max_concurrent=config["max_concurrent"],
+    )
+
+
 def _core_multiprocess_executor_creation(config: Dict[str, Any]):
     from dagster.core.executor.multiprocess import MultiprocessExecutor
 
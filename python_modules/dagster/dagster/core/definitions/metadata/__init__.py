@@ -17,7 +17,7 @@
 
 from dagster import check, seven
 from dagster.core.errors import DagsterInvalidMetadata
-from dagster.serdes import whitelist_for_serdes
+from dagster.serdes import TrustedNamedTupleSerializer, whitelist_for_serdes
 from dagster.utils.backcompat import (
     canonicalize_backcompat_args,
     deprecation_warning,
@@ -471,7 +471,7 @@ def table_schema(
 # maintain backward compatibility. See docstring of `whitelist_for_serdes` for more info.
 
 
-@whitelist_for_serdes(storage_name="TextMetadataEntryData")
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer, storage_name="TextMetadataEntryData")
 class TextMetadataValue(  # type: ignore
     NamedTuple(
         "_TextMetadataValue",
@@ -493,7 +493,7 @@ def __new__(cls, text: Optional[str]):
         )
 
 
-@whitelist_for_serdes(storage_name="UrlMetadataEntryData")
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer, storage_name="UrlMetadataEntryData")
 class UrlMetadataValue(  # type: ignore
     NamedTuple(
         "_UrlMetadataValue",
@@ -515,7 +515,7 @@ def __new__(cls, url: Optional[str]):
         )
 
 
-@whitelist_for_serdes(storage_name="PathMetadataEntryData")
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer, storage_name="PathMetadataEntryData")
 class PathMetadataValue(  # type: ignore
     NamedTuple("_PathMetadataValue", [("path", Optional[str])]), MetadataValue
 ):
@@ -557,7 +557,9 @@ def __new__(cls, data: Optional[Dict[str, Any]]):
         return super(JsonMetadataValue, cls).__new__(cls, data)
 
 
-@whitelist_for_serdes(storage_name="MarkdownMetadataEntryData")
+@whitelist_for_serdes(
+    serializer=TrustedNamedTupleSerializer, storage_name="MarkdownMetadataEntryData"
+)
 class MarkdownMetadataValue(
     NamedTuple(
         "_MarkdownMetadataValue",
@@ -579,7 +581,9 @@ def __new__(cls, md_str: Optional[str]):
         )
 
 
-@whitelist_for_serdes(storage_name="PythonArtifactMetadataEntryData")
+@whitelist_for_serdes(
+    serializer=TrustedNamedTupleSerializer, storage_name="PythonArtifactMetadataEntryData"
+)
 class PythonArtifactMetadataValue(
     NamedTuple(
         "_PythonArtifactMetadataValue",
@@ -603,7 +607,7 @@ def __new__(cls, module: str, name: str):
         )
 
 
-@whitelist_for_serdes(storage_name="FloatMetadataEntryData")
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer, storage_name="FloatMetadataEntryData")
 class FloatMetadataValue(
     NamedTuple(
         "_FloatMetadataValue",
@@ -623,7 +627,7 @@ def __new__(cls, value: Optional[float]):
         return super(FloatMetadataValue, cls).__new__(cls, check.opt_float_param(value, "value"))
 
 
-@whitelist_for_serdes(storage_name="IntMetadataEntryData")
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer, storage_name="IntMetadataEntryData")
 class IntMetadataValue(
     NamedTuple(
         "_IntMetadataValue",
@@ -643,7 +647,9 @@ def __new__(cls, value: Optional[int]):
         return super(IntMetadataValue, cls).__new__(cls, check.opt_int_param(value, "value"))
 
 
-@whitelist_for_serdes(storage_name="DagsterPipelineRunMetadataEntryData")
+@whitelist_for_serdes(
+    serializer=TrustedNamedTupleSerializer, storage_name="DagsterPipelineRunMetadataEntryData"
+)
 class DagsterPipelineRunMetadataValue(
     NamedTuple(
         "_DagsterPipelineRunMetadataValue",
@@ -665,7 +671,9 @@ def __new__(cls, run_id: str):
         )
 
 
-@whitelist_for_serdes(storage_name="DagsterAssetMetadataEntryData")
+@whitelist_for_serdes(
+    serializer=TrustedNamedTupleSerializer, storage_name="DagsterAssetMetadataEntryData"
+)
 class DagsterAssetMetadataValue(
     NamedTuple("_DagsterAssetMetadataValue", [("asset_key", "AssetKey")]), MetadataValue
 ):
@@ -790,7 +798,7 @@ def wrapper(*args, **kwargs):
 # NOTE: This currently stores value in the `entry_data` NamedTuple attribute. In the next release,
 # we will change the name of the NamedTuple property to `value`, and need to implement custom
 # serialization so that it continues to be saved as `entry_data` for backcompat purposes.
-@whitelist_for_serdes(storage_name="EventMetadataEntry")
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer, storage_name="EventMetadataEntry")
 class MetadataEntry(
     NamedTuple(
         "_MetadataEntry",
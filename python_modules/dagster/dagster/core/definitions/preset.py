@@ -1,6 +1,5 @@
 from typing import Dict, List, NamedTuple, Optional
 
-import pkg_resources
 import yaml
 
 from dagster import check
@@ -176,6 +175,8 @@ def from_pkg_resources(
             DagsterInvariantViolationError: When one of the YAML documents is invalid and has a
                 parse error.
         """
+        import pkg_resources
+
         pkg_resource_defs = check.opt_list_param(
             pkg_resource_defs, "pkg_resource_defs", of_type=tuple
         )
@@ -1,6 +1,6 @@
 import warnings
 from datetime import datetime
-from typing import Any, Callable, List, NamedTuple, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Callable, List, NamedTuple, Optional, Union, cast
 
 import pendulum
 
@@ -20,7 +20,6 @@
     user_code_error_boundary,
 )
 from dagster.core.events import PIPELINE_RUN_STATUS_TO_EVENT_TYPE, DagsterEvent
-from dagster.core.instance import DagsterInstance
 from dagster.core.storage.pipeline_run import DagsterRun, PipelineRun, PipelineRunStatus, RunsFilter
 from dagster.serdes import (
     deserialize_json_to_dagster_namedtuple,
@@ -35,6 +34,9 @@
 
 from ..decorator_utils import get_function_params
 
+if TYPE_CHECKING:
+    from dagster.core.instance import DagsterInstance
+
 
 @whitelist_for_serdes
 class RunStatusSensorCursor(
@@ -78,7 +80,7 @@ class RunStatusSensorContext(
             ("sensor_name", str),
             ("dagster_run", DagsterRun),
             ("dagster_event", DagsterEvent),
-            ("instance", DagsterInstance),
+            ("instance", "DagsterInstance"),
         ],
     )
 ):
@@ -92,6 +94,7 @@ class RunStatusSensorContext(
     """
 
     def __new__(cls, sensor_name, dagster_run, dagster_event, instance):
+        from dagster.core.instance import DagsterInstance
 
         return super(RunStatusSensorContext, cls).__new__(
             cls,
@@ -158,7 +161,7 @@ def failure_event(self):
 def build_run_status_sensor_context(
     sensor_name: str,
     dagster_event: DagsterEvent,
-    dagster_instance: DagsterInstance,
+    dagster_instance: "DagsterInstance",
     dagster_run: DagsterRun,
 ) -> RunStatusSensorContext:
     """
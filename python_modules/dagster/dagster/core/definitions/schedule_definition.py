@@ -20,8 +20,6 @@
     ScheduleExecutionError,
     user_code_error_boundary,
 )
-from ..instance import DagsterInstance
-from ..instance.ref import InstanceRef
 from ..storage.pipeline_run import PipelineRun
 from ..storage.tags import check_tags
 from .graph_definition import GraphDefinition
@@ -32,6 +30,8 @@
 from .utils import check_valid_name
 
 if TYPE_CHECKING:
+    from ..instance import DagsterInstance
+    from ..instance.ref import InstanceRef
     from .decorators.schedule_decorator import DecoratedScheduleFunction
 
 
@@ -60,8 +60,10 @@ class ScheduleEvaluationContext:
     __slots__ = ["_instance_ref", "_scheduled_execution_time", "_exit_stack", "_instance"]
 
     def __init__(
-        self, instance_ref: Optional[InstanceRef], scheduled_execution_time: Optional[datetime]
+        self, instance_ref: Optional["InstanceRef"], scheduled_execution_time: Optional[datetime]
     ):
+        from ..instance.ref import InstanceRef
+
         self._exit_stack = ExitStack()
         self._instance = None
 
@@ -85,10 +87,12 @@ def instance(self) -> "DagsterInstance":
                 "Attempted to initialize dagster instance, but no instance reference was provided."
             )
         if not self._instance:
+            from ..instance import DagsterInstance
+
             self._instance = self._exit_stack.enter_context(
                 DagsterInstance.from_ref(self._instance_ref)
             )
-        return cast(DagsterInstance, self._instance)
+        return cast("DagsterInstance", self._instance)
 
     @property
     def scheduled_execution_time(self) -> Optional[datetime]:
@@ -100,7 +104,8 @@ def scheduled_execution_time(self) -> Optional[datetime]:
 
 
 def build_schedule_context(
-    instance: Optional[DagsterInstance] = None, scheduled_execution_time: Optional[datetime] = None
+    instance: Optional["DagsterInstance"] = None,
+    scheduled_execution_time: Optional[datetime] = None,
 ) -> ScheduleEvaluationContext:
     """Builds schedule execution context using the provided parameters.
 
@@ -122,6 +127,8 @@ def build_schedule_context(
 
     """
 
+    from ..instance import DagsterInstance
+
     check.opt_inst_param(instance, "instance", DagsterInstance)
     return ScheduleEvaluationContext(
         instance_ref=instance.get_ref() if instance and instance.is_persistent else None,
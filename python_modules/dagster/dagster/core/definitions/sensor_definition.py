@@ -20,8 +20,6 @@
     DagsterInvalidInvocationError,
     DagsterInvariantViolationError,
 )
-from dagster.core.instance import DagsterInstance
-from dagster.core.instance.ref import InstanceRef
 from dagster.serdes import whitelist_for_serdes
 from dagster.seven import funcsigs
 from dagster.utils import ensure_gen
@@ -38,6 +36,8 @@
 
 if TYPE_CHECKING:
     from dagster.core.events.log import EventLogEntry
+    from dagster.core.instance import DagsterInstance
+    from dagster.core.instance.ref import InstanceRef
 
 
 @whitelist_for_serdes
@@ -73,13 +73,16 @@ class SensorEvaluationContext:
 
     def __init__(
         self,
-        instance_ref: Optional[InstanceRef],
+        instance_ref: Optional["InstanceRef"],
         last_completion_time: Optional[float],
         last_run_key: Optional[str],
         cursor: Optional[str],
         repository_name: Optional[str],
-        instance: Optional[DagsterInstance] = None,
+        instance: Optional["DagsterInstance"] = None,
     ):
+        from dagster.core.instance import DagsterInstance
+        from dagster.core.instance.ref import InstanceRef
+
         self._exit_stack = ExitStack()
         self._instance_ref = check.opt_inst_param(instance_ref, "instance_ref", InstanceRef)
         self._last_completion_time = check.opt_float_param(
@@ -97,7 +100,7 @@ def __exit__(self, _exception_type, _exception_value, _traceback):
         self._exit_stack.close()
 
     @property
-    def instance(self) -> DagsterInstance:
+    def instance(self) -> "DagsterInstance":
         # self._instance_ref should only ever be None when this SensorEvaluationContext was
         # constructed under test.
         if not self._instance:
@@ -105,10 +108,12 @@ def instance(self) -> DagsterInstance:
                 raise DagsterInvariantViolationError(
                     "Attempted to initialize dagster instance, but no instance reference was provided."
                 )
+            from dagster.core.instance import DagsterInstance
+
             self._instance = self._exit_stack.enter_context(
                 DagsterInstance.from_ref(self._instance_ref)
             )
-        return cast(DagsterInstance, self._instance)
+        return cast("DagsterInstance", self._instance)
 
     @property
     def last_completion_time(self) -> Optional[float]:
@@ -509,7 +514,7 @@ def _wrapped_fn(context):
 
 
 def build_sensor_context(
-    instance: Optional[DagsterInstance] = None,
+    instance: Optional["DagsterInstance"] = None,
     cursor: Optional[str] = None,
     repository_name: Optional[str] = None,
 ) -> SensorEvaluationContext:
@@ -533,6 +538,8 @@ def build_sensor_context(
 
     """
 
+    from dagster.core.instance import DagsterInstance
+
     check.opt_inst_param(instance, "instance", DagsterInstance)
     check.opt_str_param(cursor, "cursor")
     check.opt_str_param(repository_name, "repository_name")
@@ -4,7 +4,6 @@
 from glob import glob
 from typing import Any, Dict, List, Optional, Tuple
 
-import pkg_resources
 import yaml
 
 from dagster import check, seven
@@ -200,6 +199,8 @@ def config_from_pkg_resources(pkg_resource_defs: List[Tuple[str, str]]) -> Dict[
         DagsterInvariantViolationError: When one of the YAML documents is invalid and has a
             parse error.
     """
+    import pkg_resources
+
     pkg_resource_defs = check.list_param(pkg_resource_defs, "pkg_resource_defs", of_type=tuple)
 
     try:
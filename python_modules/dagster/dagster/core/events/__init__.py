@@ -30,7 +30,11 @@
 from dagster.core.execution.plan.outputs import StepOutputData
 from dagster.core.log_manager import DagsterLogManager
 from dagster.core.storage.pipeline_run import PipelineRunStatus
-from dagster.serdes import register_serdes_tuple_fallbacks, whitelist_for_serdes
+from dagster.serdes import (
+    TrustedNamedTupleSerializer,
+    register_serdes_tuple_fallbacks,
+    whitelist_for_serdes,
+)
 from dagster.utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster.utils.timing import format_duration
 
@@ -198,6 +202,19 @@ class DagsterEventType(Enum):
     DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
 }
 
+# events that run and step stats, asset history and run monitoring are computed from, which are kept
+# in the event log when the events of a finished run are compacted
+RETAINED_EVENTS = PIPELINE_EVENTS | ASSET_EVENTS | {
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_RESTARTED,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+    DagsterEventType.STEP_EXPECTATION_RESULT,
+    DagsterEventType.ENGINE_EVENT,
+}
+
 
 def _assert_type(
     method: str, expected_type: DagsterEventType, actual_type: DagsterEventType
@@ -269,7 +286,26 @@ def log_resource_event(log_manager: DagsterLogManager, event: "DagsterEvent") ->
     log_manager.log_dagster_event(level=log_level, msg=event.message or "", dagster_event=event)
 
 
-@whitelist_for_serdes
+class DagsterEventSerializer(TrustedNamedTupleSerializer):
+    @classmethod
+    def value_from_trusted_unpacked(cls, unpacked_dict, klass):
+        # legacy events are remapped and have their step handle / key derived in __new__
+        if (
+            unpacked_dict.get("event_type_value") in _BACK_COMPAT_EVENT_TYPE_VALUES
+            or (
+                unpacked_dict.get("solid_handle") is not None
+                and unpacked_dict.get("step_handle") is None
+            )
+            or (
+                unpacked_dict.get("step_handle") is not None
+                and unpacked_dict.get("step_key") is None
+            )
+        ):
+            return cls.value_from_unpacked(unpacked_dict, klass)
+        return super().value_from_trusted_unpacked(unpacked_dict, klass)
+
+
+@whitelist_for_serdes(serializer=DagsterEventSerializer)
 class DagsterEvent(
     NamedTuple(
         "_DagsterEvent",
@@ -1245,7 +1281,7 @@ def get_step_output_event(
     return None
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class AssetObservationData(
     NamedTuple("_AssetObservation", [("asset_observation", AssetObservation)])
 ):
@@ -1258,7 +1294,7 @@ def __new__(cls, asset_observation: AssetObservation):
         )
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class StepMaterializationData(
     NamedTuple(
         "_StepMaterializationData",
@@ -1284,7 +1320,7 @@ def __new__(
         )
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class AssetMaterializationPlannedData(
     NamedTuple("_AssetMaterializationPlannedData", [("asset_key", AssetKey)])
 ):
@@ -1294,7 +1330,7 @@ def __new__(cls, asset_key: AssetKey):
         )
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class StepExpectationResultData(
     NamedTuple(
         "_StepExpectationResultData",
@@ -1312,7 +1348,7 @@ def __new__(cls, expectation_result: ExpectationResult):
         )
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class ObjectStoreOperationResultData(
     NamedTuple(
         "_ObjectStoreOperationResultData",
@@ -1348,7 +1384,7 @@ def __new__(
         )
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class EngineEventData(
     NamedTuple(
         "_EngineEventData",
@@ -1419,7 +1455,7 @@ def engine_error(error: SerializableErrorInfo) -> "EngineEventData":
         return EngineEventData(metadata_entries=[], error=error)
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class PipelineFailureData(
     NamedTuple(
         "_PipelineFailureData",
@@ -1434,7 +1470,7 @@ def __new__(cls, error: Optional[SerializableErrorInfo]):
         )
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class PipelineCanceledData(
     NamedTuple(
         "_PipelineCanceledData",
@@ -1449,7 +1485,7 @@ def __new__(cls, error: Optional[SerializableErrorInfo]):
         )
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class HookErroredData(
     NamedTuple(
         "_HookErroredData",
@@ -1464,7 +1500,7 @@ def __new__(cls, error: SerializableErrorInfo):
         )
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class HandledOutputData(
     NamedTuple(
         "_HandledOutputData",
@@ -1491,7 +1527,7 @@ def __new__(
         )
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class LoadedInputData(
     NamedTuple(
         "_LoadedInputData",
@@ -1524,7 +1560,7 @@ def __new__(
         )
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class ComputeLogsCaptureData(
     NamedTuple(
         "_ComputeLogsCaptureData",
@@ -1577,6 +1613,19 @@ class PipelineInitFailureData(NamedTuple):
     error: SerializableErrorInfo
 
 
+# event type values that _handle_back_compat transforms
+_BACK_COMPAT_EVENT_TYPE_VALUES = frozenset(
+    [
+        "PIPELINE_PROCESS_START",
+        "PIPELINE_PROCESS_STARTED",
+        "PIPELINE_PROCESS_EXITED",
+        "ASSET_STORE_OPERATION",
+        "STEP_MATERIALIZATION",
+        "PIPELINE_INIT_FAILURE",
+    ]
+)
+
+
 def _handle_back_compat(event_type_value, event_specific_data):
     # transform old specific process events in to engine events
     if event_type_value == "PIPELINE_PROCESS_START":
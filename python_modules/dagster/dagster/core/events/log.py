@@ -5,7 +5,7 @@
 from dagster.core.events import DagsterEvent
 from dagster.core.utils import coerce_valid_log_level
 from dagster.serdes.serdes import (
-    DefaultNamedTupleSerializer,
+    TrustedNamedTupleSerializer,
     WhitelistMap,
     deserialize_json_to_dagster_namedtuple,
     register_serdes_tuple_fallbacks,
@@ -21,7 +21,7 @@
 )
 
 
-class EventLogEntrySerializer(DefaultNamedTupleSerializer):
+class EventLogEntrySerializer(TrustedNamedTupleSerializer):
     @classmethod
     def value_to_storage_dict(
         cls,
@@ -34,6 +34,13 @@ def value_to_storage_dict(
         storage_dict["message"] = ""
         return storage_dict
 
+    @classmethod
+    def value_from_trusted_unpacked(cls, unpacked_dict, klass):
+        # levels are coerced to ints in __new__
+        if not isinstance(unpacked_dict.get("level"), int):
+            return cls.value_from_unpacked(unpacked_dict, klass)
+        return super().value_from_trusted_unpacked(unpacked_dict, klass)
+
 
 @whitelist_for_serdes(serializer=EventLogEntrySerializer)
 class EventLogEntry(
@@ -1,18 +1,19 @@
 import io
 import os
-import subprocess
 import sys
-import tempfile
-import time
-import uuid
+import threading
 import warnings
 from contextlib import contextmanager
 
-from dagster.core.execution import poll_compute_logs, watch_orphans
-from dagster.serdes.ipc import interrupt_ipc_subprocess, open_ipc_subprocess
-from dagster.seven import IS_WINDOWS, wait_for_process
 from dagster.utils import ensure_file
 
+# How often the in-process tail checks the compute log file for new output
+TAIL_POLL_INTERVAL = 0.1
+
+# How long to wait for the in-process tail to write out the rest of the compute log file once the
+# step is done, in case the stream it writes to is blocked
+TAIL_SHUTDOWN_TIMEOUT = 5
+
 WIN_PY36_COMPUTE_LOG_DISABLED_MSG = """\u001b[33mWARNING: Compute log capture is disabled for the current environment. Set the environment variable `PYTHONLEGACYWINDOWSSTDIO` to enable.\n\u001b[0m"""
 
 
@@ -70,84 +71,58 @@ def redirect_stream(to_stream=os.devnull, from_stream=sys.stdout):
 
 @contextmanager
 def tail_to_stream(path, stream):
-    if IS_WINDOWS:
-        with execute_windows_tail(path, stream) as pids:
-            yield pids
-    else:
-        with execute_posix_tail(path, stream) as pids:
-            yield pids
+    with execute_thread_tail(path, stream) as pids:
+        yield pids
 
 
 @contextmanager
-def execute_windows_tail(path, stream):
-    # Cannot use multiprocessing here because we already may be in a daemonized process
-    # Instead, invoke a thin script to poll a file and dump output to stdout.  We pass the current
-    # pid so that the poll process kills itself if it becomes orphaned
-    poll_file = os.path.abspath(poll_compute_logs.__file__)
-    stream = stream if _fileno(stream) else None
-
-    with tempfile.TemporaryDirectory() as temp_dir:
-        ipc_output_file = os.path.join(
-            temp_dir, "execute-windows-tail-{uuid}".format(uuid=uuid.uuid4().hex)
-        )
-
-        try:
-            tail_process = open_ipc_subprocess(
-                [sys.executable, poll_file, path, str(os.getpid()), ipc_output_file], stdout=stream
-            )
-            yield (tail_process.pid, None)
-        finally:
-            if tail_process:
-                start_time = time.time()
-                while not os.path.isfile(ipc_output_file):
-                    if time.time() - start_time > 15:
-                        raise Exception("Timed out waiting for tail process to start")
-                    time.sleep(1)
-
-                # Now that we know the tail process has started, tell it to terminate once there is
-                # nothing more to output
-                interrupt_ipc_subprocess(tail_process)
-                wait_for_process(tail_process)
-
-
-@contextmanager
-def execute_posix_tail(path, stream):
-    # open a subprocess to tail the file and print to stdout
-    tail_cmd = ["tail", "-F", "-c", "+0", path]
-    stream = stream if _fileno(stream) else None
+def execute_thread_tail(path, stream):
+    # Tail the file from a thread in the current process rather than from subprocesses, so that
+    # capturing the logs for a step costs no process launches and nothing can be orphaned if the
+    # current process is suddenly killed. Yields (None, None) where the subprocess based tails used
+    # to yield the pids of the tail and orphan watcher processes.
+    stream_fd = _fileno(stream)
+    if stream_fd is None:
+        yield (None, None)
+        return
 
+    # The stream's file descriptor is about to be redirected to the file itself, so write to a
+    # copy of it that keeps pointing at the original destination
+    tail_fd = os.dup(stream_fd)
+    shutdown_event = threading.Event()
+    tail_thread = threading.Thread(
+        target=_tail_file_to_fd,
+        args=(path, tail_fd, shutdown_event),
+        name="compute-log-tail",
+        daemon=True,
+    )
+    tail_thread.start()
     try:
-        tail_process = None
-        watcher_process = None
-        tail_process = subprocess.Popen(tail_cmd, stdout=stream)
-
-        # open a watcher process to check for the orphaning of the tail process (e.g. when the
-        # current process is suddenly killed)
-        watcher_file = os.path.abspath(watch_orphans.__file__)
-        watcher_process = subprocess.Popen(
-            [
-                sys.executable,
-                watcher_file,
-                str(os.getpid()),
-                str(tail_process.pid),
-            ]
-        )
-
-        yield (tail_process.pid, watcher_process.pid)
+        yield (None, None)
     finally:
-        if tail_process:
-            _clean_up_subprocess(tail_process)
-
-        if watcher_process:
-            _clean_up_subprocess(watcher_process)
+        shutdown_event.set()
+        tail_thread.join(TAIL_SHUTDOWN_TIMEOUT)
+        if not tail_thread.is_alive():
+            os.close(tail_fd)
 
 
-def _clean_up_subprocess(subprocess_obj):
+def _tail_file_to_fd(path, fd, shutdown_event):
     try:
-        if subprocess_obj:
-            subprocess_obj.terminate()
-            wait_for_process(subprocess_obj)
+        with open(path, "rb") as file_stream:
+            while True:
+                # Check before reading, so that everything written before shutdown is copied over
+                is_shutting_down = shutdown_event.is_set()
+                chunk = file_stream.read()
+                while chunk:
+                    written = os.write(fd, chunk)
+                    chunk = chunk[written:]
+
+                if is_shutting_down:
+                    return
+
+                shutdown_event.wait(TAIL_POLL_INTERVAL)
     except OSError:
+        # The destination stream was closed, there is nowhere left to mirror the logs to
         pass
 
 
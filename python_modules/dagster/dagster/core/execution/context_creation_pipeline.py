@@ -268,8 +268,12 @@ def execution_context_event_generator(
 
     _validate_plan_with_context(execution_context, execution_plan)
 
-    yield execution_context
-    yield from resources_manager.generate_teardown_events()
+    try:
+        yield execution_context
+        yield from resources_manager.generate_teardown_events()
+    finally:
+        # make sure everything logged during the run, including resource teardown, is stored
+        log_manager.flush()
 
 
 class PlanOrchestrationContextManager(ExecutionContextManager[PlanOrchestrationContext]):
@@ -368,6 +372,8 @@ def orchestration_context_event_generator(
 
         if raise_on_error:
             raise dagster_error
+    finally:
+        log_manager.flush()
 
 
 class PlanExecutionContextManager(ExecutionContextManager[PlanExecutionContext]):
@@ -14,6 +14,7 @@
 from dagster.core.storage.tags import PRIORITY_TAG
 from dagster.utils.interrupts import pop_captured_interrupt
 
+from .inputs import StepInput
 from .outputs import StepOutputData, StepOutputHandle
 from .plan import ExecutionPlan
 from .step import ExecutionStep
@@ -88,6 +89,12 @@ def __init__(
         # see verify_complete
         self._unknown_state: Set[str] = set()
 
+        # Count the steps that still need to load each step output, so that an output can be
+        # released once the last of them is done with it
+        self._output_consumer_counts: Dict[StepOutputHandle, int] = {}
+        self._releasable_outputs: List[StepOutputHandle] = []
+        self._count_output_consumers()
+
         self._interrupted: bool = False
 
         # Start the show by loading _executable with the set of _pending steps that have no deps
@@ -346,20 +353,24 @@ def plan_events_iterator(self, pipeline_context) -> Iterator[DagsterEvent]:
     def mark_failed(self, step_key: str) -> None:
         self._failed.add(step_key)
         self._mark_complete(step_key)
+        self._mark_inputs_consumed(step_key)
 
     def mark_success(self, step_key: str) -> None:
         self._success.add(step_key)
         self._mark_complete(step_key)
         self._resolve_any_dynamic_outputs(step_key)
+        self._mark_inputs_consumed(step_key)
 
     def mark_skipped(self, step_key: str) -> None:
         self._skipped.add(step_key)
         self._mark_complete(step_key)
         self._resolve_any_dynamic_outputs(step_key)
+        self._mark_inputs_consumed(step_key)
 
     def mark_abandoned(self, step_key: str) -> None:
         self._abandoned.add(step_key)
         self._mark_complete(step_key)
+        self._mark_inputs_consumed(step_key)
 
     def mark_interrupted(self) -> None:
         self._interrupted = True
@@ -447,6 +458,53 @@ def mark_unknown_state(self, step_key: str) -> None:
     def mark_step_produced_output(self, step_output_handle: StepOutputHandle) -> None:
         self._step_outputs.add(step_output_handle)
 
+    def _count_output_consumers(self) -> None:
+        # Steps that have yet to be resolved from dynamic outputs are created at run time, so
+        # nothing they depend on is ever released. Neither are mapped outputs, which are only known
+        # at run time.
+        pinned_outputs: Set[StepOutputHandle] = set()
+        for step in self._plan.steps:
+            if isinstance(step, ExecutionStep) and step.key in self._pending:
+                for step_input in step.step_inputs:
+                    for step_output_handle in step_input.get_step_output_handle_dependencies():
+                        self._output_consumer_counts[step_output_handle] = (
+                            self._output_consumer_counts.get(step_output_handle, 0) + 1
+                        )
+            elif not isinstance(step, ExecutionStep):
+                for unresolved_input in step.step_inputs:
+                    pinned_outputs.update(
+                        unresolved_input.get_step_output_handle_dependencies()
+                        if isinstance(unresolved_input, StepInput)
+                        else unresolved_input.get_step_output_handle_deps_with_placeholders()
+                    )
+
+        for step_output_handle in pinned_outputs:
+            self._output_consumer_counts.pop(step_output_handle, None)
+
+    def _mark_inputs_consumed(self, step_key: str) -> None:
+        step = self._plan.get_step_by_key(step_key)
+        if not isinstance(step, ExecutionStep):
+            return
+
+        for step_input in step.step_inputs:
+            for step_output_handle in step_input.get_step_output_handle_dependencies():
+                if step_output_handle not in self._output_consumer_counts:
+                    continue
+
+                self._output_consumer_counts[step_output_handle] -= 1
+                if self._output_consumer_counts[step_output_handle] == 0:
+                    del self._output_consumer_counts[step_output_handle]
+                    # outputs that were never produced in this execution have nothing to release
+                    if step_output_handle in self._step_outputs:
+                        self._releasable_outputs.append(step_output_handle)
+
+    def pop_releasable_outputs(self) -> List[StepOutputHandle]:
+        """Step outputs that every step that depends on them is done with, since the last call.
+        Steps that are up for retry are not done with their inputs until their final attempt."""
+        releasable_outputs = self._releasable_outputs
+        self._releasable_outputs = []
+        return releasable_outputs
+
     @property
     def is_complete(self) -> bool:
         return (
@@ -459,6 +517,10 @@ def is_complete(self) -> bool:
             and len(self._waiting_to_retry) == 0
         )
 
+    @property
+    def plan(self) -> ExecutionPlan:
+        return self._plan
+
     @property
     def retry_state(self):
         return self._retry_state
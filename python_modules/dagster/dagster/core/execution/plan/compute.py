@@ -1,6 +1,8 @@
 import asyncio
 import inspect
-from typing import Any, AsyncGenerator, Callable, Dict, Iterator, List, Set, Union
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncGenerator, Callable, Dict, Iterator, List, Optional, Set, Union
 
 from dagster import check
 from dagster.core.definitions import (
@@ -98,8 +100,43 @@ def _validate_event(event: Any, step_context: StepExecutionContext) -> SolidOutp
     return event
 
 
+# Set by executors that run steps concurrently, so that the async compute functions of all of
+# their steps are scheduled on one event loop running in its own thread instead of each step
+# blocking its thread on a loop of its own.
+_SHARED_EVENT_LOOP: ContextVar[Optional[asyncio.AbstractEventLoop]] = ContextVar(
+    "shared_event_loop", default=None
+)
+
+
+@contextmanager
+def shared_event_loop(loop: asyncio.AbstractEventLoop) -> Iterator[None]:
+    """Run the async compute functions of any steps executed within this context on the given
+    event loop, which must be running in another thread."""
+    check.inst_param(loop, "loop", asyncio.AbstractEventLoop)
+    token = _SHARED_EVENT_LOOP.set(loop)
+    try:
+        yield
+    finally:
+        _SHARED_EVENT_LOOP.reset(token)
+
+
 def gen_from_async_gen(async_gen: AsyncGenerator) -> Iterator:
-    loop = asyncio.get_event_loop()
+    shared_loop = _SHARED_EVENT_LOOP.get()
+    if shared_loop:
+        while True:
+            try:
+                yield asyncio.run_coroutine_threadsafe(async_gen.__anext__(), shared_loop).result()
+            except StopAsyncIteration:
+                return
+
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        # only the main thread gets an event loop by default, so steps running on other threads
+        # (e.g. with the threaded executor) keep one of their own
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
     while True:
         try:
             yield loop.run_until_complete(async_gen.__anext__())
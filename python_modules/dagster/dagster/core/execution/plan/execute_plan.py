@@ -1,6 +1,10 @@
+import asyncio
+import hashlib
+import queue
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import ExitStack
-from typing import Iterator, List, cast
+from typing import Dict, Iterator, List, Optional, Tuple, cast
 
 from dagster import check
 from dagster.core.definitions import Failure, HookExecutionResult, RetryRequested
@@ -13,6 +17,8 @@
 )
 from dagster.core.events import DagsterEvent, EngineEventData
 from dagster.core.execution.context.system import PlanExecutionContext, StepExecutionContext
+from dagster.core.execution.plan.active import ActiveExecution
+from dagster.core.execution.plan.compute import shared_event_loop
 from dagster.core.execution.plan.execute_step import core_dagster_event_sequence_for_step
 from dagster.core.execution.plan.objects import (
     ErrorSource,
@@ -32,10 +38,6 @@ def inner_plan_execution_iterator(
     check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
 
     with execution_plan.start(retry_mode=pipeline_context.retry_mode) as active_execution:
-
-        # It would be good to implement a reference tracking algorithm here to
-        # garbage collect results that are no longer needed by any steps
-        # https://github.com/dagster-io/dagster/issues/811
         while not active_execution.is_complete:
             step = active_execution.get_next_step()
             step_context = cast(
@@ -113,6 +115,211 @@ def inner_plan_execution_iterator(
             for hook_event in _trigger_hook(step_context, step_event_list):
                 yield hook_event
 
+            # let IO managers free any outputs that no remaining step will load
+            yield from _release_outputs(pipeline_context, active_execution)
+
+
+# How often the concurrent iterator wakes up to check for interrupts and steps that are ready to
+# retry while it waits on running steps
+CONCURRENT_EXECUTION_POLL_INTERVAL = 0.1
+
+
+def concurrent_plan_execution_iterator(
+    pipeline_context: PlanExecutionContext,
+    execution_plan: ExecutionPlan,
+    max_concurrent: int,
+    event_loop: Optional[asyncio.AbstractEventLoop] = None,
+) -> Iterator[DagsterEvent]:
+    """Execute the plan in process, running up to max_concurrent ready steps at a time on a pool
+    of threads that share the resources of the run.
+
+    Events from the running steps are handed back to this generator, which yields them and feeds
+    them into the ActiveExecution one at a time in the order they were emitted, so the plan
+    bookkeeping, hooks and the releasing of outputs all stay on the calling thread.
+
+    Args:
+        pipeline_context (PlanExecutionContext): The context of the run.
+        execution_plan (ExecutionPlan): The plan to execute.
+        max_concurrent (int): The maximum number of steps to run at once.
+        event_loop (Optional[asyncio.AbstractEventLoop]): If set, an event loop running in another
+            thread that the async compute functions of all steps are scheduled on.
+    """
+    check.inst_param(pipeline_context, "pipeline_context", PlanExecutionContext)
+    check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+    check.int_param(max_concurrent, "max_concurrent")
+    check.opt_inst_param(event_loop, "event_loop", asyncio.AbstractEventLoop)
+
+    # stdout and stderr belong to the whole process, so steps running at the same time can't have
+    # their logs captured separately
+    steps = [execution_plan.get_step_by_key(key) for key in execution_plan.step_keys_to_execute]
+    log_key = hashlib.sha1(",".join(sorted(step.key for step in steps)).encode()).hexdigest()[:8]
+
+    with ExitStack() as stack:
+        log_capture_error = None
+        try:
+            stack.enter_context(
+                pipeline_context.instance.compute_log_manager.watch(
+                    pipeline_context.pipeline_run, log_key
+                )
+            )
+        except Exception as e:
+            yield DagsterEvent.engine_event(
+                pipeline_context=pipeline_context,
+                message="Exception while setting up compute log capture",
+                event_specific_data=EngineEventData(
+                    error=serializable_error_info_from_exc_info(sys.exc_info())
+                ),
+            )
+            log_capture_error = e
+
+        if not log_capture_error:
+            yield DagsterEvent.capture_logs(pipeline_context, log_key=log_key, steps=steps)
+
+        yield from _concurrent_step_execution_iterator(
+            pipeline_context, execution_plan, max_concurrent, event_loop
+        )
+
+        try:
+            stack.close()
+        except Exception:
+            yield DagsterEvent.engine_event(
+                pipeline_context=pipeline_context,
+                message="Exception while cleaning up compute log capture",
+                event_specific_data=EngineEventData(
+                    error=serializable_error_info_from_exc_info(sys.exc_info())
+                ),
+            )
+
+
+def _concurrent_step_execution_iterator(
+    pipeline_context: PlanExecutionContext,
+    execution_plan: ExecutionPlan,
+    max_concurrent: int,
+    event_loop: Optional[asyncio.AbstractEventLoop],
+) -> Iterator[DagsterEvent]:
+    # (step key, event) pairs from the running steps. A step puts None once it is finished.
+    event_queue: "queue.Queue[Tuple[str, Optional[DagsterEvent]]]" = queue.Queue()
+    running: Dict[str, Tuple[StepExecutionContext, Future]] = {}
+    step_event_lists: Dict[str, List[DagsterEvent]] = {}
+    step_error: Optional[BaseException] = None
+    stopping = False
+
+    with execution_plan.start(retry_mode=pipeline_context.retry_mode) as active_execution:
+        with ThreadPoolExecutor(
+            max_workers=max_concurrent, thread_name_prefix="step_worker"
+        ) as step_pool:
+            while (not stopping and not active_execution.is_complete) or running:
+                if active_execution.check_for_interrupts():
+                    yield DagsterEvent.engine_event(
+                        pipeline_context,
+                        "Received termination signal - waiting for running steps to finish",
+                        EngineEventData.interrupted(list(running.keys())),
+                    )
+                    stopping = True
+                    active_execution.mark_interrupted()
+
+                if not stopping and len(running) < max_concurrent:
+                    for step in active_execution.get_steps_to_execute(
+                        limit=max_concurrent - len(running)
+                    ):
+                        step_context = cast(
+                            StepExecutionContext,
+                            pipeline_context.for_step(
+                                step, active_execution.retry_state.get_attempt_count(step.key)
+                            ),
+                        )
+                        step_event_lists[step.key] = []
+                        running[step.key] = (
+                            step_context,
+                            step_pool.submit(
+                                _execute_step_on_thread, step_context, event_queue, event_loop
+                            ),
+                        )
+
+                try:
+                    step_key, step_event = event_queue.get(
+                        timeout=CONCURRENT_EXECUTION_POLL_INTERVAL
+                    )
+                except queue.Empty:
+                    continue
+
+                if step_event:
+                    step_event_lists[step_key].append(step_event)
+                    yield step_event
+                    # hold off on retrying the step until this attempt has finished
+                    if not step_event.is_step_up_for_retry:
+                        active_execution.handle_event(step_event)
+                    continue
+
+                step_context, step_future = running.pop(step_key)
+                step_event_list = step_event_lists.pop(step_key)
+                if step_future.exception():
+                    # the step raised rather than reporting a failure (e.g. raise_on_error), so
+                    # stop starting new steps and raise once the running ones have finished
+                    stopping = True
+                    step_error = step_error or step_future.exception()
+                    continue
+
+                for step_event in step_event_list:
+                    if step_event.is_step_up_for_retry:
+                        active_execution.handle_event(step_event)
+
+                active_execution.verify_complete(pipeline_context, step_key)
+
+                # process skips from failures or uncovered inputs
+                for event in active_execution.plan_events_iterator(pipeline_context):
+                    step_event_list.append(event)
+                    yield event
+
+                # pass a list of step events to hooks
+                for hook_event in _trigger_hook(step_context, step_event_list):
+                    yield hook_event
+
+                # let IO managers free any outputs that no remaining step will load
+                yield from _release_outputs(pipeline_context, active_execution)
+
+        if step_error:
+            raise step_error
+
+
+def _execute_step_on_thread(
+    step_context: StepExecutionContext,
+    event_queue: "queue.Queue[Tuple[str, Optional[DagsterEvent]]]",
+    event_loop: Optional[asyncio.AbstractEventLoop],
+) -> None:
+    step_key = step_context.step.key
+    try:
+        with ExitStack() as stack:
+            if event_loop:
+                stack.enter_context(shared_event_loop(event_loop))
+
+            for step_event in check.generator(dagster_event_sequence_for_step(step_context)):
+                check.inst(step_event, DagsterEvent)
+                event_queue.put((step_key, step_event))
+    finally:
+        event_queue.put((step_key, None))
+
+
+def _release_outputs(
+    pipeline_context: PlanExecutionContext, active_execution: ActiveExecution
+) -> Iterator[DagsterEvent]:
+    for step_output_handle in active_execution.pop_releasable_outputs():
+        step = active_execution.get_step_by_key(step_output_handle.step_key)
+        step_context = cast(StepExecutionContext, pipeline_context.for_step(step))
+        try:
+            step_context.get_io_manager(step_output_handle).release_output(
+                step_context.get_output_context(step_output_handle)
+            )
+        except Exception:
+            yield DagsterEvent.engine_event(
+                pipeline_context=pipeline_context,
+                message=f'Exception while releasing output "{step_output_handle.output_name}"',
+                event_specific_data=EngineEventData(
+                    error=serializable_error_info_from_exc_info(sys.exc_info())
+                ),
+                step_handle=step.handle,
+            )
+
 
 def _trigger_hook(
     step_context: StepExecutionContext, step_event_list: List[DagsterEvent]
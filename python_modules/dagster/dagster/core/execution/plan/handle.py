@@ -3,10 +3,10 @@
 
 from dagster import check
 from dagster.core.definitions.dependency import NodeHandle
-from dagster.serdes import whitelist_for_serdes
+from dagster.serdes import TrustedNamedTupleSerializer, whitelist_for_serdes
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class StepHandle(NamedTuple("_StepHandle", [("solid_handle", NodeHandle), ("key", str)])):
     """A reference to an ExecutionStep that was determined statically"""
 
@@ -38,7 +38,7 @@ def parse_from_key(
         return StepHandle(NodeHandle.from_string(string))
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class UnresolvedStepHandle(NamedTuple("_UnresolvedStepHandle", [("solid_handle", NodeHandle)])):
     """A reference to an UnresolvedMappedExecutionStep in an execution"""
 
@@ -55,7 +55,7 @@ def resolve(self, map_key) -> "ResolvedFromDynamicStepHandle":
         return ResolvedFromDynamicStepHandle(self.solid_handle, map_key)
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class ResolvedFromDynamicStepHandle(
     NamedTuple(
         "_ResolvedFromDynamicStepHandle",
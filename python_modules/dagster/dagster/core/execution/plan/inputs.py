@@ -15,7 +15,7 @@
 )
 from dagster.core.storage.io_manager import IOManager
 from dagster.core.system_config.objects import ResolvedRunConfig
-from dagster.serdes import whitelist_for_serdes
+from dagster.serdes import TrustedNamedTupleSerializer, whitelist_for_serdes
 from dagster.utils import ensure_gen
 
 from .objects import TypeCheckData
@@ -42,7 +42,7 @@ def _get_asset_lineage_from_fns(
     )
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class StepInputData(
     NamedTuple("_StepInputData", [("input_name", str), ("type_check_data", TypeCheckData)])
 ):
@@ -3,7 +3,7 @@
 
 from dagster import check
 from dagster.core.definitions.metadata import MetadataEntry
-from dagster.serdes import whitelist_for_serdes
+from dagster.serdes import TrustedNamedTupleSerializer, whitelist_for_serdes
 from dagster.utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster.utils.types import ExcInfo
 
@@ -11,7 +11,7 @@
     from dagster.core.execution.context.system import StepExecutionContext
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class TypeCheckData(
     NamedTuple(
         "_TypeCheckData",
@@ -35,7 +35,7 @@ def __new__(cls, success, label, description=None, metadata_entries=None):
         )
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class UserFailureData(
     NamedTuple(
         "_UserFailureData",
@@ -69,7 +69,7 @@ class ErrorSource(Enum):
     INTERRUPT = "INTERRUPT"
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class StepFailureData(
     NamedTuple(
         "_StepFailureData",
@@ -129,7 +129,7 @@ def step_failure_event_from_exc_info(
     )
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class StepRetryData(
     NamedTuple(
         "_StepRetryData",
@@ -144,7 +144,7 @@ def __new__(cls, error, seconds_to_wait=None):
         )
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class StepSuccessData(NamedTuple("_StepSuccessData", [("duration_ms", float)])):
     def __new__(cls, duration_ms):
         return super(StepSuccessData, cls).__new__(
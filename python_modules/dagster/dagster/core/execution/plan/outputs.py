@@ -8,7 +8,7 @@
     NodeHandle,
 )
 from dagster.core.definitions.events import AssetKey
-from dagster.serdes import whitelist_for_serdes
+from dagster.serdes import TrustedNamedTupleSerializer, whitelist_for_serdes
 
 from .handle import UnresolvedStepHandle
 from .objects import TypeCheckData
@@ -96,7 +96,7 @@ def asset_key(self) -> Optional[AssetKey]:
         return self.properties.asset_key
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class StepOutputData(
     NamedTuple(
         "_StepOutputData",
@@ -141,7 +141,7 @@ def mapping_key(self) -> Optional[str]:
         return self.step_output_handle.mapping_key
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class StepOutputHandle(
     NamedTuple(
         "_StepOutputHandle",
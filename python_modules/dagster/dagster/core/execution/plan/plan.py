@@ -8,6 +8,7 @@
     NamedTuple,
     Optional,
     Set,
+    Tuple,
     Union,
     cast,
 )
@@ -41,6 +42,7 @@
 from dagster.core.execution.retries import RetryMode, RetryState
 from dagster.core.instance import DagsterInstance, InstanceRef
 from dagster.core.storage.mem_io_manager import mem_io_manager
+from dagster.core.storage.tags import MEMOIZED_RUN_TAG
 from dagster.core.system_config.objects import ResolvedRunConfig
 from dagster.core.types.dagster_type import DagsterTypeKind
 from dagster.core.utils import toposort
@@ -92,6 +94,10 @@ class _PlanBuilder:
     (solid_name, output_name) to particular step outputs. This covers the case where a solid maps to
     multiple steps and one wants to be able to attach to the logical output of a solid during
     execution.
+
+    When the build is scoped, only the steps in step_keys_to_execute and the steps that produce
+    their inputs are created. The creation of every other ExecutionStep is deferred, and never
+    happens unless one of the selected steps depends on it.
     """
 
     def __init__(
@@ -102,6 +108,7 @@ def __init__(
         known_state,
         instance_ref: Optional[InstanceRef],
         tags: Dict[str, str],
+        scoped: bool = False,
     ):
         self.pipeline = check.inst_param(pipeline, "pipeline", IPipeline)
         self.resolved_run_config = check.inst_param(
@@ -123,6 +130,24 @@ def __init__(
         self._seen_handles: Set[StepHandleUnion] = set()
         self._tags = check.dict_param(tags, "tags", key_type=str, value_type=str)
 
+        pipeline_def = pipeline.get_definition()
+        # memoized runs resolve versions from every step in the plan, so they are never scoped
+        self._scoped = (
+            check.bool_param(scoped, "scoped")
+            and step_keys_to_execute is not None
+            and MEMOIZED_RUN_TAG not in pipeline_def.tags
+            and not pipeline_def.is_using_memoization(self._tags)
+        )
+        self._solid_handles_to_build: Set[str] = (
+            {
+                StepHandle.parse_from_key(step_key).solid_handle.to_string()
+                for step_key in step_keys_to_execute
+            }
+            if self._scoped and step_keys_to_execute is not None
+            else set()
+        )
+        self._deferred_steps: Dict[str, Tuple[Node, NodeHandle, List[StepInput]]] = {}
+
     @property
     def pipeline_name(self) -> str:
         return self.pipeline.get_definition().name
@@ -139,6 +164,58 @@ def add_step(self, step: IExecutionStep) -> None:
         self._seen_handles.add(step.handle)
         self._steps[step.solid_handle.to_string()] = step
 
+    def defer_step(self, solid: Node, handle: NodeHandle, step_inputs: List[StepInput]) -> None:
+        self._deferred_steps[handle.to_string()] = (solid, handle, step_inputs)
+
+    def is_step_deferred(self, handle: NodeHandle) -> bool:
+        return handle.to_string() in self._deferred_steps
+
+    def should_build_step(self, handle: NodeHandle) -> bool:
+        return not self._scoped or handle.to_string() in self._solid_handles_to_build
+
+    def build_step(
+        self, solid: Node, handle: NodeHandle, step_inputs: List[StepInput]
+    ) -> ExecutionStep:
+        return ExecutionStep(
+            handle=StepHandle(solid_handle=handle),
+            pipeline_name=self.pipeline_name,
+            step_inputs=step_inputs,
+            step_outputs=create_step_outputs(solid, handle, self.resolved_run_config),
+            tags=solid.tags,
+        )
+
+    def build_deferred_upstream_steps(self) -> Set[str]:
+        """Builds the deferred steps that produce the inputs of the steps selected for execution.
+
+        Returns the solid handles of the selected steps and of every step they need, following
+        unresolved steps back to the steps that resolve them.
+        """
+        needed = set(self._solid_handles_to_build)
+        to_visit = list(needed)
+        while to_visit:
+            step = self._steps.get(to_visit.pop())
+            if isinstance(step, ExecutionStep):
+                upstream_keys = step.get_execution_dependency_keys()
+            elif isinstance(step, (UnresolvedMappedExecutionStep, UnresolvedCollectExecutionStep)):
+                upstream_keys = step.get_all_dependency_keys() | step.resolved_by_step_keys
+            else:
+                continue
+
+            for upstream_key in upstream_keys:
+                upstream_handle = StepHandle.parse_from_key(upstream_key).solid_handle.to_string()
+                if upstream_handle in needed:
+                    continue
+
+                needed.add(upstream_handle)
+                if upstream_handle in self._deferred_steps:
+                    # a plain upstream step only has to provide its outputs, so its own upstream
+                    # steps are not needed
+                    self.add_step(self.build_step(*self._deferred_steps.pop(upstream_handle)))
+                else:
+                    to_visit.append(upstream_handle)
+
+        return needed
+
     def get_step_by_solid_handle(self, handle: NodeHandle) -> IExecutionStep:
         check.inst_param(handle, "handle", NodeHandle)
         return self._steps[handle.to_string()]
@@ -202,6 +279,16 @@ def build(self) -> "ExecutionPlan":
         step_dict_by_key = {step.key: step for step in self._steps.values()}
         step_handles_to_execute = [step.handle for step in self._steps.values()]
 
+        if self._scoped:
+            needed = self.build_deferred_upstream_steps()
+            step_dict = {step.handle: step for step in self._steps.values()}
+            step_dict_by_key = {step.key: step for step in self._steps.values()}
+            # unresolved steps are always built, but the ones that are not needed may depend on
+            # steps that were deferred, so they are left out of execution
+            step_handles_to_execute = [
+                step.handle for solid_handle, step in self._steps.items() if solid_handle in needed
+            ]
+
         executable_map, resolvable_map = _compute_step_maps(
             step_dict,
             step_dict_by_key,
@@ -218,7 +305,10 @@ def build(self) -> "ExecutionPlan":
             resolvable_map,
             step_handles_to_execute,
             self.known_state,
-            _compute_artifacts_persisted(
+            # a scoped plan is missing the upstream steps of the steps it does not select, and is
+            # always subset below, which computes this from the selected steps alone
+            not self._scoped
+            and _compute_artifacts_persisted(
                 step_dict,
                 step_dict_by_key,
                 step_handles_to_execute,
@@ -320,19 +410,18 @@ def _build_from_sorted_solids(
             ### 2a. COMPUTE FUNCTION
             # Create and add execution plan step for the solid compute function
             if isinstance(solid.definition, SolidDefinition):
-                step_outputs = create_step_outputs(solid, handle, self.resolved_run_config)
-
+                new_step: Optional[IExecutionStep]
                 if has_pending_input and has_unresolved_input:
                     check.failed("Can not have pending and unresolved step inputs")
 
                 elif has_unresolved_input:
-                    new_step: IExecutionStep = UnresolvedMappedExecutionStep(
+                    new_step = UnresolvedMappedExecutionStep(
                         handle=UnresolvedStepHandle(solid_handle=handle),
                         pipeline_name=self.pipeline_name,
                         step_inputs=cast(
                             List[Union[StepInput, UnresolvedMappedStepInput]], step_inputs
                         ),
-                        step_outputs=step_outputs,
+                        step_outputs=create_step_outputs(solid, handle, self.resolved_run_config),
                         tags=solid.tags,
                     )
                 elif has_pending_input:
@@ -342,19 +431,17 @@ def _build_from_sorted_solids(
                         step_inputs=cast(
                             List[Union[StepInput, UnresolvedCollectStepInput]], step_inputs
                         ),
-                        step_outputs=step_outputs,
+                        step_outputs=create_step_outputs(solid, handle, self.resolved_run_config),
                         tags=solid.tags,
                     )
+                elif self.should_build_step(handle):
+                    new_step = self.build_step(solid, handle, cast(List[StepInput], step_inputs))
                 else:
-                    new_step = ExecutionStep(
-                        handle=StepHandle(solid_handle=handle),
-                        pipeline_name=self.pipeline_name,
-                        step_inputs=cast(List[StepInput], step_inputs),
-                        step_outputs=step_outputs,
-                        tags=solid.tags,
-                    )
+                    self.defer_step(solid, handle, cast(List[StepInput], step_inputs))
+                    new_step = None
 
-                self.add_step(new_step)
+                if new_step is not None:
+                    self.add_step(new_step)
 
             ### 2b. RECURSE
             # Recurse over the solids contained in an instance of GraphDefinition
@@ -384,6 +471,14 @@ def _build_from_sorted_solids(
                 resolved_output_def, resolved_handle = solid.definition.resolve_output_to_origin(
                     output_def.name, handle
                 )
+                if self.is_step_deferred(resolved_handle):
+                    # deferred steps are always ExecutionSteps, keyed by their solid handle
+                    self.set_output_handle(
+                        output_handle,
+                        StepOutputHandle(resolved_handle.to_string(), resolved_output_def.name),
+                    )
+                    continue
+
                 step = self.get_step_by_solid_handle(resolved_handle)
                 if isinstance(step, (ExecutionStep, UnresolvedCollectExecutionStep)):
                     step_output_handle: Union[
@@ -816,6 +911,50 @@ def build_subset_plan(
             executor_name=self.executor_name,
         )
 
+    def build_step_fragment(
+        self,
+        step_keys_to_execute: List[str],
+        known_state: Optional[KnownExecutionState] = None,
+    ) -> "ExecutionPlan":
+        """Builds a plan that holds only the given executable steps and the steps that produce their
+        inputs, for handing off to a process that executes just those steps.
+
+        Unlike build_subset_plan, the fragment does not carry the rest of the plan, so it is cheap
+        to serialize and to rebuild from its snapshot. Its outputs are a subset of this plan's, so
+        it keeps this plan's artifacts_persisted.
+        """
+        check.list_param(step_keys_to_execute, "step_keys_to_execute", of_type=str)
+        check.opt_inst_param(known_state, "known_state", KnownExecutionState)
+
+        step_dict: Dict[StepHandleUnion, IExecutionStep] = {}
+        step_handles_to_execute = []
+        for step_key in step_keys_to_execute:
+            step = self.get_executable_step_by_key(step_key)
+            step_handles_to_execute.append(step.handle)
+            step_dict[step.handle] = step
+            for upstream_key in step.get_execution_dependency_keys():
+                upstream_step = self.get_step_by_key(upstream_key)
+                step_dict[upstream_step.handle] = upstream_step
+
+        step_dict_by_key = {step.key: step for step in step_dict.values()}
+        known_state = known_state or self.known_state
+        executable_map, resolvable_map = _compute_step_maps(
+            step_dict,
+            step_dict_by_key,
+            step_handles_to_execute,
+            known_state,
+        )
+
+        return ExecutionPlan(
+            step_dict,
+            executable_map,
+            resolvable_map,
+            step_handles_to_execute,
+            known_state,
+            self.artifacts_persisted,
+            executor_name=self.executor_name,
+        )
+
     def get_version_for_step_output_handle(
         self, step_output_handle: StepOutputHandle
     ) -> Optional[str]:
@@ -883,7 +1022,12 @@ def build_memoized_plan(
             resource_config=resource_config,
             log_manager=log_manager,
         ) as resources:
+            # check the outputs of each io manager in a single batch
+            handles_by_io_manager_key: Dict[str, List[StepOutputHandle]] = defaultdict(list)
             for step_output_handle, io_manager_key in io_manager_keys.items():
+                handles_by_io_manager_key[io_manager_key].append(step_output_handle)
+
+            for io_manager_key, step_output_handles in handles_by_io_manager_key.items():
                 io_manager = getattr(resources, io_manager_key)
                 if not isinstance(io_manager, MemoizableIOManager):
                     raise DagsterInvariantViolationError(
@@ -893,19 +1037,25 @@ def build_memoized_plan(
                         "Learn more about MemoizableIOManagers here: "
                         "https://docs.dagster.io/_apidocs/internals#memoizable-io-manager-experimental."
                     )
-                context = get_output_context(
-                    execution_plan=self,
-                    pipeline_def=pipeline_def,
-                    resolved_run_config=resolved_run_config,
-                    step_output_handle=step_output_handle,
-                    run_id=None,
-                    log_manager=log_manager,
-                    step_context=None,
-                    resources=resources,
-                    version=step_output_versions[step_output_handle],
-                )
-                if not io_manager.has_output(context):
-                    unmemoized_step_keys.add(step_output_handle.step_key)
+                contexts = [
+                    get_output_context(
+                        execution_plan=self,
+                        pipeline_def=pipeline_def,
+                        resolved_run_config=resolved_run_config,
+                        step_output_handle=step_output_handle,
+                        run_id=None,
+                        log_manager=log_manager,
+                        step_context=None,
+                        resources=resources,
+                        version=step_output_versions[step_output_handle],
+                    )
+                    for step_output_handle in step_output_handles
+                ]
+                for step_output_handle, has_output in zip(
+                    step_output_handles, io_manager.has_outputs(contexts)
+                ):
+                    if not has_output:
+                        unmemoized_step_keys.add(step_output_handle.step_key)
 
         return self.build_subset_plan(
             list(unmemoized_step_keys),
@@ -955,6 +1105,7 @@ def build(
         known_state=None,
         instance_ref=None,
         tags=None,
+        scoped=False,
     ) -> "ExecutionPlan":
         """Here we build a new ExecutionPlan from a pipeline definition and the resolved run config.
 
@@ -963,6 +1114,9 @@ def build(
 
         Once we've processed the entire pipeline, we invoke _PlanBuilder.build() to construct the
         ExecutionPlan object.
+
+        If scoped is set along with step_keys_to_execute, only the selected steps and the steps
+        producing their inputs are built. This is meant for workers that execute a single step.
         """
         check.inst_param(pipeline, "pipeline", IPipeline)
         check.inst_param(resolved_run_config, "resolved_run_config", ResolvedRunConfig)
@@ -977,6 +1131,7 @@ def build(
             known_state=known_state,
             instance_ref=instance_ref,
             tags=tags,
+            scoped=scoped,
         )
 
         # Finally, we build and return the execution plan
@@ -0,0 +1,30 @@
+import asyncio
+import threading
+from contextlib import contextmanager
+
+from dagster import check
+
+from .threaded import ThreadedExecutor
+
+
+class AsyncInProcessExecutor(ThreadedExecutor):
+    def __init__(self, retries, max_concurrent):
+        check.int_param(max_concurrent, "max_concurrent")
+        check.invariant(max_concurrent > 0, "max_concurrent must be a positive integer")
+        super(AsyncInProcessExecutor, self).__init__(retries, max_concurrent)
+
+    @contextmanager
+    def event_loop(self):
+        # async compute functions of all steps run on this loop, while the rest of each step
+        # (loading inputs, type checks, handling outputs and any sync compute) runs on a thread
+        loop = asyncio.new_event_loop()
+        loop_thread = threading.Thread(
+            target=loop.run_forever, name="async-in-process-executor", daemon=True
+        )
+        loop_thread.start()
+        try:
+            yield loop
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            loop_thread.join()
+            loop.close()
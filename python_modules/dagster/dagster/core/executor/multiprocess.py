@@ -17,6 +17,8 @@
 from dagster.core.execution.retries import RetryMode
 from dagster.core.executor.base import Executor
 from dagster.core.instance import DagsterInstance
+from dagster.core.snap.execution_plan_snapshot import snapshot_from_execution_plan
+from dagster.core.storage.tags import MEMOIZED_RUN_TAG
 from dagster.utils import start_termination_thread
 from dagster.utils.error import serializable_error_info_from_exc_info
 from dagster.utils.timing import format_duration, time_execution_scope
@@ -43,6 +45,7 @@ def __init__(
         recon_pipeline,
         retry_mode,
         known_state,
+        execution_plan_snapshot=None,
     ):
         self.run_config = run_config
         self.pipeline_run = pipeline_run
@@ -52,18 +55,25 @@ def __init__(
         self.recon_pipeline = recon_pipeline
         self.retry_mode = retry_mode
         self.known_state = known_state
+        self.execution_plan_snapshot = execution_plan_snapshot
 
     def execute(self):
         pipeline = self.recon_pipeline
         with DagsterInstance.from_ref(self.instance_ref) as instance:
             start_termination_thread(self.term_event)
-            execution_plan = create_execution_plan(
-                pipeline=pipeline,
-                run_config=self.run_config,
-                mode=self.pipeline_run.mode,
-                step_keys_to_execute=[self.step_key],
-                known_state=self.known_state,
-            )
+            if self.execution_plan_snapshot:
+                execution_plan = ExecutionPlan.rebuild_from_snapshot(
+                    self.pipeline_run.pipeline_name, self.execution_plan_snapshot
+                )
+            else:
+                execution_plan = create_execution_plan(
+                    pipeline=pipeline,
+                    run_config=self.run_config,
+                    mode=self.pipeline_run.mode,
+                    step_keys_to_execute=[self.step_key],
+                    known_state=self.known_state,
+                    scoped=True,
+                )
 
             yield instance.report_engine_event(
                 "Executing step {} in subprocess".format(self.step_key),
@@ -191,6 +201,7 @@ def execute(self, plan_context, execution_plan):
 
                         for step in steps:
                             step_context = plan_context.for_step(step)
+                            known_state = active_execution.get_known_state()
                             term_events[step.key] = multiproc_ctx.Event()
                             active_iters[step.key] = execute_step_out_of_process(
                                 multiproc_ctx,
@@ -200,7 +211,10 @@ def execute(self, plan_context, execution_plan):
                                 errors,
                                 term_events,
                                 self.retries,
-                                active_execution.get_known_state(),
+                                known_state,
+                                _get_execution_plan_snapshot(
+                                    plan_context, execution_plan, step, known_state
+                                ),
                             )
 
                     # process active iterators
@@ -292,6 +306,26 @@ def execute(self, plan_context, execution_plan):
         )
 
 
+def _get_execution_plan_snapshot(plan_context, execution_plan, step, known_state):
+    # hand the child process the plan fragment for its step, so that it does not have to build the
+    # full plan again
+    pipeline_snapshot_id = plan_context.pipeline_run.pipeline_snapshot_id
+    if pipeline_snapshot_id is None:
+        return None
+
+    # memoized runs resolve versions from every step in the plan, so the child process builds the
+    # full plan itself
+    pipeline_def = plan_context.pipeline.get_definition()
+    if MEMOIZED_RUN_TAG in pipeline_def.tags or pipeline_def.is_using_memoization(
+        plan_context.pipeline_run.tags
+    ):
+        return None
+
+    return snapshot_from_execution_plan(
+        execution_plan.build_step_fragment([step.key], known_state), pipeline_snapshot_id
+    )
+
+
 def execute_step_out_of_process(
     multiproc_ctx,
     pipeline,
@@ -301,6 +335,7 @@ def execute_step_out_of_process(
     term_events,
     retries,
     known_state,
+    execution_plan_snapshot=None,
 ):
     command = MultiprocessExecutorChildProcessCommand(
         run_config=step_context.run_config,
@@ -311,6 +346,7 @@ def execute_step_out_of_process(
         recon_pipeline=pipeline,
         retry_mode=retries,
         known_state=known_state,
+        execution_plan_snapshot=execution_plan_snapshot,
     )
 
     yield DagsterEvent.engine_event(
@@ -16,6 +16,11 @@
 from dagster.core.execution.plan.step import ExecutionStep
 from dagster.core.execution.retries import RetryMode
 from dagster.core.executor.step_delegating.step_handler.base import StepHandler, StepHandlerContext
+from dagster.core.snap.execution_plan_snapshot import (
+    ExecutionPlanSnapshot,
+    snapshot_from_execution_plan,
+)
+from dagster.core.storage.tags import MEMOIZED_RUN_TAG
 from dagster.grpc.types import ExecuteStepArgs
 
 from ..base import Executor
@@ -54,19 +59,44 @@ def _pop_events(self, instance, run_id) -> List[DagsterEvent]:
         check.invariant(None not in dagster_events, "Query should not return a non dagster event")
         return dagster_events
 
+    def _get_execution_plan_snapshot(
+        self, plan_context, step_keys, active_execution, known_state
+    ) -> Optional[ExecutionPlanSnapshot]:
+        # ship the steps along with the plan fragment they need, so that the worker does not have to
+        # build the full plan to execute them
+        pipeline_snapshot_id = plan_context.pipeline_run.pipeline_snapshot_id
+        if pipeline_snapshot_id is None:
+            return None
+
+        # memoized runs resolve versions from every step in the plan, so the worker builds the
+        # full plan itself
+        pipeline_def = plan_context.pipeline.get_definition()
+        if MEMOIZED_RUN_TAG in pipeline_def.tags or pipeline_def.is_using_memoization(
+            plan_context.pipeline_run.tags
+        ):
+            return None
+
+        fragment = active_execution.plan.build_step_fragment(step_keys, known_state)
+        return snapshot_from_execution_plan(fragment, pipeline_snapshot_id)
+
     def _get_step_handler_context(
         self, plan_context, steps, active_execution
     ) -> StepHandlerContext:
+        step_keys = [step.key for step in steps]
+        known_state = active_execution.get_known_state()
         return StepHandlerContext(
             instance=plan_context.plan_data.instance,
             execute_step_args=ExecuteStepArgs(
                 pipeline_origin=plan_context.reconstructable_pipeline.get_python_origin(),
                 pipeline_run_id=plan_context.pipeline_run.run_id,
-                step_keys_to_execute=[step.key for step in steps],
+                step_keys_to_execute=step_keys,
                 instance_ref=plan_context.plan_data.instance.get_ref(),
                 retry_mode=self.retries.for_inner_plan(),
-                known_state=active_execution.get_known_state(),
+                known_state=known_state,
                 should_verify_step=self._should_verify_step,
+                execution_plan_snapshot=self._get_execution_plan_snapshot(
+                    plan_context, step_keys, active_execution, known_state
+                ),
             ),
             step_tags={step.key: step.tags for step in steps},
             pipeline_run=plan_context.pipeline_run,
@@ -0,0 +1,83 @@
+import multiprocessing
+import os
+from contextlib import contextmanager
+from functools import partial
+
+from dagster import check
+from dagster.core.events import DagsterEvent, EngineEventData
+from dagster.core.execution.api import ExecuteRunWithPlanIterable
+from dagster.core.execution.context.system import PlanOrchestrationContext
+from dagster.core.execution.context_creation_pipeline import PlanExecutionContextManager
+from dagster.core.execution.plan.execute_plan import concurrent_plan_execution_iterator
+from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.retries import RetryMode
+from dagster.utils.timing import format_duration, time_execution_scope
+
+from .base import Executor
+
+
+class ThreadedExecutor(Executor):
+    def __init__(self, retries, max_concurrent):
+        self._retries = check.inst_param(retries, "retries", RetryMode)
+        max_concurrent = max_concurrent if max_concurrent else multiprocessing.cpu_count()
+        self._max_concurrent = check.int_param(max_concurrent, "max_concurrent")
+        check.invariant(self._max_concurrent > 0, "max_concurrent must be a positive integer")
+
+    @property
+    def retries(self):
+        return self._retries
+
+    @property
+    def max_concurrent(self):
+        return self._max_concurrent
+
+    @contextmanager
+    def event_loop(self):
+        """The event loop that the async compute functions of all steps are scheduled on, if any.
+        Otherwise each step runs its async compute function on a loop of its own."""
+        yield None
+
+    def execute(self, plan_context, execution_plan):
+        check.inst_param(plan_context, "plan_context", PlanOrchestrationContext)
+        check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+
+        step_keys_to_execute = execution_plan.step_keys_to_execute
+
+        yield DagsterEvent.engine_event(
+            plan_context,
+            "Executing steps in process (pid: {pid}) on up to {max_concurrent} threads".format(
+                pid=os.getpid(), max_concurrent=self._max_concurrent
+            ),
+            event_specific_data=EngineEventData.in_process(os.getpid(), step_keys_to_execute),
+        )
+
+        with time_execution_scope() as timer_result:
+            with self.event_loop() as loop:
+                yield from iter(
+                    ExecuteRunWithPlanIterable(
+                        execution_plan=plan_context.execution_plan,
+                        iterator=partial(
+                            concurrent_plan_execution_iterator,
+                            max_concurrent=self._max_concurrent,
+                            event_loop=loop,
+                        ),
+                        execution_context_manager=PlanExecutionContextManager(
+                            pipeline=plan_context.pipeline,
+                            retry_mode=plan_context.retry_mode,
+                            execution_plan=plan_context.execution_plan,
+                            run_config=plan_context.run_config,
+                            pipeline_run=plan_context.pipeline_run,
+                            instance=plan_context.instance,
+                            raise_on_error=plan_context.raise_on_error,
+                            output_capture=plan_context.output_capture,
+                        ),
+                    )
+                )
+
+        yield DagsterEvent.engine_event(
+            plan_context,
+            "Finished steps in process (pid: {pid}) in {duration_ms}".format(
+                pid=os.getpid(), duration_ms=format_duration(timer_result.millis)
+            ),
+            event_specific_data=EngineEventData.in_process(os.getpid(), step_keys_to_execute),
+        )
@@ -1,5 +1,6 @@
 import warnings
 from collections import OrderedDict
+from copy import copy
 from typing import TYPE_CHECKING, List, Optional, Sequence, Union
 
 from dagster import check
@@ -89,6 +90,14 @@ def __init__(
     def name(self):
         return self.external_repository_data.name
 
+    def with_repository_handle(self, repository_handle: RepositoryHandle) -> "ExternalRepository":
+        """A copy of this ExternalRepository for a new handle to the same repository data, sharing
+        the indexes that were already built for it."""
+        check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
+        external_repository = copy(self)
+        external_repository._handle = repository_handle  # pylint: disable=protected-access
+        return external_repository
+
     def get_pipeline_index(self, pipeline_name):
         return self._pipeline_index_map[pipeline_name]
 
@@ -3,7 +3,7 @@
 import uuid
 from abc import abstractmethod
 from contextlib import AbstractContextManager
-from typing import Generic, NamedTuple, Optional, TypeVar, Union, cast
+from typing import Dict, Generic, NamedTuple, Optional, TypeVar, Union, cast
 
 import pendulum
 
@@ -123,8 +123,13 @@ def __init__(
         self._heartbeat_ttl = check.int_param(heartbeat_ttl, "heartbeat_ttl")
         self._startup_timeout = check.int_param(startup_timeout, "startup_timeout")
 
+        # Guards _active_entries, _all_processes and _origin_locks
         self._lock = threading.Lock()
 
+        # Serializes server creation for each origin, so that servers for different origins can
+        # start up concurrently without ever creating two servers for the same origin
+        self._origin_locks: Dict[str, threading.Lock] = {}
+
         self._all_processes = []
 
         self._cleanup_thread_shutdown_event = None
@@ -154,12 +159,13 @@ def reload_grpc_endpoint(
         check.inst_param(
             repository_location_origin, "repository_location_origin", RepositoryLocationOrigin
         )
-        with self._lock:
-            origin_id = repository_location_origin.get_id()
-            if origin_id in self._active_entries:
-                # Free the map entry for this origin so that _get_grpc_endpoint will create
-                # a new process
-                del self._active_entries[origin_id]
+        origin_id = repository_location_origin.get_id()
+        with self._get_origin_lock(origin_id):
+            with self._lock:
+                if origin_id in self._active_entries:
+                    # Free the map entry for this origin so that _get_grpc_endpoint will create
+                    # a new process
+                    del self._active_entries[origin_id]
 
             return self._get_grpc_endpoint(repository_location_origin)
 
@@ -170,9 +176,15 @@ def get_grpc_endpoint(
             repository_location_origin, "repository_location_origin", RepositoryLocationOrigin
         )
 
-        with self._lock:
+        with self._get_origin_lock(repository_location_origin.get_id()):
             return self._get_grpc_endpoint(repository_location_origin)
 
+    def _get_origin_lock(self, origin_id: str) -> threading.Lock:
+        with self._lock:
+            if origin_id not in self._origin_locks:
+                self._origin_locks[origin_id] = threading.Lock()
+            return self._origin_locks[origin_id]
+
     def _get_loadable_target_origin(
         self, repository_location_origin: ManagedGrpcPythonEnvRepositoryLocationOrigin
     ):
@@ -186,6 +198,8 @@ def _get_loadable_target_origin(
     def _get_grpc_endpoint(
         self, repository_location_origin: ManagedGrpcPythonEnvRepositoryLocationOrigin
     ) -> GrpcServerEndpoint:
+        # Must be called while holding the lock for this origin. The registry-wide lock is only
+        # held while reading and writing the registry state, not while a server is starting up.
         origin_id = repository_location_origin.get_id()
         loadable_target_origin = self._get_loadable_target_origin(repository_location_origin)
         if not loadable_target_origin:
@@ -193,15 +207,12 @@ def _get_grpc_endpoint(
                 f"No Python file/module information available for location {repository_location_origin.location_name}"
             )
 
-        if not origin_id in self._active_entries:
-            refresh_server = True
-        else:
-            active_entry = self._active_entries[origin_id]
-            refresh_server = loadable_target_origin != active_entry.loadable_target_origin
+        with self._lock:
+            active_entry = self._active_entries.get(origin_id)
 
-        server_process: Union[GrpcServerProcess, SerializableErrorInfo]
-        new_server_id: Optional[str]
-        if refresh_server:
+        if active_entry is None or loadable_target_origin != active_entry.loadable_target_origin:
+            server_process: Union[GrpcServerProcess, SerializableErrorInfo]
+            new_server_id: Optional[str]
             try:
                 new_server_id = str(uuid.uuid4())
                 server_process = GrpcServerProcess(
@@ -211,19 +222,20 @@ def _get_grpc_endpoint(
                     fixed_server_id=new_server_id,
                     startup_timeout=self._startup_timeout,
                 )
-                self._all_processes.append(server_process)
             except Exception:
                 server_process = serializable_error_info_from_exc_info(sys.exc_info())
                 new_server_id = None
 
-            self._active_entries[origin_id] = ProcessRegistryEntry(
+            active_entry = ProcessRegistryEntry(
                 process_or_error=server_process,
                 loadable_target_origin=loadable_target_origin,
                 creation_timestamp=pendulum.now("UTC").timestamp(),
                 server_id=new_server_id,
             )
-
-        active_entry = self._active_entries[origin_id]
+            with self._lock:
+                if isinstance(server_process, GrpcServerProcess):
+                    self._all_processes.append(server_process)
+                self._active_entries[origin_id] = active_entry
 
         if isinstance(active_entry.process_or_error, SerializableErrorInfo):
             raise DagsterUserCodeProcessError(
@@ -16,7 +16,9 @@
     sync_get_external_partition_tags_grpc,
 )
 from dagster.api.snapshot_pipeline import sync_get_external_pipeline_subset_grpc
-from dagster.api.snapshot_repository import sync_get_streaming_external_repositories_data_grpc
+from dagster.api.snapshot_repository import (
+    sync_get_streaming_serialized_external_repositories_data_grpc,
+)
 from dagster.api.snapshot_schedule import sync_get_external_schedule_execution_data_grpc
 from dagster.api.snapshot_sensor import sync_get_external_sensor_execution_data_grpc
 from dagster.core.code_pointer import CodePointer
@@ -30,6 +32,7 @@
     ExternalPipeline,
     ExternalRepository,
 )
+from dagster.core.host_representation.external_data import ExternalRepositoryData
 from dagster.core.host_representation.grpc_server_registry import GrpcServerRegistry
 from dagster.core.host_representation.handle import PipelineHandle, RepositoryHandle
 from dagster.core.host_representation.origin import (
@@ -51,6 +54,7 @@
 )
 from dagster.grpc.types import GetCurrentImageResult
 from dagster.serdes import deserialize_as
+from dagster.serdes.utils import hash_str
 from dagster.seven.compat.pendulum import PendulumDateTime
 from dagster.utils import merge_dicts
 from dagster.utils.hosted_user_process import external_repo_from_def
@@ -488,10 +492,12 @@ def __init__(
         heartbeat: Optional[bool] = False,
         watch_server: Optional[bool] = True,
         grpc_server_registry: Optional[GrpcServerRegistry] = None,
+        previous_location: Optional["GrpcServerRepositoryLocation"] = None,
     ):
         from dagster.grpc.client import DagsterGrpcClient, client_heartbeat_thread
 
         self._origin = check.inst_param(origin, "origin", RepositoryLocationOrigin)
+        check.opt_inst_param(previous_location, "previous_location", GrpcServerRepositoryLocation)
 
         self.grpc_server_registry = check.opt_inst_param(
             grpc_server_registry, "grpc_server_registry", GrpcServerRegistry
@@ -514,11 +520,16 @@ def __init__(
         self._heartbeat_shutdown_event = None
         self._heartbeat_thread = None
 
+        # A location that finished loading after it timed out may be cleaned up by the loader
+        # while the workspace that owned it cleans it up too
+        self._cleanup_lock = threading.Lock()
+        self._cleaned_up = False
+
         self._heartbeat = check.bool_param(heartbeat, "heartbeat")
         self._watch_server = check.bool_param(watch_server, "watch_server")
 
         self.server_id = None
-        self._external_repositories_data = None
+        self._repository_snapshot_ids: Dict[str, str] = {}
 
         self._executable_path = None
         self._container_image = None
@@ -561,21 +572,33 @@ def __init__(
 
             self._container_image = self._reload_current_image()
 
-            self._external_repositories_data = sync_get_streaming_external_repositories_data_grpc(
-                self.client,
-                self,
+            serialized_repository_datas = (
+                sync_get_streaming_serialized_external_repositories_data_grpc(self.client, self)
             )
 
-            self.external_repositories = {
-                repo_name: ExternalRepository(
-                    repo_data,
-                    RepositoryHandle(
-                        repository_name=repo_name,
-                        repository_location=self,
-                    ),
+            self.external_repositories = {}
+            for repo_name, serialized_repository_data in serialized_repository_datas.items():
+                repository_handle = RepositoryHandle(
+                    repository_name=repo_name,
+                    repository_location=self,
                 )
-                for repo_name, repo_data in self._external_repositories_data.items()
-            }
+                snapshot_id = hash_str(serialized_repository_data)
+                self._repository_snapshot_ids[repo_name] = snapshot_id
+
+                if (
+                    previous_location
+                    and previous_location.get_repository_snapshot_id(repo_name) == snapshot_id
+                ):
+                    # The repository is unchanged since the previous location loaded it, so reuse
+                    # the already deserialized and indexed data
+                    self.external_repositories[repo_name] = previous_location.get_repository(
+                        repo_name
+                    ).with_repository_handle(repository_handle)
+                else:
+                    self.external_repositories[repo_name] = ExternalRepository(
+                        deserialize_as(serialized_repository_data, ExternalRepositoryData),
+                        repository_handle,
+                    )
         except:
             self.cleanup()
             raise
@@ -623,6 +646,11 @@ def _reload_current_image(self) -> Optional[str]:
         ).current_image
 
     def cleanup(self) -> None:
+        with self._cleanup_lock:
+            if self._cleaned_up:
+                return
+            self._cleaned_up = True
+
         if self._heartbeat_shutdown_event:
             self._heartbeat_shutdown_event.set()
             self._heartbeat_shutdown_event = None
@@ -643,6 +671,15 @@ def cleanup(self) -> None:
     def is_reload_supported(self) -> bool:
         return True
 
+    def get_repository_snapshot_id(self, name: str) -> Optional[str]:
+        """A hash of the serialized data for the given repository, as it was loaded from the
+        server. Used to tell whether the repository changed between loads of this location."""
+        check.str_param(name, "name")
+        return self._repository_snapshot_ids.get(name)
+
+    def get_current_server_id(self) -> str:
+        return sync_get_server_id(self.client)
+
     def get_repository(self, name: str) -> ExternalRepository:
         check.str_param(name, "name")
         return self.get_repositories()[name]
@@ -3,10 +3,11 @@
 import logging.config
 import os
 import sys
+import threading
 import time
 import warnings
 import weakref
-from collections import defaultdict
+from collections import OrderedDict, defaultdict, deque
 from contextlib import ExitStack
 from enum import Enum
 from tempfile import TemporaryDirectory
@@ -14,6 +15,7 @@
     TYPE_CHECKING,
     Any,
     Callable,
+    Deque,
     Dict,
     Iterable,
     List,
@@ -64,9 +66,10 @@
 from .config import (
     DAGSTER_CONFIG_YAML_FILENAME,
     DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT,
+    DEFAULT_MAX_CONCURRENT_LOCATION_LOADS,
     is_dagster_home_set,
 )
-from .ref import InstanceRef
+from .ref import InstanceRef, configurable_class_data
 
 # 'airflow_execution_date' and 'is_airflow_ingest_pipeline' are hardcoded tags used in the
 # airflow ingestion logic (see: dagster_pipeline_factory.py). 'airflow_execution_date' stores the
@@ -78,6 +81,7 @@
 
 if TYPE_CHECKING:
     from dagster.core.debug import DebugRunPayload
+    from dagster.core.definitions.run_request import InstigatorType
     from dagster.core.events import DagsterEvent, DagsterEventType
     from dagster.core.events.log import EventLogEntry
     from dagster.core.execution.stats import RunStepKeyStatsSnapshot
@@ -93,7 +97,13 @@
     from dagster.core.snap import ExecutionPlanSnapshot, PipelineSnapshot
     from dagster.core.storage.compute_log_manager import ComputeLogManager
     from dagster.core.storage.event_log import EventLogStorage
-    from dagster.core.storage.event_log.base import AssetRecord, EventLogRecord, EventRecordsFilter
+    from dagster.core.storage.event_log.archive import EventLogArchive
+    from dagster.core.storage.event_log.base import (
+        AssetPartitionRecord,
+        AssetRecord,
+        EventLogRecord,
+        EventRecordsFilter,
+    )
     from dagster.core.storage.root import LocalArtifactStorage
     from dagster.core.storage.runs import RunStorage
     from dagster.core.storage.schedules import ScheduleStorage
@@ -101,6 +111,26 @@
     from dagster.daemon.types import DaemonHeartbeat
 
 
+def _filter_archived_logs(
+    events: List["EventLogEntry"],
+    cursor: int,
+    of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]],
+    limit: Optional[int],
+) -> List["EventLogEntry"]:
+    # match the semantics of the sql event log storages, which apply the cursor after the event
+    # type filter
+    if of_type:
+        event_types = {of_type} if not isinstance(of_type, (set, frozenset)) else of_type
+        events = [
+            event
+            for event in events
+            if event.is_dagster_event and event.dagster_event.event_type in event_types
+        ]
+
+    events = events[cursor + 1 :]
+    return events[:limit] if limit else events
+
+
 def _check_run_equality(
     pipeline_run: PipelineRun, candidate_run: PipelineRun
 ) -> Dict[str, Tuple[Any, Any]]:
@@ -134,25 +164,124 @@ def _format_field_diff(field_diff: Dict[str, Tuple[Any, Any]]) -> str:
     )
 
 
+# Maximum number of plain log messages waiting to be written to the event log. Loggers block until
+# the background writer catches up once this is reached.
+EVENT_LOG_WRITER_MAX_BACKLOG = 1000
+
+# Maximum number of plain log messages written to the event log storage at once
+EVENT_LOG_WRITER_MAX_BATCH_SIZE = 100
+
+# Maximum number of runs whose archived events are kept in memory after being read
+ARCHIVED_LOGS_CACHE_SIZE = 16
+
+
 class _EventListenerLogHandler(logging.Handler):
+    """Writes the records logged through a DagsterLogManager to the event log.
+
+    Dagster events are written synchronously, since they are the source of truth for the state of
+    the run. Plain log messages are handed off to a background thread that writes them in batches,
+    so that ops logging in tight loops don't wait on a storage write per message. All pending
+    messages are written before the next dagster event is, so the event log keeps the order in
+    which things were logged, and a step's messages are stored by the time its outcome is.
+    """
+
     def __init__(self, instance):
         self._instance = instance
+        self._backlog: Deque["EventLogEntry"] = deque()
+        self._backlog_condition = threading.Condition()
+        self._writer_thread: Optional[threading.Thread] = None
         super(_EventListenerLogHandler, self).__init__()
 
     def emit(self, record):
-        from dagster.core.events import EngineEventData
-        from dagster.core.events.log import StructuredLoggerMessage, construct_event_record
-
-        event = construct_event_record(
-            StructuredLoggerMessage(
-                name=record.name,
-                message=record.msg,
-                level=record.levelno,
-                meta=record.dagster_meta,
-                record=record,
-            )
+        from dagster.core.events.log import EventLogEntry
+
+        meta = record.dagster_meta
+        event = EventLogEntry(
+            level=record.levelno,
+            user_message=meta["orig_message"],
+            run_id=meta["run_id"],
+            timestamp=record.created,
+            step_key=meta.get("step_key"),
+            job_name=meta.get("pipeline_name"),
+            dagster_event=meta.get("dagster_event"),
+            error_info=None,
         )
 
+        if event.dagster_event is None and event.run_id is not None:
+            self._enqueue(event)
+        else:
+            self.flush()
+            self._write(event)
+
+    def flush(self):
+        """Block until every pending log message has been written to the event log."""
+        with self._backlog_condition:
+            if threading.current_thread() is self._writer_thread:
+                return
+
+            # a writer that stopped early may have left messages behind
+            self._start_writer_if_needed()
+            while self._is_writing():
+                self._backlog_condition.wait()
+
+    def close(self):
+        self.flush()
+        super(_EventListenerLogHandler, self).close()
+
+    def _is_writing(self) -> bool:
+        return self._writer_thread is not None and self._writer_thread.is_alive()
+
+    def _enqueue(self, event):
+        with self._backlog_condition:
+            while len(self._backlog) >= EVENT_LOG_WRITER_MAX_BACKLOG and self._is_writing():
+                self._backlog_condition.wait()
+
+            self._backlog.append(event)
+            self._start_writer_if_needed()
+
+    def _start_writer_if_needed(self):
+        # the writer exits whenever the backlog is drained, so start a new one if needed
+        if self._backlog and not self._is_writing():
+            self._writer_thread = threading.Thread(
+                target=self._write_backlog, name="dagster-event-log-writer", daemon=True
+            )
+            self._writer_thread.start()
+
+    def _write_backlog(self):
+        try:
+            while True:
+                with self._backlog_condition:
+                    if not self._backlog:
+                        self._writer_thread = None
+                        return
+
+                    batch = [
+                        self._backlog.popleft()
+                        for _ in range(min(len(self._backlog), EVENT_LOG_WRITER_MAX_BATCH_SIZE))
+                    ]
+                    self._backlog_condition.notify_all()
+
+                try:
+                    if len(batch) == 1:
+                        self._write(batch[0])
+                    else:
+                        self._write_batch(batch)
+                except Exception as e:
+                    # reporting the failure to write the batch failed as well, so the batch is
+                    # dropped and the writer moves on to the rest of the backlog
+                    sys.stderr.write(
+                        f"Exception while writing logger calls to event log: {str(e)}\n"
+                    )
+        finally:
+            # always wake the loggers waiting on the writer, even if it stopped early
+            with self._backlog_condition:
+                if self._writer_thread is threading.current_thread():
+                    self._writer_thread = None
+                self._backlog_condition.notify_all()
+
+    def _write(self, event):
+        from dagster.core.events import EngineEventData
+
         try:
             self._instance.handle_new_event(event)
         except Exception as e:
@@ -173,6 +302,22 @@ def emit(self, record):
                     ),
                 )
 
+    def _write_batch(self, events):
+        from dagster.core.events import EngineEventData
+
+        try:
+            self._instance.handle_new_events(events)
+        except Exception as e:
+            sys.stderr.write(f"Exception while writing logger calls to event log: {str(e)}\n")
+            self._instance.report_engine_event(
+                "Exception while writing logger calls to event log",
+                pipeline_name=events[0].pipeline_name,
+                run_id=events[0].run_id,
+                engine_event_data=EngineEventData(
+                    error=serializable_error_info_from_exc_info(sys.exc_info()),
+                ),
+            )
+
 
 class InstanceType(Enum):
     PERSISTENT = "PERSISTENT"
@@ -319,6 +464,11 @@ def __init__(
 
         self._subscribers: Dict[str, List[Callable]] = defaultdict(list)
 
+        self._event_log_archive: Optional["EventLogArchive"] = None
+        # archived events never change, so they are read from the archive once per run
+        self._archived_logs_cache: Dict[str, List["EventLogEntry"]] = OrderedDict()
+        self._archived_logs_cache_lock = threading.Lock()
+
         run_monitoring_enabled = self.run_monitoring_settings.get("enabled", False)
         if run_monitoring_enabled and not self.run_launcher.supports_check_run_worker_health:
             run_monitoring_enabled = False
@@ -612,6 +762,16 @@ def code_server_process_startup_timeout(self) -> int:
             "local_startup_timeout", DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT
         )
 
+    @property
+    def code_server_max_concurrent_location_loads(self) -> int:
+        return self.code_server_settings.get(
+            "max_concurrent_location_loads", DEFAULT_MAX_CONCURRENT_LOCATION_LOADS
+        )
+
+    @property
+    def code_server_location_load_timeout(self) -> Optional[int]:
+        return self.code_server_settings.get("location_load_timeout")
+
     @property
     def run_monitoring_max_resume_run_attempts(self) -> int:
         default_max_resume_run_attempts = 3 if self.run_launcher.supports_resume_run else 0
@@ -629,6 +789,68 @@ def cancellation_thread_poll_interval_seconds(self) -> int:
             "cancellation_thread_poll_interval_seconds", 10
         )
 
+    # event log retention
+
+    @property
+    def event_log_retention_settings(self) -> Dict:
+        return self.get_settings("retention").get("event_log", {})
+
+    @property
+    def event_log_retention_enabled(self) -> bool:
+        return self.event_log_retention_compact_after_days is not None
+
+    @property
+    def event_log_retention_compact_after_days(self) -> Optional[int]:
+        return self.event_log_retention_settings.get("compact_after_days")
+
+    @property
+    def event_log_retention_batch_size(self) -> int:
+        return self.event_log_retention_settings.get("batch_size", 50)
+
+    @property
+    def event_log_retention_poll_interval_seconds(self) -> int:
+        return self.event_log_retention_settings.get("poll_interval_seconds", 300)
+
+    @property
+    def event_log_archive(self) -> Optional["EventLogArchive"]:
+        if self._event_log_archive is None and self.event_log_retention_settings.get("archive"):
+            self._event_log_archive = configurable_class_data(
+                self.event_log_retention_settings["archive"]
+            ).rehydrate()
+        return self._event_log_archive
+
+    # tick retention
+
+    def _tick_retention_settings(self, instigator_type: "InstigatorType") -> Dict:
+        return self.get_settings("retention").get(instigator_type.value.lower(), {})
+
+    def get_tick_retention_purge_after_days(
+        self, instigator_type: "InstigatorType"
+    ) -> Dict["TickStatus", int]:
+        """The number of days to keep the ticks of each configured status for, or -1 to keep them
+        forever."""
+        from dagster.core.scheduler.instigation import TickStatus
+
+        purge_after_days = self._tick_retention_settings(instigator_type).get(
+            "purge_after_days", {}
+        )
+        return {TickStatus(status.upper()): days for status, days in purge_after_days.items()}
+
+    def get_tick_retention_collapse_skipped_after_days(
+        self, instigator_type: "InstigatorType"
+    ) -> Optional[int]:
+        return self._tick_retention_settings(instigator_type).get("collapse_skipped_after_days")
+
+    @property
+    def tick_retention_enabled(self) -> bool:
+        from dagster.core.definitions.run_request import InstigatorType
+
+        return any(
+            self.get_tick_retention_purge_after_days(instigator_type)
+            or self.get_tick_retention_collapse_skipped_after_days(instigator_type) is not None
+            for instigator_type in InstigatorType
+        )
+
     # python logs
 
     @property
@@ -1226,11 +1448,15 @@ def supports_bucket_queries(self):
     def wipe(self):
         self._run_storage.wipe()
         self._event_storage.wipe()
+        with self._archived_logs_cache_lock:
+            self._archived_logs_cache.clear()
 
     @traced
     def delete_run(self, run_id: str):
         self._run_storage.delete_run(run_id)
         self._event_storage.delete_events(run_id)
+        with self._archived_logs_cache_lock:
+            self._archived_logs_cache.pop(run_id, None)
 
     # event storage
     @traced
@@ -1241,6 +1467,10 @@ def logs_after(
         of_type: Optional["DagsterEventType"] = None,
         limit: Optional[int] = None,
     ):
+        archived_logs = self._get_archived_logs(run_id)
+        if archived_logs is not None:
+            return _filter_archived_logs(archived_logs, cursor, of_type, limit)
+
         return self._event_storage.get_logs_for_run(
             run_id,
             cursor=cursor,
@@ -1248,12 +1478,54 @@ def logs_after(
             limit=limit,
         )
 
+    @traced
+    def get_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[int] = None,
+        of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
+        limit: Optional[int] = None,
+    ) -> Sequence["EventLogRecord"]:
+        return self._event_storage.get_records_for_run(
+            run_id, cursor=cursor, of_type=of_type, limit=limit
+        )
+
     @traced
     def all_logs(
         self, run_id, of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None
     ):
+        archived_logs = self._get_archived_logs(run_id)
+        if archived_logs is not None:
+            return _filter_archived_logs(archived_logs, -1, of_type, None)
+
         return self._event_storage.get_logs_for_run(run_id, of_type=of_type)
 
+    def _get_archived_logs(self, run_id: str) -> Optional[List["EventLogEntry"]]:
+        """The full event log of a run whose events have been compacted by the event log retention
+        policy after being archived, or None if the event log storage has the full event log."""
+        from dagster.core.storage.tags import EVENT_LOG_ARCHIVED, EVENT_LOG_RETENTION_TAG
+
+        if not self.event_log_archive:
+            return None
+
+        with self._archived_logs_cache_lock:
+            if run_id in self._archived_logs_cache:
+                self._archived_logs_cache.move_to_end(run_id)
+                return self._archived_logs_cache[run_id]
+
+        run = self.get_run_by_id(run_id)
+        if not run or run.tags.get(EVENT_LOG_RETENTION_TAG) != EVENT_LOG_ARCHIVED:
+            return None
+
+        archived_logs = self.event_log_archive.get_archived_events(run_id)
+        if archived_logs is not None:
+            with self._archived_logs_cache_lock:
+                self._archived_logs_cache[run_id] = archived_logs
+                if len(self._archived_logs_cache) > ARCHIVED_LOGS_CACHE_SIZE:
+                    self._archived_logs_cache.popitem(last=False)
+
+        return archived_logs
+
     def watch_event_logs(self, run_id, cursor, cb):
         return self._event_storage.watch(run_id, cursor, cb)
 
@@ -1368,6 +1640,23 @@ def get_materialization_count_by_partition(
     ) -> Mapping[AssetKey, Mapping[str, int]]:
         return self._event_storage.get_materialization_count_by_partition(asset_keys)
 
+    @traced
+    def get_latest_materialization_records_by_partition(
+        self, asset_keys: Sequence[AssetKey]
+    ) -> Mapping[AssetKey, Mapping[str, "AssetPartitionRecord"]]:
+        return self._event_storage.get_latest_materialization_records_by_partition(asset_keys)
+
+    @traced
+    def get_partitions_missing_since(
+        self,
+        asset_key: AssetKey,
+        since_timestamp: float,
+        partitions: Optional[Sequence[str]] = None,
+    ) -> Sequence[str]:
+        return self._event_storage.get_partitions_missing_since(
+            asset_key, since_timestamp, partitions
+        )
+
     # event subscriptions
 
     def _get_yaml_python_handlers(self):
@@ -1421,6 +1710,16 @@ def handle_new_event(self, event):
         for sub in self._subscribers[run_id]:
             sub(event)
 
+    def handle_new_events(self, events):
+        self._event_storage.store_events(events)
+
+        for event in events:
+            if event.is_dagster_event and event.dagster_event.is_pipeline_event:
+                self._run_storage.handle_run_event(event.run_id, event.dagster_event)
+
+            for sub in self._subscribers[event.run_id]:
+                sub(event)
+
     def add_event_listener(self, run_id, cb):
         self._subscribers[run_id].append(cb)
 
@@ -1912,8 +2211,15 @@ def create_tick(self, tick_data):
     def update_tick(self, tick):
         return self._schedule_storage.update_tick(tick)
 
-    def purge_ticks(self, origin_id, selector_id, tick_status, before):
-        self._schedule_storage.purge_ticks(origin_id, selector_id, tick_status, before)
+    def purge_ticks(self, origin_id, selector_id, tick_status, before, limit=None):
+        return self._schedule_storage.purge_ticks(
+            origin_id, selector_id, tick_status, before, limit=limit
+        )
+
+    def collapse_skipped_ticks(self, origin_id, selector_id, before, after=None, limit=None):
+        return self._schedule_storage.collapse_skipped_ticks(
+            origin_id, selector_id, before, after=after, limit=limit
+        )
 
     def wipe_all_schedules(self):
         if self._scheduler:
@@ -1964,9 +2270,11 @@ def get_required_daemon_types(self):
         from dagster.core.scheduler import DagsterDaemonScheduler
         from dagster.daemon.daemon import (
             BackfillDaemon,
+            EventLogRetentionDaemon,
             MonitoringDaemon,
             SchedulerDaemon,
             SensorDaemon,
+            TickRetentionDaemon,
         )
         from dagster.daemon.run_coordinator.queued_run_coordinator_daemon import (
             QueuedRunCoordinatorDaemon,
@@ -1982,6 +2290,10 @@ def get_required_daemon_types(self):
             daemons.append(QueuedRunCoordinatorDaemon.daemon_type())
         if self.run_monitoring_enabled:
             daemons.append(MonitoringDaemon.daemon_type())
+        if self.event_log_retention_enabled:
+            daemons.append(EventLogRetentionDaemon.daemon_type())
+        if self.tick_retention_enabled:
+            daemons.append(TickRetentionDaemon.daemon_type())
         return daemons
 
     # backfill
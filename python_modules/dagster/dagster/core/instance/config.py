@@ -97,8 +97,29 @@ def python_logs_config_schema():
     )
 
 
+def tick_retention_config_schema():
+    return Field(
+        {
+            # days to keep the ticks of each status for, or -1 to keep them forever
+            "purge_after_days": Field(
+                {
+                    "skipped": Field(int, is_required=False),
+                    "success": Field(int, is_required=False),
+                    "failure": Field(int, is_required=False),
+                    "started": Field(int, is_required=False),
+                },
+                is_required=False,
+            ),
+            "collapse_skipped_after_days": Field(int, is_required=False),
+        },
+        is_required=False,
+    )
+
+
 DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT = 60
 
+DEFAULT_MAX_CONCURRENT_LOCATION_LOADS = 8
+
 
 def dagster_instance_config_schema():
     return {
@@ -131,7 +152,27 @@ def dagster_instance_config_schema():
             },
         ),
         "code_servers": Field(
-            {"local_startup_timeout": Field(int, is_required=False)},
+            {
+                "local_startup_timeout": Field(int, is_required=False),
+                "max_concurrent_location_loads": Field(int, is_required=False),
+                "location_load_timeout": Field(int, is_required=False),
+            },
+            is_required=False,
+        ),
+        "retention": Field(
+            {
+                "schedule": tick_retention_config_schema(),
+                "sensor": tick_retention_config_schema(),
+                "event_log": Field(
+                    {
+                        "compact_after_days": Field(int, is_required=False),
+                        "archive": config_field_for_configurable_class(),
+                        "batch_size": Field(int, is_required=False),
+                        "poll_interval_seconds": Field(int, is_required=False),
+                    },
+                    is_required=False,
+                ),
+            },
             is_required=False,
         ),
     }
@@ -1,5 +1,7 @@
 import datetime
 import logging
+import threading
+from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Union
 
 from dagster import check
@@ -155,11 +157,11 @@ def construct_log_string(
 
 
 def get_dagster_meta_dict(
-    logging_metadata: DagsterLoggingMetadata, dagster_message_props: DagsterMessageProps
+    logging_metadata_dict: Dict[str, Any], dagster_message_props: DagsterMessageProps
 ) -> Dict[str, Any]:
     # combine all dagster meta information into a single dictionary
     meta_dict = {
-        **logging_metadata._asdict(),
+        **logging_metadata_dict,
         **dagster_message_props._asdict(),
     }
     # step-level events can be logged from a pipeline context. for these cases, pull the step
@@ -170,6 +172,10 @@ def get_dagster_meta_dict(
     return meta_dict
 
 
+# The attributes of a LogRecord that were not passed through the `extra` argument of the log call
+_REFERENCE_LOG_RECORD_ATTRS = frozenset(logging.makeLogRecord({}).__dict__) | {"message", "asctime"}
+
+
 class DagsterLogHandler(logging.Handler):
     """Internal class used to turn regular logs into Dagster logs by adding Dagster-specific
     metadata (such as pipeline_name or step_key), as well as reformatting the underlying message.
@@ -187,9 +193,12 @@ def __init__(
         handlers: List[logging.Handler],
     ):
         self._logging_metadata = logging_metadata
+        # computed once per handler (i.e. per step) rather than for every logged message
+        self._logging_metadata_dict = logging_metadata._asdict()
         self._loggers = loggers
         self._handlers = handlers
-        self._should_capture = True
+        # per thread, since steps running on different threads can log through the same handler
+        self._emitting = threading.local()
         super().__init__()
 
     @property
@@ -209,8 +218,7 @@ def _extract_extra(self, record: logging.LogRecord) -> Dict[str, Any]:
         This function figures out what the original `extra` values of the log call were by
         comparing the set of attributes in the received record to those of a default record.
         """
-        ref_attrs = list(logging.makeLogRecord({}).__dict__.keys()) + ["message", "asctime"]
-        return {k: v for k, v in record.__dict__.items() if k not in ref_attrs}
+        return {k: v for k, v in record.__dict__.items() if k not in _REFERENCE_LOG_RECORD_ATTRS}
 
     def _convert_record(self, record: logging.LogRecord) -> logging.LogRecord:
         # we store the originating DagsterEvent in the DAGSTER_META_KEY field, if applicable
@@ -225,7 +233,7 @@ def _convert_record(self, record: logging.LogRecord) -> logging.LogRecord:
         setattr(
             record,
             DAGSTER_META_KEY,
-            get_dagster_meta_dict(self._logging_metadata, dagster_message_props),
+            get_dagster_meta_dict(self._logging_metadata_dict, dagster_message_props),
         )
 
         # update the message to be formatted like other dagster logs
@@ -240,7 +248,7 @@ def filter(self, record: logging.LogRecord) -> bool:
         multiple times, as the DagsterLogHandler will be invoked at each level of the hierarchy as
         the message is propagated. This filter prevents this from happening.
         """
-        return self._should_capture and not isinstance(
+        return not getattr(self._emitting, "active", False) and not isinstance(
             getattr(record, DAGSTER_META_KEY, None), dict
         )
 
@@ -251,22 +259,92 @@ def emit(self, record: logging.LogRecord):
             # to prevent the potential for infinite loops in which a handler produces log messages
             # which are then captured and then handled by that same handler (etc.), do not capture
             # any log messages while one is currently being emitted
-            self._should_capture = False
+            self._emitting.active = True
             dagster_record = self._convert_record(record)
             # built-in handlers
             for handler in self._handlers:
                 if dagster_record.levelno >= handler.level:
                     handler.handle(dagster_record)
             # user-defined @loggers
-            for logger in self._loggers:
-                logger.log(
-                    dagster_record.levelno,
-                    dagster_record.msg,
-                    exc_info=dagster_record.exc_info,
-                    extra=self._extract_extra(record),
-                )
+            if self._loggers:
+                extra = self._extract_extra(record)
+                for logger in self._loggers:
+                    logger.log(
+                        dagster_record.levelno,
+                        dagster_record.msg,
+                        exc_info=dagster_record.exc_info,
+                        extra=extra,
+                    )
         finally:
-            self._should_capture = True
+            self._emitting.active = False
+
+    def flush(self):
+        """Block until the built-in handlers have finished processing the records they received,
+        e.g. until every message has been written to the event log."""
+        for handler in self._handlers:
+            handler.flush()
+
+
+# Number of python log captures that are active on each thread. The managed python loggers are
+# shared by the whole process, so when steps run concurrently on different threads each of them
+# only captures records logged from its own thread. Records from threads not running a step (e.g.
+# threads started by the op itself) can't be told apart, so they are only captured while a single
+# step is capturing. To attribute them while other steps run, start the thread's target in a copy
+# of the step's context (``contextvars.copy_context().run``).
+_python_log_capture_lock = threading.Lock()
+_python_log_capture_counts: Dict[int, int] = {}
+
+# The thread of the step capturing python logs in the current context. Async compute functions
+# run on an event loop thread shared by all steps (see async_in_process_executor), but each of
+# their coroutines is scheduled from the step's thread and so runs in a copy of its context.
+_python_log_capture_thread_id: ContextVar[Optional[int]] = ContextVar(
+    "python_log_capture_thread_id", default=None
+)
+
+
+class _PythonLogCaptureHandler(logging.Handler):
+    """Attached to the managed python loggers while a step captures python logs. Forwards the
+    records that belong to the step to its DagsterLogHandler."""
+
+    def __init__(self, dagster_handler: DagsterLogHandler):
+        self._dagster_handler = dagster_handler
+        self._thread_id = threading.get_ident()
+        self._context_token = None
+        super().__init__()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        # records are filtered on the thread that logged them
+        capture_thread_id = _python_log_capture_thread_id.get()
+        if capture_thread_id is not None:
+            return capture_thread_id == self._thread_id
+        if record.thread == self._thread_id:
+            return True
+        with _python_log_capture_lock:
+            if record.thread in _python_log_capture_counts:
+                return False
+            return len(_python_log_capture_counts) == 1
+
+    def emit(self, record: logging.LogRecord):
+        self._dagster_handler.handle(record)
+
+    def start(self, loggers: List[logging.Logger]):
+        with _python_log_capture_lock:
+            _python_log_capture_counts[self._thread_id] = (
+                _python_log_capture_counts.get(self._thread_id, 0) + 1
+            )
+        self._context_token = _python_log_capture_thread_id.set(self._thread_id)
+        for logger in loggers:
+            logger.addHandler(self)
+
+    def stop(self, loggers: List[logging.Logger]):
+        for logger in loggers:
+            logger.removeHandler(self)
+        _python_log_capture_thread_id.reset(self._context_token)
+        self._context_token = None
+        with _python_log_capture_lock:
+            _python_log_capture_counts[self._thread_id] -= 1
+            if not _python_log_capture_counts[self._thread_id]:
+                del _python_log_capture_counts[self._thread_id]
 
 
 class DagsterLogManager(logging.Logger):
@@ -303,6 +381,7 @@ def __init__(
             managed_loggers, "managed_loggers", of_type=logging.Logger
         )
         self._dagster_handler = dagster_handler
+        self._python_log_capture_handler: Optional[_PythonLogCaptureHandler] = None
         self.addHandler(dagster_handler)
 
     @classmethod
@@ -357,12 +436,21 @@ def logging_metadata(self) -> DagsterLoggingMetadata:
         return self._dagster_handler.logging_metadata
 
     def begin_python_log_capture(self):
-        for logger in self._managed_loggers:
-            logger.addHandler(self._dagster_handler)
+        if self._python_log_capture_handler:
+            return
+        self._python_log_capture_handler = _PythonLogCaptureHandler(self._dagster_handler)
+        self._python_log_capture_handler.start(self._managed_loggers)
 
     def end_python_log_capture(self):
-        for logger in self._managed_loggers:
-            logger.removeHandler(self._dagster_handler)
+        if not self._python_log_capture_handler:
+            return
+        self._python_log_capture_handler.stop(self._managed_loggers)
+        self._python_log_capture_handler = None
+
+    def flush(self):
+        """Wait for every message logged so far to be fully handled, e.g. written to the event
+        log. Called at the end of each run and step worker."""
+        self._dagster_handler.flush()
 
     def log_dagster_event(self, level: Union[str, int], msg: str, dagster_event: "DagsterEvent"):
         """Log a DagsterEvent at the given level. Attributes about the context it was logged in
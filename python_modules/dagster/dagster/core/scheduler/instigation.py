@@ -380,6 +380,14 @@ def origin_run_ids(self):
     def failure_count(self) -> int:
         return self.tick_data.failure_count
 
+    @property
+    def collapsed_tick_count(self) -> int:
+        return self.tick_data.collapsed_tick_count
+
+    @property
+    def collapsed_since_timestamp(self) -> Optional[float]:
+        return self.tick_data.collapsed_since_timestamp
+
 
 register_serdes_tuple_fallbacks({"JobTick": InstigatorTick})
 # for internal backcompat
@@ -453,6 +461,8 @@ class TickData(
             ("origin_run_ids", List[str]),
             ("failure_count", int),
             ("selector_id", Optional[str]),
+            ("collapsed_tick_count", int),
+            ("collapsed_since_timestamp", Optional[float]),
         ],
     )
 ):
@@ -474,6 +484,10 @@ class TickData(
         origin_run_ids (List[str]): The runs originated from the schedule/sensor.
         failure_count (int): The number of times this tick has failed. If the status is not
             FAILED, this is the number of previous failures before it reached the current state.
+        collapsed_tick_count (int): The number of earlier consecutive skipped ticks that the tick
+            retention policy collapsed into this skipped tick.
+        collapsed_since_timestamp (Optional[float]): The timestamp of the earliest of the ticks
+            collapsed into this tick.
     """
 
     def __new__(
@@ -491,6 +505,8 @@ def __new__(
         origin_run_ids: Optional[List[str]] = None,
         failure_count: Optional[int] = None,
         selector_id: Optional[str] = None,
+        collapsed_tick_count: Optional[int] = None,
+        collapsed_since_timestamp: Optional[float] = None,
     ):
         _validate_tick_args(instigator_type, status, run_ids, error, skip_reason)
         return super(TickData, cls).__new__(
@@ -508,6 +524,12 @@ def __new__(
             origin_run_ids=check.opt_list_param(origin_run_ids, "origin_run_ids", of_type=str),
             failure_count=check.opt_int_param(failure_count, "failure_count", 0),
             selector_id=check.opt_str_param(selector_id, "selector_id"),
+            collapsed_tick_count=check.opt_int_param(
+                collapsed_tick_count, "collapsed_tick_count", 0
+            ),
+            collapsed_since_timestamp=check.opt_float_param(
+                collapsed_since_timestamp, "collapsed_since_timestamp"
+            ),
         )
 
     def with_status(self, status, error=None, timestamp=None, failure_count=None):
@@ -560,6 +582,21 @@ def with_cursor(self, cursor):
             **merge_dicts(self._asdict(), {"cursor": check.opt_str_param(cursor, "cursor")})
         )
 
+    def with_collapsed_ticks(self, collapsed_tick_count, collapsed_since_timestamp):
+        return TickData(
+            **merge_dicts(
+                self._asdict(),
+                {
+                    "collapsed_tick_count": check.int_param(
+                        collapsed_tick_count, "collapsed_tick_count"
+                    ),
+                    "collapsed_since_timestamp": check.float_param(
+                        collapsed_since_timestamp, "collapsed_since_timestamp"
+                    ),
+                },
+            )
+        )
+
     def with_origin_run(self, origin_run_id):
         check.str_param(origin_run_id, "origin_run_id")
         return TickData(
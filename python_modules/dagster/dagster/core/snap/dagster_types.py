@@ -4,7 +4,7 @@
 from dagster.core.definitions.metadata import MetadataEntry
 from dagster.core.definitions.pipeline_definition import PipelineDefinition
 from dagster.core.types.dagster_type import DagsterType, DagsterTypeKind
-from dagster.serdes import DefaultNamedTupleSerializer, whitelist_for_serdes
+from dagster.serdes import TrustedNamedTupleSerializer, whitelist_for_serdes
 
 
 def build_dagster_type_namespace_snapshot(
@@ -32,7 +32,7 @@ def build_dagster_type_snap(dagster_type: DagsterType) -> "DagsterTypeSnap":
     )
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class DagsterTypeNamespaceSnapshot(
     NamedTuple(
         "_DagsterTypeNamespaceSnapshot",
@@ -55,11 +55,16 @@ def get_dagster_type_snap(self, key: str) -> "DagsterTypeSnap":
         return self.all_dagster_type_snaps_by_key[key]
 
 
-class DagsterTypeSnapSerializer(DefaultNamedTupleSerializer):
+class DagsterTypeSnapSerializer(TrustedNamedTupleSerializer):
     @classmethod
     def skip_when_empty(cls) -> Set[str]:
         return {"metadata_entries"}  # Maintain stable snapshot ID for back-compat purposes
 
+    @classmethod
+    def value_from_trusted_unpacked(cls, unpacked_dict, klass):
+        unpacked_dict.setdefault("metadata_entries", [])
+        return super().value_from_trusted_unpacked(unpacked_dict, klass)
+
 
 @whitelist_for_serdes(serializer=DagsterTypeSnapSerializer)
 class DagsterTypeSnap(
@@ -4,7 +4,7 @@
 from dagster import check
 from dagster.core.definitions import GraphDefinition
 from dagster.core.definitions.dependency import DependencyType, Node, SolidInputHandle
-from dagster.serdes import whitelist_for_serdes
+from dagster.serdes import TrustedNamedTupleSerializer, whitelist_for_serdes
 
 
 def build_solid_invocation_snap(icontains_solids, solid):
@@ -49,7 +49,7 @@ def build_dep_structure_snapshot_from_icontains_solids(icontains_solids):
     )
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class DependencyStructureSnapshot(
     NamedTuple(
         "_DependencyStructureSnapshot", [("solid_invocation_snaps", List["SolidInvocationSnap"])]
@@ -156,7 +156,7 @@ def get_downstream_inputs(self, solid_name, output_name):
         return self._output_to_upstream_index[solid_name][output_name]
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class OutputHandleSnap(
     NamedTuple("_OutputHandleSnap", [("solid_name", str), ("output_name", str)])
 ):
@@ -168,7 +168,7 @@ def __new__(cls, solid_name: str, output_name: str):
         )
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class InputDependencySnap(
     NamedTuple(
         "_InputDependencySnap",
@@ -197,7 +197,7 @@ def __new__(
         )
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class SolidInvocationSnap(
     NamedTuple(
         "_SolidInvocationSnap",
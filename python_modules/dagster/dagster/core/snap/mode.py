@@ -4,7 +4,7 @@
 from dagster import check
 from dagster.config.snap import ConfigFieldSnap, snap_from_field
 from dagster.core.definitions import LoggerDefinition, ModeDefinition, ResourceDefinition
-from dagster.serdes import whitelist_for_serdes
+from dagster.serdes import TrustedNamedTupleSerializer, whitelist_for_serdes
 
 
 def build_mode_def_snap(mode_def, root_config_key):
@@ -26,7 +26,7 @@ def build_mode_def_snap(mode_def, root_config_key):
     )
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class ModeDefSnap(
     NamedTuple(
         "_ModeDefSnap",
@@ -73,7 +73,7 @@ def build_resource_def_snap(name, resource_def):
     )
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class ResourceDefSnap(
     NamedTuple(
         "_ResourceDefSnap",
@@ -109,7 +109,7 @@ def build_logger_def_snap(name, logger_def):
     )
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class LoggerDefSnap(
     NamedTuple(
         "_LoggerDefSnap",
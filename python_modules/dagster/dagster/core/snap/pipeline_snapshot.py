@@ -47,9 +47,25 @@
 )
 
 
+# Pipeline snapshot ids are hashed from json that is streamed field by field through these
+# containers, while the json of the config type and node definition snaps they hold is kept on
+# the snaps. Those snaps are shared between every snapshot built from the same definitions (see
+# snap_from_config_type and build_solid_definitions_snapshot), so that e.g. computing the id of a
+# subset snapshot and then that of its parent only encodes the parent's remaining definitions.
+_SNAPSHOT_CONTAINER_TYPES = frozenset([ConfigSchemaSnapshot, SolidDefinitionsSnapshot])
+_MEMOIZED_SNAPSHOT_TYPES = frozenset([ConfigTypeSnap, SolidDefSnap, CompositeSolidDefSnap])
+
+
 def create_pipeline_snapshot_id(snapshot: "PipelineSnapshot") -> str:
     check.inst_param(snapshot, "snapshot", PipelineSnapshot)
-    return create_snapshot_id(snapshot)
+    # snapshots are immutable, so their id is only computed once
+    snapshot_id = snapshot.__dict__.get("_snapshot_id")
+    if snapshot_id is None:
+        snapshot_id = create_snapshot_id(
+            snapshot, _SNAPSHOT_CONTAINER_TYPES, _MEMOIZED_SNAPSHOT_TYPES
+        )
+        snapshot.__dict__["_snapshot_id"] = snapshot_id
+    return snapshot_id
 
 
 class PipelineSnapshotSerializer(DefaultNamedTupleSerializer):
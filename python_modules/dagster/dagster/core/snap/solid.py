@@ -1,3 +1,4 @@
+import weakref
 from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Set, Union
 
 from dagster import check
@@ -12,8 +13,7 @@
     SolidDefinition,
 )
 from dagster.core.definitions.metadata import MetadataEntry
-from dagster.serdes import whitelist_for_serdes
-from dagster.serdes.serdes import DefaultNamedTupleSerializer
+from dagster.serdes import TrustedNamedTupleSerializer, whitelist_for_serdes
 
 from .dep_snapshot import (
     DependencyStructureSnapshot,
@@ -21,11 +21,16 @@
 )
 
 
-class InputDefSnapSerializer(DefaultNamedTupleSerializer):
+class InputDefSnapSerializer(TrustedNamedTupleSerializer):
     @classmethod
     def skip_when_empty(cls) -> Set[str]:
         return {"metadata_entries"}  # Maintain stable snapshot ID for back-compat purposes
 
+    @classmethod
+    def value_from_trusted_unpacked(cls, unpacked_dict, klass):
+        unpacked_dict.setdefault("metadata_entries", [])
+        return super().value_from_trusted_unpacked(unpacked_dict, klass)
+
 
 @whitelist_for_serdes(serializer=InputDefSnapSerializer)
 class InputDefSnap(
@@ -57,11 +62,16 @@ def __new__(
         )
 
 
-class OutputDefSnapSerializer(DefaultNamedTupleSerializer):
+class OutputDefSnapSerializer(TrustedNamedTupleSerializer):
     @classmethod
     def skip_when_empty(cls) -> Set[str]:
         return {"metadata_entries"}  # Maintain stable snapshot ID for back-compat purposes
 
+    @classmethod
+    def value_from_trusted_unpacked(cls, unpacked_dict, klass):
+        unpacked_dict.setdefault("metadata_entries", [])
+        return super().value_from_trusted_unpacked(unpacked_dict, klass)
+
 
 @whitelist_for_serdes(serializer=OutputDefSnapSerializer)
 class OutputDefSnap(
@@ -99,7 +109,7 @@ def __new__(
         )
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class OutputMappingSnap(
     NamedTuple(
         "_OutputMappingSnap",
@@ -132,7 +142,7 @@ def build_output_mapping_snap(output_mapping: OutputMapping) -> OutputMappingSna
     )
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class InputMappingSnap(
     NamedTuple(
         "_InputMappingSnap",
@@ -205,7 +215,7 @@ def _check_solid_def_header_args(
     )
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class CompositeSolidDefSnap(
     NamedTuple(
         "_CompositeSolidDefSnap",
@@ -276,7 +286,7 @@ def get_output_snap(self, name: str) -> OutputDefSnap:
         return _get_output_snap(self, name)
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class SolidDefSnap(
     NamedTuple(
         "_SolidDefMeta",
@@ -323,7 +333,7 @@ def get_output_snap(self, name: str) -> OutputDefSnap:
         return _get_output_snap(self, name)
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class SolidDefinitionsSnapshot(
     NamedTuple(
         "_SolidDefinitionsSnapshot",
@@ -355,15 +365,30 @@ def __new__(
         )
 
 
+# Node definitions are immutable, so the snap of each is built once and shared between the
+# snapshots of every pipeline it is a part of, e.g. a job and each of its op subsets. This lets
+# anything cached on the snaps, like their json when computing snapshot ids, be reused as well.
+_node_def_snaps: "weakref.WeakKeyDictionary[Any, Union[SolidDefSnap, CompositeSolidDefSnap]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
 def build_solid_definitions_snapshot(pipeline_def: PipelineDefinition) -> SolidDefinitionsSnapshot:
     check.inst_param(pipeline_def, "pipeline_def", PipelineDefinition)
     solid_def_snaps = []
     graph_def_snaps = []
     for node_def in pipeline_def.all_node_defs:
+        node_def_snap = _node_def_snaps.get(node_def)
         if isinstance(node_def, SolidDefinition):
-            solid_def_snaps.append(build_core_solid_def_snap(node_def))
+            if node_def_snap is None:
+                node_def_snap = _node_def_snaps[node_def] = build_core_solid_def_snap(node_def)
+            solid_def_snaps.append(node_def_snap)
         elif isinstance(node_def, GraphDefinition):
-            graph_def_snaps.append(build_composite_solid_def_snap(node_def))
+            if node_def_snap is None:
+                node_def_snap = _node_def_snaps[node_def] = build_composite_solid_def_snap(
+                    node_def
+                )
+            graph_def_snaps.append(node_def_snap)
         else:
             check.failed(f"Unexpected NodeDefinition type {node_def}")
 
@@ -0,0 +1,118 @@
+import gzip
+import os
+import threading
+from abc import ABC, abstractmethod
+from typing import List, Optional, Sequence
+
+from dagster import StringSource, check
+from dagster.core.events.log import EventLogEntry
+from dagster.serdes import (
+    ConfigurableClass,
+    ConfigurableClassData,
+    deserialize_as,
+    serialize_dagster_namedtuple,
+)
+from dagster.utils import mkdir_p
+
+ARCHIVE_FILE_EXTENSION = ".jsonl.gz"
+
+
+class EventLogArchive(ABC):
+    """Abstract base class for storing the raw events of finished runs outside of the event log
+    storage, once the event log retention policy has compacted them.
+
+    Archived events are written once per run, and are read back in place of the compacted events
+    of the run by :py:meth:`~dagster.core.instance.DagsterInstance.logs_after` and
+    :py:meth:`~dagster.core.instance.DagsterInstance.all_logs`.
+    """
+
+    @abstractmethod
+    def archive_events(self, run_id: str, events: Sequence[EventLogEntry]):
+        """Store the full, ordered list of events of a run.
+
+        Args:
+            run_id (str): The id of the run.
+            events (Sequence[EventLogEntry]): The events of the run, in storage order.
+        """
+
+    @abstractmethod
+    def has_archived_events(self, run_id: str) -> bool:
+        """Whether the events of a run have been archived."""
+
+    @abstractmethod
+    def get_archived_events(self, run_id: str) -> Optional[List[EventLogEntry]]:
+        """Return the archived events of a run, in storage order, or None if the run has not been
+        archived."""
+
+
+def serialize_archived_events(events: Sequence[EventLogEntry]) -> bytes:
+    return gzip.compress(
+        "".join(serialize_dagster_namedtuple(event) + "\n" for event in events).encode("utf-8")
+    )
+
+
+def deserialize_archived_events(data: bytes) -> List[EventLogEntry]:
+    return [
+        deserialize_as(line, EventLogEntry)
+        for line in gzip.decompress(data).decode("utf-8").splitlines()
+        if line
+    ]
+
+
+class LocalEventLogArchive(EventLogArchive, ConfigurableClass):
+    """Archives the events of each run to a gzipped file of serialized events, one per line, in a
+    local directory.
+
+    .. code-block:: YAML
+
+        retention:
+          event_log:
+            compact_after_days: 30
+            archive:
+              module: dagster.core.storage.event_log.archive
+              class: LocalEventLogArchive
+              config:
+                base_dir: /path/to/archive
+    """
+
+    def __init__(self, base_dir: str, inst_data: Optional[ConfigurableClassData] = None):
+        self._base_dir = check.str_param(base_dir, "base_dir")
+        self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
+        mkdir_p(self._base_dir)
+
+    @property
+    def inst_data(self):
+        return self._inst_data
+
+    @classmethod
+    def config_type(cls):
+        return {"base_dir": StringSource}
+
+    @staticmethod
+    def from_config_value(inst_data, config_value):
+        return LocalEventLogArchive(inst_data=inst_data, **config_value)
+
+    def _path_for_run(self, run_id: str) -> str:
+        return os.path.join(self._base_dir, f"{run_id}{ARCHIVE_FILE_EXTENSION}")
+
+    def archive_events(self, run_id, events):
+        check.str_param(run_id, "run_id")
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        path = self._path_for_run(run_id)
+        # write to a temporary file first, so that readers never see a partial archive
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(serialize_archived_events(events))
+        os.replace(temp_path, path)
+
+    def has_archived_events(self, run_id):
+        return os.path.exists(self._path_for_run(check.str_param(run_id, "run_id")))
+
+    def get_archived_events(self, run_id):
+        path = self._path_for_run(check.str_param(run_id, "run_id"))
+        if not os.path.exists(path):
+            return None
+
+        with open(path, "rb") as f:
+            return deserialize_archived_events(f.read())
@@ -17,7 +17,7 @@
 from dagster import check
 from dagster.core.assets import AssetDetails
 from dagster.core.definitions.events import AssetKey
-from dagster.core.events import DagsterEventType
+from dagster.core.events import RETAINED_EVENTS, DagsterEventType
 from dagster.core.events.log import EventLogEntry
 from dagster.core.execution.stats import (
     RunStepKeyStatsSnapshot,
@@ -82,6 +82,20 @@ class AssetRecord(NamedTuple):
     asset_entry: AssetEntry
 
 
+class AssetPartitionRecord(NamedTuple):
+    """Summary of the materializations of a single partition of an asset: the latest
+    materialization, and the number of times the partition has been materialized since the asset
+    was last wiped.
+    """
+
+    asset_key: AssetKey
+    partition: str
+    last_materialization_storage_id: Optional[int]
+    last_run_id: Optional[str]
+    last_materialization_timestamp: float
+    materialization_count: int
+
+
 @whitelist_for_serdes
 class EventRecordsFilter(
     NamedTuple(
@@ -176,6 +190,36 @@ def get_logs_for_run(
             of_type (Optional[DagsterEventType]): the dagster event type to filter the logs.
         """
 
+    def get_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[int] = None,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        limit: Optional[int] = None,
+    ) -> Sequence[EventLogRecord]:
+        """Get the event log records of a run, in the order in which they were stored.
+
+        Unlike the cursor of get_logs_for_run, the cursor is the storage id of the last record
+        seen, so that it can be advanced consistently when the records are filtered by type.
+        Storages that do not assign storage ids use the index of each event in the run's logs.
+
+        Args:
+            run_id (str): The id of the run for which to fetch records.
+            cursor (Optional[int]): Only records with a storage id greater than the cursor are
+                returned. If None, all records are returned. (default: None)
+            of_type (Optional[DagsterEventType]): the dagster event type to filter the records.
+            limit (Optional[int]): the maximum number of records to fetch
+        """
+        start_index = -1 if cursor is None else cursor
+        of_types = {of_type} if isinstance(of_type, DagsterEventType) else of_type
+        records = [
+            EventLogRecord(storage_id=start_index + 1 + index, event_log_entry=event)
+            for index, event in enumerate(self.get_logs_for_run(run_id, cursor=start_index))
+            if not of_types
+            or (event.is_dagster_event and event.dagster_event.event_type in of_types)
+        ]
+        return records[:limit] if limit else records
+
     def get_stats_for_run(self, run_id: str) -> PipelineRunStatsSnapshot:
         """Get a summary of events that have ocurred in a run."""
         return build_run_stats_from_events(run_id, self.get_logs_for_run(run_id))
@@ -200,10 +244,32 @@ def store_event(self, event: EventLogEntry):
             event (EventLogEntry): The event to store.
         """
 
+    def store_events(self, events: Sequence[EventLogEntry]):
+        """Store a batch of events, in order. Storages that can write several events at once
+        should override this.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        for event in events:
+            self.store_event(event)
+
     @abstractmethod
     def delete_events(self, run_id: str):
         """Remove events for a given run id"""
 
+    def compact_events(self, run_id: str):
+        """Remove the log messages and the other unstructured events of a finished run, keeping
+        the run, step and asset events in ``RETAINED_EVENTS``.
+
+        The retained events must keep their storage ids, since the latest materializations of
+        assets and the cursors of asset sensors are keyed on them. By default, nothing is removed.
+        Storages that can delete the other events in place should override this.
+
+        Args:
+            run_id (str): The id of the run to compact.
+        """
+
     @abstractmethod
     def upgrade(self):
         """This method should perform any schema migrations necessary to bring an
@@ -321,6 +387,46 @@ def get_materialization_count_by_partition(
     ) -> Mapping[AssetKey, Mapping[str, int]]:
         pass
 
+    @abstractmethod
+    def get_latest_materialization_records_by_partition(
+        self, asset_keys: Sequence[AssetKey]
+    ) -> Mapping[AssetKey, Mapping[str, AssetPartitionRecord]]:
+        """Return a summary of the latest materialization of every materialized partition of the
+        given assets, keyed by partition."""
+
+    def get_partitions_missing_since(
+        self,
+        asset_key: AssetKey,
+        since_timestamp: float,
+        partitions: Optional[Sequence[str]] = None,
+    ) -> Sequence[str]:
+        """Return the partitions of the given asset that have not been materialized at or after
+        ``since_timestamp``.
+
+        Args:
+            asset_key (AssetKey): The asset to check.
+            since_timestamp (float): The timestamp that partitions must have been materialized at or
+                after to not be considered missing.
+            partitions (Optional[Sequence[str]]): The partitions to check. If not provided, only the
+                partitions that have been materialized at some point are checked.
+        """
+        check.inst_param(asset_key, "asset_key", AssetKey)
+        check.numeric_param(since_timestamp, "since_timestamp")
+        check.opt_list_param(partitions, "partitions", of_type=str)
+
+        records_by_partition = self.get_latest_materialization_records_by_partition([asset_key])[
+            asset_key
+        ]
+        if partitions is None:
+            partitions = list(records_by_partition.keys())
+
+        return [
+            partition
+            for partition in partitions
+            if partition not in records_by_partition
+            or records_by_partition[partition].last_materialization_timestamp < since_timestamp
+        ]
+
 
 def extract_asset_events_cursor(cursor, before_cursor, after_cursor, ascending):
     if cursor:
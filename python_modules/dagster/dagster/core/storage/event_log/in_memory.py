@@ -6,13 +6,14 @@
 from dagster import check
 from dagster.core.assets import AssetDetails
 from dagster.core.definitions.events import AssetKey
-from dagster.core.events import DagsterEventType
+from dagster.core.events import RETAINED_EVENTS, DagsterEventType
 from dagster.core.events.log import EventLogEntry
 from dagster.core.storage.event_log.base import AssetEntry, AssetRecord
 from dagster.serdes import ConfigurableClass
 from dagster.utils import utc_datetime_from_timestamp
 
 from .base import (
+    AssetPartitionRecord,
     EventLogRecord,
     EventLogStorage,
     EventRecordsFilter,
@@ -144,6 +145,13 @@ def store_asset_event(self, event):
     def delete_events(self, run_id):
         del self._logs[run_id]
 
+    def compact_events(self, run_id):
+        self._logs[run_id] = [
+            event
+            for event in self._logs[run_id]
+            if event.is_dagster_event and event.dagster_event.event_type in RETAINED_EVENTS
+        ]
+
     def upgrade(self):
         pass
 
@@ -420,3 +428,43 @@ def get_materialization_count_by_partition(
                 materialization_count_by_key_partition[asset_key] = {}
 
         return materialization_count_by_key_partition
+
+    def get_latest_materialization_records_by_partition(
+        self, asset_keys: Sequence[AssetKey]
+    ) -> Mapping[AssetKey, Mapping[str, AssetPartitionRecord]]:
+        check.list_param(asset_keys, "asset_keys", of_type=AssetKey)
+
+        records_by_key_partition: Dict[AssetKey, Dict[str, AssetPartitionRecord]] = {
+            asset_key: {} for asset_key in asset_keys
+        }
+        for records in self._logs.values():
+            for record in records:
+                if not (
+                    record.is_dagster_event
+                    and record.dagster_event.asset_key
+                    and record.dagster_event.asset_key in records_by_key_partition
+                    and record.dagster_event.event_type_value
+                    == DagsterEventType.ASSET_MATERIALIZATION.value
+                    and record.dagster_event.partition
+                    and self._wiped_asset_keys[record.dagster_event.asset_key] < record.timestamp
+                ):
+                    continue
+
+                records_by_partition = records_by_key_partition[record.dagster_event.asset_key]
+                partition = record.dagster_event.partition
+                existing = records_by_partition.get(partition)
+                is_latest = (
+                    not existing or existing.last_materialization_timestamp <= record.timestamp
+                )
+                records_by_partition[partition] = AssetPartitionRecord(
+                    asset_key=record.dagster_event.asset_key,
+                    partition=partition,
+                    last_materialization_storage_id=None,
+                    last_run_id=record.run_id if is_latest else existing.last_run_id,
+                    last_materialization_timestamp=record.timestamp
+                    if is_latest
+                    else existing.last_materialization_timestamp,
+                    materialization_count=existing.materialization_count + 1 if existing else 1,
+                )
+
+        return records_by_key_partition
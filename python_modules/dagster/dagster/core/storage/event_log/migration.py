@@ -8,11 +8,15 @@
 
 SECONDARY_INDEX_ASSET_KEY = "asset_key_table"  # builds the asset key table from the event log
 ASSET_KEY_INDEX_COLS = "asset_key_index_columns"  # extracts index columns from the asset_keys table
+ASSET_PARTITIONS_TABLE = "asset_partitions_table"  # summarizes materializations per partition
 
 EVENT_LOG_DATA_MIGRATIONS = {
     SECONDARY_INDEX_ASSET_KEY: lambda: migrate_asset_key_data,
 }
-ASSET_DATA_MIGRATIONS = {ASSET_KEY_INDEX_COLS: lambda: migrate_asset_keys_index_columns}
+ASSET_DATA_MIGRATIONS = {
+    ASSET_KEY_INDEX_COLS: lambda: migrate_asset_keys_index_columns,
+    ASSET_PARTITIONS_TABLE: lambda: migrate_asset_partitions_data,
+}
 
 
 def migrate_event_log_data(instance=None):
@@ -167,6 +171,47 @@ def migrate_asset_keys_index_columns(event_log_storage, print_fn=None):
                 )
 
 
+def migrate_asset_partitions_data(event_log_storage, print_fn=None):
+    """
+    Utility method to build the asset partitions table from the materializations in existing event
+    log records.  Takes in event_log_storage, and a print_fn to keep track of progress.
+    """
+    from dagster.core.errors import DagsterInstanceSchemaOutdated
+    from dagster.core.events import DagsterEventType
+    from dagster.core.storage.event_log.sql_event_log import SqlEventLogStorage
+
+    from .schema import SqlEventLogStorageTable
+
+    if not isinstance(event_log_storage, SqlEventLogStorage):
+        return
+
+    if not event_log_storage.has_asset_partitions_table():
+        raise DagsterInstanceSchemaOutdated()
+
+    query = (
+        db.select([SqlEventLogStorageTable.c.asset_key])
+        .where(
+            SqlEventLogStorageTable.c.dagster_event_type
+            == DagsterEventType.ASSET_MATERIALIZATION.value
+        )
+        .where(SqlEventLogStorageTable.c.partition != None)
+        .group_by(SqlEventLogStorageTable.c.asset_key)
+    )
+    with event_log_storage.index_connection() as conn:
+        if print_fn:
+            print_fn("Querying partitioned asset materializations.")
+        # legacy and current asset key strings map to the same asset key
+        asset_keys = list(
+            {AssetKey.from_db_string(asset_key) for (asset_key,) in conn.execute(query).fetchall()}
+        )
+        if print_fn:
+            print_fn(f"Found {len(asset_keys)} assets to index.")
+            asset_keys = tqdm(asset_keys)
+
+        for asset_key in asset_keys:
+            event_log_storage.rebuild_asset_partitions(conn, asset_key)
+
+
 def sql_asset_event_generator(conn, cursor=None, batch_size=1000):
     from .schema import SqlEventLogStorageTable
 
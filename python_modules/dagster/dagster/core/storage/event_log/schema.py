@@ -52,6 +52,23 @@
     db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
 )
 
+# The AssetPartitionsTable holds a summary of the materializations of every partition of an asset,
+# so that partition-aware queries do not have to scan every historic materialization in the event
+# log. Its rows are maintained as materialization events are stored, and are guarded by a secondary
+# index check.
+AssetPartitionsTable = db.Table(
+    "asset_partitions",
+    SqlEventLogStorageMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("asset_key", db.Text, nullable=False),
+    db.Column("partition", db.Text, nullable=False),
+    db.Column("last_materialization_storage_id", db.Integer),
+    db.Column("last_run_id", db.String(255)),
+    db.Column("last_materialization_timestamp", db.types.TIMESTAMP),
+    db.Column("materialization_count", db.Integer, nullable=False),
+    db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
+)
+
 db.Index("idx_run_id", SqlEventLogStorageTable.c.run_id)
 db.Index(
     "idx_step_key",
@@ -75,3 +92,10 @@
     SqlEventLogStorageTable.c.id,
     mysql_length={"dagster_event_type": 64},
 )
+db.Index(
+    "idx_asset_partitions_asset_key_partition",
+    AssetPartitionsTable.c.asset_key,
+    AssetPartitionsTable.c.partition,
+    unique=True,
+    mysql_length={"asset_key": 255, "partition": 255},
+)
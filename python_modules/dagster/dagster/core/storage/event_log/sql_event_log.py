@@ -2,7 +2,8 @@
 from abc import abstractmethod
 from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, cast
+from itertools import groupby
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, cast
 
 import pendulum
 import sqlalchemy as db
@@ -11,7 +12,7 @@
 from dagster.core.assets import AssetDetails
 from dagster.core.definitions.events import AssetKey, AssetMaterialization
 from dagster.core.errors import DagsterEventLogInvalidForRun
-from dagster.core.events import DagsterEventType
+from dagster.core.events import RETAINED_EVENTS, DagsterEventType
 from dagster.core.events.log import EventLogEntry
 from dagster.core.execution.stats import build_run_step_stats_from_events
 from dagster.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
@@ -21,6 +22,7 @@
 from ..pipeline_run import PipelineRunStatsSnapshot
 from .base import (
     AssetEntry,
+    AssetPartitionRecord,
     AssetRecord,
     EventLogRecord,
     EventLogStorage,
@@ -28,8 +30,18 @@
     RunShardedEventsCursor,
     extract_asset_events_cursor,
 )
-from .migration import ASSET_DATA_MIGRATIONS, ASSET_KEY_INDEX_COLS, EVENT_LOG_DATA_MIGRATIONS
-from .schema import AssetKeyTable, SecondaryIndexMigrationTable, SqlEventLogStorageTable
+from .migration import (
+    ASSET_DATA_MIGRATIONS,
+    ASSET_KEY_INDEX_COLS,
+    ASSET_PARTITIONS_TABLE,
+    EVENT_LOG_DATA_MIGRATIONS,
+)
+from .schema import (
+    AssetKeyTable,
+    AssetPartitionsTable,
+    SecondaryIndexMigrationTable,
+    SqlEventLogStorageTable,
+)
 
 MIN_ASSET_ROWS = 25
 
@@ -73,6 +85,12 @@ def prepare_insert_event(self, event):
         `store_event`.
         """
 
+        # https://stackoverflow.com/a/54386260/324449
+        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+            **self._get_event_insert_values(event)
+        )
+
+    def _get_event_insert_values(self, event):
         dagster_event_type = None
         asset_key_str = None
         partition = None
@@ -87,8 +105,7 @@ def prepare_insert_event(self, event):
             if event.dagster_event.partition:
                 partition = event.dagster_event.partition
 
-        # https://stackoverflow.com/a/54386260/324449
-        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+        return dict(
             run_id=event.run_id,
             event=serialize_dagster_namedtuple(event),
             dagster_event_type=dagster_event_type,
@@ -105,8 +122,13 @@ def has_asset_key_index_cols(self):
             column_names = [x.get("name") for x in db.inspect(conn).get_columns(AssetKeyTable.name)]
             return "last_materialization_timestamp" in column_names
 
-    def store_asset_event(self, event):
+    def has_asset_partitions_table(self):
+        with self.index_connection() as conn:
+            return AssetPartitionsTable.name in db.inspect(conn).get_table_names()
+
+    def store_asset_event(self, event, event_id=None):
         check.inst_param(event, "event", EventLogEntry)
+        check.opt_int_param(event_id, "event_id")
         if not event.is_dagster_event or not event.dagster_event.asset_key:
             return
 
@@ -133,6 +155,7 @@ def store_asset_event(self, event):
                 AssetKeyTable.c.asset_key == event.dagster_event.asset_key.to_string(),
             )
         )
+        should_store_asset_partition = self._should_store_asset_partition(event)
 
         with self.index_connection() as conn:
             try:
@@ -140,6 +163,49 @@ def store_asset_event(self, event):
             except db.exc.IntegrityError:
                 conn.execute(update_statement)
 
+            if should_store_asset_partition:
+                self._store_asset_partition(conn, event, event_id)
+
+    def _should_store_asset_partition(self, event):
+        return (
+            event.dagster_event.is_step_materialization
+            and event.dagster_event.partition is not None
+            and self.has_secondary_index(ASSET_PARTITIONS_TABLE)
+        )
+
+    def _store_asset_partition(self, conn, event, event_id):
+        """Update the summary row of the materialized partition in the asset partitions table, which
+        saves partition-aware queries from having to scan every historic materialization."""
+        asset_key_str = event.dagster_event.asset_key.to_string()
+        partition = event.dagster_event.partition
+        values = dict(
+            last_materialization_storage_id=event_id,
+            last_run_id=event.run_id,
+            last_materialization_timestamp=datetime.utcfromtimestamp(event.timestamp),
+        )
+        update_statement = (
+            AssetPartitionsTable.update()  # pylint: disable=no-value-for-parameter
+            .where(AssetPartitionsTable.c.asset_key == asset_key_str)
+            .where(AssetPartitionsTable.c.partition == partition)
+            .values(
+                materialization_count=AssetPartitionsTable.c.materialization_count + 1,
+                **values,
+            )
+        )
+
+        if conn.execute(update_statement).rowcount:
+            return
+
+        try:
+            conn.execute(
+                AssetPartitionsTable.insert().values(  # pylint: disable=no-value-for-parameter
+                    asset_key=asset_key_str, partition=partition, materialization_count=1, **values
+                )
+            )
+        except db.exc.IntegrityError:
+            # the partition was materialized concurrently
+            conn.execute(update_statement)
+
     def _get_asset_entry_values(self, event, has_asset_key_index_cols):
         # The AssetKeyTable contains a `last_materialization_timestamp` column that is exclusively
         # used to determine if an asset exists (last materialization timestamp > wipe timestamp).
@@ -211,7 +277,7 @@ def store_event(self, event):
         run_id = event.run_id
 
         with self.run_connection(run_id) as conn:
-            conn.execute(insert_event_statement)
+            event_id = conn.execute(insert_event_statement).inserted_primary_key[0]
 
         if (
             event.is_dagster_event
@@ -222,7 +288,30 @@ def store_event(self, event):
             )
             and event.dagster_event.asset_key
         ):
-            self.store_asset_event(event)
+            self.store_asset_event(event, event_id)
+
+    def store_events(self, events):
+        """Store a batch of events, in order. Runs of plain log messages for the same run are
+        inserted with a single statement, while dagster events are stored one at a time since they
+        may also need to be indexed.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.list_param(events, "events", of_type=EventLogEntry)
+
+        for (run_id, is_dagster_event), run_events in groupby(
+            events, key=lambda event: (event.run_id, event.is_dagster_event)
+        ):
+            if is_dagster_event:
+                for event in run_events:
+                    self.store_event(event)
+            else:
+                with self.run_connection(run_id) as conn:
+                    conn.execute(
+                        SqlEventLogStorageTable.insert(),  # pylint: disable=no-value-for-parameter
+                        [self._get_event_insert_values(event) for event in run_events],
+                    )
 
     def get_logs_for_run_by_log_id(
         self,
@@ -274,7 +363,9 @@ def get_logs_for_run_by_log_id(
                 json_str,
             ) in results:
                 events[record_id] = check.inst_param(
-                    deserialize_json_to_dagster_namedtuple(json_str), "event", EventLogEntry
+                    deserialize_json_to_dagster_namedtuple(json_str, trusted=True),
+                    "event",
+                    EventLogEntry,
                 )
         except (seven.JSONDecodeError, DeserializationError) as err:
             raise DagsterEventLogInvalidForRun(run_id=run_id) from err
@@ -313,6 +404,58 @@ def get_logs_for_run(
         events_by_id = self.get_logs_for_run_by_log_id(run_id, cursor, of_type, limit)
         return [event for id, event in sorted(events_by_id.items(), key=lambda x: x[0])]
 
+    def get_records_for_run(
+        self,
+        run_id,
+        cursor=None,
+        of_type=None,
+        limit=None,
+    ):
+        check.str_param(run_id, "run_id")
+        check.opt_int_param(cursor, "cursor")
+
+        dagster_event_types = (
+            {of_type}
+            if isinstance(of_type, DagsterEventType)
+            else check.opt_set_param(of_type, "of_type", of_type=DagsterEventType)
+        )
+
+        query = (
+            db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        if cursor is not None:
+            query = query.where(SqlEventLogStorageTable.c.id > cursor)
+
+        if dagster_event_types:
+            query = query.where(
+                SqlEventLogStorageTable.c.dagster_event_type.in_(
+                    [dagster_event_type.value for dagster_event_type in dagster_event_types]
+                )
+            )
+
+        if limit:
+            query = query.limit(limit)
+
+        with self.run_connection(run_id) as conn:
+            results = conn.execute(query).fetchall()
+
+        try:
+            return [
+                EventLogRecord(
+                    storage_id=record_id,
+                    event_log_entry=check.inst_param(
+                        deserialize_json_to_dagster_namedtuple(json_str, trusted=True),
+                        "event",
+                        EventLogEntry,
+                    ),
+                )
+                for record_id, json_str in results
+            ]
+        except (seven.JSONDecodeError, DeserializationError) as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
     def get_stats_for_run(self, run_id):
         check.str_param(run_id, "run_id")
 
@@ -419,7 +562,9 @@ def get_step_stats_for_run(self, run_id, step_keys=None):
         try:
             records = [
                 check.inst_param(
-                    deserialize_json_to_dagster_namedtuple(json_str), "event", EventLogEntry
+                    deserialize_json_to_dagster_namedtuple(json_str, trusted=True),
+                    "event",
+                    EventLogEntry,
                 )
                 for (json_str,) in results
             ]
@@ -463,6 +608,10 @@ def wipe(self):
         with self.index_connection() as conn:
             conn.execute(SqlEventLogStorageTable.delete())  # pylint: disable=no-value-for-parameter
             conn.execute(AssetKeyTable.delete())  # pylint: disable=no-value-for-parameter
+            if AssetPartitionsTable.name in db.inspect(conn).get_table_names():
+                conn.execute(
+                    AssetPartitionsTable.delete()  # pylint: disable=no-value-for-parameter
+                )
 
     def delete_events(self, run_id):
         with self.run_connection(run_id) as conn:
@@ -511,6 +660,30 @@ def delete_events_for_run(self, conn, run_id):
                     )
                 )
 
+            # the partition summaries of the removed materializations are stale
+            if AssetPartitionsTable.name in db.inspect(conn).get_table_names():
+                for asset_key in set(removed_asset_keys):
+                    self.rebuild_asset_partitions(conn, asset_key)
+
+    def compact_events(self, run_id):
+        check.str_param(run_id, "run_id")
+
+        # log messages are stored without an event type. Asset events are retained, so the events
+        # mirrored to the index shard by run-sharded storages are unaffected
+        with self.run_connection(run_id) as conn:
+            conn.execute(
+                SqlEventLogStorageTable.delete()  # pylint: disable=no-value-for-parameter
+                .where(SqlEventLogStorageTable.c.run_id == run_id)
+                .where(
+                    db.or_(
+                        SqlEventLogStorageTable.c.dagster_event_type == None,
+                        SqlEventLogStorageTable.c.dagster_event_type.notin_(
+                            [event_type.value for event_type in RETAINED_EVENTS]
+                        ),
+                    )
+                )
+            )
+
     @property
     def is_persistent(self):
         return True
@@ -698,7 +871,7 @@ def get_event_records(
         event_records = []
         for row_id, json_str in results:
             try:
-                event_record = deserialize_json_to_dagster_namedtuple(json_str)
+                event_record = deserialize_json_to_dagster_namedtuple(json_str, trusted=True)
                 if not isinstance(event_record, EventLogEntry):
                     logging.warning(
                         "Could not resolve event record as EventLogEntry for id `{}`.".format(
@@ -741,7 +914,7 @@ def _get_latest_materializations(
             if not asset_key:
                 continue
             event_or_materialization = (
-                deserialize_json_to_dagster_namedtuple(row[2]) if row[2] else None
+                deserialize_json_to_dagster_namedtuple(row[2], trusted=True) if row[2] else None
             )
             if isinstance(event_or_materialization, EventLogEntry):
                 results[asset_key] = event_or_materialization
@@ -785,7 +958,7 @@ def _get_latest_materializations(
             asset_key = AssetKey.from_db_string(row[0])
             if asset_key:
                 results[asset_key] = cast(
-                    EventLogEntry, deserialize_json_to_dagster_namedtuple(row[1])
+                    EventLogEntry, deserialize_json_to_dagster_namedtuple(row[1], trusted=True)
                 )
         return results
 
@@ -929,7 +1102,7 @@ def _fetch_raw_asset_rows(self, asset_keys=None, prefix=None, limit=None, cursor
                 row_by_asset_key[asset_key] = row
                 continue
             materialization_or_event = (
-                deserialize_json_to_dagster_namedtuple(row[2]) if row[2] else None
+                deserialize_json_to_dagster_namedtuple(row[2], trusted=True) if row[2] else None
             )
             if isinstance(materialization_or_event, EventLogEntry):
                 if asset_details.last_wipe_timestamp > materialization_or_event.timestamp:
@@ -1035,7 +1208,9 @@ def _get_assets_details(self, asset_keys: Sequence[AssetKey]):
             ).fetchall()
 
             asset_key_to_details = {
-                row[0]: (deserialize_json_to_dagster_namedtuple(row[1]) if row[1] else None)
+                row[0]: (
+                    deserialize_json_to_dagster_namedtuple(row[1], trusted=True) if row[1] else None
+                )
                 for row in rows
             }
 
@@ -1150,7 +1325,7 @@ def _asset_materialization_from_json_column(self, json_str):
         #
         # https://github.com/dagster-io/dagster/issues/3945
 
-        event_or_materialization = deserialize_json_to_dagster_namedtuple(json_str)
+        event_or_materialization = deserialize_json_to_dagster_namedtuple(json_str, trusted=True)
         if isinstance(event_or_materialization, AssetMaterialization):
             return event_or_materialization
 
@@ -1205,11 +1380,30 @@ def wipe_asset(self, asset_key):
                     )
                 )
 
+        if self.has_secondary_index(ASSET_PARTITIONS_TABLE):
+            with self.index_connection() as conn:
+                conn.execute(
+                    AssetPartitionsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                        AssetPartitionsTable.c.asset_key == asset_key.to_string()
+                    )
+                )
+
     def get_materialization_count_by_partition(
         self, asset_keys: Sequence[AssetKey]
     ) -> Mapping[AssetKey, Mapping[str, int]]:
         check.list_param(asset_keys, "asset_keys", AssetKey)
 
+        if self.has_secondary_index(ASSET_PARTITIONS_TABLE):
+            return {
+                asset_key: {
+                    partition: record.materialization_count
+                    for partition, record in records_by_partition.items()
+                }
+                for asset_key, records_by_partition in (
+                    self.get_latest_materialization_records_by_partition(asset_keys).items()
+                )
+            }
+
         query = (
             db.select(
                 [
@@ -1228,6 +1422,8 @@ def get_materialization_count_by_partition(
                             [asset_key.to_string(legacy=True) for asset_key in asset_keys]
                         ),
                     ),
+                    SqlEventLogStorageTable.c.dagster_event_type
+                    == DagsterEventType.ASSET_MATERIALIZATION.value,
                     SqlEventLogStorageTable.c.partition != None,
                 )
             )
@@ -1250,6 +1446,194 @@ def get_materialization_count_by_partition(
 
         return materialization_count_by_partition
 
+    def get_latest_materialization_records_by_partition(
+        self, asset_keys: Sequence[AssetKey]
+    ) -> Mapping[AssetKey, Mapping[str, AssetPartitionRecord]]:
+        check.list_param(asset_keys, "asset_keys", AssetKey)
+
+        if self.has_secondary_index(ASSET_PARTITIONS_TABLE):
+            query = db.select(
+                [
+                    AssetPartitionsTable.c.asset_key,
+                    AssetPartitionsTable.c.partition,
+                    AssetPartitionsTable.c.materialization_count,
+                    AssetPartitionsTable.c.last_materialization_storage_id,
+                    AssetPartitionsTable.c.last_run_id,
+                    AssetPartitionsTable.c.last_materialization_timestamp,
+                ]
+            ).where(
+                AssetPartitionsTable.c.asset_key.in_(
+                    [asset_key.to_string() for asset_key in asset_keys]
+                )
+            )
+        else:
+            query = self._get_asset_partitions_summary_query(
+                asset_keys, self._get_assets_details(asset_keys)
+            )
+
+        with self.index_connection() as conn:
+            rows = conn.execute(query).fetchall()
+
+        records_by_key_partition: Dict[AssetKey, Dict[str, AssetPartitionRecord]] = {
+            asset_key: {} for asset_key in asset_keys
+        }
+        for record in _asset_partition_records_from_rows(rows):
+            records_by_key_partition[record.asset_key][record.partition] = record
+
+        return records_by_key_partition
+
+    def get_partitions_missing_since(
+        self,
+        asset_key: AssetKey,
+        since_timestamp: float,
+        partitions: Optional[Sequence[str]] = None,
+    ) -> Sequence[str]:
+        check.inst_param(asset_key, "asset_key", AssetKey)
+        check.numeric_param(since_timestamp, "since_timestamp")
+        check.opt_list_param(partitions, "partitions", of_type=str)
+
+        if not self.has_secondary_index(ASSET_PARTITIONS_TABLE):
+            return super().get_partitions_missing_since(asset_key, since_timestamp, partitions)
+
+        since = datetime.utcfromtimestamp(since_timestamp)
+        query = db.select([AssetPartitionsTable.c.partition]).where(
+            AssetPartitionsTable.c.asset_key == asset_key.to_string()
+        )
+        if partitions is None:
+            # every materialized partition whose latest materialization is too old
+            query = query.where(AssetPartitionsTable.c.last_materialization_timestamp < since)
+            with self.index_connection() as conn:
+                return [row[0] for row in conn.execute(query).fetchall()]
+
+        query = query.where(AssetPartitionsTable.c.last_materialization_timestamp >= since).where(
+            AssetPartitionsTable.c.partition.in_(partitions)
+        )
+        with self.index_connection() as conn:
+            materialized_since = {row[0] for row in conn.execute(query).fetchall()}
+
+        return [partition for partition in partitions if partition not in materialized_since]
+
+    def _get_asset_partitions_summary_query(self, asset_keys, assets_details):
+        """Query the event log for the number of materializations of every partition of the given
+        assets, along with the run id and timestamp of the latest one."""
+        summary = (
+            db.select(
+                [
+                    SqlEventLogStorageTable.c.asset_key,
+                    SqlEventLogStorageTable.c.partition,
+                    db.func.count(SqlEventLogStorageTable.c.id).label("materialization_count"),
+                    db.func.max(SqlEventLogStorageTable.c.id).label(
+                        "last_materialization_storage_id"
+                    ),
+                ]
+            )
+            .where(
+                db.or_(
+                    SqlEventLogStorageTable.c.asset_key.in_(
+                        [asset_key.to_string() for asset_key in asset_keys]
+                    ),
+                    SqlEventLogStorageTable.c.asset_key.in_(
+                        [asset_key.to_string(legacy=True) for asset_key in asset_keys]
+                    ),
+                )
+            )
+            .where(
+                SqlEventLogStorageTable.c.dagster_event_type
+                == DagsterEventType.ASSET_MATERIALIZATION.value
+            )
+            .where(SqlEventLogStorageTable.c.partition != None)
+            .group_by(SqlEventLogStorageTable.c.asset_key, SqlEventLogStorageTable.c.partition)
+        )
+        summary = self._add_assets_wipe_filter_to_query(summary, assets_details, asset_keys).alias(
+            "summary"
+        )
+
+        return db.select(
+            [
+                summary.c.asset_key,
+                summary.c.partition,
+                summary.c.materialization_count,
+                summary.c.last_materialization_storage_id,
+                SqlEventLogStorageTable.c.run_id,
+                SqlEventLogStorageTable.c.timestamp,
+            ]
+        ).select_from(
+            summary.join(
+                SqlEventLogStorageTable,
+                SqlEventLogStorageTable.c.id == summary.c.last_materialization_storage_id,
+            )
+        )
+
+    def rebuild_asset_partitions(self, conn, asset_key):
+        """Rebuild the rows of the given asset in the asset partitions table from the event log,
+        using the given connection. Used to build the table for existing event logs, and to correct
+        it once materializations have been removed."""
+        check.inst_param(asset_key, "asset_key", AssetKey)
+
+        asset_details_str = conn.execute(
+            db.select([AssetKeyTable.c.asset_details]).where(
+                AssetKeyTable.c.asset_key == asset_key.to_string()
+            )
+        ).scalar()
+        asset_details = (
+            deserialize_json_to_dagster_namedtuple(asset_details_str) if asset_details_str else None
+        )
+        rows = conn.execute(
+            self._get_asset_partitions_summary_query([asset_key], [asset_details])
+        ).fetchall()
+
+        conn.execute(
+            AssetPartitionsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                AssetPartitionsTable.c.asset_key == asset_key.to_string()
+            )
+        )
+        values = [
+            dict(
+                asset_key=record.asset_key.to_string(),
+                partition=record.partition,
+                last_materialization_storage_id=record.last_materialization_storage_id,
+                last_run_id=record.last_run_id,
+                last_materialization_timestamp=datetime.utcfromtimestamp(
+                    record.last_materialization_timestamp
+                ),
+                materialization_count=record.materialization_count,
+            )
+            for record in _asset_partition_records_from_rows(rows)
+        ]
+        if values:
+            conn.execute(
+                AssetPartitionsTable.insert(), values  # pylint: disable=no-value-for-parameter
+            )
+
+
+def _asset_partition_records_from_rows(rows) -> List[AssetPartitionRecord]:
+    """Build partition summaries from (asset_key, partition, materialization_count,
+    last_materialization_storage_id, last_run_id, last_materialization_timestamp) rows, merging the
+    rows of legacy and current asset key strings that refer to the same asset."""
+    records: Dict[Tuple[AssetKey, str], AssetPartitionRecord] = {}
+    for asset_key_str, partition, count, storage_id, run_id, timestamp in rows:
+        asset_key = AssetKey.from_db_string(asset_key_str)
+        if not asset_key:
+            continue
+
+        record = AssetPartitionRecord(
+            asset_key=asset_key,
+            partition=partition,
+            last_materialization_storage_id=storage_id,
+            last_run_id=run_id,
+            last_materialization_timestamp=datetime_as_float(timestamp),
+            materialization_count=count,
+        )
+        existing = records.get((asset_key, partition))
+        if existing:
+            latest = max(existing, record, key=lambda r: r.last_materialization_storage_id or 0)
+            record = latest._replace(
+                materialization_count=existing.materialization_count + record.materialization_count
+            )
+        records[(asset_key, partition)] = record
+
+    return list(records.values())
+
 
 def _get_from_row(row, column):
     """utility function for extracting a column from a sqlalchemy row proxy, since '_asdict' is not
@@ -0,0 +1,22 @@
+"""add asset partitions table
+
+Revision ID: e63016185cdf
+Revises: 05844c702676
+Create Date: 2022-04-11 14:02:17.291486
+
+"""
+from dagster.core.storage.migration.utils import create_asset_partitions_table
+
+# revision identifiers, used by Alembic.
+revision = "e63016185cdf"
+down_revision = "05844c702676"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_asset_partitions_table()
+
+
+def downgrade():
+    pass
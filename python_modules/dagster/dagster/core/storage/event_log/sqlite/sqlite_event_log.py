@@ -165,6 +165,7 @@ def _initdb(self, engine):
 
                 if not (
                     "table asset_keys already exists" in err_msg
+                    or "table asset_partitions already exists" in err_msg
                     or "table secondary_indexes already exists" in err_msg
                     or "table event_logs already exists" in err_msg
                     or "database is locked" in err_msg
@@ -237,14 +238,14 @@ def store_event(self, event):
 
             # mirror the event in the cross-run index database
             with self.index_connection() as conn:
-                conn.execute(insert_event_statement)
+                event_id = conn.execute(insert_event_statement).inserted_primary_key[0]
 
             if (
                 event.dagster_event.is_step_materialization
                 or event.dagster_event.is_asset_observation
                 or event.dagster_event.is_asset_materialization_planned
             ):
-                self.store_asset_event(event)
+                self.store_asset_event(event, event_id)
 
     def get_event_records(
         self,
@@ -326,7 +327,7 @@ def get_event_records(
 
             for row_id, json_str in results:
                 try:
-                    event_record = deserialize_json_to_dagster_namedtuple(json_str)
+                    event_record = deserialize_json_to_dagster_namedtuple(json_str, trusted=True)
                     if not isinstance(event_record, EventLogEntry):
                         logging.warning(
                             "Could not resolve event record as EventLogEntry for id `{}`.".format(
@@ -121,6 +121,16 @@ def handle_output(self, context, obj):
             obj (Any): The object, returned by the op, to be stored.
         """
 
+    def release_output(self, _context) -> None:
+        """User-defined method that is called once every downstream op that loads an output has
+        finished, so that an IOManager that holds outputs in memory or in temporary storage can free
+        them. This is only called for outputs that are stored and loaded in the same process, by
+        the in-process executor. By default, it does nothing.
+
+        Args:
+            context (OutputContext): The context of the step output that is no longer needed.
+        """
+
     def get_output_asset_key(self, _context) -> Optional[AssetKey]:
         """User-defined method that associates outputs handled by this IOManager with a particular
         AssetKey.
@@ -1,6 +1,8 @@
 import os
 import pickle
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Sequence, Set
 
 from dagster import check
 from dagster.config import Field
@@ -10,12 +12,18 @@
 from dagster.utils import PICKLE_PROTOCOL, mkdir_p
 from dagster.utils.backcompat import experimental
 
+# The most has_output calls that MemoizableIOManager.has_outputs makes at once
+HAS_OUTPUTS_MAX_WORKERS = 16
+
 
 class MemoizableIOManager(IOManager):
     """
     Base class for IO manager enabled to work with memoized execution. Users should implement
     the ``load_input`` and ``handle_output`` methods described in the ``IOManager`` API, and the
     ``has_output`` method, which returns a boolean representing whether a data object can be found.
+
+    IO managers that can check for many data objects at once, for example by listing a directory,
+    can also override the ``has_outputs`` method.
     """
 
     @abstractmethod
@@ -29,6 +37,35 @@ def has_output(self, context: OutputContext) -> bool:
             bool: True if there is data present that matches the provided context. False otherwise.
         """
 
+    def has_outputs(self, contexts: Sequence[OutputContext]) -> List[bool]:
+        """Returns whether data exists for each of the given contexts.
+
+        Memoized execution calls this once with all of the outputs handled by this IO manager. By
+        default, it calls ``has_output`` for the contexts concurrently on a thread pool.
+
+        Args:
+            contexts (Sequence[OutputContext]): The contexts of the step outputs to check.
+
+        Returns:
+            List[bool]: For each context, in order, whether there is data present that matches it.
+        """
+        if len(contexts) <= 1:
+            return [self.has_output(context) for context in contexts]
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(contexts), HAS_OUTPUTS_MAX_WORKERS),
+            thread_name_prefix="dagster_has_output",
+        ) as executor:
+            return list(executor.map(self.has_output, contexts))
+
+
+def _list_dir(path: str, files_only: bool) -> Set[str]:
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries if not files_only or entry.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
 
 class VersionedPickledObjectFilesystemIOManager(MemoizableIOManager):
     def __init__(self, base_dir=None):
@@ -80,6 +117,28 @@ def has_output(self, context):
 
         return os.path.exists(filepath) and not os.path.isdir(filepath)
 
+    def has_outputs(self, contexts):
+        """Lists the directory of each step output once, rather than checking for each file.
+
+        Outputs of steps without a directory under the base directory are missing, so a step that
+        has never run costs no more than the single listing of the base directory.
+        """
+
+        step_keys = _list_dir(self.base_dir, files_only=False)
+        output_dir_files = {}
+        results = []
+        for context in contexts:
+            if context.step_key not in step_keys:
+                results.append(False)
+                continue
+
+            output_dir, version = os.path.split(self._get_path(context))
+            if output_dir not in output_dir_files:
+                output_dir_files[output_dir] = _list_dir(output_dir, files_only=True)
+            results.append(version in output_dir_files[output_dir])
+
+        return results
+
 
 @io_manager(config_schema={"base_dir": Field(StringSource, is_required=False)})
 @experimental
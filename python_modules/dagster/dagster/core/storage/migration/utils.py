@@ -300,3 +300,32 @@ def create_tick_selector_index():
     op.create_index(
         "idx_tick_selector_timestamp", "job_ticks", ["selector_id", "timestamp"], unique=False
     )
+
+
+def create_asset_partitions_table():
+    if not has_table("event_logs"):
+        # not an event log storage db
+        return
+
+    if has_table("asset_partitions"):
+        # already migrated
+        return
+
+    op.create_table(
+        "asset_partitions",
+        db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+        db.Column("asset_key", db.Text, nullable=False),
+        db.Column("partition", db.Text, nullable=False),
+        db.Column("last_materialization_storage_id", db.Integer),
+        db.Column("last_run_id", db.String(255)),
+        db.Column("last_materialization_timestamp", db.types.TIMESTAMP),
+        db.Column("materialization_count", db.Integer, nullable=False),
+        db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
+    )
+    op.create_index(
+        "idx_asset_partitions_asset_key_partition",
+        "asset_partitions",
+        ["asset_key", "partition"],
+        unique=True,
+        mysql_length={"asset_key": 255, "partition": 255},
+    )
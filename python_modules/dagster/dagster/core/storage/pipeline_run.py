@@ -10,7 +10,9 @@
 from dagster.serdes.serdes import (
     DefaultNamedTupleSerializer,
     EnumSerializer,
+    TrustedNamedTupleSerializer,
     WhitelistMap,
+    is_deserializing_trusted_input,
     register_serdes_enum_fallbacks,
     register_serdes_tuple_fallbacks,
     replace_storage_keys,
@@ -126,7 +128,7 @@ def __new__(
         )
 
 
-class DagsterRunSerializer(DefaultNamedTupleSerializer):
+class DagsterRunSerializer(TrustedNamedTupleSerializer):
     @classmethod
     def value_from_storage_dict(
         cls,
@@ -141,6 +143,12 @@ def value_from_storage_dict(
             key: unpack_inner_value(value, whitelist_map, f"{descent_path}.{key}")
             for key, value in storage_dict.items()
         }
+        if is_deserializing_trusted_input():
+            return cls.value_from_trusted_unpacked(unpacked_dict, klass)
+        return cls.value_from_unpacked(unpacked_dict, klass)
+
+    @classmethod
+    def value_from_unpacked(cls, unpacked_dict, klass):
         # called by the serdes layer, delegates to helper method with expanded kwargs
         return pipeline_run_from_storage(**unpacked_dict)
 
@@ -171,7 +171,7 @@ def handle_run_event(self, run_id: str, event: DagsterEvent):
             )
 
     def _row_to_run(self, row: Tuple) -> PipelineRun:
-        return deserialize_as(row[0], PipelineRun)
+        return deserialize_as(row[0], PipelineRun, trusted=True)
 
     def _rows_to_runs(self, rows: Iterable[Tuple]) -> List[PipelineRun]:
         return list(map(self._row_to_run, rows))
@@ -395,7 +395,7 @@ def get_run_by_id(self, run_id: str) -> Optional[PipelineRun]:
 
         query = db.select([RunsTable.c.run_body]).where(RunsTable.c.run_id == run_id)
         rows = self.fetchall(query)
-        return deserialize_as(rows[0][0], PipelineRun) if len(rows) else None
+        return deserialize_as(rows[0][0], PipelineRun, trusted=True) if len(rows) else None
 
     def get_run_records(
         self,
@@ -429,7 +429,7 @@ def get_run_records(
             RunRecord(
                 storage_id=check.int_param(row["id"], "id"),
                 pipeline_run=deserialize_as(
-                    check.str_param(row["run_body"], "run_body"), PipelineRun
+                    check.str_param(row["run_body"], "run_body"), PipelineRun, trusted=True
                 ),
                 create_timestamp=check.inst(row["create_timestamp"], datetime),
                 update_timestamp=check.inst(row["update_timestamp"], datetime),
@@ -1009,7 +1009,7 @@ def _warn(msg):
         return None
 
     try:
-        return deserialize_json_to_dagster_namedtuple(decoded_str)
+        return deserialize_json_to_dagster_namedtuple(decoded_str, trusted=True)
     except JSONDecodeError:
         _warn("Could not parse json in snapshot table.")
         return None
@@ -108,7 +108,14 @@ def update_tick(self, tick: InstigatorTick):
         """
 
     @abc.abstractmethod
-    def purge_ticks(self, origin_id: str, selector_id: str, tick_status: TickStatus, before: float):
+    def purge_ticks(
+        self,
+        origin_id: str,
+        selector_id: str,
+        tick_status: TickStatus,
+        before: float,
+        limit: Optional[int] = None,
+    ) -> int:
         """Wipe ticks for an instigator for a certain status and timestamp.
 
         Args:
@@ -116,7 +123,37 @@ def purge_ticks(self, origin_id: str, selector_id: str, tick_status: TickStatus,
             selector_id (str): The logical instigator identifier
             tick_status (TickStatus): The tick status to wipe
             before (datetime): All ticks before this datetime will get purged
+            limit (Optional[int]): The maximum number of ticks to purge, oldest first
+
+        Returns:
+            int: The number of purged ticks
+        """
+
+    def collapse_skipped_ticks(
+        self,
+        origin_id: str,
+        selector_id: str,
+        before: float,
+        after: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> Optional[float]:
+        """Collapse every span of consecutive skipped ticks of an instigator into the last tick of
+        the span, which keeps count of the collapsed ticks.
+
+        Args:
+            origin_id (str): The id of the instigator target
+            selector_id (str): The logical instigator identifier
+            before (float): Only ticks before this timestamp are collapsed
+            after (Optional[float]): Only ticks at or after this timestamp are collapsed
+            limit (Optional[int]): The maximum number of ticks to read, oldest first
+
+        Returns:
+            Optional[float]: The timestamp of the last tick that was read, to pass as ``after`` to
+                continue with the next ticks, or None if there were no ticks to read.
+
+        Storages that do not implement this leave skipped ticks uncollapsed.
         """
+        return None
 
     @abc.abstractmethod
     def upgrade(self):
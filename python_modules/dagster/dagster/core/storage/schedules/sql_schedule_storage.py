@@ -1,7 +1,7 @@
 from abc import abstractmethod
 from collections import defaultdict
 from datetime import datetime
-from typing import Callable, Iterable, Mapping, Optional, Sequence, cast
+from typing import Callable, Iterable, List, Mapping, Optional, Sequence, cast
 
 import pendulum
 import sqlalchemy as db
@@ -26,6 +26,8 @@
 class SqlScheduleStorage(ScheduleStorage):
     """Base class for SQL backed schedule storage"""
 
+    _tick_selector_ids_built = False
+
     @abstractmethod
     def connect(self):
         """Context manager yielding a sqlalchemy.engine.Connection."""
@@ -233,6 +235,33 @@ def _has_instigators_table(self, conn):
         table_names = db.inspect(conn).get_table_names()
         return "instigators" in table_names
 
+    def _ticks_have_selector_ids(self):
+        # once built, the selector id index stays built, so only a positive result is cached
+        if not self._tick_selector_ids_built:
+            self._tick_selector_ids_built = self.has_instigators_table() and self.has_built_index(
+                SCHEDULE_TICKS_SELECTOR_ID
+            )
+        return self._tick_selector_ids_built
+
+    def _add_tick_selector_filter(self, query, origin_id, selector_id):
+        if self._ticks_have_selector_ids():
+            # every tick has a selector id, so that the (selector_id, timestamp) index serves the
+            # query
+            return query.where(JobTickTable.c.selector_id == selector_id)
+
+        if self.has_instigators_table():
+            return query.where(
+                db.or_(
+                    JobTickTable.c.selector_id == selector_id,
+                    db.and_(
+                        JobTickTable.c.selector_id == None,
+                        JobTickTable.c.job_origin_id == origin_id,
+                    ),
+                )
+            )
+
+        return query.where(JobTickTable.c.job_origin_id == origin_id)
+
     def get_batch_ticks(
         self,
         selector_ids: Sequence[str],
@@ -243,45 +272,21 @@ def get_batch_ticks(
         check.opt_int_param(limit, "limit")
         check.opt_list_param(statuses, "statuses", of_type=TickStatus)
 
-        bucket_rank_column = (
-            db.func.rank()
-            .over(
-                order_by=db.desc(JobTickTable.c.timestamp),
-                partition_by=JobTickTable.c.selector_id,
-            )
-            .label("rank")
-        )
-        subquery = (
-            db.select(
-                [
-                    JobTickTable.c.id,
-                    JobTickTable.c.selector_id,
-                    JobTickTable.c.tick_body,
-                    bucket_rank_column,
-                ]
-            )
-            .select_from(JobTickTable)
-            .where(JobTickTable.c.selector_id.in_(selector_ids))
-            .alias("subquery")
-        )
-        if statuses:
-            subquery = subquery.where(
-                JobTickTable.c.status.in_([status.value for status in statuses])
-            )
-
-        query = (
-            db.select([subquery.c.id, subquery.c.selector_id, subquery.c.tick_body])
-            .order_by(subquery.c.rank.asc())
-            .where(subquery.c.rank <= limit)
-        )
-
-        rows = self.execute(query)
+        # a limited query per selector id walks the (selector_id, timestamp) index backwards,
+        # instead of ranking every tick of the selected instigators
         results = defaultdict(list)
-        for row in rows:
-            tick_id = row[0]
-            selector_id = row[1]
-            tick_data = cast(TickData, deserialize_json_to_dagster_namedtuple(row[2]))
-            results[selector_id].append(InstigatorTick(tick_id, tick_data))
+        with self.connect() as conn:
+            for selector_id in selector_ids:
+                query = (
+                    db.select([JobTickTable.c.id, JobTickTable.c.tick_body])
+                    .select_from(JobTickTable)
+                    .where(JobTickTable.c.selector_id == selector_id)
+                    .order_by(JobTickTable.c.timestamp.desc())
+                )
+                query = self._add_filter_limit(query, limit=limit, statuses=statuses)
+                for row in conn.execute(query).fetchall():
+                    tick_data = cast(TickData, deserialize_json_to_dagster_namedtuple(row[1]))
+                    results[selector_id].append(InstigatorTick(row[0], tick_data))
         return results
 
     def get_ticks(self, origin_id, selector_id, before=None, after=None, limit=None, statuses=None):
@@ -291,24 +296,12 @@ def get_ticks(self, origin_id, selector_id, before=None, after=None, limit=None,
         check.opt_int_param(limit, "limit")
         check.opt_list_param(statuses, "statuses", of_type=TickStatus)
 
-        base_query = (
+        query = (
             db.select([JobTickTable.c.id, JobTickTable.c.tick_body])
             .select_from(JobTickTable)
             .order_by(JobTickTable.c.timestamp.desc())
         )
-        if self.has_instigators_table():
-            query = base_query.where(
-                db.or_(
-                    JobTickTable.c.selector_id == selector_id,
-                    db.and_(
-                        JobTickTable.c.selector_id == None,
-                        JobTickTable.c.job_origin_id == origin_id,
-                    ),
-                )
-            )
-        else:
-            query = base_query.where(JobTickTable.c.job_origin_id == origin_id)
-
+        query = self._add_tick_selector_filter(query, origin_id, selector_id)
         query = self._add_filter_limit(
             query, before=before, after=after, limit=limit, statuses=statuses
         )
@@ -365,34 +358,99 @@ def update_tick(self, tick):
 
         return tick
 
-    def purge_ticks(self, origin_id, selector_id, tick_status, before):
+    def purge_ticks(self, origin_id, selector_id, tick_status, before, limit=None):
         check.str_param(origin_id, "origin_id")
         check.inst_param(tick_status, "tick_status", TickStatus)
         check.float_param(before, "before")
+        check.opt_int_param(limit, "limit")
 
         utc_before = utc_datetime_from_timestamp(before)
 
-        base_query = (
-            JobTickTable.delete()  # pylint: disable=no-value-for-parameter
-            .where(JobTickTable.c.status == tick_status.value)
-            .where(JobTickTable.c.timestamp < utc_before)
-        )
-
-        if self.has_instigators_table():
-            query = base_query.where(
-                db.or_(
-                    JobTickTable.c.selector_id == selector_id,
-                    db.and_(
-                        JobTickTable.c.selector_id == None,
-                        JobTickTable.c.job_origin_id == origin_id,
-                    ),
+        with self.connect() as conn:
+            if limit:
+                id_query = (
+                    db.select([JobTickTable.c.id])
+                    .where(JobTickTable.c.status == tick_status.value)
+                    .where(JobTickTable.c.timestamp < utc_before)
+                    .order_by(JobTickTable.c.timestamp.asc())
+                    .limit(limit)
                 )
+                id_query = self._add_tick_selector_filter(id_query, origin_id, selector_id)
+                tick_ids = [row[0] for row in conn.execute(id_query).fetchall()]
+                if tick_ids:
+                    conn.execute(
+                        JobTickTable.delete().where(  # pylint: disable=no-value-for-parameter
+                            JobTickTable.c.id.in_(tick_ids)
+                        )
+                    )
+                return len(tick_ids)
+
+            query = (
+                JobTickTable.delete()  # pylint: disable=no-value-for-parameter
+                .where(JobTickTable.c.status == tick_status.value)
+                .where(JobTickTable.c.timestamp < utc_before)
             )
-        else:
-            query = base_query.where(JobTickTable.c.job_origin_id == origin_id)
+            query = self._add_tick_selector_filter(query, origin_id, selector_id)
+            return conn.execute(query).rowcount
+
+    def collapse_skipped_ticks(self, origin_id, selector_id, before, after=None, limit=None):
+        check.str_param(origin_id, "origin_id")
+        check.float_param(before, "before")
+        check.opt_float_param(after, "after")
+        check.opt_int_param(limit, "limit")
+
+        query = (
+            db.select([JobTickTable.c.id, JobTickTable.c.tick_body])
+            .select_from(JobTickTable)
+            .where(JobTickTable.c.timestamp < utc_datetime_from_timestamp(before))
+            .order_by(JobTickTable.c.timestamp.asc())
+        )
+        if after is not None:
+            # the last tick of the previous batch is read again, so that a span of skipped ticks
+            # that continues into this batch is collapsed into a single tick
+            query = query.where(JobTickTable.c.timestamp >= utc_datetime_from_timestamp(after))
+        if limit:
+            query = query.limit(limit)
+        query = self._add_tick_selector_filter(query, origin_id, selector_id)
 
         with self.connect() as conn:
-            conn.execute(query)
+            ticks = [
+                InstigatorTick(row[0], deserialize_json_to_dagster_namedtuple(row[1]))
+                for row in conn.execute(query).fetchall()
+            ]
+
+            span: List[InstigatorTick] = []
+            for tick in ticks:
+                if tick.status == TickStatus.SKIPPED:
+                    span.append(tick)
+                    continue
+                self._collapse_tick_span(conn, span)
+                span = []
+            self._collapse_tick_span(conn, span)
+
+        return ticks[-1].timestamp if ticks else None
+
+    def _collapse_tick_span(self, conn, span):
+        if len(span) < 2:
+            return
+
+        last_tick = span[-1]
+        collapsed_tick_data = last_tick.tick_data.with_collapsed_ticks(
+            collapsed_tick_count=sum(tick.collapsed_tick_count + 1 for tick in span) - 1,
+            collapsed_since_timestamp=min(
+                tick.collapsed_since_timestamp or tick.timestamp for tick in span
+            ),
+        )
+        conn.execute(
+            JobTickTable.update()  # pylint: disable=no-value-for-parameter
+            .where(JobTickTable.c.id == last_tick.tick_id)
+            .values(tick_body=serialize_dagster_namedtuple(collapsed_tick_data))
+        )
+        conn.execute(
+            JobTickTable.delete().where(  # pylint: disable=no-value-for-parameter
+                JobTickTable.c.id.in_([tick.tick_id for tick in span[:-1]])
+            )
+        )
 
     def wipe(self):
         """Clears the schedule storage."""
@@ -11,15 +11,13 @@
     run_alembic_upgrade,
     stamp_alembic_rev,
 )
-from dagster.core.storage.sqlite import create_db_conn_string, get_sqlite_version
+from dagster.core.storage.sqlite import create_db_conn_string
 from dagster.serdes import ConfigurableClass, ConfigurableClassData
 from dagster.utils import mkdir_p
 
 from ..schema import ScheduleStorageSqlMetadata
 from ..sql_schedule_storage import SqlScheduleStorage
 
-MINIMUM_SQLITE_BATCH_VERSION = "3.25.0"
-
 
 class SqliteScheduleStorage(SqlScheduleStorage, ConfigurableClass):
     """Local SQLite backed schedule storage"""
@@ -80,12 +78,6 @@ def connect(self):
         finally:
             conn.close()
 
-    @property
-    def supports_batch_queries(self):
-        return (
-            get_sqlite_version() > MINIMUM_SQLITE_BATCH_VERSION and super().supports_batch_queries
-        )
-
     def upgrade(self):
         alembic_config = get_alembic_config(__file__)
         with self.connect() as conn:
@@ -33,6 +33,12 @@
 
 SCHEDULED_EXECUTION_TIME_TAG = "{prefix}scheduled_execution_time".format(prefix=HIDDEN_TAG_PREFIX)
 
+# set on a finished run once the event log retention policy has compacted its events, to "archived"
+# if its full event log was archived beforehand and to "compacted" otherwise
+EVENT_LOG_RETENTION_TAG = "{prefix}event_log_retention".format(prefix=HIDDEN_TAG_PREFIX)
+EVENT_LOG_ARCHIVED = "archived"
+EVENT_LOG_COMPACTED = "compacted"
+
 RUN_KEY_TAG = "{prefix}run_key".format(prefix=SYSTEM_TAG_PREFIX)
 
 PRIORITY_TAG = "{prefix}priority".format(prefix=SYSTEM_TAG_PREFIX)
@@ -457,7 +457,12 @@ def create_test_daemon_workspace(workspace_load_target, instance):
     """Creates a DynamicWorkspace suitable for passing into a DagsterDaemon loop when running tests."""
     configure_loggers()
     with create_daemon_grpc_server_registry(instance) as grpc_server_registry:
-        with DaemonWorkspace(grpc_server_registry, workspace_load_target) as workspace:
+        with DaemonWorkspace(
+            grpc_server_registry,
+            workspace_load_target,
+            max_concurrent_location_loads=instance.code_server_max_concurrent_location_loads,
+            location_load_timeout=instance.code_server_location_load_timeout,
+        ) as workspace:
             yield workspace
 
 
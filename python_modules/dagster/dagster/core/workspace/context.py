@@ -13,7 +13,6 @@
 from dagster.core.host_representation import (
     ExternalExecutionPlan,
     ExternalPipeline,
-    GrpcServerRepositoryLocation,
     PipelineSelector,
     RepositoryHandle,
     RepositoryLocation,
@@ -34,6 +33,7 @@
 from dagster.utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
 from .load_target import WorkspaceLoadTarget
+from .location_loader import create_location_from_origin, load_location_entries
 from .permissions import get_user_permissions
 from .workspace import IWorkspace, WorkspaceLocationEntry, WorkspaceLocationLoadStatus
 
@@ -451,8 +451,11 @@ def workspace_load_target(self):
     def add_state_subscriber(self, subscriber):
         self._state_subscribers.append(subscriber)
 
-    def _load_workspace(self):
+    def _load_workspace(
+        self, previous_entries: Optional[Dict[str, WorkspaceLocationEntry]] = None
+    ):
         assert self._lock.locked()
+        previous_entries = check.opt_dict_param(previous_entries, "previous_entries")
         repository_location_origins = (
             self._workspace_load_target.create_origins() if self._workspace_load_target else []
         )
@@ -465,40 +468,32 @@ def _load_workspace(self):
 
         self._location_entry_dict = OrderedDict()
 
+        location_names = set()
         for origin in repository_location_origins:
             check.invariant(
-                self._location_entry_dict.get(origin.location_name) is None,
+                origin.location_name not in location_names,
                 'Cannot have multiple locations with the same name, got multiple "{name}"'.format(
                     name=origin.location_name,
                 ),
             )
+            location_names.add(origin.location_name)
 
             if origin.supports_server_watch:
                 self._start_watch_thread(origin)
-            self._location_entry_dict[origin.location_name] = self._load_location(origin)
 
-    def _create_location_from_origin(
-        self, origin: RepositoryLocationOrigin
-    ) -> Optional[RepositoryLocation]:
-        if not self._grpc_server_registry.supports_origin(origin):
-            return origin.create_location()
-        else:
-            endpoint = (
-                self._grpc_server_registry.reload_grpc_endpoint(origin)
-                if self._grpc_server_registry.supports_reload
-                else self._grpc_server_registry.get_grpc_endpoint(origin)
+        # Locations are loaded on worker threads while this thread holds the lock
+        def _load_location(origin):
+            previous_entry = previous_entries.get(origin.location_name)
+            return self._load_location(
+                origin, previous_entry.repository_location if previous_entry else None
             )
 
-            return GrpcServerRepositoryLocation(
-                origin=origin,
-                server_id=endpoint.server_id,
-                port=endpoint.port,
-                socket=endpoint.socket,
-                host=endpoint.host,
-                heartbeat=True,
-                watch_server=False,
-                grpc_server_registry=self._grpc_server_registry,
-            )
+        self._location_entry_dict = load_location_entries(
+            repository_location_origins,
+            _load_location,
+            max_concurrent_loads=self._instance.code_server_max_concurrent_location_loads,
+            timeout=self._instance.code_server_location_load_timeout,
+        )
 
     @property
     def instance(self):
@@ -549,13 +544,22 @@ def _start_watch_thread(self, origin: GrpcServerRepositoryLocationOrigin) -> Non
         self._watch_threads[location_name] = watch_thread
         watch_thread.start()
 
-    def _load_location(self, origin):
+    def _load_location(
+        self,
+        origin: RepositoryLocationOrigin,
+        previous_location: Optional[RepositoryLocation] = None,
+    ) -> WorkspaceLocationEntry:
         assert self._lock.locked()
         location_name = origin.location_name
         location = None
         error = None
         try:
-            location = self._create_location_from_origin(origin)
+            location = create_location_from_origin(
+                origin,
+                self._grpc_server_registry,
+                reload_grpc_server=self._grpc_server_registry.supports_reload,
+                previous_location=previous_location,
+            )
         except Exception:
             error = serializable_error_info_from_exc_info(sys.exc_info())
             warnings.warn(
@@ -611,8 +615,9 @@ def reload_repository_location(self, name: str) -> None:
         with self._lock:
             # Relying on GC to clean up the old location once nothing else
             # is referencing it
+            previous_entry = self._location_entry_dict[name]
             self._location_entry_dict[name] = self._load_location(
-                self._location_entry_dict[name].origin
+                previous_entry.origin, previous_entry.repository_location
             )
 
     def shutdown_repository_location(self, name: str):
@@ -622,10 +627,25 @@ def shutdown_repository_location(self, name: str):
     def reload_workspace(self):
         # Can be called from a background thread
         with self._lock:
-            self._cleanup_locations()
-            self._load_workspace()
-
-    def _cleanup_locations(self):
+            # Locations whose server has not changed are carried over as is, so only clean up the
+            # ones that were replaced
+            previous_entries = self._location_entry_dict
+            self._stop_watch_threads()
+            self._location_entry_dict = OrderedDict()
+            try:
+                self._load_workspace(previous_entries)
+            finally:
+                reused_locations = {
+                    id(entry.repository_location) for entry in self._location_entry_dict.values()
+                }
+                for entry in previous_entries.values():
+                    if (
+                        entry.repository_location
+                        and id(entry.repository_location) not in reused_locations
+                    ):
+                        entry.repository_location.cleanup()
+
+    def _stop_watch_threads(self):
         assert self._lock.locked()
         for _, event in self._watch_thread_shutdown_events.items():
             event.set()
@@ -635,6 +655,10 @@ def _cleanup_locations(self):
         self._watch_thread_shutdown_events = {}
         self._watch_threads = {}
 
+    def _cleanup_locations(self):
+        assert self._lock.locked()
+        self._stop_watch_threads()
+
         for entry in self._location_entry_dict.values():
             if entry.repository_location:
                 entry.repository_location.cleanup()
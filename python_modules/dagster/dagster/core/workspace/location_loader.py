@@ -0,0 +1,256 @@
+import queue
+import sys
+import threading
+import time
+import warnings
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+from dagster import check
+from dagster.core.errors import DagsterRepositoryLocationLoadError
+from dagster.core.host_representation import (
+    GrpcServerRepositoryLocation,
+    RepositoryLocation,
+    RepositoryLocationOrigin,
+)
+from dagster.core.host_representation.grpc_server_registry import GrpcServerRegistry
+from dagster.core.host_representation.origin import GrpcServerRepositoryLocationOrigin
+from dagster.core.instance.config import DEFAULT_MAX_CONCURRENT_LOCATION_LOADS
+from dagster.utils.error import serializable_error_info_from_exc_info
+
+from .workspace import WorkspaceLocationEntry, WorkspaceLocationLoadStatus
+
+
+def create_location_from_origin(
+    origin: RepositoryLocationOrigin,
+    grpc_server_registry: GrpcServerRegistry,
+    reload_grpc_server: bool = False,
+    previous_location: Optional[RepositoryLocation] = None,
+) -> RepositoryLocation:
+    """Create the repository location for an origin, reusing what was loaded for it before.
+
+    Args:
+        origin (RepositoryLocationOrigin): The origin of the location to load.
+        grpc_server_registry (GrpcServerRegistry): The registry that manages code servers for
+            any origins that it supports.
+        reload_grpc_server (bool): Whether the caller requested a reload. Starts a new code server
+            for origins managed by the registry, rather than using the one it is already running,
+            and always rebuilds the location rather than reusing previous_location, since servers
+            started with a fixed server id keep it across code changes.
+        previous_location (Optional[RepositoryLocation]): The location that was last loaded for
+            this origin. Unless a reload was requested, if it is still talking to the same server
+            (same server id), it is returned as is without fetching anything else. Otherwise, any
+            of its repositories whose snapshot is unchanged on the new server are reused rather
+            than deserialized and indexed again.
+
+    Returns:
+        RepositoryLocation: The loaded location, which may be previous_location itself.
+    """
+    check.inst_param(origin, "origin", RepositoryLocationOrigin)
+    check.inst_param(grpc_server_registry, "grpc_server_registry", GrpcServerRegistry)
+    check.bool_param(reload_grpc_server, "reload_grpc_server")
+    check.opt_inst_param(previous_location, "previous_location", RepositoryLocation)
+
+    previous_grpc_location = (
+        previous_location
+        if isinstance(previous_location, GrpcServerRepositoryLocation)
+        and previous_location.origin == origin
+        else None
+    )
+
+    if not grpc_server_registry.supports_origin(origin):
+        if not isinstance(origin, GrpcServerRepositoryLocationOrigin):
+            return origin.create_location()
+
+        if previous_grpc_location and not reload_grpc_server:
+            try:
+                current_server_id = previous_grpc_location.get_current_server_id()
+            except Exception:
+                # the server is unreachable, loading the location below surfaces the error
+                current_server_id = None
+
+            if current_server_id and current_server_id == previous_grpc_location.server_id:
+                return previous_grpc_location
+
+        return GrpcServerRepositoryLocation(origin, previous_location=previous_grpc_location)
+
+    endpoint = (
+        grpc_server_registry.reload_grpc_endpoint(origin)
+        if reload_grpc_server
+        else grpc_server_registry.get_grpc_endpoint(origin)
+    )
+
+    if (
+        previous_grpc_location
+        and not reload_grpc_server
+        and previous_grpc_location.server_id == endpoint.server_id
+    ):
+        return previous_grpc_location
+
+    return GrpcServerRepositoryLocation(
+        origin=origin,
+        server_id=endpoint.server_id,
+        port=endpoint.port,
+        socket=endpoint.socket,
+        host=endpoint.host,
+        heartbeat=True,
+        watch_server=False,
+        grpc_server_registry=grpc_server_registry,
+        previous_location=previous_grpc_location,
+    )
+
+
+class _LocationLoad:
+    """A single location load running on a loader thread. Tracks when it started so that the timeout
+    does not include time spent waiting for a free worker, and cleans up the location if it
+    finishes after it has already been reported as timed out."""
+
+    def __init__(
+        self,
+        origin: RepositoryLocationOrigin,
+        load_location: Callable[[RepositoryLocationOrigin], WorkspaceLocationEntry],
+    ):
+        self.origin = origin
+        self.start_time: Optional[float] = None
+        self._load_location = load_location
+        self._lock = threading.Lock()
+        self._finished = False
+        self._timed_out = False
+
+    def __call__(self) -> WorkspaceLocationEntry:
+        self.start_time = time.time()
+        entry = self._load_location(self.origin)
+        with self._lock:
+            self._finished = True
+            timed_out = self._timed_out
+        if timed_out and entry.repository_location:
+            entry.repository_location.cleanup()
+        return entry
+
+    def mark_timed_out(self) -> bool:
+        with self._lock:
+            if self._finished:
+                return False
+            self._timed_out = True
+            return True
+
+
+def _timed_out_entry(origin: RepositoryLocationOrigin, timeout: float) -> WorkspaceLocationEntry:
+    try:
+        raise DagsterRepositoryLocationLoadError(
+            f"Timed out after {timeout} seconds loading location {origin.location_name}.",
+            load_error_infos=[],
+        )
+    except DagsterRepositoryLocationLoadError:
+        error = serializable_error_info_from_exc_info(sys.exc_info())
+
+    warnings.warn(
+        "Error loading repository location {location_name}:{error_string}".format(
+            location_name=origin.location_name, error_string=error.to_string()
+        )
+    )
+
+    return WorkspaceLocationEntry(
+        origin=origin,
+        repository_location=None,
+        load_error=error,
+        load_status=WorkspaceLocationLoadStatus.LOADED,
+        display_metadata=origin.get_display_metadata(),
+        update_timestamp=time.time(),
+    )
+
+
+def load_location_entries(
+    origins: List[RepositoryLocationOrigin],
+    load_location: Callable[[RepositoryLocationOrigin], WorkspaceLocationEntry],
+    max_concurrent_loads: int = DEFAULT_MAX_CONCURRENT_LOCATION_LOADS,
+    timeout: Optional[float] = None,
+) -> Dict[str, WorkspaceLocationEntry]:
+    """Load a set of repository locations concurrently on a bounded set of daemon threads.
+
+    Args:
+        origins (List[RepositoryLocationOrigin]): The origins of the locations to load.
+        load_location (Callable[[RepositoryLocationOrigin], WorkspaceLocationEntry]): Loads a
+            single location. Should capture any load errors in the returned entry.
+        max_concurrent_loads (int): The maximum number of locations to load at once.
+        timeout (Optional[float]): If set, how many seconds a single location may take to load
+            before it is reported as a load error, so that one slow location never holds up the
+            rest of the workspace. A location that finishes loading after timing out is cleaned
+            up. Defaults to no timeout.
+
+    Returns:
+        Dict[str, WorkspaceLocationEntry]: An entry for each origin, keyed by location name, in
+            the same order as the origins.
+    """
+    check.list_param(origins, "origins", of_type=RepositoryLocationOrigin)
+    check.callable_param(load_location, "load_location")
+    check.int_param(max_concurrent_loads, "max_concurrent_loads")
+    check.opt_numeric_param(timeout, "timeout")
+
+    pending: Dict[str, _LocationLoad] = OrderedDict()
+    location_loads: queue.Queue = queue.Queue()
+    for origin in origins:
+        location_load = _LocationLoad(origin, load_location)
+        pending[origin.location_name] = location_load
+        location_loads.put(location_load)
+
+    finished_loads: queue.Queue = queue.Queue()
+
+    def _run_location_loads():
+        while True:
+            try:
+                location_load = location_loads.get_nowait()
+            except queue.Empty:
+                return
+
+            try:
+                finished_loads.put((location_load, location_load(), None))
+            except Exception as e:
+                finished_loads.put((location_load, None, e))
+
+    # Daemon threads, so that a load that hangs after timing out never blocks interpreter exit
+    for i in range(max(1, min(max_concurrent_loads, len(origins)))):
+        threading.Thread(
+            target=_run_location_loads, name=f"location_loader_{i}", daemon=True
+        ).start()
+
+    entries: Dict[str, WorkspaceLocationEntry] = {}
+    while pending:
+        wait_timeout = None
+        if timeout is not None:
+            # Locations that have not started yet will only start once another one finishes,
+            # which wakes us up, so waiting for the full timeout is an upper bound
+            deadlines = [
+                location_load.start_time + timeout
+                for location_load in pending.values()
+                if location_load.start_time is not None
+            ]
+            wait_timeout = max(0, min(deadlines) - time.time()) if deadlines else timeout
+
+        try:
+            location_load, entry, error = finished_loads.get(timeout=wait_timeout)
+        except queue.Empty:
+            pass
+        else:
+            location_name = location_load.origin.location_name
+            # loads that already timed out have been reported
+            if location_name in pending:
+                if error:
+                    raise error
+                del pending[location_name]
+                entries[location_name] = entry
+
+        if timeout is None:
+            continue
+
+        now = time.time()
+        for location_name, location_load in list(pending.items()):
+            if (
+                location_load.start_time is not None
+                and now - location_load.start_time >= timeout
+                and location_load.mark_timed_out()
+            ):
+                del pending[location_name]
+                entries[location_name] = _timed_out_entry(location_load.origin, timeout)
+
+    return OrderedDict((origin.location_name, entries[origin.location_name]) for origin in origins)
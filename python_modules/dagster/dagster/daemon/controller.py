@@ -14,9 +14,11 @@
 from dagster.daemon.daemon import (
     BackfillDaemon,
     DagsterDaemon,
+    EventLogRetentionDaemon,
     MonitoringDaemon,
     SchedulerDaemon,
     SensorDaemon,
+    TickRetentionDaemon,
 )
 from dagster.daemon.run_coordinator.queued_run_coordinator_daemon import QueuedRunCoordinatorDaemon
 from dagster.daemon.types import DaemonHeartbeat, DaemonStatus
@@ -31,6 +33,9 @@
 # Default interval at which daemons run
 DEFAULT_DAEMON_INTERVAL_SECONDS = 30
 
+# Interval at which the tick retention policy is applied
+TICK_RETENTION_INTERVAL_SECONDS = 300
+
 # Interval at which heartbeats are posted
 DEFAULT_HEARTBEAT_INTERVAL_SECONDS = 30
 
@@ -86,7 +91,13 @@ def daemon_controller_from_instance(
             # Create this in each daemon to generate a workspace per-daemon
             @contextmanager
             def gen_workspace(_instance):
-                with DaemonWorkspace(grpc_server_registry, workspace_load_target) as workspace:
+                max_concurrent_loads = instance.code_server_max_concurrent_location_loads
+                with DaemonWorkspace(
+                    grpc_server_registry,
+                    workspace_load_target,
+                    max_concurrent_location_loads=max_concurrent_loads,
+                    location_load_timeout=instance.code_server_location_load_timeout,
+                ) as workspace:
                     yield workspace
 
             with DagsterDaemonController(
@@ -301,6 +312,12 @@ def create_daemon_of_type(daemon_type, instance):
         return BackfillDaemon(interval_seconds=DEFAULT_DAEMON_INTERVAL_SECONDS)
     elif daemon_type == MonitoringDaemon.daemon_type():
         return MonitoringDaemon(interval_seconds=instance.run_monitoring_poll_interval_seconds)
+    elif daemon_type == EventLogRetentionDaemon.daemon_type():
+        return EventLogRetentionDaemon(
+            interval_seconds=instance.event_log_retention_poll_interval_seconds
+        )
+    elif daemon_type == TickRetentionDaemon.daemon_type():
+        return TickRetentionDaemon(interval_seconds=TICK_RETENTION_INTERVAL_SECONDS)
     else:
         raise Exception(f"Unexpected daemon type {daemon_type}")
 
@@ -13,6 +13,10 @@
 from dagster.core.workspace import IWorkspace
 from dagster.daemon.backfill import execute_backfill_iteration
 from dagster.daemon.monitoring import execute_monitoring_iteration
+from dagster.daemon.retention import (
+    execute_event_log_retention_iteration,
+    execute_tick_retention_iteration,
+)
 from dagster.daemon.sensor import execute_sensor_iteration_loop
 from dagster.daemon.types import DaemonHeartbeat
 from dagster.scheduler.scheduler import execute_scheduler_iteration_loop
@@ -191,8 +195,8 @@ def __init__(self, interval_seconds):
     def core_loop(self, instance, workspace):
         while True:
             start_time = time.time()
-            # Clear out the workspace locations after each iteration
-            workspace.cleanup()
+            # Refresh the workspace locations after each iteration
+            workspace.refresh()
             try:
                 yield from self.run_iteration(instance, workspace)
             except Exception:
@@ -249,3 +253,36 @@ def daemon_type(cls):
 
     def run_iteration(self, instance, workspace):
         yield from execute_monitoring_iteration(instance, workspace, self._logger)
+
+
+class EventLogRetentionDaemon(IntervalDaemon):
+    def __init__(self, interval_seconds):
+        super().__init__(interval_seconds)
+        # the update timestamp of the last run visited, so that each iteration compacts a small
+        # batch of the runs that finished since
+        self._cursor = None
+
+    @classmethod
+    def daemon_type(cls):
+        return "EVENT_LOG_RETENTION"
+
+    def run_iteration(self, instance, workspace):
+        self._cursor = yield from execute_event_log_retention_iteration(
+            instance, self._logger, self._cursor
+        )
+
+
+class TickRetentionDaemon(IntervalDaemon):
+    def __init__(self, interval_seconds):
+        super().__init__(interval_seconds)
+        # selector id -> timestamp of the last tick whose skipped span was collapsed
+        self._collapse_cursors = {}
+
+    @classmethod
+    def daemon_type(cls):
+        return "TICK_RETENTION"
+
+    def run_iteration(self, instance, workspace):
+        yield from execute_tick_retention_iteration(
+            instance, self._logger, self._collapse_cursors
+        )
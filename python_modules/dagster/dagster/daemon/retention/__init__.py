@@ -0,0 +1,2 @@
+from .event_log_retention import apply_event_log_retention, execute_event_log_retention_iteration
+from .tick_retention import execute_tick_retention_iteration
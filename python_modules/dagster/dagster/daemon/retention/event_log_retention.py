@@ -0,0 +1,102 @@
+import sys
+from datetime import datetime
+from typing import Optional
+
+import pendulum
+
+from dagster import DagsterInstance, check
+from dagster.core.storage.pipeline_run import PipelineRunStatus, RunRecord, RunsFilter
+from dagster.core.storage.tags import (
+    EVENT_LOG_ARCHIVED,
+    EVENT_LOG_COMPACTED,
+    EVENT_LOG_RETENTION_TAG,
+)
+from dagster.utils import utc_datetime_from_naive
+from dagster.utils.error import serializable_error_info_from_exc_info
+
+FINISHED_RUN_STATUSES = [
+    PipelineRunStatus.SUCCESS,
+    PipelineRunStatus.FAILURE,
+    PipelineRunStatus.CANCELED,
+]
+
+
+def apply_event_log_retention(instance: DagsterInstance, run_id: str) -> str:
+    """Compact the event log of a finished run, archiving its full event log beforehand if the
+    instance has an event log archive. Returns the value of the retention tag set on the run."""
+    archive = instance.event_log_archive
+    if archive:
+        # a run that was archived but not tagged before an interruption may already have been
+        # compacted, so its archive must not be overwritten
+        if not archive.has_archived_events(run_id):
+            archive.archive_events(run_id, instance.event_log_storage.get_logs_for_run(run_id))
+        retention_status = EVENT_LOG_ARCHIVED
+    else:
+        retention_status = EVENT_LOG_COMPACTED
+
+    instance.event_log_storage.compact_events(run_id)
+    instance.add_run_tags(run_id, {EVENT_LOG_RETENTION_TAG: retention_status})
+    return retention_status
+
+
+def _should_apply_retention(record: RunRecord, cutoff_timestamp: float) -> bool:
+    if EVENT_LOG_RETENTION_TAG in record.pipeline_run.tags:
+        return False
+
+    end_time = (
+        record.end_time
+        if record.end_time is not None
+        else utc_datetime_from_naive(record.update_timestamp).timestamp()
+    )
+    return end_time < cutoff_timestamp
+
+
+def execute_event_log_retention_iteration(
+    instance: DagsterInstance, logger, cursor: Optional[datetime] = None
+):
+    """Apply the event log retention policy to at most ``batch_size`` of the finished runs created
+    before the retention cutoff, visiting them in the order in which they were last updated,
+    starting after the update timestamp ``cursor``.
+
+    Returns the update timestamp of the last run visited, as the high-water mark to resume from in
+    the next iteration. Runs are only visited again once they have been updated since, e.g. when
+    they are tagged after being compacted, so finished runs are not rescanned on every pass.
+    """
+    check.invariant(instance.event_log_retention_enabled, "Event log retention must be configured")
+    check.opt_inst_param(cursor, "cursor", datetime)
+
+    cutoff = pendulum.now("UTC").subtract(days=instance.event_log_retention_compact_after_days)
+    records = instance.get_run_records(
+        filters=RunsFilter(
+            statuses=FINISHED_RUN_STATUSES,
+            created_before=datetime.utcfromtimestamp(cutoff.timestamp()),
+            updated_after=cursor,
+        ),
+        limit=instance.event_log_retention_batch_size,
+        order_by="update_timestamp",
+        ascending=True,
+    )
+
+    for record in records:
+        if utc_datetime_from_naive(record.update_timestamp).timestamp() >= cutoff.timestamp():
+            # this run and every run after it were updated too recently to have finished before
+            # the cutoff, so they are left for a later iteration
+            break
+
+        cursor = record.update_timestamp
+        if not _should_apply_retention(record, cutoff.timestamp()):
+            yield
+            continue
+
+        run_id = record.pipeline_run.run_id
+        try:
+            retention_status = apply_event_log_retention(instance, run_id)
+            logger.info(f"Compacted the event log of run {run_id} ({retention_status})")
+        except Exception:
+            error_info = serializable_error_info_from_exc_info(sys.exc_info())
+            logger.error(f"Hit error while compacting the event log of run {run_id}: {error_info}")
+            yield error_info
+        else:
+            yield
+
+    return cursor
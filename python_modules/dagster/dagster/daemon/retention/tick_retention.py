@@ -0,0 +1,78 @@
+import sys
+from typing import Dict
+
+import pendulum
+
+from dagster import DagsterInstance, check
+from dagster.core.definitions.run_request import InstigatorType
+from dagster.utils.error import serializable_error_info_from_exc_info
+
+# the number of ticks that are purged or collapsed per statement
+TICK_RETENTION_BATCH_SIZE = 1000
+
+
+def execute_tick_retention_iteration(
+    instance: DagsterInstance, logger, collapse_cursors: Dict[str, float]
+):
+    """Apply the tick retention policy of the instance to the ticks of every schedule and sensor,
+    in batches of ``TICK_RETENTION_BATCH_SIZE`` ticks.
+
+    ``collapse_cursors`` maps the selector id of each instigator to the timestamp of the last tick
+    whose skipped span was collapsed, so that each iteration only reads the ticks that aged past the
+    collapse cutoff since. It is updated in place.
+    """
+    check.invariant(instance.tick_retention_enabled, "Tick retention must be configured")
+
+    now = pendulum.now("UTC")
+    for instigator_type in InstigatorType:
+        purge_after_days = instance.get_tick_retention_purge_after_days(instigator_type)
+        collapse_after_days = instance.get_tick_retention_collapse_skipped_after_days(
+            instigator_type
+        )
+        if not purge_after_days and collapse_after_days is None:
+            continue
+
+        for state in instance.all_instigator_state(instigator_type=instigator_type):
+            try:
+                for tick_status, days in purge_after_days.items():
+                    if days < 0:
+                        continue
+
+                    before = now.subtract(days=days).timestamp()
+                    while (
+                        instance.purge_ticks(
+                            state.instigator_origin_id,
+                            state.selector_id,
+                            tick_status,
+                            before,
+                            limit=TICK_RETENTION_BATCH_SIZE,
+                        )
+                        == TICK_RETENTION_BATCH_SIZE
+                    ):
+                        yield
+
+                if collapse_after_days is not None:
+                    before = now.subtract(days=collapse_after_days).timestamp()
+                    after = collapse_cursors.get(state.selector_id)
+                    while True:
+                        last_timestamp = instance.collapse_skipped_ticks(
+                            state.instigator_origin_id,
+                            state.selector_id,
+                            before,
+                            after=after,
+                            limit=TICK_RETENTION_BATCH_SIZE,
+                        )
+                        if last_timestamp is None or last_timestamp == after:
+                            break
+                        after = last_timestamp
+                        collapse_cursors[state.selector_id] = after
+                        yield
+            except Exception:
+                error_info = serializable_error_info_from_exc_info(sys.exc_info())
+                logger.error(
+                    f"Hit error while applying tick retention to {state.instigator_name}: "
+                    f"{error_info}"
+                )
+                yield error_info
+            else:
+                yield
@@ -140,12 +140,15 @@ def __exit__(self, exception_type, exception_value, traceback):
 
         self._write()
 
-        self._instance.purge_ticks(
-            self._state.instigator_origin_id,
-            selector_id=self._state.selector_id,
-            tick_status=TickStatus.SKIPPED,
-            before=pendulum.now("UTC").subtract(days=7).timestamp(),  #  keep the last 7 days
-        )
+        # the tick retention daemon purges skipped ticks instead if the instance configures it to
+        purge_after_days = self._instance.get_tick_retention_purge_after_days(InstigatorType.SENSOR)
+        if TickStatus.SKIPPED not in purge_after_days:
+            self._instance.purge_ticks(
+                self._state.instigator_origin_id,
+                selector_id=self._state.selector_id,
+                tick_status=TickStatus.SKIPPED,
+                before=pendulum.now("UTC").subtract(days=7).timestamp(),  #  keep the last 7 days
+            )
 
 
 def _check_for_debug_crash(debug_crash_flags, key):
@@ -182,7 +185,7 @@ def execute_sensor_iteration_loop(instance, workspace, logger, until=None):
             break
 
         if start_time - workspace_loaded_time > RELOAD_WORKSPACE:
-            workspace.cleanup()
+            workspace.refresh()
             workspace_loaded_time = pendulum.now("UTC").timestamp()
             workspace_iteration = 0
 
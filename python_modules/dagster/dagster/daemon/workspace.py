@@ -1,18 +1,20 @@
 import sys
 import time
 from abc import abstractmethod
-from typing import Dict
+from typing import Dict, Optional
 
 from dagster import check
 from dagster.core.errors import DagsterRepositoryLocationLoadError
 from dagster.core.host_representation.grpc_server_registry import GrpcServerRegistry
 from dagster.core.host_representation.origin import RepositoryLocationOrigin
-from dagster.core.host_representation.repository_location import (
-    GrpcServerRepositoryLocation,
-    RepositoryLocation,
-)
+from dagster.core.host_representation.repository_location import RepositoryLocation
+from dagster.core.instance.config import DEFAULT_MAX_CONCURRENT_LOCATION_LOADS
 from dagster.core.workspace import IWorkspace, WorkspaceLocationEntry, WorkspaceLocationLoadStatus
 from dagster.core.workspace.load_target import WorkspaceLoadTarget
+from dagster.core.workspace.location_loader import (
+    create_location_from_origin,
+    load_location_entries,
+)
 from dagster.utils.error import serializable_error_info_from_exc_info
 
 
@@ -23,36 +25,58 @@ class BaseDaemonWorkspace(IWorkspace):
     the server processes can be shared across multiple daemons.
 
     Both the list of locations and the RepositoryLocation objects are cached until the daemon
-    code calls cleanup() on the DaemonWorkspace - daemons are responsible for doing this
-    periodically whenever they might want to check for code updates and workspace.yaml updates.
+    code calls refresh() or cleanup() on the DaemonWorkspace - daemons are responsible for doing
+    this periodically whenever they might want to check for code updates and workspace.yaml
+    updates. After a refresh(), locations whose server has not changed are carried over to the
+    reloaded workspace instead of being fetched again.
     """
 
     def __init__(self):
         self._location_entries = None
+        self._stale_location_entries = None
 
     def __enter__(self):
         return self
 
     def get_workspace_snapshot(self) -> Dict[str, WorkspaceLocationEntry]:
+        return self._get_location_entries()
+
+    def _get_location_entries(self) -> Dict[str, WorkspaceLocationEntry]:
         if self._location_entries == None:
-            self._location_entries = self._load_workspace()
+            previous_entries = self._stale_location_entries or {}
+            self._stale_location_entries = None
+            try:
+                self._location_entries = self._load_workspace(previous_entries)
+            finally:
+                reused_locations = {
+                    id(entry.repository_location)
+                    for entry in (self._location_entries or {}).values()
+                }
+                for entry in previous_entries.values():
+                    if (
+                        entry.repository_location
+                        and id(entry.repository_location) not in reused_locations
+                    ):
+                        entry.repository_location.cleanup()
+
         return self._location_entries
 
     @abstractmethod
-    def _load_workspace(self) -> Dict[str, WorkspaceLocationEntry]:
+    def _load_workspace(
+        self, previous_entries: Dict[str, WorkspaceLocationEntry]
+    ) -> Dict[str, WorkspaceLocationEntry]:
         pass
 
     def get_location(self, location_name: str) -> RepositoryLocation:
-        if self._location_entries == None:
-            self._location_entries = self._load_workspace()
+        location_entries = self._get_location_entries()
 
-        if location_name not in self._location_entries:
+        if location_name not in location_entries:
             raise DagsterRepositoryLocationLoadError(
                 f"Location {location_name} does not exist in workspace",
                 load_error_infos=[],
             )
 
-        location_entry = self._location_entries[location_name]
+        location_entry = location_entries[location_name]
 
         if location_entry.load_error:
             raise DagsterRepositoryLocationLoadError(
@@ -68,20 +92,33 @@ def get_location(self, location_name: str) -> RepositoryLocation:
 
         return location_entry.repository_location
 
-    def cleanup(self) -> None:
+    def refresh(self) -> None:
+        """Reload the workspace the next time it is accessed, only fetching the locations that
+        changed since it was last loaded."""
         if self._location_entries != None:
-            for location_entry in self._location_entries.values():
-                if location_entry.repository_location:
-                    location_entry.repository_location.cleanup()
+            self._stale_location_entries = self._location_entries
             self._location_entries = None
 
+    def cleanup(self) -> None:
+        for location_entries in [self._location_entries, self._stale_location_entries]:
+            if location_entries != None:
+                for location_entry in location_entries.values():
+                    if location_entry.repository_location:
+                        location_entry.repository_location.cleanup()
+        self._location_entries = None
+        self._stale_location_entries = None
+
     def __exit__(self, exception_type, exception_value, traceback):
         self.cleanup()
 
 
 class DaemonWorkspace(BaseDaemonWorkspace):
     def __init__(
-        self, grpc_server_registry: GrpcServerRegistry, workspace_load_target: WorkspaceLoadTarget
+        self,
+        grpc_server_registry: GrpcServerRegistry,
+        workspace_load_target: WorkspaceLoadTarget,
+        max_concurrent_location_loads: int = DEFAULT_MAX_CONCURRENT_LOCATION_LOADS,
+        location_load_timeout: Optional[int] = None,
     ):
         self._grpc_server_registry = check.inst_param(
             grpc_server_registry, "grpc_server_registry", GrpcServerRegistry
@@ -91,20 +128,42 @@ def __init__(
             workspace_load_target, "workspace_load_target", WorkspaceLoadTarget
         )
 
+        self._max_concurrent_location_loads = check.int_param(
+            max_concurrent_location_loads, "max_concurrent_location_loads"
+        )
+        self._location_load_timeout = check.opt_int_param(
+            location_load_timeout, "location_load_timeout"
+        )
+
         super().__init__()
 
-    def _load_workspace(self) -> Dict[str, WorkspaceLocationEntry]:
-        entries = {}
-        origins = self._workspace_load_target.create_origins()
-        for origin in origins:
-            entries[origin.location_name] = self._load_location(origin)
-        return entries
+    def _load_workspace(
+        self, previous_entries: Dict[str, WorkspaceLocationEntry]
+    ) -> Dict[str, WorkspaceLocationEntry]:
+        def _load_location(origin):
+            previous_entry = previous_entries.get(origin.location_name)
+            return self._load_location(
+                origin, previous_entry.repository_location if previous_entry else None
+            )
 
-    def _load_location(self, origin) -> WorkspaceLocationEntry:
+        return load_location_entries(
+            self._workspace_load_target.create_origins(),
+            _load_location,
+            max_concurrent_loads=self._max_concurrent_location_loads,
+            timeout=self._location_load_timeout,
+        )
+
+    def _load_location(
+        self,
+        origin: RepositoryLocationOrigin,
+        previous_location: Optional[RepositoryLocation] = None,
+    ) -> WorkspaceLocationEntry:
         location = None
         error = None
         try:
-            location = self._create_location_from_origin(origin)
+            location = create_location_from_origin(
+                origin, self._grpc_server_registry, previous_location=previous_location
+            )
         except Exception:
             error = serializable_error_info_from_exc_info(sys.exc_info())
 
@@ -118,21 +177,3 @@ def _load_location(self, origin) -> WorkspaceLocationEntry:
             else origin.get_display_metadata(),
             update_timestamp=time.time(),
         )
-
-    def _create_location_from_origin(self, origin) -> RepositoryLocation:
-        check.inst_param(origin, "origin", RepositoryLocationOrigin)
-
-        if not self._grpc_server_registry.supports_origin(origin):
-            return origin.create_location()
-        else:
-            endpoint = self._grpc_server_registry.get_grpc_endpoint(origin)
-            return GrpcServerRepositoryLocation(
-                origin=origin,
-                server_id=endpoint.server_id,
-                port=endpoint.port,
-                socket=endpoint.socket,
-                host=endpoint.host,
-                heartbeat=True,
-                watch_server=False,
-                grpc_server_registry=self._grpc_server_registry,
-            )
@@ -8,5 +8,9 @@
 drive web frontends like dagit.
 """
 
+# dagster.core.host_representation imports the grpc client, so it has to finish loading before the
+# client module when dagster.grpc is the first module imported.
+import dagster.core.host_representation  # isort:skip
+
 from .client import DagsterGrpcClient, ephemeral_grpc_api_client
 from .server import DagsterGrpcServer
@@ -11,6 +11,7 @@
 )
 from dagster.core.instance.ref import InstanceRef
 from dagster.core.origin import PipelinePythonOrigin, get_python_environment_entry_point
+from dagster.core.snap.execution_plan_snapshot import ExecutionPlanSnapshot
 from dagster.serdes import serialize_dagster_namedtuple, whitelist_for_serdes
 from dagster.utils import frozenlist
 from dagster.utils.error import SerializableErrorInfo
@@ -185,6 +186,10 @@ def __new__(
         )
 
 
+# Linux limits each command line argument to 128 KiB (MAX_ARG_STRLEN)
+MAX_COMMAND_ARG_LENGTH = 128 * 1024
+
+
 @whitelist_for_serdes
 class ExecuteStepArgs(
     NamedTuple(
@@ -197,6 +202,7 @@ class ExecuteStepArgs(
             ("retry_mode", Optional[RetryMode]),
             ("known_state", Optional[KnownExecutionState]),
             ("should_verify_step", Optional[bool]),
+            ("execution_plan_snapshot", Optional[ExecutionPlanSnapshot]),
         ],
     )
 ):
@@ -209,6 +215,7 @@ def __new__(
         retry_mode: Optional[RetryMode] = None,
         known_state: Optional[KnownExecutionState] = None,
         should_verify_step: Optional[bool] = None,
+        execution_plan_snapshot: Optional[ExecutionPlanSnapshot] = None,
     ):
         return super(ExecuteStepArgs, cls).__new__(
             cls,
@@ -225,13 +232,27 @@ def __new__(
             should_verify_step=check.opt_bool_param(
                 should_verify_step, "should_verify_step", False
             ),
+            execution_plan_snapshot=check.opt_inst_param(
+                execution_plan_snapshot, "execution_plan_snapshot", ExecutionPlanSnapshot
+            ),
         )
 
     def get_command_args(self) -> List[str]:
+        serialized_args = serialize_dagster_namedtuple(self)
+        if (
+            self.execution_plan_snapshot is not None
+            and len(serialized_args.encode("utf-8")) >= MAX_COMMAND_ARG_LENGTH
+        ):
+            # the plan fragment is too large to pass on the command line, so the step worker builds
+            # the plan for its steps itself
+            serialized_args = serialize_dagster_namedtuple(
+                self._replace(execution_plan_snapshot=None)
+            )
+
         return _get_entry_point(self.pipeline_origin) + [
             "api",
             "execute_step",
-            serialize_dagster_namedtuple(self),
+            serialized_args,
         ]
 
 
@@ -15,9 +15,12 @@
 """
 
 from abc import ABC, abstractmethod
+from contextvars import ContextVar
 from enum import Enum
 from inspect import Parameter, signature
+from json.encoder import encode_basestring_ascii as _encode_json_str
 from typing import (
+    AbstractSet,
     Any,
     Callable,
     Dict,
@@ -47,12 +50,23 @@
 ]
 EnumEntry = Tuple[Type[Enum], Type["EnumSerializer"]]
 
+# Compiled per-class functions, built once at registration time, that convert between values and
+# their json-ready packed form without walking the generic isinstance chain or building descent
+# paths. Packers are keyed by class name and store the class they were compiled for so that a
+# different class that happens to share the name falls back to the generic path. Unpackers take a
+# flag saying whether the value being loaded is trusted, see `TrustedNamedTupleSerializer`.
+Packer = Callable[[Any, "WhitelistMap"], Any]
+Unpacker = Callable[[Dict[str, Any], "WhitelistMap", bool], Any]
+PackerEntry = Tuple[type, Packer]
+
 
 class WhitelistMap(NamedTuple):
     tuples: Dict[str, TupleEntry]
     enums: Dict[str, EnumEntry]
     serialized_names: Dict[str, str]
     deserialized_names: Dict[str, str]
+    packers: Dict[str, PackerEntry]
+    unpackers: Dict[str, Unpacker]
 
     def register_tuple(
         self,
@@ -69,7 +83,13 @@ def register_tuple(
             serializer: The class to use when serializing and deserializing
             args_for_class: the inspect.signature paramaters for __new__
         """
-        self.tuples[name] = (nt, serializer or DefaultNamedTupleSerializer, args_for_class)
+        serializer = serializer or DefaultNamedTupleSerializer
+        self.tuples[name] = (nt, serializer, args_for_class)
+        self.unpackers[name] = _compile_tuple_unpacker(nt, serializer, args_for_class)
+        if nt is not None and nt.__name__ == name:
+            self.packers[name] = (nt, _compile_tuple_packer(nt, serializer))
+        else:
+            self.packers.pop(name, None)
 
     def has_tuple_entry(self, name: str) -> bool:
         return name in self.tuples
@@ -83,7 +103,12 @@ def register_enum(
         enum: Type[Enum],
         serializer: Optional[Type["EnumSerializer"]],
     ):
-        self.enums[name] = (enum, serializer or DefaultEnumSerializer)
+        serializer = serializer or DefaultEnumSerializer
+        self.enums[name] = (enum, serializer)
+        if enum.__name__ == name:
+            self.packers[name] = (enum, _compile_enum_packer(serializer))
+        else:
+            self.packers.pop(name, None)
 
     def has_enum_entry(self, name: str) -> bool:
         return name in self.enums
@@ -111,7 +136,14 @@ def get_deserialized_name(self, name: str) -> str:
 
     @staticmethod
     def create():
-        return WhitelistMap(tuples={}, enums={}, serialized_names={}, deserialized_names={})
+        return WhitelistMap(
+            tuples={},
+            enums={},
+            serialized_names={},
+            deserialized_names={},
+            packers={},
+            unpackers={},
+        )
 
 
 _WHITELIST_MAP = WhitelistMap.create()
@@ -291,11 +323,22 @@ def value_from_storage_dict(
         # Naively implements backwards compatibility by filtering arguments that aren't present in
         # the constructor. If a property is present in the serialized object, but doesn't exist in
         # the version of the class loaded into memory, that property will be completely ignored.
-        unpacked_dict = {
-            key: unpack_inner_value(value, whitelist_map, f"{descent_path}.{key}")
-            for key, value in storage_dict.items()
-            if key in args_for_class
-        }
+        trusted = _TRUSTED_DESERIALIZATION.get()
+        try:
+            unpacked_dict = {
+                key: _unpack_value(value, whitelist_map, trusted)
+                for key, value in storage_dict.items()
+                if key in args_for_class
+            }
+        except DeserializationError:
+            # only build descent paths once we know we need them for the error message
+            unpacked_dict = {
+                key: _unpack_value_with_descent_path(value, whitelist_map, f"{descent_path}.{key}")
+                for key, value in storage_dict.items()
+                if key in args_for_class
+            }
+        if trusted:
+            return cls.value_from_trusted_unpacked(unpacked_dict, klass)
         return cls.value_from_unpacked(unpacked_dict, klass)
 
     @classmethod
@@ -306,6 +349,16 @@ def value_from_unpacked(
     ):
         return klass(**unpacked_dict)
 
+    @classmethod
+    def value_from_trusted_unpacked(
+        cls,
+        unpacked_dict: Dict[str, Any],
+        klass: Type,
+    ):
+        # Override this method to build the namedtuple without running the validation in __new__
+        # when loading values that dagster wrote itself, e.g. rows read back from storage.
+        return cls.value_from_unpacked(unpacked_dict, klass)
+
     @classmethod
     def value_to_storage_dict(
         cls,
@@ -314,21 +367,143 @@ def value_to_storage_dict(
         descent_path: str,
     ) -> Dict[str, Any]:
         skip_when_empty_fields = cls.skip_when_empty()
+        try:
+            return _pack_tuple_fields(
+                value, value._fields, skip_when_empty_fields, whitelist_map, descent_path=None
+            )
+        except SerializationError:
+            # only build descent paths once we know we need them for the error message
+            return _pack_tuple_fields(
+                value, value._fields, skip_when_empty_fields, whitelist_map, descent_path
+            )
 
-        base_dict = {}
-        for key, inner_value in value._asdict().items():
-            if key in skip_when_empty_fields and inner_value in EMPTY_VALUES_TO_SKIP:
-                continue
-            base_dict[key] = pack_inner_value(inner_value, whitelist_map, f"{descent_path}.{key}")
 
-        klass_name = value.__class__.__name__
-        base_dict["__class__"] = (
-            whitelist_map.get_serialized_name(klass_name)
-            if whitelist_map.has_serialized_name(klass_name)
-            else klass_name
+class TrustedNamedTupleSerializer(DefaultNamedTupleSerializer):
+    """
+    Serializer for namedtuples whose __new__ only validates and normalizes its arguments. When
+    deserializing trusted input, values that have every field stored are built directly through
+    tuple.__new__, skipping the parameter checks. Anything else, such as values written by older
+    versions that are missing fields or still carry graveyard arguments, goes through __new__.
+    """
+
+    @classmethod
+    def value_from_trusted_unpacked(
+        cls,
+        unpacked_dict: Dict[str, Any],
+        klass: Type,
+    ):
+        fields = klass._fields
+        if len(unpacked_dict) == len(fields):
+            try:
+                return tuple.__new__(klass, [unpacked_dict[field] for field in fields])
+            except KeyError:
+                pass
+        return cls.value_from_unpacked(unpacked_dict, klass)
+
+
+def _pack_tuple_fields(
+    value: NamedTuple,
+    fields: Tuple[str, ...],
+    skip_when_empty_fields: AbstractSet[str],
+    whitelist_map: WhitelistMap,
+    descent_path: Optional[str],
+) -> Dict[str, Any]:
+    base_dict = {}
+    for key, inner_value in zip(fields, value):
+        if key in skip_when_empty_fields and inner_value in EMPTY_VALUES_TO_SKIP:
+            continue
+        base_dict[key] = (
+            _pack_value(inner_value, whitelist_map)
+            if descent_path is None
+            else _pack_value_with_descent_path(inner_value, whitelist_map, f"{descent_path}.{key}")
         )
 
-        return base_dict
+    klass_name = value.__class__.__name__
+    base_dict["__class__"] = whitelist_map.serialized_names.get(klass_name, klass_name)
+    return base_dict
+
+
+def _overrides_default(serializer: Type[Serializer], method_name: str, default: Type) -> bool:
+    method = getattr(serializer, method_name)
+    return getattr(method, "__func__", method) is not getattr(default, method_name).__func__
+
+
+def _compile_tuple_packer(
+    klass: Type[NamedTuple], serializer: Type[NamedTupleSerializer]
+) -> Packer:
+    if _overrides_default(serializer, "value_to_storage_dict", DefaultNamedTupleSerializer):
+
+        def _custom_packer(value, whitelist_map):
+            return serializer.value_to_storage_dict(value, whitelist_map, "")
+
+        return _custom_packer
+
+    fields = klass._fields
+    skip_when_empty_fields = frozenset(
+        cast(Type[DefaultNamedTupleSerializer], serializer).skip_when_empty()
+    )
+
+    def _default_packer(value, whitelist_map):
+        return _pack_tuple_fields(
+            value, fields, skip_when_empty_fields, whitelist_map, descent_path=None
+        )
+
+    return _default_packer
+
+
+def _compile_tuple_unpacker(
+    klass: Optional[Type[NamedTuple]],
+    serializer: Type[NamedTupleSerializer],
+    args_for_class: Mapping[str, Parameter],
+) -> Unpacker:
+    if klass is None:
+        # Target class being set to none, likely by register_serdes_tuple_fallbacks
+        return lambda _storage_dict, _whitelist_map, _trusted: None
+
+    if _overrides_default(serializer, "value_from_storage_dict", DefaultNamedTupleSerializer):
+        # custom serializers read the trusted flag from _TRUSTED_DESERIALIZATION
+
+        def _custom_unpacker(storage_dict, whitelist_map, _trusted):
+            return serializer.value_from_storage_dict(
+                _without_class_key(storage_dict), klass, args_for_class, whitelist_map, ""
+            )
+
+        return _custom_unpacker
+
+    arg_names = frozenset(args_for_class)
+    default_serializer = cast(Type[DefaultNamedTupleSerializer], serializer)
+    construct: Callable[[Dict[str, Any]], Any]
+    if _overrides_default(serializer, "value_from_unpacked", DefaultNamedTupleSerializer):
+        value_from_unpacked = default_serializer.value_from_unpacked
+        construct = lambda unpacked_dict: value_from_unpacked(unpacked_dict, klass)
+    else:
+        construct = lambda unpacked_dict: klass(**unpacked_dict)  # type: ignore
+
+    construct_trusted: Callable[[Dict[str, Any]], Any] = construct
+    if _overrides_default(serializer, "value_from_trusted_unpacked", DefaultNamedTupleSerializer):
+        value_from_trusted_unpacked = default_serializer.value_from_trusted_unpacked
+        construct_trusted = lambda unpacked_dict: value_from_trusted_unpacked(unpacked_dict, klass)
+
+    def _default_unpacker(storage_dict, whitelist_map, trusted):
+        unpacked_dict = {
+            key: _unpack_value(value, whitelist_map, trusted)
+            for key, value in storage_dict.items()
+            if key in arg_names
+        }
+        return construct_trusted(unpacked_dict) if trusted else construct(unpacked_dict)
+
+    return _default_unpacker
+
+
+def _compile_enum_packer(serializer: Type[EnumSerializer]) -> Packer:
+    if _overrides_default(serializer, "value_to_storage_str", DefaultEnumSerializer):
+
+        def _custom_packer(value, whitelist_map):
+            return {"__enum__": serializer.value_to_storage_str(value, whitelist_map, "")}
+
+        return _custom_packer
+
+    return lambda value, _whitelist_map: {"__enum__": str(value)}
 
 
 ###################################################################################################
@@ -343,12 +518,15 @@ def serialize_dagster_namedtuple(nt: tuple, **json_kwargs) -> str:
 
 
 def _serialize_dagster_namedtuple(nt: tuple, whitelist_map: WhitelistMap, **json_kwargs) -> str:
-    return seven.json.dumps(pack_inner_value(nt, whitelist_map, _root(nt)), **json_kwargs)
+    packed = pack_inner_value(nt, whitelist_map, _root(nt))
+    if json_kwargs:
+        return seven.json.dumps(packed, **json_kwargs)
+    return seven.json.fast_dumps(packed)
 
 
 def serialize_value(val: Any, whitelist_map: WhitelistMap = _WHITELIST_MAP) -> str:
     """Serialize a value to a json encoded string."""
-    return seven.json.dumps(
+    return seven.json.fast_dumps(
         pack_inner_value(val, whitelist_map=whitelist_map, descent_path=_root(val))
     )
 
@@ -365,9 +543,66 @@ def pack_value(val: Any) -> Any:
 
 
 def pack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
+    try:
+        return _pack_value(val, whitelist_map)
+    except SerializationError:
+        # The fast path does not track where in the tree it is. Walk the value again building
+        # descent paths so the error points at the offending node.
+        return _pack_value_with_descent_path(val, whitelist_map, descent_path)
+
+
+_PASSTHROUGH_TYPES = frozenset([str, int, float, bool, type(None)])
+
+
+def _pack_value(val: Any, whitelist_map: WhitelistMap) -> Any:
+    val_type = type(val)
+    if val_type in _PASSTHROUGH_TYPES:
+        return val
+    if val_type is list:
+        return [_pack_value(item, whitelist_map) for item in val]
+    if val_type is dict:
+        return {key: _pack_value(value, whitelist_map) for key, value in val.items()}
+
+    compiled = whitelist_map.packers.get(val_type.__name__)
+    if compiled is not None and compiled[0] is val_type:
+        return compiled[1](val, whitelist_map)
+
+    if isinstance(val, list):
+        return [_pack_value(item, whitelist_map) for item in val]
+    if isinstance(val, tuple):
+        klass_name = val.__class__.__name__
+        if not whitelist_map.has_tuple_entry(klass_name):
+            raise SerializationError(f"Can only serialize whitelisted namedtuples, received {val}.")
+        _, serializer, _ = whitelist_map.get_tuple_entry(klass_name)
+        return serializer.value_to_storage_dict(cast(NamedTuple, val), whitelist_map, "")
+    if isinstance(val, Enum):
+        klass_name = val.__class__.__name__
+        if not whitelist_map.has_enum_entry(klass_name):
+            raise SerializationError(
+                f"Can only serialize whitelisted Enums, received {klass_name}.",
+            )
+        _, enum_serializer = whitelist_map.get_enum_entry(klass_name)
+        return {"__enum__": enum_serializer.value_to_storage_str(val, whitelist_map, "")}
+    if isinstance(val, set):
+        return {
+            "__set__": [_pack_value(item, whitelist_map) for item in sorted(list(val), key=str)]
+        }
+    if isinstance(val, frozenset):
+        return {
+            "__frozenset__": [
+                _pack_value(item, whitelist_map) for item in sorted(list(val), key=str)
+            ]
+        }
+    if isinstance(val, dict):
+        return {key: _pack_value(value, whitelist_map) for key, value in val.items()}
+
+    return val
+
+
+def _pack_value_with_descent_path(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
     if isinstance(val, list):
         return [
-            pack_inner_value(item, whitelist_map, f"{descent_path}[{idx}]")
+            _pack_value_with_descent_path(item, whitelist_map, f"{descent_path}[{idx}]")
             for idx, item in enumerate(val)
         ]
     if isinstance(val, tuple):
@@ -391,7 +626,7 @@ def pack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -
         set_path = descent_path + "{}"
         return {
             "__set__": [
-                pack_inner_value(item, whitelist_map, set_path)
+                _pack_value_with_descent_path(item, whitelist_map, set_path)
                 for item in sorted(list(val), key=str)
             ]
         }
@@ -399,30 +634,150 @@ def pack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -
         frz_set_path = descent_path + "{}"
         return {
             "__frozenset__": [
-                pack_inner_value(item, whitelist_map, frz_set_path)
+                _pack_value_with_descent_path(item, whitelist_map, frz_set_path)
                 for item in sorted(list(val), key=str)
             ]
         }
     if isinstance(val, dict):
         return {
-            key: pack_inner_value(value, whitelist_map, f"{descent_path}.{key}")
+            key: _pack_value_with_descent_path(value, whitelist_map, f"{descent_path}.{key}")
             for key, value in val.items()
         }
 
     return val
 
 
+###################################################################################################
+# Streaming canonical json
+###################################################################################################
+
+# Attribute that memoized values keep their canonical json in, see `write_packed_json`.
+_PACKED_JSON_ATTR = "_packed_json"
+
+
+def write_packed_json(
+    val: Any,
+    write: Callable[[str], Any],
+    container_types: AbstractSet[type] = frozenset(),
+    memoized_types: AbstractSet[type] = frozenset(),
+    whitelist_map: WhitelistMap = _WHITELIST_MAP,
+) -> None:
+    """
+    Write ``seven.json.dumps(pack_value(val))``, the canonical json that snapshot ids are computed
+    from, as a sequence of chunks rather than one string.
+
+    ``val`` and the values of ``container_types`` below it are written field by field, as are the
+    lists and dicts they hold. Any other value is packed and encoded in one go. Values of
+    ``memoized_types`` keep their json in their instance dict the first time they are written,
+    so that writing a value that shares them with a previously written one, like the snapshot of a
+    subset of a pipeline and that of the full pipeline, only encodes them once.
+    """
+    _write_packed_json(val, write, container_types, memoized_types, whitelist_map, is_root=True)
+
+
+def _write_packed_json(
+    val: Any,
+    write: Callable[[str], Any],
+    container_types: AbstractSet[type],
+    memoized_types: AbstractSet[type],
+    whitelist_map: WhitelistMap,
+    is_root: bool = False,
+) -> None:
+    val_type = type(val)
+
+    if val_type is str:
+        write(_encode_json_str(val))
+    elif val_type is list:
+        write("[")
+        for idx, item in enumerate(val):
+            if idx:
+                write(", ")
+            _write_packed_json(item, write, container_types, memoized_types, whitelist_map)
+        write("]")
+    elif val_type is dict and all(type(key) is str for key in val):
+        _write_packed_json_object(
+            sorted(val.items()), write, container_types, memoized_types, whitelist_map
+        )
+    elif val_type in memoized_types:
+        packed_json = val.__dict__.get(_PACKED_JSON_ATTR)
+        if packed_json is None:
+            packed_json = seven.json.dumps(_pack_value(val, whitelist_map))
+            val.__dict__[_PACKED_JSON_ATTR] = packed_json
+        write(packed_json)
+    elif (is_root or val_type in container_types) and _has_default_tuple_packer(
+        val, whitelist_map
+    ):
+        skip_when_empty_fields = cast(
+            Type[DefaultNamedTupleSerializer], whitelist_map.tuples[val_type.__name__][1]
+        ).skip_when_empty()
+        items = [
+            (key, inner_value)
+            for key, inner_value in zip(val._fields, val)
+            if not (key in skip_when_empty_fields and inner_value in EMPTY_VALUES_TO_SKIP)
+        ]
+        klass_name = val_type.__name__
+        items.append(("__class__", whitelist_map.serialized_names.get(klass_name, klass_name)))
+        items.sort(key=lambda item: item[0])
+        _write_packed_json_object(items, write, container_types, memoized_types, whitelist_map)
+    else:
+        write(seven.json.dumps(_pack_value(val, whitelist_map)))
+
+
+def _has_default_tuple_packer(val: Any, whitelist_map: WhitelistMap) -> bool:
+    entry = whitelist_map.tuples.get(type(val).__name__)
+    return (
+        entry is not None
+        and entry[0] is type(val)
+        and not _overrides_default(entry[1], "value_to_storage_dict", DefaultNamedTupleSerializer)
+    )
+
+
+def _write_packed_json_object(
+    sorted_items: List[Tuple[str, Any]],
+    write: Callable[[str], Any],
+    container_types: AbstractSet[type],
+    memoized_types: AbstractSet[type],
+    whitelist_map: WhitelistMap,
+) -> None:
+    write("{")
+    for idx, (key, value) in enumerate(sorted_items):
+        write(f"{', ' if idx else ''}{_encode_json_str(key)}: ")
+        _write_packed_json(value, write, container_types, memoized_types, whitelist_map)
+    write("}")
+
+
 ###################################################################################################
 # Deserialize
 ###################################################################################################
 
 
+# Set while deserializing trusted input, i.e. values that dagster serialized itself such as rows
+# read back from storage. Serializers that opt in (see `TrustedNamedTupleSerializer`) skip the
+# validation in __new__ for these values. Custom serializers recurse through `unpack_inner_value`,
+# so the flag is carried in a context variable instead of being threaded through every serializer.
+_TRUSTED_DESERIALIZATION: ContextVar[bool] = ContextVar("trusted_deserialization", default=False)
+
+
+def is_deserializing_trusted_input() -> bool:
+    """Whether the value currently being deserialized was marked as trusted. For use in custom
+    `value_from_storage_dict` implementations."""
+    return _TRUSTED_DESERIALIZATION.get()
+
+
 def deserialize_json_to_dagster_namedtuple(
     json_str: str,
+    trusted: bool = False,
 ) -> tuple:
-    """Deserialize a json encoded string in to a whitelisted named tuple"""
+    """Deserialize a json encoded string in to a whitelisted named tuple
+
+    Args:
+        json_str (str): The json encoded string.
+        trusted (bool): Whether the string was serialized by dagster itself, e.g. when read back
+            from storage. Trusted values may skip the parameter validation in __new__. This should
+            never be set for input crossing a process or user boundary, like GraphQL or gRPC args.
+    """
     dagster_namedtuple = _deserialize_json(
-        check.str_param(json_str, "json_str"), whitelist_map=_WHITELIST_MAP
+        check.str_param(json_str, "json_str"), whitelist_map=_WHITELIST_MAP, trusted=trusted
     )
     if not isinstance(dagster_namedtuple, tuple):
         raise DeserializationError(
@@ -437,40 +792,53 @@ def deserialize_json_to_dagster_namedtuple(
 
 
 @overload
-def deserialize_as(json_str: str, cls: Tuple[Type[T], Type[U]]) -> Union[T, U]:
+def deserialize_as(
+    json_str: str, cls: Tuple[Type[T], Type[U]], trusted: bool = False
+) -> Union[T, U]:
     pass
 
 
 @overload
-def deserialize_as(json_str: str, cls: Type[T]) -> T:
+def deserialize_as(json_str: str, cls: Type[T], trusted: bool = False) -> T:
     pass
 
 
-def deserialize_as(json_str: str, cls: Union[Type[T], Tuple[Type[T], Type[U]]]) -> Union[T, U]:
+def deserialize_as(
+    json_str: str, cls: Union[Type[T], Tuple[Type[T], Type[U]]], trusted: bool = False
+) -> Union[T, U]:
     """Deserialize a json encoded string to a specific namedtuple class."""
-    val = deserialize_json_to_dagster_namedtuple(json_str)
+    val = deserialize_json_to_dagster_namedtuple(json_str, trusted=trusted)
     if not isinstance(val, cls):
         check.failed(f"Deserialized object was not expected target type {cls}, got {type(val)}")
     return cast(Union[T, U], val)
 
 
-def opt_deserialize_as(json_str: Optional[str], cls: Type[T]) -> Optional[T]:
+def opt_deserialize_as(
+    json_str: Optional[str], cls: Type[T], trusted: bool = False
+) -> Optional[T]:
     """Optionally deserialize a json encoded string to a specific namedtuple class."""
-    return deserialize_as(json_str, cls) if json_str else None
+    return deserialize_as(json_str, cls, trusted=trusted) if json_str else None
 
 
-def _deserialize_json(json_str: str, whitelist_map: WhitelistMap):
-    value = seven.json.loads(json_str)
-    return unpack_inner_value(value, whitelist_map=whitelist_map, descent_path=_root(value))
+def _deserialize_json(json_str: str, whitelist_map: WhitelistMap, trusted: bool = False):
+    value = seven.json.fast_loads(json_str)
+    token = _TRUSTED_DESERIALIZATION.set(trusted)
+    try:
+        return unpack_inner_value(value, whitelist_map=whitelist_map, descent_path=_root(value))
+    finally:
+        _TRUSTED_DESERIALIZATION.reset(token)
 
 
-def deserialize_value(val: str, whitelist_map: WhitelistMap = _WHITELIST_MAP) -> Any:
+def deserialize_value(
+    val: str, whitelist_map: WhitelistMap = _WHITELIST_MAP, trusted: bool = False
+) -> Any:
     """Deserialize a json encoded string in to its original value"""
-    return unpack_inner_value(
-        seven.json.loads(check.str_param(val, "val")),
-        whitelist_map=whitelist_map,
-        descent_path="",
-    )
+    value = seven.json.fast_loads(check.str_param(val, "val"))
+    token = _TRUSTED_DESERIALIZATION.set(trusted)
+    try:
+        return unpack_inner_value(value, whitelist_map=whitelist_map, descent_path="")
+    finally:
+        _TRUSTED_DESERIALIZATION.reset(token)
 
 
 def unpack_value(val: Any) -> Any:
@@ -483,28 +851,56 @@ def unpack_value(val: Any) -> Any:
 
 
 def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
+    try:
+        return _unpack_value(val, whitelist_map, _TRUSTED_DESERIALIZATION.get())
+    except DeserializationError:
+        # The fast path does not track where in the tree it is. Walk the value again building
+        # descent paths so the error points at the offending node.
+        return _unpack_value_with_descent_path(val, whitelist_map, descent_path)
+
+
+def _unpack_value(val: Any, whitelist_map: WhitelistMap, trusted: bool) -> Any:
+    if isinstance(val, list):
+        return [_unpack_value(item, whitelist_map, trusted) for item in val]
+    if isinstance(val, dict):
+        klass_name = val.get("__class__")
+        if klass_name:
+            lookup_name = whitelist_map.deserialized_names.get(klass_name, klass_name)
+            unpacker = whitelist_map.unpackers.get(lookup_name)
+            if unpacker is None:
+                raise DeserializationError(_not_whitelisted_tuple_msg(klass_name, lookup_name, ""))
+            return unpacker(val, whitelist_map, trusted)
+        if val.get("__enum__"):
+            return _unpack_enum(val["__enum__"], whitelist_map, "")
+        if val.get("__set__") is not None:
+            return set([_unpack_value(item, whitelist_map, trusted) for item in val["__set__"]])
+        if val.get("__frozenset__") is not None:
+            return frozenset(
+                [_unpack_value(item, whitelist_map, trusted) for item in val["__frozenset__"]]
+            )
+        return {key: _unpack_value(value, whitelist_map, trusted) for key, value in val.items()}
+
+    return val
+
+
+def _unpack_value_with_descent_path(
+    val: Any, whitelist_map: WhitelistMap, descent_path: str
+) -> Any:
     if isinstance(val, list):
         return [
-            unpack_inner_value(item, whitelist_map, f"{descent_path}[{idx}]")
+            _unpack_value_with_descent_path(item, whitelist_map, f"{descent_path}[{idx}]")
             for idx, item in enumerate(val)
         ]
     if isinstance(val, dict) and val.get("__class__"):
-        klass_name = cast(str, val.pop("__class__"))
+        klass_name = cast(str, val["__class__"])
         lookup_name = (
             whitelist_map.get_deserialized_name(klass_name)
             if whitelist_map.has_deserialized_name(klass_name)
             else klass_name
         )
         if not whitelist_map.has_tuple_entry(lookup_name):
-            name_str = (
-                f'"{klass_name}"'
-                if klass_name == lookup_name
-                else f'"{klass_name}" (mapped to: "{lookup_name}")'
-            )
             raise DeserializationError(
-                f"Attempted to deserialize class {name_str} which is not in the whitelist. "
-                "This error can occur due to version skew, verify processes are running "
-                f"expected versions.{_path_msg(descent_path)}"
+                _not_whitelisted_tuple_msg(klass_name, lookup_name, descent_path)
             )
 
         klass, serializer, args_for_class = whitelist_map.get_tuple_entry(lookup_name)
@@ -514,35 +910,64 @@ def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str)
             return None
 
         return serializer.value_from_storage_dict(
-            val, klass, args_for_class, whitelist_map, descent_path
+            _without_class_key(val), klass, args_for_class, whitelist_map, descent_path
         )
     if isinstance(val, dict) and val.get("__enum__"):
-        name, member = val["__enum__"].split(".")
-        if not whitelist_map.has_enum_entry(name):
-            raise DeserializationError(
-                f"Attempted to deserialize enum {name} which was not in the whitelist.\n"
-                "This error can occur due to version skew, verify processes are running "
-                f"expected versions.{_path_msg(descent_path)}"
-            )
-        enum_class, enum_serializer = whitelist_map.get_enum_entry(name)
-        return enum_serializer.value_from_storage_str(member, enum_class)
+        return _unpack_enum(val["__enum__"], whitelist_map, descent_path)
     if isinstance(val, dict) and val.get("__set__") is not None:
         set_path = descent_path + "{}"
-        return set([unpack_inner_value(item, whitelist_map, set_path) for item in val["__set__"]])
+        return set(
+            [
+                _unpack_value_with_descent_path(item, whitelist_map, set_path)
+                for item in val["__set__"]
+            ]
+        )
     if isinstance(val, dict) and val.get("__frozenset__") is not None:
         frz_set_path = descent_path + "{}"
         return frozenset(
-            [unpack_inner_value(item, whitelist_map, frz_set_path) for item in val["__frozenset__"]]
+            [
+                _unpack_value_with_descent_path(item, whitelist_map, frz_set_path)
+                for item in val["__frozenset__"]
+            ]
         )
     if isinstance(val, dict):
         return {
-            key: unpack_inner_value(value, whitelist_map, f"{descent_path}.{key}")
+            key: _unpack_value_with_descent_path(value, whitelist_map, f"{descent_path}.{key}")
             for key, value in val.items()
         }
 
     return val
 
 
+def _unpack_enum(storage_str: str, whitelist_map: WhitelistMap, descent_path: str) -> Enum:
+    name, member = storage_str.split(".")
+    if not whitelist_map.has_enum_entry(name):
+        raise DeserializationError(
+            f"Attempted to deserialize enum {name} which was not in the whitelist.\n"
+            "This error can occur due to version skew, verify processes are running "
+            f"expected versions.{_path_msg(descent_path)}"
+        )
+    enum_class, enum_serializer = whitelist_map.get_enum_entry(name)
+    return enum_serializer.value_from_storage_str(member, enum_class)
+
+
+def _not_whitelisted_tuple_msg(klass_name: str, lookup_name: str, descent_path: str) -> str:
+    name_str = (
+        f'"{klass_name}"'
+        if klass_name == lookup_name
+        else f'"{klass_name}" (mapped to: "{lookup_name}")'
+    )
+    return (
+        f"Attempted to deserialize class {name_str} which is not in the whitelist. "
+        "This error can occur due to version skew, verify processes are running "
+        f"expected versions.{_path_msg(descent_path)}"
+    )
+
+
+def _without_class_key(storage_dict: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in storage_dict.items() if key != "__class__"}
+
+
 ###################################################################################################
 # Back compat
 ###################################################################################################
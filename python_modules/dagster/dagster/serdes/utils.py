@@ -1,11 +1,42 @@
 import hashlib
+from typing import AbstractSet, List
 
-from .serdes import serialize_dagster_namedtuple
+from dagster import check
 
+from .errors import SerializationError
+from .serdes import pack_value, serialize_dagster_namedtuple, write_packed_json
 
-def create_snapshot_id(snapshot: tuple) -> str:
-    json_rep = serialize_dagster_namedtuple(snapshot)
-    return hash_str(json_rep)
+# number of json chunks buffered before they are fed to the hash
+_HASH_CHUNK_BATCH_SIZE = 4096
+
+
+def create_snapshot_id(
+    snapshot: tuple,
+    container_types: AbstractSet[type] = frozenset(),
+    memoized_types: AbstractSet[type] = frozenset(),
+) -> str:
+    check.tuple_param(snapshot, "snapshot")
+    # Snapshot ids are persisted and compared across processes, so they are always computed from
+    # the canonical stdlib encoding regardless of which json backend serdes is using. The json is
+    # streamed in to the hash rather than built up in full, see write_packed_json.
+    m = hashlib.sha1()  # so that hexdigest is 40, not 64 bytes
+    chunks: List[str] = []
+
+    def _write(chunk: str) -> None:
+        chunks.append(chunk)
+        if len(chunks) >= _HASH_CHUNK_BATCH_SIZE:
+            m.update("".join(chunks).encode("utf-8"))
+            chunks.clear()
+
+    try:
+        write_packed_json(snapshot, _write, container_types, memoized_types)
+    except SerializationError:
+        # pack the snapshot to raise the error along with the path to the offending value
+        pack_value(snapshot)
+        raise
+
+    m.update("".join(chunks).encode("utf-8"))
+    return m.hexdigest()
 
 
 def hash_str(in_str: str) -> str:
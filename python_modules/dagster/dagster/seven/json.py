@@ -1,9 +1,13 @@
 # pylint: disable=unused-import
+import os
+import re
+import warnings
 from functools import partial
 from json import dump as dump_
 from json import dumps as dumps_
 from json import load as load_
 from json import loads as loads_
+from typing import Any, Callable, Optional, Tuple, Union
 
 try:
     from json import JSONDecodeError
@@ -17,3 +21,140 @@
 load = partial(load_, strict=False)
 
 loads = partial(loads_, strict=False)
+
+###################################################################################################
+# Fast backends
+###################################################################################################
+
+# `fast_dumps` and `fast_loads` are used on the hot serdes paths. They use orjson or ujson when
+# they are installed and fall back to the stdlib otherwise. Set DAGSTER_JSON_BACKEND to one of
+# "orjson", "ujson" or "json" to pin a backend, "json" disabling the fast backends entirely.
+#
+# Both always agree with the stdlib on the decoded value:
+#
+# * orjson is only used for decoding. Its encoder writes NaN and Infinity as null, which would not
+#   round trip. Its decoder silently turns integers wider than 64 bits into floats, so documents
+#   containing long runs of digits are handed to the stdlib.
+# * ujson encodes with the same separators, key order and escaping as the stdlib. The only
+#   difference is that it does not zero pad single digit float exponents (1e-7 vs 1e-07). Anything
+#   that needs byte-for-byte stable output, like snapshot ids, should use `dumps` instead.
+# * Anything a fast backend rejects is retried with the stdlib, so errors are the stdlib's.
+
+JSON_BACKEND_ENV_VAR = "DAGSTER_JSON_BACKEND"
+
+_JSON_BACKENDS = ("orjson", "ujson", "json")
+
+# integers that need more than 64 bits have at least 19 digits
+_LONG_DIGIT_RUN = re.compile(r"\d{19,}")
+
+
+def _stdlib_dumps(obj: Any) -> str:
+    return dumps(obj)
+
+
+def _stdlib_loads(json_str: Union[str, bytes]) -> Any:
+    return loads(json_str)
+
+
+def _ujson_encoder() -> Optional[Callable[[Any], str]]:
+    try:
+        import ujson
+    except ImportError:
+        return None
+
+    def _ujson_dumps(obj: Any) -> str:
+        try:
+            return ujson.dumps(
+                obj,
+                sort_keys=True,
+                ensure_ascii=True,
+                escape_forward_slashes=False,
+                separators=(", ", ": "),
+            )
+        except (TypeError, ValueError, OverflowError):
+            return _stdlib_dumps(obj)
+
+    return _ujson_dumps
+
+
+def _ujson_decoder() -> Optional[Callable[[Union[str, bytes]], Any]]:
+    try:
+        import ujson
+    except ImportError:
+        return None
+
+    def _ujson_loads(json_str: Union[str, bytes]) -> Any:
+        try:
+            return ujson.loads(json_str)
+        except ValueError:
+            return _stdlib_loads(json_str)
+
+    return _ujson_loads
+
+
+def _orjson_decoder() -> Optional[Callable[[Union[str, bytes]], Any]]:
+    try:
+        import orjson
+    except ImportError:
+        return None
+
+    def _orjson_loads(json_str: Union[str, bytes]) -> Any:
+        if not isinstance(json_str, str) or _LONG_DIGIT_RUN.search(json_str):
+            return _stdlib_loads(json_str)
+        try:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            return _stdlib_loads(json_str)
+
+    return _orjson_loads
+
+
+def _select_backends(
+    requested: Optional[str],
+) -> Tuple[Tuple[str, Callable[[Any], str]], Tuple[str, Callable[[Union[str, bytes]], Any]]]:
+    if requested and requested not in _JSON_BACKENDS:
+        warnings.warn(
+            f'Unknown {JSON_BACKEND_ENV_VAR} "{requested}", expected one of '
+            f"{', '.join(_JSON_BACKENDS)}. Falling back to the default backend selection."
+        )
+        requested = None
+
+    encoder_candidates = {
+        None: [("ujson", _ujson_encoder)],
+        "orjson": [("ujson", _ujson_encoder)],
+        "ujson": [("ujson", _ujson_encoder)],
+        "json": [],
+    }[requested]
+    decoder_candidates = {
+        None: [("orjson", _orjson_decoder), ("ujson", _ujson_decoder)],
+        "orjson": [("orjson", _orjson_decoder)],
+        "ujson": [("ujson", _ujson_decoder)],
+        "json": [],
+    }[requested]
+
+    encoder: Tuple[str, Callable[[Any], str]] = ("json", _stdlib_dumps)
+    for name, build_encoder in encoder_candidates:
+        fast_encoder = build_encoder()
+        if fast_encoder:
+            encoder = (name, fast_encoder)
+            break
+
+    decoder: Tuple[str, Callable[[Union[str, bytes]], Any]] = ("json", _stdlib_loads)
+    for name, build_decoder in decoder_candidates:
+        fast_decoder = build_decoder()
+        if fast_decoder:
+            decoder = (name, fast_decoder)
+            break
+
+    if requested and requested != decoder[0]:
+        warnings.warn(
+            f'{JSON_BACKEND_ENV_VAR} is set to "{requested}" but it is not installed. Falling back '
+            "to the stdlib json module."
+        )
+
+    return encoder, decoder
+
+
+(ENCODER_BACKEND, fast_dumps), (DECODER_BACKEND, fast_loads) = _select_backends(
+    os.getenv(JSON_BACKEND_ENV_VAR)
+)
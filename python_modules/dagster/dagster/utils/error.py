@@ -2,11 +2,11 @@
 from types import TracebackType
 from typing import Any, List, NamedTuple, Optional, Tuple, Type, Union
 
-from dagster.serdes import whitelist_for_serdes
+from dagster.serdes import TrustedNamedTupleSerializer, whitelist_for_serdes
 
 
 # mypy does not support recursive types, so "cause" has to be typed `Any`
-@whitelist_for_serdes
+@whitelist_for_serdes(serializer=TrustedNamedTupleSerializer)
 class SerializableErrorInfo(
     NamedTuple(
         "SerializableErrorInfo",
@@ -584,6 +584,84 @@ def test_purge_ticks(self, storage):
         ticks = storage.get_ticks("my_sensor", "my_sensor")
         assert len(ticks) == 2
 
+    def test_purge_ticks_with_limit(self, storage):
+        now = pendulum.now()
+        for minutes_ago in [5, 4, 3, 1]:
+            storage.create_tick(
+                self.build_sensor_tick(
+                    now.subtract(minutes=minutes_ago).timestamp(), TickStatus.SKIPPED
+                )
+            )
+
+        before = now.subtract(minutes=2).timestamp()
+        purged = storage.purge_ticks("my_sensor", "my_sensor", TickStatus.SKIPPED, before, limit=2)
+        assert purged == 2
+        ticks = storage.get_ticks("my_sensor", "my_sensor")
+        assert [tick.timestamp for tick in ticks] == [
+            now.subtract(minutes=1).timestamp(),
+            now.subtract(minutes=3).timestamp(),
+        ]
+
+        purged = storage.purge_ticks("my_sensor", "my_sensor", TickStatus.SKIPPED, before, limit=2)
+        assert purged == 1
+        assert len(storage.get_ticks("my_sensor", "my_sensor")) == 1
+
+    def test_collapse_skipped_ticks(self, storage):
+        now = pendulum.now()
+        statuses = [
+            TickStatus.SKIPPED,
+            TickStatus.SKIPPED,
+            TickStatus.SUCCESS,
+            TickStatus.SKIPPED,
+            TickStatus.SKIPPED,
+            TickStatus.SKIPPED,
+            TickStatus.SKIPPED,
+            TickStatus.SKIPPED,
+        ]
+        timestamps = [
+            now.subtract(minutes=len(statuses) - i).timestamp() for i in range(len(statuses))
+        ]
+        for timestamp, status in zip(timestamps, statuses):
+            run_id = "fake_run_id" if status == TickStatus.SUCCESS else None
+            storage.create_tick(self.build_sensor_tick(timestamp, status, run_id=run_id))
+
+        # the most recent tick is not collapsed yet
+        before = now.subtract(seconds=90).timestamp()
+        after = storage.collapse_skipped_ticks("my_sensor", "my_sensor", before, limit=5)
+        assert after == timestamps[4]
+        after = storage.collapse_skipped_ticks(
+            "my_sensor", "my_sensor", before, after=after, limit=5
+        )
+        assert after == timestamps[6]
+        assert (
+            storage.collapse_skipped_ticks("my_sensor", "my_sensor", before, after=after, limit=5)
+            == after
+        )
+
+        ticks = storage.get_ticks("my_sensor", "my_sensor")
+        assert [(tick.timestamp, tick.status) for tick in ticks] == [
+            (timestamps[7], TickStatus.SKIPPED),
+            (timestamps[6], TickStatus.SKIPPED),
+            (timestamps[2], TickStatus.SUCCESS),
+            (timestamps[1], TickStatus.SKIPPED),
+        ]
+        assert [(tick.collapsed_tick_count, tick.collapsed_since_timestamp) for tick in ticks] == [
+            (0, None),
+            (3, timestamps[3]),
+            (0, None),
+            (1, timestamps[0]),
+        ]
+
+        # collapsing again with a later cutoff extends the collapsed span
+        assert storage.collapse_skipped_ticks("my_sensor", "my_sensor", now.timestamp()) == (
+            timestamps[7]
+        )
+        ticks = storage.get_ticks("my_sensor", "my_sensor")
+        assert len(ticks) == 3
+        assert ticks[0].timestamp == timestamps[7]
+        assert ticks[0].collapsed_tick_count == 4
+        assert ticks[0].collapsed_since_timestamp == timestamps[3]
+
     def test_ticks_filtered(self, storage):
         storage.create_tick(self.build_sensor_tick(time.time(), status=TickStatus.STARTED))
         storage.create_tick(self.build_sensor_tick(time.time(), status=TickStatus.SUCCESS))
@@ -641,3 +719,14 @@ def test_ticks_batched(self, storage):
         assert len(ticks_by_origin["sensor_one"]) == 1
         assert ticks_by_origin["sensor_one"][0].tick_id == b.tick_id
         assert ticks_by_origin["sensor_two"][0].tick_id == d.tick_id
+
+        ticks_by_origin = storage.get_batch_ticks(["sensor_one", "sensor_two"])
+        assert [tick.tick_id for tick in ticks_by_origin["sensor_one"]] == [b.tick_id, _a.tick_id]
+        assert [tick.tick_id for tick in ticks_by_origin["sensor_two"]] == [d.tick_id, _c.tick_id]
+
+        storage.update_tick(b.with_status(TickStatus.SKIPPED))
+        ticks_by_origin = storage.get_batch_ticks(
+            ["sensor_one", "sensor_two"], limit=1, statuses=[TickStatus.SKIPPED]
+        )
+        assert [tick.tick_id for tick in ticks_by_origin["sensor_one"]] == [b.tick_id]
+        assert "sensor_two" not in ticks_by_origin
@@ -0,0 +1,111 @@
+"""
+Benchmarks for validating and post-processing the run config of a wide job, comparing the
+compiled config validators against the interpretive traversal.
+
+Run with:
+
+    python -m dagster_tests.benchmarks.config_benchmarks [--num-ops N] [--iterations N]
+"""
+import argparse
+from typing import List
+
+from dagster import Field, Int, String, job, op
+from dagster.config.compiled import CompiledConfigType
+from dagster.config.post_process import post_process_config
+from dagster.config.validate import (
+    _validate_config_from_snap,
+    process_config,
+    validate_config_from_snap,
+)
+
+from .utils import BenchmarkResult, format_results, run_benchmark
+
+
+def build_flat_job(num_ops: int):
+    """A job with ``num_ops`` independent configurable ops. Unlike the chain of ops of the serdes
+    benchmarks, this stays shallow enough to build at thousands of ops."""
+
+    def _make_op(index: int):
+        @op(
+            name=f"op_{index}",
+            config_schema={
+                "multiplier": Field(Int, is_required=False, default_value=1),
+                "label": Field(String, is_required=False, default_value=f"op_{index}"),
+            },
+        )
+        def _op(context):
+            return context.op_config["multiplier"]
+
+        return _op
+
+    ops = [_make_op(index) for index in range(num_ops)]
+
+    @job(name="flat_job")
+    def _job():
+        for each_op in ops:
+            each_op()
+
+    return _job
+
+
+def _interpretive_process_config(config_type, config_schema_snapshot, run_config):
+    validate_evr = _validate_config_from_snap(config_schema_snapshot, config_type.key, run_config)
+    assert validate_evr.success
+    return post_process_config(config_type, validate_evr.value)
+
+
+def run_config_benchmarks(num_ops: int = 5000, iterations: int = 5) -> List[BenchmarkResult]:
+    flat_job = build_flat_job(num_ops)
+    config_type = flat_job.get_run_config_schema("default").run_config_schema_type
+    run_config = {
+        "ops": {
+            f"op_{index}": {"config": {"multiplier": 2}}
+            for index in range(0, num_ops, 2)  # leave every other op to its defaults
+        }
+    }
+
+    compiled = CompiledConfigType(config_type)
+    config_schema_snapshot = compiled.config_schema_snapshot
+
+    def _compile():
+        fresh = CompiledConfigType(config_type)
+        fresh._config_schema_snapshot = config_schema_snapshot  # pylint: disable=protected-access
+        return fresh.validator, fresh.post_processor
+
+    assert process_config(config_type, run_config).success
+
+    return [
+        run_benchmark(f"compile run config schema ({num_ops} ops)", _compile, iterations),
+        run_benchmark(
+            f"process run config ({num_ops} ops, interpretive)",
+            lambda: _interpretive_process_config(config_type, config_schema_snapshot, run_config),
+            iterations,
+        ),
+        run_benchmark(
+            f"process run config ({num_ops} ops, compiled)",
+            lambda: process_config(config_type, run_config),
+            iterations,
+        ),
+        run_benchmark(
+            f"validate run config from snapshot ({num_ops} ops, interpretive)",
+            lambda: _validate_config_from_snap(
+                config_schema_snapshot, config_type.key, run_config
+            ),
+            iterations,
+        ),
+        run_benchmark(
+            f"validate run config from snapshot ({num_ops} ops, compiled)",
+            lambda: validate_config_from_snap(config_schema_snapshot, config_type.key, run_config),
+            iterations,
+        ),
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-ops", type=int, default=5000)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+    print(  # pylint: disable=print-call
+        format_results(run_config_benchmarks(args.num_ops, args.iterations))
+    )
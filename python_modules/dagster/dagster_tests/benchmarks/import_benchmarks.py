@@ -0,0 +1,77 @@
+"""
+Benchmarks for the time it takes a fresh interpreter to import dagster, as measured by
+``python -X importtime``.
+
+Run with:
+
+    python -m dagster_tests.benchmarks.import_benchmarks [--iterations N]
+"""
+import argparse
+import re
+import subprocess
+import sys
+from typing import List
+
+from .utils import BenchmarkResult, format_results
+
+IMPORT_STATEMENTS = [
+    "import dagster",
+    "from dagster import job, op",
+    "from dagster import execute_pipeline",
+    "from dagster import DagsterInstance",
+    "import dagster.grpc",
+]
+
+_IMPORT_TIME_LINE = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \|( *)(\S+)$")
+
+
+def measure_import_time(statement: str) -> float:
+    """Run ``statement`` in a fresh interpreter and return the cumulative time in seconds spent
+    importing the modules it loaded, as reported by ``-X importtime``."""
+    output = subprocess.check_output(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        stderr=subprocess.STDOUT,
+        universal_newlines=True,
+    )
+    cumulative_us = 0
+    for line in output.splitlines():
+        match = _IMPORT_TIME_LINE.match(line)
+        # only top level imports, whose cumulative time already includes their own imports
+        if match and match.group(2) == " ":
+            cumulative_us += int(match.group(1))
+    return cumulative_us / 1e6
+
+
+def imported_modules(statement: str) -> List[str]:
+    """Run ``statement`` in a fresh interpreter and return the names of every loaded module."""
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            "-c",
+            f"{statement}\nimport sys\nprint('\\n'.join(sorted(sys.modules)))",
+        ],
+        universal_newlines=True,
+    )
+    return output.splitlines()
+
+
+def run_import_benchmarks(iterations: int = 5) -> List[BenchmarkResult]:
+    results = []
+    for statement in IMPORT_STATEMENTS:
+        timings = [measure_import_time(statement) for _ in range(iterations)]
+        results.append(
+            BenchmarkResult(
+                name=statement,
+                iterations=iterations,
+                best=min(timings),
+                mean=sum(timings) / len(timings),
+            )
+        )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+    print(format_results(run_import_benchmarks(args.iterations)))  # pylint: disable=print-call
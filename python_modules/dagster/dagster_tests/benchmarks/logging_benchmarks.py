@@ -0,0 +1,57 @@
+"""
+Benchmarks for logging from inside an op to the event log of a persistent instance.
+
+Run with:
+
+    python -m dagster_tests.benchmarks.logging_benchmarks [--num-messages N] [--iterations N]
+"""
+import argparse
+from typing import List
+
+from dagster import job, op
+from dagster.core.test_utils import instance_for_test
+
+from .utils import BenchmarkResult, format_results, run_benchmark
+
+# keep the console quiet, so that only the event log write path is measured
+QUIET_RUN_CONFIG = {"loggers": {"console": {"config": {"log_level": "CRITICAL"}}}}
+
+
+def build_chatty_job(num_messages: int):
+    """A job with a single op that logs ``num_messages`` messages."""
+
+    @op
+    def chatty(context):
+        for i in range(num_messages):
+            context.log.info(f"message {i}")
+
+    @job(name="chatty_job")
+    def _job():
+        chatty()
+
+    return _job
+
+
+def run_logging_benchmarks(num_messages: int = 5000, iterations: int = 5) -> List[BenchmarkResult]:
+    chatty_job = build_chatty_job(num_messages)
+
+    with instance_for_test() as instance:
+        return [
+            run_benchmark(
+                f"execute job logging {num_messages} messages (sqlite event log)",
+                lambda: chatty_job.execute_in_process(
+                    run_config=QUIET_RUN_CONFIG, instance=instance
+                ),
+                iterations,
+            ),
+        ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-messages", type=int, default=5000)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+    print(  # pylint: disable=print-call
+        format_results(run_logging_benchmarks(args.num_messages, args.iterations))
+    )
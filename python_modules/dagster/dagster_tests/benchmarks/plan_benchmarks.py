@@ -0,0 +1,86 @@
+"""
+Benchmarks for building the execution plan that a single-step worker executes, comparing a subset
+of the full plan against a scoped build and against rebuilding from a shipped plan fragment.
+
+Run with:
+
+    python -m dagster_tests.benchmarks.plan_benchmarks [--num-ops N] [--iterations N]
+"""
+import argparse
+from typing import List
+
+from dagster import job, op
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.snap.execution_plan_snapshot import (
+    ExecutionPlanSnapshot,
+    snapshot_from_execution_plan,
+)
+from dagster.serdes import deserialize_as, serialize_dagster_namedtuple
+
+from .utils import BenchmarkResult, format_results, run_benchmark
+
+
+def build_fan_out_job(num_ops: int):
+    """A job with a single root op feeding ``num_ops`` downstream ops."""
+
+    @op
+    def root():
+        return 1
+
+    def _make_op(index: int):
+        @op(name=f"op_{index}")
+        def _op(num):
+            return num + index
+
+        return _op
+
+    ops = [_make_op(index) for index in range(num_ops)]
+
+    @job(name="fan_out_job")
+    def _job():
+        value = root()
+        for each_op in ops:
+            each_op(value)
+
+    return _job
+
+
+def run_plan_benchmarks(num_ops: int = 5000, iterations: int = 5) -> List[BenchmarkResult]:
+    fan_out_job = build_fan_out_job(num_ops)
+    step_keys = [f"op_{num_ops - 1}"]
+
+    fragment = create_execution_plan(fan_out_job).build_step_fragment(step_keys)
+    serialized_fragment = serialize_dagster_namedtuple(
+        snapshot_from_execution_plan(fragment, "fan_out_job_snapshot_id")
+    )
+
+    return [
+        run_benchmark(
+            f"build single step plan ({num_ops} ops, full build then subset)",
+            lambda: create_execution_plan(fan_out_job, step_keys_to_execute=step_keys),
+            iterations,
+        ),
+        run_benchmark(
+            f"build single step plan ({num_ops} ops, scoped)",
+            lambda: create_execution_plan(fan_out_job, step_keys_to_execute=step_keys, scoped=True),
+            iterations,
+        ),
+        run_benchmark(
+            f"rebuild single step plan from fragment ({num_ops} ops)",
+            lambda: ExecutionPlan.rebuild_from_snapshot(
+                "fan_out_job", deserialize_as(serialized_fragment, ExecutionPlanSnapshot)
+            ),
+            iterations,
+        ),
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-ops", type=int, default=5000)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+    print(  # pylint: disable=print-call
+        format_results(run_plan_benchmarks(args.num_ops, args.iterations))
+    )
@@ -0,0 +1,139 @@
+"""
+Benchmarks for the serdes layer over representative payloads: pipeline snapshots, external
+repository data and run event logs.
+
+Run with:
+
+    python -m dagster_tests.benchmarks.serdes_benchmarks [--num-ops N] [--iterations N]
+"""
+import argparse
+from typing import List, NamedTuple
+
+from dagster import DagsterInstance, Field, In, Int, Out, String, job, op, repository
+from dagster.core.definitions import JobDefinition
+from dagster.core.events.log import EventLogEntry
+from dagster.core.host_representation.external_data import (
+    ExternalRepositoryData,
+    external_repository_data_from_def,
+)
+from dagster.core.snap import PipelineSnapshot
+from dagster.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
+
+from .utils import BenchmarkResult, format_results, run_benchmark
+
+
+class SerdesPayloads(NamedTuple):
+    pipeline_snapshot: PipelineSnapshot
+    external_repository_data: ExternalRepositoryData
+    event_log_entries: List[EventLogEntry]
+
+
+def build_wide_job(num_ops: int, name: str = "wide_job") -> JobDefinition:
+    """A job with ``num_ops`` configurable ops, each consuming the output of the previous one."""
+
+    def _make_op(index: int):
+        @op(
+            name=f"op_{index}",
+            ins={"upstream": In(Int)} if index else {},
+            out=Out(Int),
+            config_schema={
+                "multiplier": Field(Int, is_required=False, default_value=1),
+                "label": Field(String, is_required=False, default_value=f"op_{index}"),
+            },
+        )
+        def _op(context, **kwargs):
+            context.log.info(f"running {context.op_config['label']}")
+            return kwargs.get("upstream", 0) + context.op_config["multiplier"]
+
+        return _op
+
+    ops = [_make_op(index) for index in range(num_ops)]
+
+    @job(name=name)
+    def _job():
+        result = ops[0]()
+        for next_op in ops[1:]:
+            result = next_op(result)
+
+    return _job
+
+
+def build_payloads(num_ops: int) -> SerdesPayloads:
+    wide_job = build_wide_job(num_ops)
+
+    @repository
+    def bench_repo():
+        return [wide_job]
+
+    with DagsterInstance.ephemeral() as instance:
+        result = wide_job.execute_in_process(instance=instance)
+        event_log_entries = instance.all_logs(result.run_id)
+
+    return SerdesPayloads(
+        pipeline_snapshot=PipelineSnapshot.from_pipeline_def(wide_job),
+        external_repository_data=external_repository_data_from_def(bench_repo),
+        event_log_entries=event_log_entries,
+    )
+
+
+def run_serdes_benchmarks(num_ops: int = 500, iterations: int = 5) -> List[BenchmarkResult]:
+    payloads = build_payloads(num_ops)
+
+    serialized_snapshot = serialize_dagster_namedtuple(payloads.pipeline_snapshot)
+    serialized_repository_data = serialize_dagster_namedtuple(payloads.external_repository_data)
+    serialized_events = [serialize_dagster_namedtuple(e) for e in payloads.event_log_entries]
+
+    return [
+        run_benchmark(
+            "serialize PipelineSnapshot",
+            lambda: serialize_dagster_namedtuple(payloads.pipeline_snapshot),
+            iterations,
+        ),
+        run_benchmark(
+            "deserialize PipelineSnapshot",
+            lambda: deserialize_json_to_dagster_namedtuple(serialized_snapshot),
+            iterations,
+        ),
+        run_benchmark(
+            "deserialize PipelineSnapshot (trusted)",
+            lambda: deserialize_json_to_dagster_namedtuple(serialized_snapshot, trusted=True),
+            iterations,
+        ),
+        run_benchmark(
+            "serialize ExternalRepositoryData",
+            lambda: serialize_dagster_namedtuple(payloads.external_repository_data),
+            iterations,
+        ),
+        run_benchmark(
+            "deserialize ExternalRepositoryData",
+            lambda: deserialize_json_to_dagster_namedtuple(serialized_repository_data),
+            iterations,
+        ),
+        run_benchmark(
+            f"serialize {len(serialized_events)} EventLogEntry",
+            lambda: [serialize_dagster_namedtuple(e) for e in payloads.event_log_entries],
+            iterations,
+        ),
+        run_benchmark(
+            f"deserialize {len(serialized_events)} EventLogEntry",
+            lambda: [deserialize_json_to_dagster_namedtuple(e) for e in serialized_events],
+            iterations,
+        ),
+        run_benchmark(
+            f"deserialize {len(serialized_events)} EventLogEntry (trusted)",
+            lambda: [
+                deserialize_json_to_dagster_namedtuple(e, trusted=True) for e in serialized_events
+            ],
+            iterations,
+        ),
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-ops", type=int, default=500)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+    print(  # pylint: disable=print-call
+        format_results(run_serdes_benchmarks(args.num_ops, args.iterations))
+    )
@@ -0,0 +1,30 @@
+from .config_benchmarks import run_config_benchmarks
+from .import_benchmarks import run_import_benchmarks
+from .logging_benchmarks import run_logging_benchmarks
+from .plan_benchmarks import run_plan_benchmarks
+from .serdes_benchmarks import run_serdes_benchmarks
+
+
+def test_serdes_benchmarks():
+    results = run_serdes_benchmarks(num_ops=5, iterations=1)
+    assert all(result.iterations == 1 for result in results)
+
+
+def test_config_benchmarks():
+    results = run_config_benchmarks(num_ops=5, iterations=1)
+    assert all(result.iterations == 1 for result in results)
+
+
+def test_import_benchmarks():
+    results = run_import_benchmarks(iterations=1)
+    assert all(result.iterations == 1 for result in results)
+
+
+def test_plan_benchmarks():
+    results = run_plan_benchmarks(num_ops=5, iterations=1)
+    assert all(result.iterations == 1 for result in results)
+
+
+def test_logging_benchmarks():
+    results = run_logging_benchmarks(num_messages=5, iterations=1)
+    assert all(result.iterations == 1 for result in results)
@@ -0,0 +1,38 @@
+import time
+from typing import Any, Callable, List, NamedTuple, Sequence
+
+from tabulate import tabulate
+
+
+class BenchmarkResult(NamedTuple):
+    name: str
+    iterations: int
+    best: float
+    mean: float
+
+
+def run_benchmark(name: str, fn: Callable[[], Any], iterations: int = 5) -> BenchmarkResult:
+    """Call ``fn`` ``iterations`` times and record the best and mean wall clock time."""
+    timings: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return BenchmarkResult(
+        name=name, iterations=iterations, best=min(timings), mean=sum(timings) / len(timings)
+    )
+
+
+def format_results(results: Sequence[BenchmarkResult]) -> str:
+    return tabulate(
+        [
+            (
+                result.name,
+                result.iterations,
+                f"{result.best * 1000:.2f}",
+                f"{result.mean * 1000:.2f}",
+            )
+            for result in results
+        ],
+        headers=["benchmark", "iterations", "best (ms)", "mean (ms)"],
+    )
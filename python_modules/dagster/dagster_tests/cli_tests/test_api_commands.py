@@ -1,16 +1,19 @@
 import mock
 from click.testing import CliRunner
+from dagster_tests.api_tests.api_tests_repo import foo_pipeline
 from dagster_tests.api_tests.utils import get_bar_repo_handle, get_foo_pipeline_handle
 
 from dagster.cli import api
 from dagster.cli.api import ExecuteRunArgs, ExecuteStepArgs, verify_step
+from dagster.core.execution.api import create_execution_plan
 from dagster.core.execution.plan.state import KnownExecutionState
 from dagster.core.execution.retries import RetryState
 from dagster.core.execution.stats import RunStepKeyStatsSnapshot
 from dagster.core.host_representation import PipelineHandle
 from dagster.core.instance import DagsterInstance
+from dagster.core.snap.execution_plan_snapshot import snapshot_from_execution_plan
 from dagster.core.test_utils import create_run_for_test, instance_for_test
-from dagster.serdes import serialize_dagster_namedtuple
+from dagster.serdes import deserialize_as, serialize_dagster_namedtuple
 
 
 def runner_execute_run(runner, cli_args):
@@ -241,6 +244,64 @@ def test_execute_step_1():
         assert "STEP_SUCCESS" in result.stdout
 
 
+def test_execute_step_with_execution_plan_snapshot():
+    with instance_for_test(
+        overrides={
+            "compute_logs": {
+                "module": "dagster.core.storage.noop_compute_log_manager",
+                "class": "NoOpComputeLogManager",
+            }
+        }
+    ) as instance:
+        with get_foo_pipeline_handle(instance) as pipeline_handle:
+            runner = CliRunner()
+
+            run = create_run_for_test(instance, pipeline_name="foo", run_id="new_run")
+
+            fragment = create_execution_plan(foo_pipeline).build_step_fragment(["do_something"])
+            assert [step.key for step in fragment.steps] == ["do_something"]
+
+            input_json = serialize_dagster_namedtuple(
+                ExecuteStepArgs(
+                    pipeline_origin=pipeline_handle.get_python_origin(),
+                    pipeline_run_id=run.run_id,
+                    step_keys_to_execute=["do_something"],
+                    instance_ref=instance.get_ref(),
+                    execution_plan_snapshot=snapshot_from_execution_plan(
+                        fragment, "foo_snapshot_id"
+                    ),
+                )
+            )
+
+            result = runner_execute_step(
+                runner,
+                [input_json],
+            )
+
+        assert "STEP_SUCCESS" in result.stdout
+
+
+def test_execute_step_command_args_leave_out_large_execution_plan_snapshot():
+    with instance_for_test() as instance:
+        with get_foo_pipeline_handle(instance) as pipeline_handle:
+            fragment = create_execution_plan(foo_pipeline).build_step_fragment(["do_something"])
+            args = ExecuteStepArgs(
+                pipeline_origin=pipeline_handle.get_python_origin(),
+                pipeline_run_id="new_run",
+                step_keys_to_execute=["do_something"],
+                execution_plan_snapshot=snapshot_from_execution_plan(fragment, "foo_snapshot_id"),
+            )
+
+            command_args = args.get_command_args()
+            assert deserialize_as(command_args[-1], ExecuteStepArgs) == args
+
+            with mock.patch("dagster.grpc.types.MAX_COMMAND_ARG_LENGTH", len(command_args[-1])):
+                command_args = args.get_command_args()
+                assert deserialize_as(
+                    command_args[-1], ExecuteStepArgs
+                ) == args._replace(execution_plan_snapshot=None)
+
+
 def test_execute_step_verify_step():
     with instance_for_test(
         overrides={
@@ -7,8 +7,10 @@
 from dagster.check import CheckError
 from dagster.core.errors import DagsterUserCodeUnreachableError
 from dagster.core.host_representation import GrpcServerRepositoryLocationOrigin
+from dagster.core.host_representation.grpc_server_registry import ProcessGrpcServerRegistry
 from dagster.core.test_utils import environ
 from dagster.core.workspace.load import location_origins_from_config
+from dagster.core.workspace.location_loader import create_location_from_origin
 from dagster.grpc.server import GrpcServerProcess
 from dagster.utils import file_relative_path
 
@@ -66,6 +68,33 @@ def test_grpc_socket_workspace():
     first_server_process.wait()
 
 
+@pytest.mark.skipif(seven.IS_WINDOWS, reason="no named sockets on Windows")
+def test_grpc_server_location_reused_while_server_unchanged():
+    with ProcessGrpcServerRegistry(
+        reload_interval=0, heartbeat_ttl=30, startup_timeout=60
+    ) as registry:
+        server_process = GrpcServerProcess()
+        with server_process.create_ephemeral_client() as client:
+            origin = GrpcServerRepositoryLocationOrigin(host="localhost", socket=client.socket)
+            with create_location_from_origin(origin, registry) as location:
+                assert create_location_from_origin(
+                    origin, registry, previous_location=location
+                ) is location
+
+                # an explicit reload always rebuilds the location, since a server started with a
+                # fixed server id keeps it across code changes
+                with create_location_from_origin(
+                    origin, registry, reload_grpc_server=True, previous_location=location
+                ) as reloaded_location:
+                    assert reloaded_location is not location
+                    assert reloaded_location.server_id == location.server_id
+        server_process.wait()
+
+        # the server is gone, so loading the location again surfaces the error
+        with pytest.raises(DagsterUserCodeUnreachableError):
+            create_location_from_origin(origin, registry, previous_location=location)
+
+
 def test_grpc_server_env_vars():
     with environ(
         {
@@ -0,0 +1,118 @@
+import threading
+import time
+
+from dagster.core.host_representation.origin import RegisteredRepositoryLocationOrigin
+from dagster.core.workspace import WorkspaceLocationEntry, WorkspaceLocationLoadStatus
+from dagster.core.workspace.location_loader import load_location_entries
+
+
+class _FakeLocation:
+    def __init__(self):
+        self.cleaned_up = False
+
+    def get_display_metadata(self):
+        return {}
+
+    def cleanup(self):
+        self.cleaned_up = True
+
+
+def _entry(origin, location=None):
+    return WorkspaceLocationEntry(
+        origin=origin,
+        repository_location=location,
+        load_error=None,
+        load_status=WorkspaceLocationLoadStatus.LOADED,
+        display_metadata={},
+        update_timestamp=time.time(),
+    )
+
+
+def _origins(count):
+    return [RegisteredRepositoryLocationOrigin(f"location_{i}") for i in range(count)]
+
+
+def test_locations_load_concurrently():
+    origins = _origins(4)
+    all_started = threading.Barrier(len(origins), timeout=10)
+
+    def _load_location(origin):
+        # only passes if every location is loading at the same time
+        all_started.wait()
+        return _entry(origin)
+
+    entries = load_location_entries(origins, _load_location, max_concurrent_loads=4)
+    assert list(entries.keys()) == [origin.location_name for origin in origins]
+    assert all(not entry.load_error for entry in entries.values())
+
+
+def test_max_concurrent_loads():
+    lock = threading.Lock()
+    in_flight = []
+    max_in_flight = []
+
+    def _load_location(origin):
+        with lock:
+            in_flight.append(origin)
+            max_in_flight.append(len(in_flight))
+        time.sleep(0.05)
+        with lock:
+            in_flight.remove(origin)
+        return _entry(origin)
+
+    entries = load_location_entries(_origins(6), _load_location, max_concurrent_loads=2)
+    assert len(entries) == 6
+    assert max(max_in_flight) == 2
+
+
+def test_order_preserved():
+    origins = _origins(5)
+
+    def _load_location(origin):
+        # later locations finish first
+        time.sleep(0.01 * (len(origins) - int(origin.location_name.split("_")[1])))
+        return _entry(origin)
+
+    entries = load_location_entries(origins, _load_location)
+    assert list(entries.keys()) == [origin.location_name for origin in origins]
+
+
+def test_slow_location_times_out():
+    origins = _origins(3)
+    release_slow_location = threading.Event()
+    slow_location = _FakeLocation()
+
+    def _load_location(origin):
+        if origin.location_name == "location_1":
+            release_slow_location.wait(10)
+            return _entry(origin, slow_location)
+        return _entry(origin, _FakeLocation())
+
+    start_time = time.time()
+    entries = load_location_entries(origins, _load_location, timeout=0.5)
+    assert time.time() - start_time < 5
+
+    assert list(entries.keys()) == [origin.location_name for origin in origins]
+    assert entries["location_0"].repository_location
+    assert entries["location_2"].repository_location
+
+    timed_out = entries["location_1"]
+    assert not timed_out.repository_location
+    assert timed_out.load_status == WorkspaceLocationLoadStatus.LOADED
+    assert "Timed out after 0.5 seconds loading location location_1" in (
+        timed_out.load_error.message
+    )
+
+    # the hung load does not block interpreter exit
+    loader_threads = [
+        thread for thread in threading.enumerate() if thread.name.startswith("location_loader")
+    ]
+    assert loader_threads
+    assert all(thread.daemon for thread in loader_threads)
+
+    # a location that finishes loading after it timed out is cleaned up
+    release_slow_location.set()
+    deadline = time.time() + 10
+    while not slow_location.cleaned_up and time.time() < deadline:
+        time.sleep(0.01)
+    assert slow_location.cleaned_up
@@ -0,0 +1,199 @@
+import pytest
+
+from dagster import (
+    Array,
+    Enum,
+    EnumValue,
+    Field,
+    IntSource,
+    Map,
+    Noneable,
+    Permissive,
+    ScalarUnion,
+    Selector,
+    Shape,
+    StringSource,
+)
+from dagster.config.compiled import get_compiled_config_type, get_compiled_validator_for_snap
+from dagster.config.field import resolve_to_config_type
+from dagster.config.iterate_types import config_schema_snapshot_from_config_type
+from dagster.config.post_process import post_process_config
+from dagster.config.validate import (
+    _validate_config_from_snap,
+    process_config,
+    validate_config,
+    validate_config_from_snap,
+)
+from dagster.core.test_utils import environ
+
+SCHEMA = Shape(
+    {
+        "int": Field(int, is_required=False, default_value=1),
+        "float": Field(float, is_required=False),
+        "noneable": Field(Noneable(str), is_required=False),
+        "enum": Field(
+            Enum("CompiledEnum", [EnumValue("ONE", 1), EnumValue("TWO", 2)]),
+            is_required=False,
+            default_value="ONE",
+        ),
+        "array": Field([Noneable(int)], is_required=False),
+        "map": Field(Map(str, bool), is_required=False),
+        "selector": Field(
+            Selector(
+                {
+                    "a": Field(Shape({"x": Field(int, is_required=False, default_value=3)})),
+                    "b": Field(str),
+                }
+            ),
+            is_required=False,
+        ),
+        "optional_selector": Field(
+            Selector({"only": Field(Shape({"y": Field(str, default_value="y")}))}),
+            is_required=False,
+        ),
+        "permissive": Field(Permissive({"known": Field(int, default_value=2)}), is_required=False),
+        "union": Field(
+            ScalarUnion(scalar_type=str, non_scalar_schema=Array(str)), is_required=False
+        ),
+        "source": Field(StringSource, is_required=False),
+        "required": Field(Shape({"inner": Field(str)})),
+    },
+    field_aliases={"required": "also_required"},
+)
+
+VALID_CONFIGS = [
+    {"required": {"inner": "a"}},
+    {"also_required": {"inner": "a"}},
+    {
+        "int": 2,
+        "float": 1,
+        "noneable": None,
+        "enum": "TWO",
+        "array": [1, None, 3],
+        "map": {"x": True},
+        "selector": {"a": None},
+        "optional_selector": {},
+        "permissive": {"extra": [1, 2]},
+        "union": ["x", "y"],
+        "source": "foo",
+        "required": {"inner": "a"},
+    },
+    {
+        "float": 1.5,
+        "array": [],
+        "map": {},
+        "selector": {"b": "foo"},
+        "optional_selector": {"only": None},
+        "permissive": {"known": 5},
+        "union": "x",
+        "required": {"inner": "a"},
+    },
+]
+
+INVALID_CONFIGS = [
+    None,
+    [],
+    {},
+    {"required": {"inner": 1}},
+    {"required": {"inner": "a"}, "also_required": {"inner": "a"}},
+    {"required": {"inner": "a"}, "extra": 1},
+    {"required": {"inner": "a"}, "extra": 1, "other_extra": 2},
+    {"required": {"inner": "a"}, "int": True},
+    {"required": {"inner": "a"}, "float": "1.5"},
+    {"required": {"inner": "a"}, "enum": "THREE"},
+    {"required": {"inner": "a"}, "enum": 1},
+    {"required": {"inner": "a"}, "array": [1, "2"]},
+    {"required": {"inner": "a"}, "array": 1},
+    {"required": {"inner": "a"}, "map": {"x": 1}},
+    {"required": {"inner": "a"}, "map": {1: True}},
+    {"required": {"inner": "a"}, "selector": {}},
+    {"required": {"inner": "a"}, "selector": {"a": {}, "b": "foo"}},
+    {"required": {"inner": "a"}, "selector": {"c": "foo"}},
+    {"required": {"inner": "a"}, "selector": "a"},
+    {"required": {"inner": "a"}, "permissive": {"known": "2"}},
+    {"required": {"inner": "a"}, "union": 1},
+    {"required": {"inner": "a"}, "union": [1]},
+    {"required": {"inner": "a"}, "source": {"env": 1}},
+    {"required": {"inner": "a", "extra": 1}, "int": "1", "array": None},
+]
+
+
+def _interpretive_validate(config_value):
+    config_type = resolve_to_config_type(SCHEMA)
+    return _validate_config_from_snap(
+        config_schema_snapshot_from_config_type(config_type), config_type.key, config_value
+    )
+
+
+@pytest.mark.parametrize("config_value", VALID_CONFIGS)
+def test_compiled_valid_config(config_value):
+    expected = _interpretive_validate(config_value)
+    assert expected.success
+
+    result = validate_config(SCHEMA, config_value)
+    assert result.success
+    assert result.value == expected.value
+
+    processed = process_config(SCHEMA, config_value)
+    assert processed.success
+    assert processed.value == post_process_config(SCHEMA, expected.value).value
+
+
+@pytest.mark.parametrize("config_value", INVALID_CONFIGS)
+def test_compiled_invalid_config(config_value):
+    expected = _interpretive_validate(config_value)
+    assert not expected.success
+
+    result = validate_config(SCHEMA, config_value)
+    assert not result.success
+    assert result.errors == expected.errors
+    assert process_config(SCHEMA, config_value).errors == expected.errors
+
+
+def test_compiled_post_processing_error():
+    config_value = {"required": {"inner": "a"}, "source": {"env": "DAGSTER_COMPILED_TEST_ENV"}}
+    validated = validate_config(SCHEMA, config_value).value
+    expected = post_process_config(SCHEMA, validated)
+    assert not expected.success
+
+    result = process_config(SCHEMA, config_value)
+    assert not result.success
+    assert [error.message for error in result.errors] == [
+        error.message for error in expected.errors
+    ]
+    assert result.errors[0].stack.entries == expected.errors[0].stack.entries
+
+    with environ({"DAGSTER_COMPILED_TEST_ENV": "bar"}):
+        assert process_config(SCHEMA, config_value).value["source"] == "bar"
+
+    with environ({"DAGSTER_COMPILED_TEST_ENV": "bar"}):
+        assert not process_config(IntSource, {"env": "DAGSTER_COMPILED_TEST_ENV"}).success
+
+
+def test_compiled_once():
+    config_type = resolve_to_config_type(SCHEMA)
+    compiled = get_compiled_config_type(config_type)
+    validator = compiled.validator
+    post_processor = compiled.post_processor
+
+    assert process_config(SCHEMA, VALID_CONFIGS[0]).success
+    assert get_compiled_config_type(config_type) is compiled
+    assert compiled.validator is validator
+    assert compiled.post_processor is post_processor
+
+
+def test_compiled_once_for_snap():
+    config_type = resolve_to_config_type(SCHEMA)
+    snapshot = config_schema_snapshot_from_config_type(config_type)
+
+    for config_value in VALID_CONFIGS:
+        assert validate_config_from_snap(snapshot, config_type.key, config_value).success
+    for config_value in INVALID_CONFIGS:
+        assert (
+            validate_config_from_snap(snapshot, config_type.key, config_value).errors
+            == _interpretive_validate(config_value).errors
+        )
+
+    assert get_compiled_validator_for_snap(
+        snapshot, config_type.key
+    ) is get_compiled_validator_for_snap(snapshot, config_type.key)
@@ -14,6 +14,7 @@
     pipeline,
     solid,
 )
+from dagster import seven
 from dagster.config.config_type import Array, Bool, Enum, EnumValue, Float, Int, Noneable, String
 from dagster.core.snap import (
     DependencyStructureIndex,
@@ -29,9 +30,11 @@
 )
 from dagster.serdes import (
     deserialize_json_to_dagster_namedtuple,
+    pack_value,
     serialize_dagster_namedtuple,
     serialize_pp,
 )
+from dagster.serdes.utils import hash_str
 
 
 def serialize_rt(value):
@@ -544,3 +547,42 @@ def noop_pipeline():
     _dict_has_stable_hashes(
         recevied_config_type, pipeline_snapshot.config_schema_snapshot.all_config_snaps_by_key
     )
+
+
+def test_pipeline_snapshot_id_is_hash_of_json():
+    @solid(config_schema={"foo": Field(int, default_value=1), "bar": Noneable([str])})
+    def configured_solid(_):
+        return 1
+
+    @solid
+    def downstream(_, num):
+        return num
+
+    @pipeline
+    def a_pipeline():
+        downstream(configured_solid())
+        configured_solid.alias("other")()
+
+    def _hash_of_json(pipeline_snapshot):
+        return hash_str(seven.json.dumps(pack_value(pipeline_snapshot)))
+
+    pipeline_snapshot = PipelineSnapshot.from_pipeline_def(a_pipeline)
+    pipeline_snapshot_id = create_pipeline_snapshot_id(pipeline_snapshot)
+    assert pipeline_snapshot_id == _hash_of_json(pipeline_snapshot)
+    assert create_pipeline_snapshot_id(pipeline_snapshot) == pipeline_snapshot_id
+
+    # a new snapshot of the same pipeline shares the snaps of its definitions
+    rebuilt_snapshot = PipelineSnapshot.from_pipeline_def(a_pipeline)
+    assert rebuilt_snapshot.solid_definitions_snapshot.solid_def_snaps[0] is (
+        pipeline_snapshot.solid_definitions_snapshot.solid_def_snaps[0]
+    )
+    assert create_pipeline_snapshot_id(rebuilt_snapshot) == pipeline_snapshot_id
+
+    subset_snapshot = PipelineSnapshot.from_pipeline_def(
+        a_pipeline.get_pipeline_subset_def({"other"})
+    )
+    assert subset_snapshot.lineage_snapshot.parent_snapshot_id == pipeline_snapshot_id
+    assert create_pipeline_snapshot_id(subset_snapshot) == _hash_of_json(subset_snapshot)
+
+    deserialized_snapshot = serialize_rt(pipeline_snapshot)
+    assert create_pipeline_snapshot_id(deserialized_snapshot) == pipeline_snapshot_id
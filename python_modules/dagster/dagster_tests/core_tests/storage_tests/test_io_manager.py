@@ -917,3 +917,72 @@ def the_graph():
 
     assert materializations[0].metadata_entries[0].label == "one"
     assert materializations[1].metadata_entries[0].label == "two"
+
+
+def test_mem_io_manager_releases_outputs():
+    mem_io_manager_instance = InMemoryIOManager()
+
+    def held_step_keys():
+        return sorted(step_key for _run_id, step_key, _name in mem_io_manager_instance.values)
+
+    @op
+    def emit_one():
+        return 1
+
+    @op
+    def add_one(num):
+        return num + 1
+
+    @op
+    def add_two(num):
+        return num + 2
+
+    @op
+    def adder(left, right):
+        # both steps that load the output of emit_one are done with it
+        assert held_step_keys() == ["add_one", "add_two"]
+        return left + right
+
+    @job(
+        resource_defs={
+            "io_manager": IOManagerDefinition.hardcoded_io_manager(mem_io_manager_instance)
+        }
+    )
+    def diamond_job():
+        one = emit_one()
+        adder(left=add_one(one), right=add_two(one))
+
+    result = diamond_job.execute_in_process()
+    assert result.success
+    assert result.output_for_node("emit_one") == 1
+    assert result.output_for_node("adder") == 5
+
+    # only the output of the last step, which nothing loads, is still held
+    assert held_step_keys() == ["adder"]
+
+def test_release_output_error():
+    class ErrorIOManager(InMemoryIOManager):
+        def release_output(self, context):
+            raise ValueError("release output error")
+
+    @op
+    def emit_one():
+        return 1
+
+    @op
+    def add_one(num):
+        return num + 1
+
+    @job(resource_defs={"io_manager": IOManagerDefinition.hardcoded_io_manager(ErrorIOManager())})
+    def the_job():
+        add_one(emit_one())
+
+    result = the_job.execute_in_process()
+    assert result.success
+    assert result.output_for_node("add_one") == 2
+    assert any(
+        event.is_engine_event
+        and event.message == 'Exception while releasing output "result"'
+        and "release output error" in event.event_specific_data.error.message
+        for event in result.all_events
+    )
@@ -3,6 +3,8 @@
 
 from dagster import (
     ModeDefinition,
+    Output,
+    OutputDefinition,
     ResourceDefinition,
     build_init_resource_context,
     build_input_context,
@@ -12,6 +14,7 @@
     pipeline,
     solid,
 )
+from dagster.core.execution.api import create_execution_plan
 from dagster.core.storage.memoizable_io_manager import (
     MemoizableIOManager,
     VersionedPickledObjectFilesystemIOManager,
@@ -32,6 +35,89 @@ def test_versioned_pickled_object_filesystem_io_manager():
         assert not store.has_output(context_diff_version)
 
 
+def test_versioned_pickled_object_filesystem_io_manager_has_outputs():
+    with TemporaryDirectory() as temp_dir:
+        store = VersionedPickledObjectFilesystemIOManager(os.path.join(temp_dir, "outputs"))
+        contexts = [
+            build_output_context(step_key=step_key, name=name, version=version)
+            for step_key, name, version in [
+                ("foo", "bar", "version1"),
+                ("foo", "bar", "version2"),
+                ("foo", "baz", "version1"),
+                ("qux", "bar", "version1"),
+            ]
+        ]
+        assert store.has_outputs(contexts) == [False, False, False, False]
+
+        store.handle_output(contexts[0], "cat")
+        store.handle_output(contexts[2], "dog")
+        assert store.has_outputs(contexts) == [True, False, True, False]
+        assert store.has_outputs(contexts) == [store.has_output(context) for context in contexts]
+
+
+def test_has_outputs_default():
+    class OddVersionsIOManager(MemoizableIOManager):
+        def handle_output(self, context, obj):
+            pass
+
+        def load_input(self, context):
+            pass
+
+        def has_output(self, context):
+            return int(context.version) % 2 == 1
+
+    contexts = [
+        build_output_context(step_key="foo", name="bar", version=str(version))
+        for version in range(50)
+    ]
+    expected = [version % 2 == 1 for version in range(50)]
+    assert OddVersionsIOManager().has_outputs(contexts) == expected
+    assert OddVersionsIOManager().has_outputs([]) == []
+
+
+def test_memoized_plan_checks_outputs_in_one_batch():
+    batches = []
+
+    class BatchedIOManager(MemoizableIOManager):
+        def handle_output(self, context, obj):
+            pass
+
+        def load_input(self, context):
+            pass
+
+        def has_output(self, context):
+            raise Exception("has_output should not be called")
+
+        def has_outputs(self, contexts):
+            batches.append(sorted((context.step_key, context.name) for context in contexts))
+            return [context.step_key == "first" for context in contexts]
+
+    @solid(version="1", output_defs=[OutputDefinition(name="a"), OutputDefinition(name="b")])
+    def first():
+        yield Output(1, "a")
+        yield Output(2, "b")
+
+    @solid(version="1")
+    def second(a, b):
+        return a + b
+
+    @pipeline(
+        mode_defs=[
+            ModeDefinition(resource_defs={"io_manager": io_manager(lambda _: BatchedIOManager())})
+        ],
+        tags={MEMOIZED_RUN_TAG: "true"},
+    )
+    def batched_pipeline():
+        a, b = first()
+        second(a, b)
+
+    with instance_for_test() as instance:
+        memoized_plan = create_execution_plan(batched_pipeline, instance_ref=instance.get_ref())
+
+    assert memoized_plan.step_keys_to_execute == ["second"]
+    assert batches == [[("first", "a"), ("first", "b"), ("second", "result")]]
+
+
 def test_versioned_io_manager_with_resources():
     occurrence_log = []
 
@@ -35,6 +35,7 @@
 from dagster.core.definitions.dependency import NodeHandle
 from dagster.core.definitions.pipeline_base import InMemoryPipeline
 from dagster.core.events import (
+    RETAINED_EVENTS,
     DagsterEvent,
     DagsterEventType,
     EngineEventData,
@@ -54,6 +55,7 @@
 from dagster.core.storage.event_log import InMemoryEventLogStorage, SqlEventLogStorage
 from dagster.core.storage.event_log.base import (
     EventLogRecord,
+    EventLogStorage,
     EventRecordsFilter,
     RunShardedEventsCursor,
 )
@@ -61,6 +63,7 @@
     EVENT_LOG_DATA_MIGRATIONS,
     migrate_asset_key_data,
 )
+from dagster.core.storage.event_log.schema import AssetPartitionsTable
 from dagster.core.storage.event_log.sqlite.sqlite_event_log import SqliteEventLogStorage
 from dagster.core.test_utils import instance_for_test
 from dagster.core.utils import make_new_run_id
@@ -349,6 +352,34 @@ def test_event_log_storage_store_events_and_wipe(self, storage):
             storage.wipe()
             assert len(storage.get_logs_for_run(DEFAULT_RUN_ID)) == 0
 
+    def test_event_log_storage_store_events_batch(self, storage):
+        def _user_message(message, run_id):
+            return EventLogEntry(
+                error_info=None,
+                level="info",
+                user_message=message,
+                run_id=run_id,
+                timestamp=time.time(),
+            )
+
+        events = [
+            _user_message("one", "foo"),
+            _user_message("two", "foo"),
+            create_test_event_log_record("three", "foo"),
+            _user_message("four", "foo"),
+            _user_message("five", "bar"),
+        ]
+        storage.store_events(events)
+
+        assert [event.user_message for event in storage.get_logs_for_run("foo")] == [
+            "one",
+            "two",
+            "three",
+            "four",
+        ]
+        assert [event.user_message for event in storage.get_logs_for_run("bar")] == ["five"]
+        assert storage.get_logs_for_run("foo")[2].is_dagster_event
+
     def test_event_log_storage_store_with_multiple_runs(self, storage):
         runs = ["foo", "bar", "baz"]
         for run_id in runs:
@@ -666,6 +697,90 @@ def _solids():
 
         assert storage.get_logs_for_run(result.run_id) == []
 
+    def test_compact_events(self, storage):
+        @solid
+        def log_and_materialize(context):
+            context.log.info("hello")
+            yield AssetMaterialization(asset_key="compacted_asset")
+            yield Output(1)
+
+        def _solids():
+            log_and_materialize()
+
+        events, result = _synthesize_events(_solids)
+
+        for event in events:
+            storage.store_event(event)
+
+        step_stats = storage.get_step_stats_for_run(result.run_id)
+        storage.compact_events(result.run_id)
+
+        out_events = storage.get_logs_for_run(result.run_id)
+        assert len(out_events) < len(events)
+        assert all(
+            event.is_dagster_event and event.dagster_event.event_type in RETAINED_EVENTS
+            for event in out_events
+        )
+        assert _event_types(out_events) == [
+            event_type for event_type in _event_types(events) if event_type in RETAINED_EVENTS
+        ]
+        assert storage.get_step_stats_for_run(result.run_id) == step_stats
+        assert storage.has_asset_key(AssetKey("compacted_asset"))
+
+    def test_default_compact_events(self, storage):
+        @solid
+        def return_one(context):
+            context.log.info("hello")
+            return 1
+
+        def _solids():
+            return_one()
+
+        events, result = _synthesize_events(_solids)
+        storage.store_events(events)
+
+        # storages that cannot delete events in place keep every event of the run
+        EventLogStorage.compact_events(storage, result.run_id)
+
+        assert _event_types(storage.get_logs_for_run(result.run_id)) == _event_types(events)
+
+    def test_compact_events_keeps_asset_storage_ids(self, storage):
+        asset_key = AssetKey("compacted_asset")
+
+        @solid
+        def materialize(_):
+            yield AssetMaterialization(asset_key=asset_key)
+            yield Output(1)
+
+        def _solids():
+            materialize()
+
+        run_ids = []
+        for _ in range(2):
+            events, result = _synthesize_events(_solids)
+            storage.store_events(events)
+            run_ids.append(result.run_id)
+
+        def _asset_state():
+            records = storage.get_event_records(
+                EventRecordsFilter(
+                    event_type=DagsterEventType.ASSET_MATERIALIZATION, asset_key=asset_key
+                )
+            )
+            return (
+                # asset sensors advance their cursor past these storage ids
+                [(record.storage_id, record.event_log_entry.run_id) for record in records],
+                storage.get_latest_materialization_events([asset_key])[asset_key].run_id,
+            )
+
+        asset_state = _asset_state()
+        assert asset_state[1] == run_ids[-1]
+
+        storage.compact_events(run_ids[0])
+        EventLogStorage.compact_events(storage, run_ids[0])
+
+        assert _asset_state() == asset_state
+
     def test_get_logs_for_run_of_type(self, storage):
         @solid
         def return_one(_):
@@ -694,6 +809,42 @@ def _solids():
             )
         ) == [DagsterEventType.STEP_SUCCESS, DagsterEventType.PIPELINE_SUCCESS]
 
+    def test_get_records_for_run_cursor(self, storage):
+        @solid
+        def return_one(_):
+            return 1
+
+        def _solids():
+            return_one()
+
+        events, result = _synthesize_events(_solids)
+
+        for event in events:
+            storage.store_event(event)
+
+        records = storage.get_records_for_run(result.run_id)
+        assert _event_types([record.event_log_entry for record in records]) == _event_types(events)
+
+        step_event_types = {DagsterEventType.STEP_START, DagsterEventType.STEP_SUCCESS}
+        step_records = storage.get_records_for_run(result.run_id, of_type=step_event_types)
+        assert _event_types([record.event_log_entry for record in step_records]) == [
+            DagsterEventType.STEP_START,
+            DagsterEventType.STEP_SUCCESS,
+        ]
+
+        # paging by storage id stays consistent when the records are filtered by type
+        first_page = storage.get_records_for_run(result.run_id, of_type=step_event_types, limit=1)
+        assert first_page == step_records[:1]
+        assert (
+            storage.get_records_for_run(
+                result.run_id, cursor=first_page[-1].storage_id, of_type=step_event_types
+            )
+            == step_records[1:]
+        )
+        assert not storage.get_records_for_run(
+            result.run_id, cursor=records[-1].storage_id, of_type=step_event_types
+        )
+
     def test_basic_get_logs_for_run_cursor(self, storage):
         @solid
         def return_one(_):
@@ -1957,6 +2108,73 @@ def _fetch_counts(storage):
                 assert materialization_count_by_partition.get(c)["a"] == 1
                 assert materialization_count_by_partition.get(d)["x"] == 2
 
+    def test_get_latest_materialization_records_by_partition(self, storage):
+        a = AssetKey("no_materializations_asset")
+        b = AssetKey("partitioned_asset")
+
+        @op
+        def materialize():
+            yield AssetMaterialization(b, partition="x")
+            yield AssetMaterialization(b, partition="y")
+            yield AssetObservation(b, partition="z")
+            yield Output(None)
+
+        @op
+        def materialize_x():
+            yield AssetMaterialization(b, partition="x")
+            yield Output(None)
+
+        with instance_for_test() as instance:
+            if not storage._instance:  # pylint: disable=protected-access
+                storage.register_instance(instance)
+
+            events_one, result_one = _synthesize_events(lambda: materialize(), instance=instance)
+            for event in events_one:
+                storage.store_event(event)
+
+            between_runs = time.time()
+            events_two, result_two = _synthesize_events(lambda: materialize_x(), instance=instance)
+            for event in events_two:
+                storage.store_event(event)
+
+            def _validate_records():
+                records_by_key = storage.get_latest_materialization_records_by_partition([a, b])
+                assert records_by_key[a] == {}
+                records = records_by_key[b]
+                assert set(records.keys()) == {"x", "y"}
+                assert records["x"].materialization_count == 2
+                assert records["x"].last_run_id == result_two.run_id
+                assert records["x"].last_materialization_timestamp >= between_runs
+                assert records["y"].materialization_count == 1
+                assert records["y"].last_run_id == result_one.run_id
+                assert records["y"].last_materialization_timestamp < between_runs
+
+            _validate_records()
+
+            assert storage.get_partitions_missing_since(b, between_runs) == ["y"]
+            assert storage.get_partitions_missing_since(b, between_runs, ["x", "y", "z"]) == [
+                "y",
+                "z",
+            ]
+            assert storage.get_partitions_missing_since(b, time.time(), ["x"]) == ["x"]
+
+            if isinstance(storage, SqlEventLogStorage):
+                # the partitions table can be rebuilt from the event log
+                with storage.index_connection() as conn:
+                    conn.execute(AssetPartitionsTable.delete())
+                storage.reindex_assets(force=True)
+                _validate_records()
+
+            storage.delete_events(result_two.run_id)
+            records = storage.get_latest_materialization_records_by_partition([b])[b]
+            assert records["x"].materialization_count == 1
+            assert records["x"].last_run_id == result_one.run_id
+
+            if self.can_wipe():
+                storage.wipe_asset(b)
+                assert storage.get_latest_materialization_records_by_partition([b])[b] == {}
+                assert storage.get_partitions_missing_since(b, between_runs, ["x"]) == ["x"]
+
     def test_get_observation(self, storage):
         a = AssetKey(["key_a"])
 
@@ -1,8 +1,38 @@
 import pytest
 
+from dagster_tests.benchmarks.import_benchmarks import imported_modules
+
+# The backends that made up most of the time it took to import dagster, which are only loaded once
+# they are used
+DEFERRED_MODULES = [
+    "alembic",
+    "grpc",
+    "pkg_resources",
+    "sqlalchemy",
+    "watchdog",
+    "dagster.core.execution.api",
+    "dagster.core.host_representation",
+    "dagster.core.instance",
+    "dagster.core.storage.event_log",
+    "dagster.core.storage.runs",
+    "dagster.core.storage.schedules",
+    "dagster.grpc",
+]
+
 
 def test_no_warnings_on_import():
     with pytest.warns(None) as record:
         import dagster  # pylint: disable=unused-import
 
     assert len(record) == 0
+
+
+@pytest.mark.parametrize("statement", ["import dagster", "from dagster import job, op"])
+def test_import_defers_backends(statement):
+    loaded = set(imported_modules(statement))
+    assert [module for module in DEFERRED_MODULES if module in loaded] == []
+
+
+def test_lazy_names_load_on_access():
+    loaded = set(imported_modules("from dagster import DagsterInstance"))
+    assert "dagster.core.instance" in loaded
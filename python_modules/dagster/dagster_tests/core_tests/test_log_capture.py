@@ -1,3 +1,5 @@
+import os
+import subprocess
 import sys
 
 import pytest
@@ -19,3 +21,27 @@ def test_capture():
 
         with open(capture_filepath, "r") as capture_stream:
             assert "HELLO" in capture_stream.read()
+
+
+@pytest.mark.skipif(
+    should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
+)
+def test_capture_mirrors_to_stream(monkeypatch):
+    def _no_subprocesses(*_args, **_kwargs):
+        raise Exception("Compute log capture should not launch any processes")
+
+    monkeypatch.setattr(subprocess, "Popen", _no_subprocesses)
+
+    read_fd, write_fd = os.pipe()
+    with os.fdopen(read_fd, "rb") as read_stream, os.fdopen(write_fd, "w") as write_stream:
+        with get_temp_file_name() as capture_filepath:
+            with mirror_stream_to_file(write_stream, capture_filepath) as pids:
+                assert pids == (None, None)
+                write_stream.write("HELLO\n")
+                write_stream.flush()
+
+            with open(capture_filepath, "r") as capture_stream:
+                assert capture_stream.read() == "HELLO\n"
+
+            write_stream.close()
+            assert read_stream.read() == b"HELLO\n"
@@ -479,3 +479,75 @@ def pipe():
 
     assert len(logs_critical) > 0  # DagsterEvents should still be logged
     assert len(logs_default) == len(logs_critical) + 1
+
+
+@resource
+def chatty_resource(init_context):
+    try:
+        yield
+    finally:
+        init_context.log.info("tearing down")
+
+
+@solid(required_resource_keys={"chatty"})
+def chatty_solid(context):
+    for i in range(50):
+        context.log.info(f"{context.solid.name} {i}")
+
+
+@pipeline(mode_defs=[ModeDefinition(resource_defs={"chatty": chatty_resource})])
+def chatty_pipeline():
+    chatty_solid.alias("first")()
+    chatty_solid.alias("second")()
+
+
+def _assert_chatty_logs_stored(logs):
+    messages = [event.user_message for event in logs if not event.is_dagster_event]
+    assert messages == (
+        [f"first {i}" for i in range(50)] + [f"second {i}" for i in range(50)] + ["tearing down"]
+    )
+
+    # every message of a step is stored before the step's outcome
+    for step_key in ["first", "second"]:
+        step_events = [event for event in logs if event.step_key == step_key]
+        assert step_events[-1].dagster_event.event_type_value == "STEP_SUCCESS"
+        assert len([event for event in step_events if not event.is_dagster_event]) == 50
+
+
+def test_event_log_ordering():
+    with instance_for_test() as instance:
+        result = execute_pipeline(chatty_pipeline, instance=instance)
+        assert result.success
+        _assert_chatty_logs_stored(instance.all_logs(result.run_id))
+
+
+def test_event_log_backpressure(monkeypatch):
+    monkeypatch.setattr("dagster.core.instance.EVENT_LOG_WRITER_MAX_BACKLOG", 2)
+    monkeypatch.setattr("dagster.core.instance.EVENT_LOG_WRITER_MAX_BATCH_SIZE", 3)
+
+    with instance_for_test() as instance:
+        result = execute_pipeline(chatty_pipeline, instance=instance)
+        assert result.success
+        _assert_chatty_logs_stored(instance.all_logs(result.run_id))
+
+
+def test_event_log_writer_failure(monkeypatch):
+    with instance_for_test() as instance:
+        handle_new_event = instance.handle_new_event
+
+        def _fail_on_log_messages(event):
+            if not event.is_dagster_event:
+                raise Exception("Failed to write log message")
+            handle_new_event(event)
+
+        def _fail(*_args, **_kwargs):
+            raise Exception("Failed to write to event log")
+
+        monkeypatch.setattr(instance, "handle_new_event", _fail_on_log_messages)
+        monkeypatch.setattr(instance, "handle_new_events", _fail)
+        monkeypatch.setattr(instance, "report_engine_event", _fail)
+
+        # the run completes, rather than waiting on a writer that stopped
+        result = execute_pipeline(chatty_pipeline, instance=instance)
+        assert result.success
+        assert all(event.is_dagster_event for event in instance.all_logs(result.run_id))
@@ -922,6 +922,47 @@ def test_memoization_multiprocess_execution():
         assert len(memoized_plan.step_keys_to_execute) == 0
 
 
+def get_memoized_chain_pipeline():
+    @solid(version="1")
+    def first():
+        return 1
+
+    @solid(version="1")
+    def second(num):
+        return num + 1
+
+    @solid(version="1")
+    def third(num):
+        return num + 1
+
+    @pipeline(
+        tags={MEMOIZED_RUN_TAG: "true"},
+        mode_defs=[ModeDefinition(resource_defs={"io_manager": fs_io_manager})],
+    )
+    def memoized_chain_pipeline():
+        third(second(first()))
+
+    return memoized_chain_pipeline
+
+
+def test_memoization_multiprocess_execution_chain():
+    # steps further down the chain still resolve versions from every step in the plan
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(get_memoized_chain_pipeline),
+            instance=instance,
+            run_config={"execution": {"multiprocess": {}}},
+        )
+
+        assert result.success
+        assert result.result_for_solid("third").output_value() == 3
+
+        memoized_plan = create_execution_plan(
+            get_memoized_chain_pipeline(), instance_ref=instance.get_ref()
+        )
+        assert len(memoized_plan.step_keys_to_execute) == 0
+
+
 def test_source_hash_with_root_input_manager():
     @root_input_manager
     def my_input_manager():
@@ -0,0 +1,76 @@
+import os
+
+from dagster import job, op, repository
+from dagster.core.host_representation.grpc_server_registry import ProcessGrpcServerRegistry
+from dagster.core.test_utils import create_test_daemon_workspace, instance_for_test
+from dagster.core.workspace.load_target import PythonFileTarget
+from dagster.core.workspace.location_loader import create_location_from_origin
+
+
+@op
+def the_op():
+    return 1
+
+
+@job
+def the_job():
+    the_op()
+
+
+@repository
+def the_repo():
+    return [the_job]
+
+
+def workspace_load_target():
+    return PythonFileTarget(
+        python_file=__file__,
+        attribute=None,
+        working_directory=os.path.dirname(__file__),
+        location_name="test_location",
+    )
+
+
+def test_refresh_reuses_unchanged_location():
+    with instance_for_test() as instance:
+        with create_test_daemon_workspace(workspace_load_target(), instance) as workspace:
+            location = workspace.get_location("test_location")
+            snapshot = workspace.get_workspace_snapshot()
+
+            workspace.refresh()
+
+            assert workspace.get_location("test_location") is location
+            assert workspace.get_workspace_snapshot() is not snapshot
+
+            workspace.cleanup()
+
+            # cleanup() always reloads every location
+            assert workspace.get_location("test_location") is not location
+
+
+def test_new_server_reuses_unchanged_repositories():
+    origin = workspace_load_target().create_origins()[0]
+    with ProcessGrpcServerRegistry(
+        reload_interval=0, heartbeat_ttl=30, startup_timeout=60
+    ) as registry:
+        location = create_location_from_origin(origin, registry)
+        try:
+            new_location = create_location_from_origin(
+                origin, registry, reload_grpc_server=True, previous_location=location
+            )
+            try:
+                assert new_location is not location
+                assert new_location.server_id != location.server_id
+
+                repo = location.get_repository("the_repo")
+                new_repo = new_location.get_repository("the_repo")
+                assert new_repo is not repo
+                assert new_repo.external_repository_data is repo.external_repository_data
+                assert new_repo.get_pipeline_index("the_job") is repo.get_pipeline_index("the_job")
+
+                snapshot_id = location.get_repository_snapshot_id("the_repo")
+                assert new_location.get_repository_snapshot_id("the_repo") == snapshot_id
+            finally:
+                new_location.cleanup()
+        finally:
+            location.cleanup()
@@ -0,0 +1,175 @@
+import tempfile
+
+import mock
+import pendulum
+
+from dagster import (
+    AssetKey,
+    AssetMaterialization,
+    DagsterEventType,
+    EventRecordsFilter,
+    Output,
+    job,
+    op,
+)
+from dagster.core.events import RETAINED_EVENTS
+from dagster.core.storage.event_log.archive import LocalEventLogArchive
+from dagster.core.storage.tags import (
+    EVENT_LOG_ARCHIVED,
+    EVENT_LOG_COMPACTED,
+    EVENT_LOG_RETENTION_TAG,
+)
+from dagster.core.test_utils import instance_for_test
+from dagster.daemon import get_default_daemon_logger
+from dagster.daemon.retention import execute_event_log_retention_iteration
+
+
+@op
+def log_and_materialize(context):
+    context.log.info("hello")
+    yield AssetMaterialization(asset_key="retained_asset")
+    yield Output(1)
+
+
+@job
+def logging_job():
+    log_and_materialize()
+
+
+def _run_iteration(instance, cursor=None):
+    iteration = execute_event_log_retention_iteration(
+        instance, get_default_daemon_logger("EventLogRetentionDaemon"), cursor
+    )
+    while True:
+        try:
+            assert next(iteration) is None
+        except StopIteration as stop:
+            return stop.value
+
+
+def _message_and_types(events):
+    return [(event.message, event.dagster_event_type) for event in events]
+
+
+def test_event_log_retention_with_archive():
+    with tempfile.TemporaryDirectory() as archive_dir:
+        with instance_for_test(
+            overrides={
+                "retention": {
+                    "event_log": {
+                        "compact_after_days": 1,
+                        "batch_size": 2,
+                        "archive": {
+                            "module": "dagster.core.storage.event_log.archive",
+                            "class": "LocalEventLogArchive",
+                            "config": {"base_dir": archive_dir},
+                        },
+                    }
+                }
+            }
+        ) as instance:
+            assert "EVENT_LOG_RETENTION" in instance.get_required_daemon_types()
+            assert isinstance(instance.event_log_archive, LocalEventLogArchive)
+
+            run_ids = [logging_job.execute_in_process(instance=instance).run_id for _ in range(3)]
+            full_logs = {run_id: instance.all_logs(run_id) for run_id in run_ids}
+
+            # no run has finished more than a day ago
+            assert _run_iteration(instance) is None
+            assert all(EVENT_LOG_RETENTION_TAG not in run.tags for run in instance.get_runs())
+
+            update_timestamps = [
+                record.update_timestamp
+                for record in instance.get_run_records(order_by="update_timestamp", ascending=True)
+            ]
+            with pendulum.test(pendulum.now("UTC").add(days=2)):
+                # the runs are compacted in the order in which they finished, in batches
+                cursor = _run_iteration(instance)
+                assert cursor == update_timestamps[1]
+                assert EVENT_LOG_RETENTION_TAG not in instance.get_run_by_id(run_ids[2]).tags
+
+                cursor = _run_iteration(instance, cursor)
+                assert cursor == update_timestamps[2]
+
+                # the compacted runs were updated after the cutoff when they were tagged, so the
+                # high-water mark stays put
+                assert _run_iteration(instance, cursor) == cursor
+
+            for run_id in run_ids:
+                assert (
+                    instance.get_run_by_id(run_id).tags[EVENT_LOG_RETENTION_TAG]
+                    == EVENT_LOG_ARCHIVED
+                )
+                stored_logs = instance.event_log_storage.get_logs_for_run(run_id)
+                assert len(stored_logs) < len(full_logs[run_id])
+                assert all(event.dagster_event_type in RETAINED_EVENTS for event in stored_logs)
+
+                # reads fall back to the archived events
+                assert _message_and_types(instance.all_logs(run_id)) == _message_and_types(
+                    full_logs[run_id]
+                )
+                assert _message_and_types(instance.logs_after(run_id, 2, limit=3)) == (
+                    _message_and_types(full_logs[run_id][3:6])
+                )
+                assert _message_and_types(
+                    instance.all_logs(run_id, of_type=DagsterEventType.STEP_OUTPUT)
+                ) == _message_and_types(
+                    [
+                        event
+                        for event in full_logs[run_id]
+                        if event.dagster_event_type == DagsterEventType.STEP_OUTPUT
+                    ]
+                )
+
+            # the archived events of each run are only read from the archive once
+            with mock.patch.object(
+                LocalEventLogArchive, "get_archived_events"
+            ) as get_archived_events:
+                for run_id in run_ids:
+                    assert instance.logs_after(run_id, 2, limit=3)
+                assert not get_archived_events.called
+
+
+def test_event_log_retention_without_archive():
+    with instance_for_test(
+        overrides={"retention": {"event_log": {"compact_after_days": 1}}}
+    ) as instance:
+        assert instance.event_log_archive is None
+
+        run_ids = [logging_job.execute_in_process(instance=instance).run_id for _ in range(2)]
+
+        asset_key = AssetKey("retained_asset")
+
+        def _asset_state():
+            records = instance.get_event_records(
+                EventRecordsFilter(
+                    event_type=DagsterEventType.ASSET_MATERIALIZATION, asset_key=asset_key
+                )
+            )
+            return (
+                # asset sensors advance their cursor past these storage ids
+                [(record.storage_id, record.event_log_entry.run_id) for record in records],
+                instance.get_latest_materialization_events([asset_key])[asset_key].run_id,
+            )
+
+        asset_state = _asset_state()
+        with pendulum.test(pendulum.now("UTC").add(days=2)):
+            assert _run_iteration(instance) is not None
+
+        # retained asset events keep their storage ids
+        assert _asset_state() == asset_state
+        assert asset_state[1] == run_ids[-1]
+
+        for run_id in run_ids:
+            assert (
+                instance.get_run_by_id(run_id).tags[EVENT_LOG_RETENTION_TAG] == EVENT_LOG_COMPACTED
+            )
+            logs = instance.all_logs(run_id)
+            assert logs
+            assert all(event.dagster_event_type in RETAINED_EVENTS for event in logs)
+
+
+def test_event_log_retention_not_configured():
+    with instance_for_test() as instance:
+        assert not instance.event_log_retention_enabled
+        assert "EVENT_LOG_RETENTION" not in instance.get_required_daemon_types()
@@ -0,0 +1,145 @@
+import sys
+
+import pendulum
+
+from dagster.core.host_representation import (
+    ExternalRepositoryOrigin,
+    ManagedGrpcPythonEnvRepositoryLocationOrigin,
+)
+from dagster.core.scheduler.instigation import (
+    InstigatorState,
+    InstigatorStatus,
+    InstigatorType,
+    TickData,
+    TickStatus,
+)
+from dagster.core.storage.schedules.base import ScheduleStorage
+from dagster.core.test_utils import instance_for_test
+from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster.daemon import get_default_daemon_logger
+from dagster.daemon.retention import execute_tick_retention_iteration
+from dagster.utils.error import SerializableErrorInfo
+
+
+def _sensor_state(sensor_name):
+    repo_origin = ExternalRepositoryOrigin(
+        ManagedGrpcPythonEnvRepositoryLocationOrigin(
+            LoadableTargetOrigin(
+                executable_path=sys.executable, module_name="fake", attribute="fake"
+            )
+        ),
+        "fake_repo_name",
+    )
+    return InstigatorState(
+        repo_origin.get_instigator_origin(sensor_name),
+        InstigatorType.SENSOR,
+        InstigatorStatus.RUNNING,
+    )
+
+
+def _create_tick(instance, state, timestamp, status):
+    return instance.create_tick(
+        TickData(
+            state.instigator_origin_id,
+            state.instigator_name,
+            InstigatorType.SENSOR,
+            status,
+            timestamp,
+            ["fake_run_id"] if status == TickStatus.SUCCESS else [],
+            error=(
+                SerializableErrorInfo("error", [], "Exception")
+                if status == TickStatus.FAILURE
+                else None
+            ),
+            selector_id=state.selector_id,
+        )
+    )
+
+
+def _run_iteration(instance, collapse_cursors):
+    for result in execute_tick_retention_iteration(
+        instance, get_default_daemon_logger("TickRetentionDaemon"), collapse_cursors
+    ):
+        assert result is None
+
+
+def test_tick_retention():
+    with instance_for_test(
+        overrides={
+            "retention": {
+                "sensor": {
+                    "purge_after_days": {"skipped": 7, "failure": -1},
+                    "collapse_skipped_after_days": 1,
+                }
+            }
+        }
+    ) as instance:
+        assert "TICK_RETENTION" in instance.get_required_daemon_types()
+        assert instance.get_tick_retention_purge_after_days(InstigatorType.SENSOR) == {
+            TickStatus.SKIPPED: 7,
+            TickStatus.FAILURE: -1,
+        }
+
+        state = _sensor_state("my_sensor")
+        instance.add_instigator_state(state)
+
+        now = pendulum.now("UTC")
+        _create_tick(instance, state, now.subtract(days=10).timestamp(), TickStatus.SKIPPED)
+        _create_tick(instance, state, now.subtract(days=10).timestamp(), TickStatus.FAILURE)
+        for hours in [50, 49, 48]:
+            _create_tick(instance, state, now.subtract(hours=hours).timestamp(), TickStatus.SKIPPED)
+        _create_tick(instance, state, now.subtract(hours=47).timestamp(), TickStatus.SUCCESS)
+        _create_tick(instance, state, now.subtract(hours=2).timestamp(), TickStatus.SKIPPED)
+
+        collapse_cursors = {}
+        _run_iteration(instance, collapse_cursors)
+
+        ticks = instance.get_ticks(state.instigator_origin_id, state.selector_id)
+        assert [tick.status for tick in ticks] == [
+            TickStatus.SKIPPED,
+            TickStatus.SUCCESS,
+            TickStatus.SKIPPED,
+            TickStatus.FAILURE,
+        ]
+        # the skipped ticks older than a day are collapsed into the latest of them
+        assert ticks[2].timestamp == now.subtract(hours=48).timestamp()
+        assert ticks[2].collapsed_tick_count == 2
+        assert ticks[2].collapsed_since_timestamp == now.subtract(hours=50).timestamp()
+        assert ticks[0].collapsed_tick_count == 0
+        assert collapse_cursors == {state.selector_id: now.subtract(hours=47).timestamp()}
+
+        # the next iteration only reads the ticks past the cursor
+        with pendulum.test(now.add(days=1)):
+            _run_iteration(instance, collapse_cursors)
+
+        ticks = instance.get_ticks(state.instigator_origin_id, state.selector_id)
+        assert len(ticks) == 4
+        assert collapse_cursors == {state.selector_id: now.subtract(hours=2).timestamp()}
+
+
+def test_tick_retention_not_configured():
+    with instance_for_test() as instance:
+        assert not instance.tick_retention_enabled
+        assert "TICK_RETENTION" not in instance.get_required_daemon_types()
+
+
+def test_tick_retention_without_collapse_support():
+    with instance_for_test(
+        overrides={"retention": {"sensor": {"collapse_skipped_after_days": 1}}}
+    ) as instance:
+        state = _sensor_state("my_sensor")
+        instance.add_instigator_state(state)
+        now = pendulum.now("UTC")
+        for hours in [50, 49]:
+            _create_tick(instance, state, now.subtract(hours=hours).timestamp(), TickStatus.SKIPPED)
+
+        # a storage that does not support collapsing ticks leaves them as they are
+        storage = instance.schedule_storage
+        storage.collapse_skipped_ticks = (
+            lambda *args, **kwargs: ScheduleStorage.collapse_skipped_ticks(storage, *args, **kwargs)
+        )
+        collapse_cursors = {}
+        _run_iteration(instance, collapse_cursors)
+
+        assert len(instance.get_ticks(state.instigator_origin_id, state.selector_id)) == 2
+        assert collapse_cursors == {}
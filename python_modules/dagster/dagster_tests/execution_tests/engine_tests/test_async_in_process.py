@@ -0,0 +1,274 @@
+import asyncio
+import threading
+
+import pytest
+
+from dagster import (
+    DynamicOut,
+    DynamicOutput,
+    Out,
+    Output,
+    RetryRequested,
+    async_in_process_executor,
+    execute_pipeline,
+    fs_io_manager,
+    get_dagster_logger,
+    job,
+    mem_io_manager,
+    op,
+    success_hook,
+)
+from dagster.core.events import DagsterEventType
+from dagster.core.storage.compute_log_manager import ComputeIOType
+from dagster.core.test_utils import instance_for_test
+
+NUM_CONCURRENT_OPS = 5
+
+
+def _wait_for_all_started_op(name, started):
+    # only finishes if every one of these ops is running at the same time
+    @op(name=name)
+    async def wait_for_all_started(num):
+        started.append(threading.get_ident())
+        while len(started) < NUM_CONCURRENT_OPS:
+            await asyncio.sleep(0.01)
+        return num
+
+    return wait_for_all_started
+
+
+@op
+def emit_one():
+    return 1
+
+
+@op
+def total(nums):
+    return sum(nums)
+
+
+def test_async_ops_run_concurrently():
+    started = []
+    ops = [_wait_for_all_started_op(f"async_{i}", started) for i in range(NUM_CONCURRENT_OPS)]
+
+    @job(executor_def=async_in_process_executor)
+    def concurrent_async_job():
+        one = emit_one()
+        total([async_op(one) for async_op in ops])
+
+    result = execute_pipeline(
+        concurrent_async_job,
+        run_config={"execution": {"config": {"max_concurrent": NUM_CONCURRENT_OPS}}},
+    )
+    assert result.success
+    assert result.result_for_solid("total").output_value() == NUM_CONCURRENT_OPS
+
+    # all on the one shared event loop
+    assert len(set(started)) == 1
+
+
+def test_sync_ops_run_concurrently():
+    all_started = threading.Barrier(NUM_CONCURRENT_OPS, timeout=10)
+
+    def _sync_op(name):
+        @op(name=name)
+        def wait_for_all_started(num):
+            all_started.wait()
+            return num
+
+        return wait_for_all_started
+
+    ops = [_sync_op(f"sync_{i}") for i in range(NUM_CONCURRENT_OPS)]
+
+    @job(executor_def=async_in_process_executor)
+    def concurrent_sync_job():
+        one = emit_one()
+        total([sync_op(one) for sync_op in ops])
+
+    result = execute_pipeline(concurrent_sync_job)
+    assert result.success
+    assert result.result_for_solid("total").output_value() == NUM_CONCURRENT_OPS
+
+
+def test_max_concurrent():
+    lock = threading.Lock()
+    in_flight = []
+    max_in_flight = []
+
+    def _tracked_op(name):
+        @op(name=name)
+        async def tracked(num):
+            with lock:
+                in_flight.append(name)
+                max_in_flight.append(len(in_flight))
+            await asyncio.sleep(0.05)
+            with lock:
+                in_flight.remove(name)
+            return num
+
+        return tracked
+
+    ops = [_tracked_op(f"tracked_{i}") for i in range(6)]
+
+    @job(executor_def=async_in_process_executor)
+    def limited_job():
+        one = emit_one()
+        total([tracked_op(one) for tracked_op in ops])
+
+    result = execute_pipeline(
+        limited_job, run_config={"execution": {"config": {"max_concurrent": 2}}}
+    )
+    assert result.success
+    assert max(max_in_flight) == 2
+
+
+@op(out=DynamicOut())
+def emit_dynamic():
+    for i in range(3):
+        yield DynamicOutput(i, mapping_key=str(i))
+
+
+@op
+async def async_double(num):
+    await asyncio.sleep(0)
+    return num * 2
+
+
+@op
+async def async_gen_add_one(num):
+    await asyncio.sleep(0)
+    yield Output(num + 1)
+
+
+def test_mem_io_manager_dynamic():
+    @job(
+        executor_def=async_in_process_executor,
+        resource_defs={"io_manager": mem_io_manager},
+    )
+    def dynamic_job():
+        total(emit_dynamic().map(async_double).map(async_gen_add_one).collect())
+
+    result = execute_pipeline(dynamic_job)
+    assert result.success
+    assert result.result_for_solid("total").output_value() == 9
+
+
+@op
+def fail():
+    raise Exception("failed")
+
+
+@op
+def downstream_of_fail(num):
+    return num
+
+
+def test_failure():
+    @job(executor_def=async_in_process_executor)
+    def failing_job():
+        downstream_of_fail(fail())
+        emit_one()
+
+    result = execute_pipeline(failing_job, raise_on_error=False)
+    assert not result.success
+    assert result.result_for_solid("fail").failure_data
+    assert result.result_for_solid("emit_one").success
+    assert not result.result_for_solid("downstream_of_fail").success
+
+    with pytest.raises(Exception, match="failed"):
+        execute_pipeline(failing_job)
+
+
+def test_retries_and_hooks():
+    attempts = []
+    hook_calls = []
+
+    @success_hook
+    def record_success(context):
+        hook_calls.append(context.op.name)
+
+    @op
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) < 2:
+            raise RetryRequested(max_retries=1)
+        return 1
+
+    @job(executor_def=async_in_process_executor, hooks={record_success})
+    def retry_job():
+        downstream_of_fail(flaky())
+
+    with instance_for_test() as instance:
+        result = execute_pipeline(retry_job, instance=instance)
+        assert result.success
+        assert len(attempts) == 2
+        assert sorted(hook_calls) == ["downstream_of_fail", "flaky"]
+
+
+def test_compute_logs_captured_together():
+    @op(out=Out(io_manager_key="io_manager"))
+    def print_something():
+        print("printed from an op")  # pylint: disable=print-call
+        return 1
+
+    @job(
+        executor_def=async_in_process_executor,
+        resource_defs={"io_manager": fs_io_manager},
+    )
+    def printing_job():
+        downstream_of_fail(print_something())
+
+    with instance_for_test() as instance:
+        result = execute_pipeline(printing_job, instance=instance)
+        assert result.success
+
+        (logs_captured,) = [
+            event
+            for event in result.event_list
+            if event.event_type == DagsterEventType.LOGS_CAPTURED
+        ]
+        log_key = logs_captured.logs_captured_data.log_key
+        assert sorted(logs_captured.logs_captured_data.step_keys) == [
+            "downstream_of_fail",
+            "print_something",
+        ]
+
+        stdout = instance.compute_log_manager.read_logs_file(
+            result.run_id, log_key, ComputeIOType.STDOUT
+        )
+        assert "printed from an op" in stdout.data
+
+
+def test_async_python_logs_captured_by_own_step():
+    started = []
+
+    def _logging_op(name):
+        @op(name=name)
+        async def log_from_python_logger():
+            started.append(name)
+            while len(started) < 2:
+                await asyncio.sleep(0.01)
+            # logged from the shared event loop thread while both steps are capturing
+            get_dagster_logger().info(f"hello from {name}")
+            await asyncio.sleep(0.1)
+
+        return log_from_python_logger
+
+    @job(executor_def=async_in_process_executor)
+    def logging_job():
+        _logging_op("first")()
+        _logging_op("second")()
+
+    with instance_for_test(overrides={"python_logs": {"python_log_level": "INFO"}}) as instance:
+        result = execute_pipeline(logging_job, instance=instance)
+        assert result.success
+
+        hello_records = [
+            record
+            for record in instance.all_logs(result.run_id)
+            if record.user_message.startswith("hello from")
+        ]
+        assert sorted((record.step_key, record.user_message) for record in hello_records) == [
+            ("first", "hello from first"),
+            ("second", "hello from second"),
+        ]
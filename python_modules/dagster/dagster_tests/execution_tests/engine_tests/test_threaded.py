@@ -0,0 +1,170 @@
+import contextvars
+import asyncio
+import threading
+
+from dagster import (
+    execute_pipeline,
+    get_dagster_logger,
+    job,
+    mem_io_manager,
+    op,
+    resource,
+    threaded_executor,
+)
+from dagster.core.test_utils import instance_for_test
+
+NUM_CONCURRENT_OPS = 4
+
+
+@op
+def emit_one():
+    return 1
+
+
+@op
+def total(nums):
+    return sum(nums)
+
+
+def test_threaded_executor():
+    all_started = threading.Barrier(NUM_CONCURRENT_OPS, timeout=10)
+
+    @resource
+    def shared_resource(_):
+        return object()
+
+    def _wait_for_all_started_op(name):
+        # only finishes if every one of these ops is running at the same time
+        @op(name=name, required_resource_keys={"shared"})
+        def wait_for_all_started(context, num):
+            all_started.wait()
+            return (num, context.resources.shared)
+
+        return wait_for_all_started
+
+    @op
+    def check_shared(results):
+        assert len({id(shared) for _num, shared in results}) == 1
+        return sum(num for num, _shared in results)
+
+    ops = [_wait_for_all_started_op(f"op_{i}") for i in range(NUM_CONCURRENT_OPS)]
+
+    @job(
+        executor_def=threaded_executor,
+        resource_defs={"io_manager": mem_io_manager, "shared": shared_resource},
+    )
+    def threaded_job():
+        one = emit_one()
+        check_shared([wait_op(one) for wait_op in ops])
+
+    result = execute_pipeline(
+        threaded_job,
+        run_config={"execution": {"config": {"max_concurrent": NUM_CONCURRENT_OPS}}},
+    )
+    assert result.success
+    assert result.result_for_solid("check_shared").output_value() == NUM_CONCURRENT_OPS
+
+
+def test_async_op_on_worker_thread():
+    @op
+    async def async_add_one(num):
+        await asyncio.sleep(0)
+        return num + 1
+
+    @job(executor_def=threaded_executor)
+    def async_job():
+        total([async_add_one(emit_one()), async_add_one.alias("other")(emit_one())])
+
+    result = execute_pipeline(async_job)
+    assert result.success
+    assert result.result_for_solid("total").output_value() == 4
+
+
+def test_python_logs_captured_by_own_step():
+    all_started = threading.Barrier(2, timeout=10)
+
+    def _logging_op(name):
+        @op(name=name)
+        def log_from_python_logger():
+            all_started.wait()
+            get_dagster_logger().info(f"hello from {name}")
+            # keep both steps capturing until both have logged
+            all_started.wait()
+
+        return log_from_python_logger
+
+    @job(executor_def=threaded_executor)
+    def logging_job():
+        _logging_op("first")()
+        _logging_op("second")()
+
+    with instance_for_test(
+        overrides={"python_logs": {"python_log_level": "INFO"}}
+    ) as instance:
+        result = execute_pipeline(
+            logging_job,
+            instance=instance,
+            run_config={"execution": {"config": {"max_concurrent": 2}}},
+        )
+        assert result.success
+
+        hello_records = [
+            record
+            for record in instance.all_logs(result.run_id)
+            if record.user_message.startswith("hello from")
+        ]
+        assert sorted((record.step_key, record.user_message) for record in hello_records) == [
+            ("first", "hello from first"),
+            ("second", "hello from second"),
+        ]
+
+
+def test_python_logs_from_spawned_threads():
+    all_started = threading.Barrier(2, timeout=10)
+
+    def _logging_op(name):
+        @op(name=name)
+        def log_from_spawned_threads():
+            all_started.wait()
+
+            def _log(message):
+                get_dagster_logger().info(message)
+
+            # a plain thread can't be attributed to either of the running steps
+            plain = threading.Thread(target=_log, args=(f"plain thread of {name}",))
+            # a thread running in a copy of the step's context is attributed to the step
+            in_context = threading.Thread(
+                target=contextvars.copy_context().run, args=(_log, f"context thread of {name}")
+            )
+            for thread in [plain, in_context]:
+                thread.start()
+                thread.join()
+
+            all_started.wait()
+
+        return log_from_spawned_threads
+
+    @job(executor_def=threaded_executor)
+    def logging_job():
+        _logging_op("first")()
+        _logging_op("second")()
+
+    with instance_for_test(
+        overrides={"python_logs": {"python_log_level": "INFO"}}
+    ) as instance:
+        result = execute_pipeline(
+            logging_job,
+            instance=instance,
+            run_config={"execution": {"config": {"max_concurrent": 2}}},
+        )
+        assert result.success
+
+        thread_records = [
+            record
+            for record in instance.all_logs(result.run_id)
+            if "thread of" in record.user_message
+        ]
+        assert sorted((record.step_key, record.user_message) for record in thread_records) == [
+            ("first", "context thread of first"),
+            ("second", "context thread of second"),
+        ]
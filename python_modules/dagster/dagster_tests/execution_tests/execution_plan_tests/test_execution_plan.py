@@ -175,6 +175,48 @@ def test_failing_execution_plan():
         assert active_execution.is_complete
 
 
+def test_releasable_outputs():
+    plan = create_execution_plan(define_diamond_pipeline())
+
+    with plan.start(retry_mode=(RetryMode.ENABLED)) as active_execution:
+        steps = active_execution.get_steps_to_execute()
+        assert steps[0].key == "return_two"
+        active_execution.mark_step_produced_output(StepOutputHandle("return_two", "result"))
+        active_execution.mark_success("return_two")
+        assert active_execution.pop_releasable_outputs() == []
+
+        steps = active_execution.get_steps_to_execute()
+        assert [step.key for step in steps] == ["add_three", "mult_three"]
+
+        active_execution.mark_step_produced_output(StepOutputHandle("add_three", "result"))
+        active_execution.mark_success("add_three")
+        # mult_three still needs to load the output of return_two
+        assert active_execution.pop_releasable_outputs() == []
+
+        # not done with its inputs until its final attempt
+        active_execution.mark_up_for_retry("mult_three")
+        assert active_execution.pop_releasable_outputs() == []
+
+        steps = active_execution.get_steps_to_execute()
+        assert [step.key for step in steps] == ["mult_three"]
+        active_execution.mark_step_produced_output(StepOutputHandle("mult_three", "result"))
+        active_execution.mark_success("mult_three")
+        assert active_execution.pop_releasable_outputs() == [
+            StepOutputHandle("return_two", "result")
+        ]
+        assert active_execution.pop_releasable_outputs() == []
+
+        steps = active_execution.get_steps_to_execute()
+        assert [step.key for step in steps] == ["adder"]
+        active_execution.mark_success("adder")
+        assert set(active_execution.pop_releasable_outputs()) == {
+            StepOutputHandle("add_three", "result"),
+            StepOutputHandle("mult_three", "result"),
+        }
+
+        assert active_execution.is_complete
+
+
 def test_retries_active_execution():
     pipeline_def = define_diamond_pipeline()
     plan = create_execution_plan(pipeline_def)
@@ -1,16 +1,27 @@
+import pytest
+
 from dagster import (
     DependencyDefinition,
+    DynamicOut,
+    DynamicOutput,
     InputDefinition,
     Int,
     Output,
     OutputDefinition,
     PipelineDefinition,
+    graph,
+    job,
     lambda_solid,
+    op,
     solid,
 )
 from dagster.core.definitions.pipeline_base import InMemoryPipeline
+from dagster.core.errors import DagsterExecutionStepNotFoundError
 from dagster.core.execution.api import create_execution_plan, execute_plan
+from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.plan.state import KnownExecutionState
 from dagster.core.instance import DagsterInstance
+from dagster.core.snap.execution_plan_snapshot import snapshot_from_execution_plan
 
 
 def define_two_int_pipeline():
@@ -114,3 +125,94 @@ def has_tag(context):
         find_events(step_events, event_type="STEP_OUTPUT")[0].logging_tags["pipeline_tags"]
         == "{'foo': 'bar'}"
     )
+
+
+@op
+def emit_one():
+    return 1
+
+
+@op
+def add_one(num):
+    return num + 1
+
+
+@graph
+def add_two(num):
+    return add_one(add_one(num))
+
+
+@op(out=DynamicOut())
+def emit_many():
+    for i in range(3):
+        yield DynamicOutput(i, mapping_key=str(i))
+
+
+@op
+def double(num):
+    return num * 2
+
+
+@op
+def total(nums):
+    return sum(nums)
+
+
+@job
+def scoped_job():
+    one = emit_one()
+    add_two.alias("outer")(add_two(one))
+    add_one.alias("side")(one)
+    total(emit_many().map(double).collect())
+
+
+MAPPED_STATE = KnownExecutionState({}, {"emit_many": {"result": ["0", "1", "2"]}})
+
+
+@pytest.mark.parametrize(
+    "step_keys, known_state",
+    [
+        (["emit_one"], None),
+        (["add_two.add_one"], None),
+        (["outer.add_one_2"], None),
+        (["side", "outer.add_one"], None),
+        (["double[1]"], MAPPED_STATE),
+        (["total"], MAPPED_STATE),
+    ],
+)
+def test_scoped_plan(step_keys, known_state):
+    full_plan = create_execution_plan(
+        scoped_job, step_keys_to_execute=step_keys, known_state=known_state
+    )
+    scoped_plan = create_execution_plan(
+        scoped_job, step_keys_to_execute=step_keys, known_state=known_state, scoped=True
+    )
+
+    assert scoped_plan.step_keys_to_execute == full_plan.step_keys_to_execute
+    for step_key in step_keys:
+        assert scoped_plan.get_step_by_key(step_key) == full_plan.get_step_by_key(step_key)
+    assert scoped_plan.get_executable_step_deps() == full_plan.get_executable_step_deps()
+    assert scoped_plan.artifacts_persisted == full_plan.artifacts_persisted
+    assert len(scoped_plan.steps) < len(full_plan.steps)
+
+
+def test_scoped_plan_unknown_step():
+    with pytest.raises(DagsterExecutionStepNotFoundError, match="unknown step: nope"):
+        create_execution_plan(scoped_job, step_keys_to_execute=["nope"], scoped=True)
+
+
+def test_step_fragment():
+    plan = create_execution_plan(scoped_job, known_state=MAPPED_STATE)
+    fragment = plan.build_step_fragment(["double[1]"])
+
+    assert fragment.step_keys_to_execute == ["double[1]"]
+    assert {step.key for step in fragment.steps} == {"double[1]", "emit_many"}
+    assert fragment.get_step_by_key("double[1]") == plan.get_step_by_key("double[1]")
+    assert fragment.known_state == MAPPED_STATE
+
+    rebuilt = ExecutionPlan.rebuild_from_snapshot(
+        "scoped_job", snapshot_from_execution_plan(fragment, "scoped_job_snapshot_id")
+    )
+    assert rebuilt.step_keys_to_execute == ["double[1]"]
+    assert rebuilt.get_step_by_key("double[1]") == plan.get_step_by_key("double[1]")
+    assert rebuilt.get_executable_step_deps() == {"double[1]": set()}
@@ -13,8 +13,10 @@
     DefaultEnumSerializer,
     DefaultNamedTupleSerializer,
     EnumSerializer,
+    TrustedNamedTupleSerializer,
     WhitelistMap,
     _deserialize_json,
+    _pack_value_with_descent_path,
     _serialize_dagster_namedtuple,
     _whitelist_for_serdes,
     deserialize_json_to_dagster_namedtuple,
@@ -24,6 +26,7 @@
     register_serdes_tuple_fallbacks,
     serialize_value,
     unpack_inner_value,
+    write_packed_json,
 )
 from dagster.serdes.utils import create_snapshot_id, hash_str
 
@@ -72,6 +75,99 @@ class Fizz(NamedTuple):
         _deserialize_json(ser, whitelist_map=blank_map)
 
 
+def test_descent_path_through_namedtuples():
+    test_map = WhitelistMap.create()
+
+    class NotWhitelisted(NamedTuple):
+        bar: int
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Inner(NamedTuple):
+        items: list
+
+    class OuterSerializer(DefaultNamedTupleSerializer):
+        @classmethod
+        def value_to_storage_dict(cls, value, whitelist_map, descent_path):
+            return super().value_to_storage_dict(value, whitelist_map, descent_path)
+
+    @_whitelist_for_serdes(whitelist_map=test_map, serializer=OuterSerializer)
+    class Outer(NamedTuple):
+        inner: Inner
+
+    with pytest.raises(
+        SerializationError, match=re.escape("Descent path: <root:Outer>.inner.items[1]")
+    ):
+        _serialize_dagster_namedtuple(
+            Outer(Inner([1, NotWhitelisted(2)])), whitelist_map=test_map
+        )
+
+    ser = _serialize_dagster_namedtuple(Outer(Inner([1, Inner([])])), whitelist_map=test_map)
+    partial_map = WhitelistMap.create()
+    _whitelist_for_serdes(whitelist_map=partial_map, serializer=OuterSerializer)(Outer)
+
+    with pytest.raises(DeserializationError, match=re.escape("Descent path: <root:dict>.inner")):
+        _deserialize_json(ser, whitelist_map=partial_map)
+
+
+def test_compiled_packers_match_descent_path_walk():
+    test_map = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Color(Enum):
+        RED = 1
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Leaf(NamedTuple):
+        color: Color
+        tags: Set[str]
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Root(NamedTuple):
+        leaves: list
+        by_name: dict
+        frozen: frozenset
+
+    assert test_map.packers["Root"][0] is Root
+    assert test_map.packers["Color"][0] is Color
+    assert "Leaf" in test_map.unpackers
+
+    root = Root(
+        leaves=[Leaf(Color.RED, {"b", "a"}), None, 1.5],
+        by_name={"x": Leaf(Color.RED, set()), "y": [True, "z"]},
+        frozen=frozenset([1, 2]),
+    )
+    packed = pack_inner_value(root, whitelist_map=test_map, descent_path="")
+    assert packed == _pack_value_with_descent_path(root, whitelist_map=test_map, descent_path="")
+    assert unpack_inner_value(packed, whitelist_map=test_map, descent_path="") == root
+    # unpacking leaves the packed form intact
+    assert packed == _pack_value_with_descent_path(root, whitelist_map=test_map, descent_path="")
+
+
+def test_compiled_packer_name_collision():
+    test_map = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Thing(NamedTuple):
+        a: int
+
+    OriginalThing = Thing
+
+    class ThingSerializer(DefaultNamedTupleSerializer):
+        @classmethod
+        def skip_when_empty(cls):
+            return {"a"}
+
+    @_whitelist_for_serdes(
+        whitelist_map=test_map, serializer=ThingSerializer
+    )  # pylint: disable=function-redefined
+    class Thing(NamedTuple):
+        a: int
+
+    # instances of the shadowed class are serialized with the serializer registered under the name
+    assert pack_inner_value(OriginalThing(None), test_map, "") == {"__class__": "Thing"}
+    assert pack_inner_value(Thing(None), test_map, "") == {"__class__": "Thing"}
+
+
 def test_forward_compat_serdes_new_field_with_default():
     test_map = WhitelistMap.create()
 
@@ -720,3 +816,150 @@ class Thing(NamedTuple):
 
     assert wmap.get_serialized_name("Thing") == "SerializedThing"
     assert wmap.get_deserialized_name("SerializedThing") == "Thing"
+
+
+def _build_trusted_thing(whitelist_map, new_calls):
+    @_whitelist_for_serdes(whitelist_map=whitelist_map, serializer=TrustedNamedTupleSerializer)
+    class TrustedThing(NamedTuple("_TrustedThing", [("name", str), ("tags", dict)])):
+        def __new__(cls, name, tags=None, legacy_name=None):
+            new_calls.append(name)
+            return super(TrustedThing, cls).__new__(
+                cls, inst_param(legacy_name or name, "name", str), tags or {}
+            )
+
+    return TrustedThing
+
+
+def test_trusted_deserialization_skips_new():
+    test_map = WhitelistMap.create()
+    new_calls = []
+    TrustedThing = _build_trusted_thing(test_map, new_calls)
+
+    serialized = _serialize_dagster_namedtuple(TrustedThing("foo", {"a": "b"}), test_map)
+    new_calls.clear()
+
+    trusted = _deserialize_json(serialized, test_map, trusted=True)
+    assert trusted == TrustedThing("foo", {"a": "b"})
+    assert isinstance(trusted, TrustedThing)
+    assert new_calls == ["foo"]  # only the comparison value above
+
+    new_calls.clear()
+    assert _deserialize_json(serialized, test_map) == trusted
+    assert new_calls == ["foo"]
+
+
+def test_trusted_deserialization_falls_back_to_new():
+    test_map = WhitelistMap.create()
+    new_calls = []
+    TrustedThing = _build_trusted_thing(test_map, new_calls)
+
+    # missing fields are filled in by __new__
+    trusted = _deserialize_json('{"__class__": "TrustedThing", "name": "foo"}', test_map, True)
+    assert trusted == ("foo", {})
+    assert new_calls == ["foo"]
+
+    # as are graveyard arguments
+    trusted = _deserialize_json(
+        '{"__class__": "TrustedThing", "name": "foo", "tags": {}, "legacy_name": "bar"}',
+        test_map,
+        trusted=True,
+    )
+    assert trusted.name == "bar"
+
+
+def test_untrusted_deserialization_validates():
+    test_map = WhitelistMap.create()
+    TrustedThing = _build_trusted_thing(test_map, [])
+    bad_json = '{"__class__": "TrustedThing", "name": 1, "tags": {}}'
+
+    with pytest.raises(ParameterCheckError):
+        _deserialize_json(bad_json, test_map)
+
+    # storage is trusted to only hold values that passed validation when they were written
+    assert _deserialize_json(bad_json, test_map, trusted=True).name == 1
+
+
+def test_trusted_deserialization_through_custom_serializer():
+    test_map = WhitelistMap.create()
+    new_calls = []
+    TrustedThing = _build_trusted_thing(test_map, new_calls)
+
+    class WrapperSerializer(DefaultNamedTupleSerializer):
+        @classmethod
+        def value_from_storage_dict(
+            cls, storage_dict, klass, args_for_class, whitelist_map, descent_path
+        ):
+            return klass(
+                **{
+                    key: unpack_inner_value(value, whitelist_map, f"{descent_path}.{key}")
+                    for key, value in storage_dict.items()
+                }
+            )
+
+    @_whitelist_for_serdes(whitelist_map=test_map, serializer=WrapperSerializer)
+    class Wrapper(NamedTuple):
+        things: list
+
+    serialized = _serialize_dagster_namedtuple(
+        Wrapper([TrustedThing("foo"), TrustedThing("bar")]), test_map
+    )
+    new_calls.clear()
+
+    wrapper = _deserialize_json(serialized, test_map, trusted=True)
+    assert [thing.name for thing in wrapper.things] == ["foo", "bar"]
+    assert new_calls == []
+
+    # the trusted flag does not leak past the call
+    wrapper = _deserialize_json(serialized, test_map)
+    assert new_calls == ["foo", "bar"]
+
+
+def test_write_packed_json_matches_packed_dumps():
+    wmap = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=wmap)
+    class Color(Enum):
+        RED = "RED"
+
+    class SkipBarSerializer(DefaultNamedTupleSerializer):
+        @classmethod
+        def skip_when_empty(cls) -> Set[str]:
+            return {"bar"}
+
+    @_whitelist_for_serdes(whitelist_map=wmap, serializer=SkipBarSerializer)
+    class Leaf(namedtuple("_Leaf", "foo bar")):
+        pass
+
+    @_whitelist_for_serdes(whitelist_map=wmap, storage_name="StoredBranch")
+    class Branch(namedtuple("_Branch", "leaves by_name misc")):
+        pass
+
+    @_whitelist_for_serdes(whitelist_map=wmap)
+    class Root(namedtuple("_Root", "branch leaf values")):
+        pass
+
+    root = Root(
+        branch=Branch(
+            leaves=[Leaf("a", None), Leaf("b", ["c"])],
+            by_name={"z": Leaf("z", {}), "ü": Leaf("\n", None)},
+            misc=[{2: "int keys", 1: "are packed as is"}, {"s": {"tags"}}],
+        ),
+        leaf=Leaf(Color.RED, frozenset(["x", "y"])),
+        values=[1.5, float("nan"), True, None, -3, "☃"],
+    )
+    expected = seven.json.dumps(pack_inner_value(root, wmap, ""))
+
+    for container_types, memoized_types in [
+        (frozenset(), frozenset()),
+        (frozenset([Branch]), frozenset()),
+        (frozenset([Branch]), frozenset([Leaf])),
+    ]:
+        for _ in range(2):  # the second time reads back anything memoized
+            chunks = []
+            write_packed_json(root, chunks.append, container_types, memoized_types, wmap)
+            assert "".join(chunks) == expected
+
+    assert root.leaf._packed_json == seven.json.dumps(  # pylint: disable=protected-access
+        pack_inner_value(root.leaf, wmap, "")
+    )
+
@@ -0,0 +1,243 @@
+import json
+import warnings
+
+import pytest
+
+from dagster import (
+    DagsterInstance,
+    ScheduleDefinition,
+    StaticPartitionsDefinition,
+    job,
+    op,
+    repository,
+    sensor,
+)
+from dagster import seven
+from dagster.core.host_representation.external_data import external_repository_data_from_def
+from dagster.core.snap import PipelineSnapshot, create_pipeline_snapshot_id
+from dagster.serdes import (
+    deserialize_json_to_dagster_namedtuple,
+    deserialize_value,
+    serialize_dagster_namedtuple,
+    serialize_value,
+)
+from dagster.serdes.utils import hash_str
+from dagster.seven.json import _select_backends
+from dagster_test.graph_job_op_toys.many_events import many_events
+
+
+def _available_backends():
+    backends = []
+    for name in ["json", "ujson", "orjson"]:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            (encoder_name, encoder), (decoder_name, decoder) = _select_backends(name)
+        if decoder_name != name:
+            # not installed in this environment
+            continue
+        backends.append(
+            pytest.param((encoder, decoder), id=f"encode:{encoder_name}-decode:{decoder_name}")
+        )
+    return backends
+
+
+BACKENDS = _available_backends()
+
+
+def _canonical(value):
+    # compares NaN and Infinity by their json representation
+    return json.dumps(value, sort_keys=True)
+
+
+EDGE_VALUES = [
+    None,
+    True,
+    0,
+    -1,
+    2 ** 63,
+    98765432109876543210,
+    -98765432109876543210,
+    1.5,
+    1e-07,
+    1e22,
+    -0.0,
+    float("nan"),
+    float("inf"),
+    float("-inf"),
+    "",
+    "forward/slash",
+    "quote\" backslash\\",
+    "control\x01\x1f",
+    "unicode é   \U0001F600",
+    "0123456789012345678901234",
+    [],
+    {},
+    {"b": [1, {"c": None}], "a": "x"},
+    [[[[[]]]]],
+]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("value", EDGE_VALUES, ids=repr)
+def test_backend_edge_values(backend, value):
+    encoder, decoder = backend
+
+    assert _canonical(json.loads(encoder(value))) == _canonical(value)
+    assert _canonical(decoder(json.dumps(value))) == _canonical(value)
+    assert _canonical(decoder(encoder(value))) == _canonical(value)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backend_key_order(backend):
+    encoder, _ = backend
+    assert encoder({"b": 1, "a": {"d": 2, "c": 3}}) == seven.json.dumps(
+        {"b": 1, "a": {"d": 2, "c": 3}}
+    )
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backend_invalid_json(backend):
+    _, decoder = backend
+    with pytest.raises(json.JSONDecodeError):
+        decoder('{"a": ')
+
+
+def test_unknown_backend():
+    with pytest.warns(UserWarning, match="Unknown DAGSTER_JSON_BACKEND"):
+        (encoder_name, _), (decoder_name, _) = _select_backends("simplejson")
+
+    (default_encoder_name, _), (default_decoder_name, _) = _select_backends(None)
+    assert encoder_name == default_encoder_name
+    assert decoder_name == default_decoder_name
+
+
+@op
+def noop_op():
+    return 1
+
+
+@job(partitions_def=StaticPartitionsDefinition(["a", "b"]))
+def partitioned_job():
+    noop_op()
+
+
+@sensor(job=partitioned_job)
+def noop_sensor():
+    return None
+
+
+@repository
+def conformance_repo():
+    return [
+        partitioned_job,
+        many_events.to_job(),
+        ScheduleDefinition(job=partitioned_job, cron_schedule="@daily"),
+        noop_sensor,
+    ]
+
+
+@pytest.fixture(scope="module", name="serialized_corpus")
+def serialized_corpus_fixture():
+    many_events_job = conformance_repo.get_job("many_events")
+    values = [
+        PipelineSnapshot.from_pipeline_def(many_events_job),
+        external_repository_data_from_def(conformance_repo),
+    ]
+    with DagsterInstance.ephemeral() as instance:
+        result = many_events_job.execute_in_process(instance=instance)
+        run = instance.get_run_by_id(result.run_id)
+        values.extend(
+            [
+                run,
+                instance.get_execution_plan_snapshot(run.execution_plan_snapshot_id),
+                *instance.all_logs(result.run_id),
+            ]
+        )
+    return [serialize_dagster_namedtuple(value) for value in values]
+
+
+def _class_names(packed, names):
+    if isinstance(packed, list):
+        for item in packed:
+            _class_names(item, names)
+    elif isinstance(packed, dict):
+        if "__class__" in packed:
+            names.add(packed["__class__"])
+        for item in packed.values():
+            _class_names(item, names)
+    return names
+
+
+def test_corpus_coverage(serialized_corpus):
+    names = set()
+    for serialized in serialized_corpus:
+        _class_names(json.loads(serialized), names)
+
+    assert {
+        "PipelineSnapshot",
+        "ExternalRepositoryData",
+        "ExecutionPlanSnapshot",
+        "PipelineRun",
+        "EventLogEntry",
+        "DagsterEvent",
+        "ExternalScheduleData",
+        "ExternalSensorData",
+        "ExternalPartitionSetData",
+        "EventMetadataEntry",
+    } <= names
+    # many_events records a NaN float metadata entry
+    assert any("NaN" in serialized for serialized in serialized_corpus)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_corpus_round_trip(backend, serialized_corpus):
+    encoder, decoder = backend
+    for serialized in serialized_corpus:
+        packed = json.loads(serialized)
+        assert _canonical(decoder(serialized)) == _canonical(packed)
+        assert _canonical(json.loads(encoder(packed))) == _canonical(packed)
+
+        value = deserialize_json_to_dagster_namedtuple(serialized)
+        assert _canonical(decoder(serialize_dagster_namedtuple(value))) == _canonical(packed)
+
+
+def test_corpus_trusted_deserialization(serialized_corpus):
+    for serialized in serialized_corpus:
+        validated = deserialize_json_to_dagster_namedtuple(serialized)
+        trusted = deserialize_json_to_dagster_namedtuple(serialized, trusted=True)
+        assert trusted == validated
+        assert type(trusted) is type(validated)  # pylint: disable=unidiomatic-typecheck
+        assert serialize_dagster_namedtuple(trusted) == serialized
+
+
+def test_serdes_uses_fast_backend(monkeypatch):
+    calls = []
+
+    def _tracking_dumps(obj):
+        calls.append("dumps")
+        return json.dumps(obj, sort_keys=True)
+
+    def _tracking_loads(json_str):
+        calls.append("loads")
+        return json.loads(json_str)
+
+    monkeypatch.setattr(seven.json, "fast_dumps", _tracking_dumps)
+    monkeypatch.setattr(seven.json, "fast_loads", _tracking_loads)
+
+    assert deserialize_value(serialize_value({"a": {1, 2}})) == {"a": {1, 2}}
+    assert calls == ["dumps", "loads"]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_snapshot_id_independent_of_backend(backend, monkeypatch):
+    encoder, decoder = backend
+    many_events_job = conformance_repo.get_job("many_events")
+    snapshot = PipelineSnapshot.from_pipeline_def(many_events_job)
+    expected = hash_str(
+        json.dumps(json.loads(serialize_dagster_namedtuple(snapshot)), sort_keys=True)
+    )
+
+    monkeypatch.setattr(seven.json, "fast_dumps", encoder)
+    monkeypatch.setattr(seven.json, "fast_loads", decoder)
+
+    assert create_pipeline_snapshot_id(snapshot) == expected
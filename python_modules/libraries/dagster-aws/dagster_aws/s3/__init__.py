@@ -1,4 +1,5 @@
 from .compute_log_manager import S3ComputeLogManager
+from .event_log_archive import S3EventLogArchive
 from .file_cache import S3FileCache, s3_file_cache
 from .file_manager import S3FileHandle, S3FileManager
 from .io_manager import (
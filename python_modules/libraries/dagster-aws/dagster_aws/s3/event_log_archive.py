@@ -0,0 +1,117 @@
+import boto3
+from botocore.errorfactory import ClientError
+
+from dagster import Field, StringSource, check
+from dagster.core.events.log import EventLogEntry
+from dagster.core.storage.event_log.archive import (
+    ARCHIVE_FILE_EXTENSION,
+    EventLogArchive,
+    deserialize_archived_events,
+    serialize_archived_events,
+)
+from dagster.serdes import ConfigurableClass, ConfigurableClassData
+
+
+class S3EventLogArchive(EventLogArchive, ConfigurableClass):
+    """Archives the events of each run that the event log retention policy compacts to a gzipped
+    object in S3.
+
+    Users should not instantiate this class directly. Instead, use a YAML block in ``dagster.yaml``
+    such as the following:
+
+    .. code-block:: YAML
+
+        retention:
+          event_log:
+            compact_after_days: 30
+            archive:
+              module: dagster_aws.s3.event_log_archive
+              class: S3EventLogArchive
+              config:
+                bucket: "mycorp-dagster-event-logs"
+                prefix: "dagster-test-"
+                use_ssl: true
+                verify: true
+                verify_cert_path: "/path/to/cert/bundle.pem"
+                endpoint_url: "http://alternate-s3-host.io"
+
+    Args:
+        bucket (str): The name of the s3 bucket to which to archive events.
+        prefix (Optional[str]): Prefix for the archive keys.
+        use_ssl (Optional[bool]): Whether or not to use SSL. Default True.
+        verify (Optional[bool]): Whether or not to verify SSL certificates. Default True.
+        verify_cert_path (Optional[str]): A filename of the CA cert bundle to use. Only used if
+            `verify` set to False.
+        endpoint_url (Optional[str]): Override for the S3 endpoint url.
+        inst_data (Optional[ConfigurableClassData]): Serializable representation of the archive
+            when newed up from config.
+    """
+
+    def __init__(
+        self,
+        bucket,
+        inst_data=None,
+        prefix="dagster",
+        use_ssl=True,
+        verify=True,
+        verify_cert_path=None,
+        endpoint_url=None,
+    ):
+        _verify = False if not verify else verify_cert_path
+        self._s3_session = boto3.resource(
+            "s3", use_ssl=use_ssl, verify=_verify, endpoint_url=endpoint_url
+        ).meta.client
+        self._s3_bucket = check.str_param(bucket, "bucket")
+        self._s3_prefix = check.str_param(prefix, "prefix")
+        self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
+
+    @property
+    def inst_data(self):
+        return self._inst_data
+
+    @classmethod
+    def config_type(cls):
+        return {
+            "bucket": StringSource,
+            "prefix": Field(StringSource, is_required=False, default_value="dagster"),
+            "use_ssl": Field(bool, is_required=False, default_value=True),
+            "verify": Field(bool, is_required=False, default_value=True),
+            "verify_cert_path": Field(StringSource, is_required=False),
+            "endpoint_url": Field(StringSource, is_required=False),
+        }
+
+    @staticmethod
+    def from_config_value(inst_data, config_value):
+        return S3EventLogArchive(inst_data=inst_data, **config_value)
+
+    def _bucket_key(self, run_id):
+        return "/".join([self._s3_prefix, "event_logs", f"{run_id}{ARCHIVE_FILE_EXTENSION}"])
+
+    def archive_events(self, run_id, events):
+        check.str_param(run_id, "run_id")
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        self._s3_session.put_object(
+            Bucket=self._s3_bucket,
+            Key=self._bucket_key(run_id),
+            Body=serialize_archived_events(events),
+        )
+
+    def has_archived_events(self, run_id):
+        try:
+            self._s3_session.head_object(
+                Bucket=self._s3_bucket, Key=self._bucket_key(check.str_param(run_id, "run_id"))
+            )
+            return True
+        except ClientError:
+            return False
+
+    def get_archived_events(self, run_id):
+        try:
+            obj = self._s3_session.get_object(
+                Bucket=self._s3_bucket, Key=self._bucket_key(check.str_param(run_id, "run_id"))
+            )
+        except ClientError:
+            return None
+
+        return deserialize_archived_events(obj["Body"].read())
@@ -1,5 +1,6 @@
 import io
 import pickle
+from collections import defaultdict
 
 from dagster import Field, MemoizableIOManager, StringSource, check, io_manager
 from dagster.utils import PICKLE_PROTOCOL
@@ -24,6 +25,34 @@ def has_output(self, context):
         key = self._get_path(context)
         return self._has_object(key)
 
+    def has_outputs(self, contexts):
+        """Lists the objects in the directory of a step's outputs once, a page of up to 1000 keys
+        per request, when several of the outputs are in it. Outputs that are alone in their
+        directory, such as the versioned outputs of different steps, are checked one by one."""
+        contexts_by_dir = defaultdict(list)
+        for context in contexts:
+            key = self._get_path(context)
+            contexts_by_dir[key[: key.rfind("/") + 1]].append(context)
+
+        single_contexts = [
+            dir_contexts[0] for dir_contexts in contexts_by_dir.values() if len(dir_contexts) == 1
+        ]
+        existing_keys = {
+            self._get_path(context)
+            for context, found in zip(single_contexts, super().has_outputs(single_contexts))
+            if found
+        }
+
+        paginator = self.s3.get_paginator("list_objects_v2")
+        for output_dir, dir_contexts in contexts_by_dir.items():
+            if len(dir_contexts) == 1:
+                continue
+
+            for page in paginator.paginate(Bucket=self.bucket, Prefix=output_dir, Delimiter="/"):
+                existing_keys.update(obj["Key"] for obj in page.get("Contents", []))
+
+        return [self._get_path(context) in existing_keys for context in contexts]
+
     def _rm_object(self, key):
         check.str_param(key, "key")
         check.param_invariant(len(key) > 0, "key")
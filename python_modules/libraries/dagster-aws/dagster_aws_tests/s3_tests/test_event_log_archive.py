@@ -0,0 +1,49 @@
+from dagster_aws.s3 import S3EventLogArchive
+
+from dagster import job, op
+from dagster.core.test_utils import instance_for_test
+
+
+@op
+def easy(context):
+    context.log.info("easy")
+    return "easy"
+
+
+@job
+def simple():
+    easy()
+
+
+def test_s3_event_log_archive(mock_s3_bucket):
+    with instance_for_test() as instance:
+        run_id = simple.execute_in_process(instance=instance).run_id
+        events = instance.all_logs(run_id)
+
+    archive = S3EventLogArchive(bucket=mock_s3_bucket.name, prefix="my_prefix")
+    assert not archive.has_archived_events(run_id)
+    assert archive.get_archived_events(run_id) is None
+
+    archive.archive_events(run_id, events)
+    assert archive.has_archived_events(run_id)
+    assert archive.get_archived_events(run_id) == events
+
+    assert mock_s3_bucket.Object(key=f"my_prefix/event_logs/{run_id}.jsonl.gz").get()
+
+
+def test_s3_event_log_archive_from_config(mock_s3_bucket):
+    with instance_for_test(
+        overrides={
+            "retention": {
+                "event_log": {
+                    "compact_after_days": 30,
+                    "archive": {
+                        "module": "dagster_aws.s3.event_log_archive",
+                        "class": "S3EventLogArchive",
+                        "config": {"bucket": mock_s3_bucket.name, "prefix": "my_prefix"},
+                    },
+                }
+            }
+        }
+    ) as instance:
+        assert isinstance(instance.event_log_archive, S3EventLogArchive)
@@ -1,4 +1,8 @@
-from dagster_aws.s3.io_manager import s3_pickle_asset_io_manager, s3_pickle_io_manager
+from dagster_aws.s3.io_manager import (
+    PickledObjectS3IOManager,
+    s3_pickle_asset_io_manager,
+    s3_pickle_io_manager,
+)
 from dagster_aws.s3.utils import construct_s3_client
 
 from dagster import (
@@ -9,6 +13,7 @@
     VersionStrategy,
     asset,
     build_assets_job,
+    build_output_context,
     job,
     op,
     resource,
@@ -92,6 +97,32 @@ def test_s3_pickle_io_manager_prefix(mock_s3_bucket):
     assert len(list(mock_s3_bucket.objects.all())) == 2
 
 
+def test_s3_pickle_io_manager_has_outputs(mock_s3_bucket):
+    io_manager = PickledObjectS3IOManager(
+        mock_s3_bucket.name, construct_s3_client(max_attempts=5), s3_prefix="dagster"
+    )
+    contexts = [
+        build_output_context(step_key=step_key, name=name, version=version)
+        for step_key, name, version in [
+            ("foo", "result", "v1"),
+            ("foo", "result", "v2"),
+            ("bar", "result", "v1"),
+            ("bar", "other", "v1"),
+            ("bar", "missing", "v1"),
+        ]
+    ]
+    io_manager.handle_output(contexts[0], 1)
+    io_manager.handle_output(contexts[2], 2)
+    io_manager.handle_output(contexts[3], 3)
+
+    # the outputs of bar share a directory, which is listed, and the others are checked one by one
+    assert io_manager.has_outputs(contexts) == [True, False, True, True, False]
+    assert io_manager.has_outputs(contexts) == [
+        io_manager.has_output(context) for context in contexts
+    ]
+    assert io_manager.has_outputs(contexts[1:2]) == [False]
+
+
 def test_memoization_s3_io_manager(mock_s3_bucket):
     class BasicVersionStrategy(VersionStrategy):
         def get_solid_version(self, _):
@@ -1,15 +1,15 @@
 import sys
 import time
 
+from celery.backends.base import BaseKeyValueStoreBackend
 from celery.exceptions import TaskRevokedError
 
 from dagster import check
 from dagster.core.errors import DagsterSubprocessError
-from dagster.core.events import DagsterEvent, EngineEventData
+from dagster.core.events import STEP_EVENTS, DagsterEvent, DagsterEventType, EngineEventData
 from dagster.core.execution.context.system import PlanOrchestrationContext
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.storage.tags import PRIORITY_TAG
-from dagster.serdes import deserialize_json_to_dagster_namedtuple
 from dagster.utils.error import serializable_error_info_from_exc_info
 
 from .defaults import task_default_priority, task_default_queue
@@ -20,9 +20,20 @@
     DAGSTER_CELERY_STEP_PRIORITY_TAG,
 )
 
-TICK_SECONDS = 1
+# The interval between polls of the event log and the result backend, which backs off from
+# TICK_SECONDS up to MAX_TICK_SECONDS while no step makes progress
+TICK_SECONDS = 0.1
+MAX_TICK_SECONDS = 1.0
 DELEGATE_MARKER = "celery_queue_wait"
 
+# The events that workers write for their steps and that the executor yields as they are written
+WORKER_EVENTS = STEP_EVENTS | {
+    DagsterEventType.HOOK_COMPLETED,
+    DagsterEventType.HOOK_ERRORED,
+    DagsterEventType.HOOK_SKIPPED,
+    DagsterEventType.LOGS_CAPTURED,
+}
+
 
 def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_fn):
 
@@ -55,6 +66,13 @@ def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_
     step_results = {}  # Dict[ExecutionStep, celery.AsyncResult]
     step_errors = {}
 
+    # Workers write the events of the steps they execute to the event log of the run, from which
+    # they are consumed as they happen. This cursor is the storage id of the last step event read.
+    run_id = pipeline_context.pipeline_run.run_id
+    instance = pipeline_context.instance
+    events_cursor = None
+    tick_seconds = TICK_SECONDS
+
     with execution_plan.start(
         retry_mode=pipeline_context.executor.retries,
         sort_key_fn=priority_for_step,
@@ -73,41 +91,44 @@ def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_
                 active_execution.mark_interrupted()
                 for result in step_results.values():
                     result.revoke()
-            results_to_pop = []
-            for step_key, result in sorted(
-                step_results.items(), key=lambda x: priority_for_key(x[0])
-            ):
-                if result.ready():
-                    try:
-                        step_events = result.get()
-                    except TaskRevokedError:
-                        step_events = []
-                        yield DagsterEvent.engine_event(
-                            pipeline_context,
-                            'celery task for running step "{step_key}" was revoked.'.format(
-                                step_key=step_key,
-                            ),
-                            EngineEventData(marker_end=DELEGATE_MARKER),
-                            step_handle=active_execution.get_step_by_key(step_key).handle,
-                        )
-                    except Exception:
-                        # We will want to do more to handle the exception here.. maybe subclass Task
-                        # Certainly yield an engine or pipeline event
-                        step_events = []
-                        step_errors[step_key] = serializable_error_info_from_exc_info(
-                            sys.exc_info()
-                        )
-                    for step_event in step_events:
-                        event = deserialize_json_to_dagster_namedtuple(step_event)
-                        yield event
-                        active_execution.handle_event(event)
-
-                    results_to_pop.append(step_key)
-
-            for step_key in results_to_pop:
-                if step_key in step_results:
-                    del step_results[step_key]
-                    active_execution.verify_complete(pipeline_context, step_key)
+            # results are checked before the event log is read, so that every event that a finished
+            # task wrote is handled before its step is verified as complete
+            finished_step_keys = _get_finished_step_keys(app, step_results)
+
+            step_records = instance.get_records_for_run(
+                run_id, events_cursor, of_type=WORKER_EVENTS
+            )
+            if step_records:
+                events_cursor = step_records[-1].storage_id
+
+            for record in step_records:
+                log_entry = record.event_log_entry
+                # skip the events of steps that were not executed by a worker
+                if log_entry.step_key not in step_results:
+                    continue
+
+                yield log_entry.dagster_event
+                active_execution.handle_event(log_entry.dagster_event)
+
+            for step_key in sorted(finished_step_keys, key=priority_for_key):
+                result = step_results.pop(step_key)
+                try:
+                    result.get()
+                except TaskRevokedError:
+                    yield DagsterEvent.engine_event(
+                        pipeline_context,
+                        'celery task for running step "{step_key}" was revoked.'.format(
+                            step_key=step_key,
+                        ),
+                        EngineEventData(marker_end=DELEGATE_MARKER),
+                        step_handle=active_execution.get_step_by_key(step_key).handle,
+                    )
+                except Exception:
+                    # We will want to do more to handle the exception here.. maybe subclass Task
+                    # Certainly yield an engine or pipeline event
+                    step_errors[step_key] = serializable_error_info_from_exc_info(sys.exc_info())
+
+                active_execution.verify_complete(pipeline_context, step_key)
 
             # process skips from failures or uncovered inputs
             for event in active_execution.plan_events_iterator(pipeline_context):
@@ -115,6 +136,7 @@ def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_
 
             # don't add any new steps if we are stopping
             if stopping or step_errors:
+                tick_seconds = _wait_for_progress(tick_seconds, step_records or finished_step_keys)
                 continue
 
             # This is a slight refinement. If we have n workers idle and schedule m > n steps for
@@ -122,7 +144,8 @@ def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_
             # which they are scheduled (and the following m-n steps will be executed in priority
             # order, provided that it takes longer to execute a step than to schedule it). The test
             # case has m >> n to exhibit this behavior in the absence of this sort step.
-            for step in active_execution.get_steps_to_execute():
+            steps = active_execution.get_steps_to_execute()
+            for step in steps:
                 try:
                     queue = step.tags.get(DAGSTER_CELERY_QUEUE_TAG, task_default_queue)
                     yield DagsterEvent.engine_event(
@@ -157,7 +180,9 @@ def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_
                     )
                     raise
 
-            time.sleep(TICK_SECONDS)
+            tick_seconds = _wait_for_progress(
+                tick_seconds, step_records or finished_step_keys or steps
+            )
 
         if step_errors:
             raise DagsterSubprocessError(
@@ -173,6 +198,38 @@ def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_
             )
 
 
+def _wait_for_progress(tick_seconds, made_progress):
+    """Sleeps before the next poll unless the last one made progress, doubling the interval on
+    each idle poll so that long running steps do not keep the event log storage busy. Returns the
+    interval to wait after the next poll.
+    """
+    if made_progress:
+        return TICK_SECONDS
+
+    time.sleep(tick_seconds)
+    return min(tick_seconds * 2, MAX_TICK_SECONDS)
+
+
+def _get_finished_step_keys(app, step_results):
+    """The keys of the steps whose celery tasks have finished. Key-value store result backends
+    (e.g. redis or memcached) are queried for all of the tasks in a single round trip.
+    """
+    if not step_results:
+        return set()
+
+    # eagerly executed tasks are never stored in the result backend
+    if isinstance(app.backend, BaseKeyValueStoreBackend) and not app.conf.task_always_eager:
+        step_keys_by_task_id = {result.id: step_key for step_key, result in step_results.items()}
+        return {
+            step_keys_by_task_id[task_id]
+            for task_id, _meta in app.backend.get_many(
+                step_keys_by_task_id.keys(), interval=0, max_iterations=1
+            )
+        }
+
+    return {step_key for step_key, result in step_results.items() if result.ready()}
+
+
 def _get_step_priority(context, step):
     """Step priority is (currently) set as the overall pipeline run priority plus the individual
     step priority.
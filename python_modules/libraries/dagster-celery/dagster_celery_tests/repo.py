@@ -1,3 +1,4 @@
+import os
 import time
 
 from dagster_celery import celery_executor
@@ -15,6 +16,7 @@
     lambda_solid,
     pipeline,
     solid,
+    success_hook,
 )
 from dagster.core.test_utils import nesting_composite_pipeline
 
@@ -160,6 +162,30 @@ def test_resources_limit():
     resource_req_solid()
 
 
+@solid(config_schema={"flag_path": str})
+def wait_for_flag(context):
+    start_time = time.time()
+    while not os.path.exists(context.solid_config["flag_path"]):
+        time.sleep(0.1)
+        if time.time() - start_time > 60:
+            raise Exception("Timed out waiting for the step start event to be streamed")
+
+
+@pipeline(mode_defs=celery_mode_defs)
+def test_wait_for_flag():
+    wait_for_flag()
+
+
+@success_hook
+def noop_hook(_):
+    pass
+
+
+@pipeline(mode_defs=celery_mode_defs, hook_defs={noop_hook})
+def test_hooks():
+    simple()
+
+
 # test_priority pipelines
 
 
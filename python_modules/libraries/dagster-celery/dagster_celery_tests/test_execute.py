@@ -6,6 +6,9 @@
 from unittest import mock
 
 import pytest
+from celery.contrib.testing.worker import start_worker
+from dagster_celery.make_app import make_app
+from dagster_celery.tasks import create_task
 from dagster_celery_tests.repo import COMPOSITE_DEPTH
 
 from dagster import (
@@ -18,7 +21,7 @@
 from dagster.core.definitions.reconstruct import ReconstructablePipeline
 from dagster.core.errors import DagsterSubprocessError
 from dagster.core.events import DagsterEventType
-from dagster.utils import send_interrupt
+from dagster.utils import send_interrupt, touch_file
 
 from .utils import (  # isort:skip
     execute_eagerly_on_celery,
@@ -152,6 +155,35 @@ def test_terminate_pipeline_on_celery(dagster_celery_worker, instance, tempdir):
     assert DagsterEventType.PIPELINE_FAILURE in result_types
 
 
+def test_execute_streams_step_events_on_celery(instance, tempdir):
+    # an in-memory broker and result backend are shared by every app in the process, so the tasks
+    # are executed by a worker thread in this process
+    executor_config = {"broker": "memory://", "backend": "cache+memory://"}
+    worker_app = make_app(executor_config)
+    create_task(worker_app)
+
+    flag_path = os.path.join(tempdir, "flag")
+    event_types = []
+    with start_worker(worker_app, perform_ping_check=False):
+        for event in execute_pipeline_iterator(
+            pipeline=ReconstructablePipeline.for_file(REPO_FILE, "test_wait_for_flag"),
+            run_config={
+                "resources": {"io_manager": {"config": {"base_dir": tempdir}}},
+                "solids": {"wait_for_flag": {"config": {"flag_path": flag_path}}},
+                "execution": {"celery": {"config": executor_config}},
+            },
+            instance=instance,
+        ):
+            # the step only finishes once its start event has reached the executor
+            if event.event_type == DagsterEventType.STEP_START:
+                touch_file(flag_path)
+            event_types.append(event.event_type)
+
+    assert event_types.count(DagsterEventType.STEP_START) == 1
+    assert DagsterEventType.STEP_SUCCESS in event_types
+    assert DagsterEventType.PIPELINE_SUCCESS in event_types
+
+
 def test_execute_eagerly_on_celery(instance):
     with execute_eagerly_on_celery("test_pipeline", instance=instance) as result:
         assert result.result_for_solid("simple").output_value() == 1
@@ -185,6 +217,14 @@ def test_execute_eagerly_on_celery(instance):
             seen.add(key)
 
 
+def test_execute_eagerly_hooks_on_celery():
+    # the events that workers write besides step events reach the result too
+    with execute_eagerly_on_celery("test_hooks") as result:
+        assert result.success
+        assert len(events_of_type(result, "HOOK_COMPLETED")) == 1
+        assert len(events_of_type(result, "LOGS_CAPTURED")) == 1
+
+
 def test_execute_eagerly_serial_on_celery():
     with execute_eagerly_on_celery("test_serial_pipeline") as result:
         assert result.result_for_solid("simple").output_value() == 1
@@ -1,3 +1,6 @@
+import time
+from contextlib import contextmanager
+
 import dask
 import dask.distributed
 
@@ -12,18 +15,23 @@
     seven,
 )
 from dagster.core.definitions.executor_definition import executor
-from dagster.core.errors import raise_execution_interrupts
-from dagster.core.events import DagsterEvent
-from dagster.core.execution.api import create_execution_plan, execute_plan
+from dagster.core.errors import DagsterExecutionInterruptedError, DagsterSubprocessError
+from dagster.core.events import DagsterEvent, EngineEventData
+from dagster.core.execution.api import create_execution_plan, execute_plan_iterator
 from dagster.core.execution.context.system import PlanOrchestrationContext
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.execution.retries import RetryMode
 from dagster.core.instance import DagsterInstance
-from dagster.utils import frozentags, iterate_with_context
+from dagster.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
+from dagster.utils import frozentags
+from dagster.utils.error import serializable_error_info_from_exc_info
 
 # Dask resource requirements are specified under this key
 DASK_RESOURCE_REQUIREMENTS_KEY = "dagster-dask/resource_requirements"
 
+# How long the executor waits between polls of the step event queue when there is nothing to do
+TICK_SECONDS = 0.1
+
 
 @executor(
     name="dask",
@@ -70,7 +78,12 @@
                     ),
                 }
             )
-        )
+        ),
+        "retries": Field(
+            Selector({"enabled": {}, "disabled": {}}),
+            is_required=False,
+            default_value={"disabled": {}},
+        ),
     },
 )
 def dask_executor(init_context):
@@ -83,6 +96,10 @@ def dask_executor(init_context):
     will be created (as when calling :py:class:`dask.distributed.Client() <dask:distributed.Client>`
     with :py:class:`dask.distributed.LocalCluster() <dask:distributed.LocalCluster>`).
 
+    Each step is submitted to the cluster as soon as its upstream steps have completed, and its
+    events are streamed back to the executor through a :py:class:`dask.distributed.Queue` while it
+    runs. This means that dynamic outputs are supported, and step retries once they are enabled.
+
     The Dask executor optionally takes the following config:
 
     .. code-block:: none
@@ -96,6 +113,10 @@ def dask_executor(init_context):
                         threads_per_worker?: 1 # Number of threads per each worker
                     }
             }
+        retries:
+            {
+                enabled: {} | disabled: {}  # Whether failed steps may be retried, default disabled
+            }
 
     To use the `dask_executor`, set it as the `executor_def` when defining a job:
 
@@ -110,24 +131,41 @@ def dask_enabled_job():
 
     """
     ((cluster_type, cluster_configuration),) = init_context.executor_config["cluster"].items()
-    return DaskExecutor(cluster_type, cluster_configuration)
-
-
-def query_on_dask_worker(
-    dependencies,
+    return DaskExecutor(
+        cluster_type,
+        cluster_configuration,
+        retries=RetryMode.from_config(init_context.executor_config["retries"]),
+    )
+
+
+@contextmanager
+def _events_queue(name, client=None):
+    # every client that opens the queue holds a reference to it on the scheduler, which only
+    # deletes the queue once all of them have been released, so that it does not outlive the run
+    # on long-lived clusters
+    events_queue = dask.distributed.Queue(name=name, client=client)
+    try:
+        yield events_queue
+    finally:
+        events_queue.close()
+
+
+def execute_step_on_dask_worker(
     recon_pipeline,
     pipeline_run,
     run_config,
-    step_keys,
-    mode,
+    step_key,
     instance_ref,
     known_state,
-):  # pylint: disable=unused-argument
-    """Note that we need to pass "dependencies" to ensure Dask sequences futures during task
-    scheduling, even though we do not use this argument within the function.
+    retry_mode,
+    events_queue_name,
+):
+    """Executes a single step on a Dask worker, publishing each of its events to the named Dask
+    queue as soon as it is emitted so that the executor can act on them while the step runs.
     """
-
-    with DagsterInstance.from_ref(instance_ref) as instance:
+    with _events_queue(events_queue_name) as events_queue, DagsterInstance.from_ref(
+        instance_ref
+    ) as instance:
         subset_pipeline = recon_pipeline.subset_for_execution_from_existing_pipeline(
             pipeline_run.solids_to_execute
         )
@@ -135,14 +173,20 @@ def query_on_dask_worker(
         execution_plan = create_execution_plan(
             subset_pipeline,
             run_config=run_config,
-            step_keys_to_execute=step_keys,
-            mode=mode,
+            step_keys_to_execute=[step_key],
+            mode=pipeline_run.mode,
             known_state=known_state,
         )
 
-        return execute_plan(
-            execution_plan, subset_pipeline, instance, pipeline_run, run_config=run_config
-        )
+        for step_event in execute_plan_iterator(
+            execution_plan,
+            subset_pipeline,
+            pipeline_run,
+            instance,
+            retry_mode=retry_mode,
+            run_config=run_config,
+        ):
+            events_queue.put(serialize_dagster_namedtuple(step_event))
 
 
 def get_dask_resource_requirements(tags):
@@ -155,15 +199,16 @@ def get_dask_resource_requirements(tags):
 
 
 class DaskExecutor(Executor):
-    def __init__(self, cluster_type, cluster_configuration):
+    def __init__(self, cluster_type, cluster_configuration, retries=None):
         self.cluster_type = check.opt_str_param(cluster_type, "cluster_type", default="local")
         self.cluster_configuration = check.opt_dict_param(
             cluster_configuration, "cluster_configuration"
         )
+        self._retries = check.opt_inst_param(retries, "retries", RetryMode, RetryMode.DISABLED)
 
     @property
     def retries(self):
-        return RetryMode.DISABLED
+        return self._retries
 
     def execute(self, plan_context, execution_plan):
         check.inst_param(plan_context, "plan_context", PlanOrchestrationContext)
@@ -179,8 +224,6 @@ def execute(self, plan_context, execution_plan):
             "Dask execution requires a persistent DagsterInstance",
         )
 
-        step_levels = execution_plan.get_steps_to_execute_by_level()
-
         pipeline_name = plan_context.pipeline_name
 
         instance = plan_context.instance
@@ -234,54 +277,109 @@ def execute(self, plan_context, execution_plan):
                 f"Must be providing one of the following ('existing', 'local', 'yarn', 'ssh', 'pbs', 'moab', 'sge', 'lsf', 'slurm', 'oar', 'kube') not {cluster_type}"
             )
 
-        with dask.distributed.Client(cluster) as client:
-            execution_futures = []
-            execution_futures_dict = {}
-
-            for step_level in step_levels:
-                for step in step_level:
-                    # We ensure correctness in sequencing by letting Dask schedule futures and
-                    # awaiting dependencies within each step.
-                    dependencies = []
-                    for step_input in step.step_inputs:
-                        for key in step_input.dependency_keys:
-                            dependencies.append(execution_futures_dict[key])
-
-                    if plan_context.pipeline.get_definition().is_job:
-                        run_config = plan_context.run_config
-                    else:
-                        run_config = dict(plan_context.run_config, execution={"in_process": {}})
-
-                    dask_task_name = "%s.%s" % (pipeline_name, step.key)
-
-                    recon_pipeline = plan_context.reconstructable_pipeline
-
-                    future = client.submit(
-                        query_on_dask_worker,
-                        dependencies,
-                        recon_pipeline,
-                        plan_context.pipeline_run,
-                        run_config,
-                        [step.key],
-                        plan_context.pipeline_run.mode,
-                        instance.get_ref(),
-                        execution_plan.known_state,
-                        key=dask_task_name,
-                        resources=get_dask_resource_requirements(step.tags),
+        if plan_context.pipeline.get_definition().is_job:
+            run_config = plan_context.run_config
+        else:
+            run_config = dict(plan_context.run_config, execution={"in_process": {}})
+
+        pipeline_run = plan_context.pipeline_run
+        recon_pipeline = plan_context.reconstructable_pipeline
+
+        with dask.distributed.Client(cluster) as client, _events_queue(
+            "dagster-events-{run_id}".format(run_id=pipeline_run.run_id), client
+        ) as events_queue:
+            step_futures = {}
+            step_errors = {}
+
+            with execution_plan.start(retry_mode=self.retries) as active_execution:
+                stopping = False
+
+                while (not active_execution.is_complete and not stopping) or step_futures:
+                    if active_execution.check_for_interrupts():
+                        yield DagsterEvent.engine_event(
+                            plan_context,
+                            "Dask executor: received termination signal - cancelling active "
+                            "step futures",
+                            EngineEventData.interrupted(list(step_futures.keys())),
+                        )
+                        stopping = True
+                        active_execution.mark_interrupted()
+                        client.cancel(list(step_futures.values()))
+                        step_futures = {}
+                        break
+
+                    # futures are checked before the queue is drained, so that every event that a
+                    # finished step published is handled before the step is verified as complete
+                    finished_step_keys = [
+                        step_key for step_key, future in step_futures.items() if future.done()
+                    ]
+
+                    step_events = events_queue.get(batch=True)
+                    for serialized_event in step_events:
+                        step_event = deserialize_json_to_dagster_namedtuple(serialized_event)
+                        check.inst(step_event, DagsterEvent)
+                        yield step_event
+                        active_execution.handle_event(step_event)
+
+                    for step_key in finished_step_keys:
+                        future = step_futures.pop(step_key)
+                        if future.status == "error":
+                            exc = future.exception()
+                            step_errors[step_key] = serializable_error_info_from_exc_info(
+                                (type(exc), exc, future.traceback())
+                            )
+                        active_execution.verify_complete(plan_context, step_key)
+
+                    # process skips from failures or uncovered inputs
+                    yield from active_execution.plan_events_iterator(plan_context)
+
+                    # a step whose worker failed was either marked failed by its failure event or
+                    # abandoned by verify_complete, so its downstream steps are skipped while any
+                    # independent steps still run and the plan can complete
+                    steps = active_execution.get_steps_to_execute()
+                    for step in steps:
+                        # include the attempt in the key, since dask reuses the result of a
+                        # previously submitted task with the same key
+                        dask_task_name = "%s.%s.%s.%s" % (
+                            pipeline_name,
+                            step.key,
+                            pipeline_run.run_id,
+                            active_execution.retry_state.get_attempt_count(step.key),
+                        )
+                        step_futures[step.key] = client.submit(
+                            execute_step_on_dask_worker,
+                            recon_pipeline,
+                            pipeline_run,
+                            run_config,
+                            step.key,
+                            instance.get_ref(),
+                            active_execution.get_known_state(),
+                            self.retries.for_inner_plan(),
+                            events_queue.name,
+                            key=dask_task_name,
+                            resources=get_dask_resource_requirements(step.tags),
+                        )
+
+                    if not (step_events or finished_step_keys or steps):
+                        time.sleep(TICK_SECONDS)
+
+                # raised before the plan is exited, so that the worker errors are reported rather
+                # than the unknown state of the steps that they left behind
+                if step_errors and not stopping:
+                    raise DagsterSubprocessError(
+                        "During dask execution errors occurred in workers:\n{error_list}".format(
+                            error_list="\n".join(
+                                [
+                                    "[{step}]: {err}".format(step=key, err=err.to_string())
+                                    for key, err in step_errors.items()
+                                ]
+                            )
+                        ),
+                        subprocess_error_infos=list(step_errors.values()),
                     )
 
-                    execution_futures.append(future)
-                    execution_futures_dict[step.key] = future
-
-            # This tells Dask to awaits the step executions and retrieve their results to the
-            # master
-            futures = dask.distributed.as_completed(execution_futures, with_results=True)
-
-            # Allow interrupts while waiting for the results from Dask
-            for future, result in iterate_with_context(raise_execution_interrupts, futures):
-                for step_event in result:
-                    check.inst(step_event, DagsterEvent)
-                    yield step_event
+            if stopping:
+                raise DagsterExecutionInterruptedError()
 
     def build_dict(self, pipeline_name):
         """Returns a dict we can use for kwargs passed to dask client instantiation.
@@ -1,4 +1,5 @@
 import asyncio
+import os
 import tempfile
 import time
 from threading import Thread
@@ -6,12 +7,15 @@
 import dagster_pandas as dagster_pd
 import pytest
 from dagster_dask import DataFrame, dask_executor
-from dask.distributed import Scheduler, Worker
+from dask.distributed import LocalCluster, Scheduler, Worker
 
 from dagster import (
     DagsterUnmetExecutorRequirementsError,
+    DynamicOut,
+    DynamicOutput,
     InputDefinition,
     ModeDefinition,
+    RetryPolicy,
     VersionStrategy,
     execute_pipeline,
     execute_pipeline_iterator,
@@ -27,7 +31,7 @@
 from dagster.core.definitions.reconstruct import ReconstructablePipeline
 from dagster.core.events import DagsterEventType
 from dagster.core.test_utils import instance_for_test, nesting_composite_pipeline
-from dagster.utils import send_interrupt
+from dagster.utils import send_interrupt, touch_file
 
 
 @solid
@@ -274,6 +278,26 @@ async def _run_test():
     asyncio.get_event_loop().run_until_complete(_run_test())
 
 
+def test_existing_cluster_releases_events_queue():
+    with LocalCluster(n_workers=1, processes=False, dashboard_address=None) as cluster:
+        with instance_for_test() as instance:
+            existing_cluster = {"existing": {"address": cluster.scheduler_address}}
+            result = execute_pipeline(
+                reconstructable(dask_engine_pipeline),
+                run_config={"execution": {"dask": {"config": {"cluster": existing_cluster}}}},
+                instance=instance,
+                mode="filesystem",
+            )
+            assert result.success
+
+        # the queue that the step events were streamed through does not outlive the run
+        queues = cluster.scheduler.extensions["queues"].queues
+        deadline = time.time() + 10
+        while queues and time.time() < deadline:
+            time.sleep(0.1)
+        assert not queues
+
+
 @solid
 def foo_solid():
     return "foo"
@@ -335,3 +359,144 @@ def test_dask_executor_job():
         )
         assert result.success
         assert result.output_for_solid("the_op") == 5
+
+
+@op(retry_policy=RetryPolicy(max_retries=2))
+def flaky_op(context):
+    if context.retry_number < 1:
+        raise Exception("Flaky failure")
+    return context.retry_number
+
+
+@job(executor_def=dask_executor)
+def flaky_job():
+    flaky_op()
+
+
+def test_dask_executor_retries():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(flaky_job),
+            instance=instance,
+            run_config={
+                "execution": {
+                    "config": {"cluster": {"local": {"timeout": 30}}, "retries": {"enabled": {}}}
+                }
+            },
+        )
+        assert result.success
+        assert result.output_for_solid("flaky_op") == 1
+        event_types = [event.event_type for event in result.step_event_list]
+        assert DagsterEventType.STEP_UP_FOR_RETRY in event_types
+        assert DagsterEventType.STEP_RESTARTED in event_types
+
+
+@op(out=DynamicOut())
+def emit_numbers():
+    for num in range(3):
+        yield DynamicOutput(num, mapping_key=str(num))
+
+
+@op
+def double(num):
+    return num * 2
+
+
+@op
+def total(nums):
+    return sum(nums)
+
+
+@job(executor_def=dask_executor)
+def dynamic_job():
+    total(emit_numbers().map(double).collect())
+
+
+def test_dask_executor_dynamic():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(dynamic_job),
+            instance=instance,
+            run_config={"execution": {"config": {"cluster": {"local": {"timeout": 30}}}}},
+        )
+        assert result.success
+        assert result.output_for_solid("total") == 6
+
+
+@op(config_schema={"flag_path": str})
+def wait_for_flag(context):
+    start_time = time.time()
+    while not os.path.exists(context.op_config["flag_path"]):
+        time.sleep(0.1)
+        if time.time() - start_time > 60:
+            raise Exception("Timed out waiting for the step start event to be streamed")
+
+
+@job(executor_def=dask_executor)
+def wait_for_flag_job():
+    wait_for_flag()
+
+
+def test_dask_executor_streams_events():
+    with tempfile.TemporaryDirectory() as tempdir:
+        flag_path = os.path.join(tempdir, "flag")
+        with instance_for_test() as instance:
+            event_types = []
+            for event in execute_pipeline_iterator(
+                reconstructable(wait_for_flag_job),
+                instance=instance,
+                run_config={
+                    "ops": {"wait_for_flag": {"config": {"flag_path": flag_path}}},
+                    "execution": {"config": {"cluster": {"local": {"timeout": 30}}}},
+                },
+            ):
+                # the step only finishes once its start event has reached the executor
+                if event.event_type == DagsterEventType.STEP_START:
+                    touch_file(flag_path)
+                event_types.append(event.event_type)
+
+            assert DagsterEventType.STEP_SUCCESS in event_types
+            assert DagsterEventType.PIPELINE_SUCCESS in event_types
+
+
+class WorkerCrash(BaseException):
+    pass
+
+
+@op
+def crash_worker():
+    # escapes step execution, so that the dask future itself errors
+    raise WorkerCrash()
+
+
+@op
+def slow_op():
+    time.sleep(2)
+    return 1
+
+
+@op
+def after_slow_op(num):
+    return num + 1
+
+
+@job(executor_def=dask_executor)
+def worker_crash_job():
+    crash_worker()
+    after_slow_op(slow_op())
+
+
+def test_dask_executor_worker_error_runs_independent_steps():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(worker_crash_job),
+            instance=instance,
+            run_config={"execution": {"config": {"cluster": {"local": {"timeout": 30}}}}},
+            raise_on_error=False,
+        )
+        assert not result.success
+        assert not result.result_for_solid("crash_worker").success
+        assert result.output_for_solid("after_slow_op") == 2
+        failure_event = result.event_list[-1]
+        assert failure_event.event_type == DagsterEventType.PIPELINE_FAILURE
+        assert "WorkerCrash" in failure_event.event_specific_data.error.message
@@ -1,12 +1,22 @@
 import hashlib
 import json
 import os
+import shutil
+import tempfile
 import textwrap
 from typing import AbstractSet, Any, Callable, Dict, Mapping, Optional, Sequence, Set, Tuple
 
+import pkg_resources
+from dagster_dbt.cli.resources import DbtCliResource
 from dagster_dbt.cli.types import DbtCliOutput
 from dagster_dbt.cli.utils import execute_cli
-from dagster_dbt.utils import generate_materializations
+from dagster_dbt.utils import (
+    generate_materializations,
+    get_node_finished_info,
+    node_finished_event_to_metadata,
+    node_finished_successfully,
+)
+from dagster_dbt.version import __version__
 
 from dagster import (
     AssetKey,
@@ -47,6 +57,122 @@ def _load_manifest_for_project(
         return json.load(f), cli_output
 
 
+def _select_dbt_nodes(
+    manifest_json: Mapping[str, Any], selected_unique_ids: AbstractSet[str]
+) -> Dict[str, Any]:
+    """The subset of the nodes and sources of a manifest that the assets for the selected nodes are
+    built from: the selected nodes and the nodes that they depend on."""
+    dbt_nodes = {**manifest_json["nodes"], **manifest_json["sources"]}
+    unique_ids = set(selected_unique_ids)
+    for unique_id in selected_unique_ids:
+        unique_ids.update(dbt_nodes[unique_id]["depends_on"]["nodes"])
+    return {unique_id: dbt_nodes[unique_id] for unique_id in unique_ids}
+
+
+# directories of a dbt project that do not affect its manifest
+_IGNORED_PROJECT_DIRS = {"logs", "__pycache__"}
+
+
+def _get_dbt_version() -> str:
+    """The version of dbt-core installed alongside dagster-dbt or, when dbt is installed elsewhere,
+    the path and modification time of the dbt executable, which change when dbt is upgraded."""
+    try:
+        return pkg_resources.get_distribution("dbt-core").version
+    except pkg_resources.DistributionNotFound:
+        executable = shutil.which("dbt")
+        if executable is None:
+            return ""
+        return f"{executable}:{os.path.getmtime(executable)}"
+
+
+def _get_project_hash(
+    project_dir: str, profiles_dir: str, target_dir: str, cache_dir: str, select: str
+) -> str:
+    """A hash of the files of a dbt project and its profiles, of the selection of its models and of
+    the installed versions of dagster-dbt and dbt, that changes whenever the models selected from
+    the project may."""
+    ignored_dirs = {os.path.abspath(target_dir), os.path.abspath(cache_dir)}
+    hash_obj = hashlib.sha256()
+    hash_obj.update(__version__.encode("utf-8"))
+    hash_obj.update(b"\0" + _get_dbt_version().encode("utf-8"))
+    hash_obj.update(b"\0" + select.encode("utf-8"))
+    for base_dir in sorted({os.path.abspath(project_dir), os.path.abspath(profiles_dir)}):
+        for root, dirs, files in os.walk(base_dir):
+            dirs[:] = sorted(
+                name
+                for name in dirs
+                if not name.startswith(".")
+                and name not in _IGNORED_PROJECT_DIRS
+                and os.path.join(root, name) not in ignored_dirs
+            )
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                hash_obj.update(b"\0" + os.path.relpath(path, base_dir).encode("utf-8") + b"\0")
+                with open(path, "rb") as f:
+                    hash_obj.update(f.read())
+    return hash_obj.hexdigest()
+
+
+def _load_dbt_nodes_for_project(
+    project_dir: str,
+    profiles_dir: str,
+    target_dir: str,
+    select: str,
+    cache_dir: Optional[str],
+) -> Tuple[Mapping[str, Any], AbstractSet[str]]:
+    """Returns the nodes that the assets for the models selected from a dbt project are built from,
+    and the unique ids of the selected models.
+
+    When a cache directory is given, the nodes are read from it if the project and selection have
+    not changed since they were cached, and are written to it otherwise, so that dbt is only invoked
+    once for each version of the project, across processes.
+    """
+    cache_path = None
+    if cache_dir is not None:
+        project_hash = _get_project_hash(project_dir, profiles_dir, target_dir, cache_dir, select)
+        cache_path = os.path.join(cache_dir, f"dbt_nodes_{project_hash}.json")
+        if os.path.exists(cache_path):
+            with open(cache_path, "r") as f:
+                cached = json.load(f)
+            return cached["nodes"], set(cached["selected_unique_ids"])
+
+    manifest_json, cli_output = _load_manifest_for_project(
+        project_dir, profiles_dir, target_dir, select
+    )
+    selected_unique_ids: Set[str] = set(
+        filter(None, (line.get("unique_id") for line in cli_output.logs))
+    )
+    dbt_nodes = _select_dbt_nodes(manifest_json, selected_unique_ids)
+
+    if cache_path is not None:
+        _write_cache_entry(cache_dir, cache_path, dbt_nodes, selected_unique_ids)
+
+    return dbt_nodes, selected_unique_ids
+
+
+def _write_cache_entry(
+    cache_dir: str,
+    cache_path: str,
+    dbt_nodes: Mapping[str, Any],
+    selected_unique_ids: AbstractSet[str],
+):
+    # the cache is an optimization, so failing to write to it (e.g. because the directory is
+    # read-only or full) does not fail loading the assets
+    temp_path = None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # write the cache entry to a temporary file first, so that processes loading the project
+        # concurrently never read a partially written entry
+        fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"nodes": dbt_nodes, "selected_unique_ids": sorted(selected_unique_ids)}, f)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        get_dagster_logger().warning(f"Could not cache the dbt models in {cache_dir}: {e}")
+        if temp_path is not None and os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
 def _get_node_name(node_info: Mapping[str, Any]):
     return "__".join([node_info["resource_type"], node_info["package_name"], node_info["name"]])
 
@@ -68,6 +194,7 @@ def _dbt_nodes_to_assets(
     outs: Dict[str, Out] = {}
     sources: Set[AssetKey] = set()
     out_name_to_node_info: Dict[str, Mapping[str, Any]] = {}
+    unique_id_to_out_name: Dict[str, str] = {}
     internal_asset_deps: Dict[str, Set[AssetKey]] = {}
     package_name = None
     for unique_id in selected_unique_ids:
@@ -102,6 +229,7 @@ def _dbt_nodes_to_assets(
             metadata=_columns_to_metadata(node_info["columns"]),
         )
         out_name_to_node_info[node_name] = node_info
+        unique_id_to_out_name[unique_id] = node_name
         internal_asset_deps[node_name] = asset_deps
 
     # prevent op name collisions between multiple dbt multi-assets
@@ -118,22 +246,44 @@ def _dbt_nodes_to_assets(
         internal_asset_deps=internal_asset_deps,
     )
     def _dbt_project_multi_assset(context):
-        dbt_output = context.resources.dbt.run(select=select)
-        # yield an Output for each materialization generated in the run
-        for materialization in generate_materializations(dbt_output):
-            output_name = materialization.asset_key.path[-1]
+        def _output(output_name, metadata_entries):
             if runtime_metadata_fn:
-                yield Output(
+                return Output(
                     value=None,
                     output_name=output_name,
                     metadata=runtime_metadata_fn(context, out_name_to_node_info[output_name]),
                 )
-            else:
-                yield Output(
-                    value=None,
-                    output_name=output_name,
-                    metadata_entries=materialization.metadata_entries,
-                )
+            return Output(value=None, output_name=output_name, metadata_entries=metadata_entries)
+
+        streamed_output_names = set()
+        if isinstance(context.resources.dbt, DbtCliResource):
+            # yield the Output of each model as soon as dbt reports that the model finished
+            # successfully
+            events = context.resources.dbt.run_stream(select=select)
+            while True:
+                try:
+                    event = next(events)
+                except StopIteration as stop:
+                    dbt_output = stop.value
+                    break
+
+                if not node_finished_successfully(event):
+                    continue
+                node_info = check.not_none(get_node_finished_info(event))
+                output_name = unique_id_to_out_name.get(node_info.get("unique_id"))
+                if output_name is None or output_name in streamed_output_names:
+                    continue
+                streamed_output_names.add(output_name)
+                yield _output(output_name, node_finished_event_to_metadata(event))
+        else:
+            dbt_output = context.resources.dbt.run(select=select)
+
+        # yield an Output for each materialization generated in the run that was not streamed, e.g.
+        # for versions of dbt that do not report when each model finishes
+        for materialization in generate_materializations(dbt_output):
+            output_name = materialization.asset_key.path[-1]
+            if output_name not in streamed_output_names:
+                yield _output(output_name, materialization.metadata_entries)
 
     return _dbt_project_multi_assset
 
@@ -169,6 +319,7 @@ def load_assets_from_dbt_project(
     ] = None,
     io_manager_key: Optional[str] = None,
     node_info_to_asset_key: Callable[[Mapping[str, Any]], AssetKey] = _get_node_asset_key,
+    cache_dir: Optional[str] = None,
 ) -> Sequence[AssetsDefinition]:
     """
     Loads a set of DBT models from a DBT project into Dagster assets.
@@ -176,6 +327,10 @@ def load_assets_from_dbt_project(
     Creates one Dagster asset for each dbt model. All assets will be re-materialized using a single
     `dbt run` command.
 
+    The models are listed by running `dbt ls`, which compiles the project. To avoid compiling the
+    project each time the assets are loaded, set ``cache_dir``, or use
+    :py:func:`load_assets_from_dbt_manifest` with a manifest compiled ahead of time.
+
     Args:
         project_dir (Optional[str]): The directory containing the DBT project to load.
         profiles_dir (Optional[str]): The profiles directory to use for loading the DBT project.
@@ -193,21 +348,24 @@ def load_assets_from_dbt_project(
         node_info_to_asset_key: (Mapping[str, Any] -> AssetKey): A function that takes a dictionary
             of dbt node info and returns the AssetKey that you want to represent that node. By
             default, the asset key will simply be the name of the dbt model.
+        cache_dir (Optional[str]): A directory in which to cache the models selected from the
+            project, keyed by a hash of the files of the project and profiles directories and of
+            the selection. While the project does not change, processes that load the assets
+            (e.g. run workers, or code servers after a reload) read the models from the cache
+            instead of running `dbt ls`. The directory can be shared by processes, and populated
+            ahead of time by loading the assets once, e.g. while building an image. Changes to
+            environment variables that the project reads are not detected.
     """
     check.str_param(project_dir, "project_dir")
     profiles_dir = check.opt_str_param(
         profiles_dir, "profiles_dir", os.path.join(project_dir, "config")
     )
     target_dir = check.opt_str_param(target_dir, "target_dir", os.path.join(project_dir, "target"))
+    check.opt_str_param(cache_dir, "cache_dir")
 
-    manifest_json, cli_output = _load_manifest_for_project(
-        project_dir, profiles_dir, target_dir, select or "*"
-    )
-    selected_unique_ids: Set[str] = set(
-        filter(None, (line.get("unique_id") for line in cli_output.logs))
+    dbt_nodes, selected_unique_ids = _load_dbt_nodes_for_project(
+        project_dir, profiles_dir, target_dir, select or "*", cache_dir
     )
-
-    dbt_nodes = {**manifest_json["nodes"], **manifest_json["sources"]}
     return [
         _dbt_nodes_to_assets(
             dbt_nodes,
@@ -221,13 +379,14 @@ def load_assets_from_dbt_project(
 
 
 def load_assets_from_dbt_manifest(
-    manifest_json: Mapping[str, Any],
+    manifest_json: Optional[Mapping[str, Any]] = None,
     runtime_metadata_fn: Optional[
         Callable[[SolidExecutionContext, Mapping[str, Any]], Mapping[str, Any]]
     ] = None,
     io_manager_key: Optional[str] = None,
     selected_unique_ids: Optional[AbstractSet[str]] = None,
     node_info_to_asset_key: Callable[[Mapping[str, Any]], AssetKey] = _get_node_asset_key,
+    manifest_path: Optional[str] = None,
 ) -> Sequence[AssetsDefinition]:
     """
     Loads a set of dbt models, described in a manifest.json, into Dagster assets.
@@ -235,9 +394,14 @@ def load_assets_from_dbt_manifest(
     Creates one Dagster asset for each dbt model. All assets will be re-materialized using a single
     `dbt run` command.
 
+    dbt is not invoked to load the assets, so a manifest compiled ahead of time (e.g. by running
+    `dbt compile` while building an image) can be used to load them in processes that should not
+    compile the project, like run workers.
+
     Args:
         manifest_json (Optional[Mapping[str, Any]]): The contents of a DBT manifest.json, which contains
-            a set of models to load into assets.
+            a set of models to load into assets. Exactly one of ``manifest_json`` and
+            ``manifest_path`` must be set.
         runtime_metadata_fn: (Optional[Callable[[SolidExecutionContext, Mapping[str, Any]], Mapping[str, Any]]]):
             A function that will be run after any of the assets are materialized and returns
             metadata entries for the asset, to be displayed in the asset catalog for that run.
@@ -249,7 +413,16 @@ def load_assets_from_dbt_manifest(
         node_info_to_asset_key: (Mapping[str, Any] -> AssetKey): A function that takes a dictionary
             of dbt node info and returns the AssetKey that you want to represent that node. By
             default, the asset key will simply be the name of the dbt model.
+        manifest_path (Optional[str]): The path to a DBT manifest.json to load the models from,
+            instead of its contents.
     """
+    check.invariant(
+        (manifest_json is None) != (manifest_path is None),
+        "Exactly one of manifest_json and manifest_path must be set",
+    )
+    if manifest_path is not None:
+        with open(check.str_param(manifest_path, "manifest_path"), "r") as f:
+            manifest_json = json.load(f)
     check.dict_param(manifest_json, "manifest_json", key_type=str)
     dbt_nodes = {**manifest_json["nodes"], **manifest_json["sources"]}
 
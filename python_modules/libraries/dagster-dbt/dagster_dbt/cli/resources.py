@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Generator, List, Optional, Set
 
 from dagster import Permissive, check, resource
 from dagster.utils.merger import merge_dicts
@@ -6,7 +6,7 @@
 from ..dbt_resource import DbtResource
 from .constants import CLI_COMMON_FLAGS_CONFIG_SCHEMA, CLI_COMMON_OPTIONS_CONFIG_SCHEMA
 from .types import DbtCliOutput
-from .utils import execute_cli
+from .utils import execute_cli, execute_cli_stream
 
 
 class DbtCliResource(DbtResource):
@@ -51,6 +51,18 @@ def strict_flags(self) -> Set[str]:
         """
         return {"models", "exclude", "select"}
 
+    def _get_flags(self, extra_flags: Dict[str, Any]) -> Dict[str, Any]:
+        # remove default flags that are declared as "strict" and not explicitly passed in
+        default_flags = {
+            k: v
+            for k, v in self.default_flags.items()
+            if not (k in self.strict_flags and k not in extra_flags)
+        }
+
+        return merge_dicts(
+            default_flags, self._format_params(extra_flags, replace_underscores=True)
+        )
+
     def cli(self, command: str, **kwargs) -> DbtCliOutput:
         """
         Executes a dbt CLI command. Params passed in as keyword arguments will be merged with the
@@ -67,21 +79,38 @@ def cli(self, command: str, **kwargs) -> DbtCliOutput:
         command = check.str_param(command, "command")
         extra_flags = {} if kwargs is None else kwargs
 
-        # remove default flags that are declared as "strict" and not explicitly passed in
-        default_flags = {
-            k: v
-            for k, v in self.default_flags.items()
-            if not (k in self.strict_flags and k not in extra_flags)
-        }
-
-        flags = merge_dicts(
-            default_flags, self._format_params(extra_flags, replace_underscores=True)
+        return execute_cli(
+            executable=self._executable,
+            command=command,
+            flags_dict=self._get_flags(extra_flags),
+            log=self.logger,
+            warn_error=self._warn_error,
+            ignore_handled_error=self._ignore_handled_error,
+            target_path=self._target_path,
         )
 
-        return execute_cli(
+    def cli_stream(self, command: str, **kwargs) -> Generator[Dict[str, Any], None, DbtCliOutput]:
+        """
+        Executes a dbt CLI command, yielding each structured log event that dbt emits (e.g. when a
+            model starts or finishes running) as soon as it is emitted. Params are handled as in
+            :py:meth:`cli`.
+
+        Args:
+            command (str): The command you wish to run (e.g. 'run', 'test', 'docs generate', etc.)
+
+        Returns:
+            Generator[Dict[str, Any], None, DbtCliOutput]: A generator of the parsed JSON log
+                events of the command. Once dbt exits, the generator returns an instance of
+                :class:`DbtCliOutput<dagster_dbt.DbtCliOutput>`, which is the value of the
+                ``StopIteration`` that ends the iteration.
+        """
+        command = check.str_param(command, "command")
+        extra_flags = {} if kwargs is None else kwargs
+
+        return execute_cli_stream(
             executable=self._executable,
             command=command,
-            flags_dict=flags,
+            flags_dict=self._get_flags(extra_flags),
             log=self.logger,
             warn_error=self._warn_error,
             ignore_handled_error=self._ignore_handled_error,
@@ -120,6 +149,24 @@ def run(
         """
         return self.cli("run", models=models, exclude=exclude, **kwargs)
 
+    def run_stream(
+        self, models: Optional[List[str]] = None, exclude: Optional[List[str]] = None, **kwargs
+    ) -> Generator[Dict[str, Any], None, DbtCliOutput]:
+        """
+        Run the ``run`` command on a dbt project, yielding each structured log event that dbt emits
+            as soon as it is emitted. Params are handled as in :py:meth:`run`.
+
+        Args:
+            models (List[str], optional): the models to include in compilation.
+            exclude (List[str]), optional): the models to exclude from compilation.
+
+        Returns:
+            Generator[Dict[str, Any], None, DbtCliOutput]: A generator of the parsed JSON log
+                events of the command. Once dbt exits, the generator returns an instance of
+                :class:`DbtCliOutput<dagster_dbt.DbtCliOutput>`, as in :py:meth:`cli_stream`.
+        """
+        return self.cli_stream("run", models=models, exclude=exclude, **kwargs)
+
     def snapshot(
         self, select: Optional[List[str]] = None, exclude: Optional[List[str]] = None, **kwargs
     ) -> DbtCliOutput:
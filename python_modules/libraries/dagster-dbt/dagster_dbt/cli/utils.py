@@ -1,7 +1,7 @@
 import json
 import os
 import subprocess
-from typing import Any, Dict
+from typing import Any, Dict, Generator
 
 from dagster import check
 from dagster.core.utils import coerce_valid_log_level
@@ -15,7 +15,7 @@
 from .types import DbtCliOutput
 
 
-def execute_cli(
+def execute_cli_stream(
     executable: str,
     command: str,
     flags_dict: Dict[str, Any],
@@ -23,8 +23,10 @@ def execute_cli(
     warn_error: bool,
     ignore_handled_error: bool,
     target_path: str,
-) -> DbtCliOutput:
-    """Executes a command on the dbt CLI in a subprocess."""
+) -> Generator[Dict[str, Any], None, DbtCliOutput]:
+    """Executes a command on the dbt CLI in a subprocess, yielding each structured (JSON) log event
+    that dbt emits as soon as it is emitted. Returns the DbtCliOutput of the command once dbt
+    exits."""
     check.str_param(executable, "executable")
     check.str_param(command, "command")
     check.dict_param(flags_dict, "flags_dict", key_type=str)
@@ -65,19 +67,26 @@ def execute_cli(
     output = []
 
     process = subprocess.Popen(command_list, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-    for raw_line in process.stdout or []:
-        line = raw_line.decode("utf-8")
-        output.append(line)
-        try:
-            json_line = json.loads(line)
-        except json.JSONDecodeError:
-            log.info(line.rstrip())
-        else:
-            logs.append(json_line)
-            level = coerce_valid_log_level(
-                json_line.get("levelname", json_line.get("level", "info"))
-            )
-            log.log(level, json_line.get("message", json_line.get("msg", line.rstrip())))
+    try:
+        for raw_line in process.stdout or []:
+            line = raw_line.decode("utf-8")
+            output.append(line)
+            try:
+                json_line = json.loads(line)
+            except json.JSONDecodeError:
+                log.info(line.rstrip())
+            else:
+                logs.append(json_line)
+                level = coerce_valid_log_level(
+                    json_line.get("levelname", json_line.get("level", "info"))
+                )
+                log.log(level, json_line.get("message", json_line.get("msg", line.rstrip())))
+                yield json_line
+    except GeneratorExit:
+        # the stream was closed before dbt exited, so dbt is stopped rather than left running
+        process.terminate()
+        process.wait()
+        raise
 
     process.wait()
     return_code = process.returncode
@@ -107,6 +116,39 @@ def execute_cli(
     )
 
 
+def execute_cli(
+    executable: str,
+    command: str,
+    flags_dict: Dict[str, Any],
+    log: Any,
+    warn_error: bool,
+    ignore_handled_error: bool,
+    target_path: str,
+) -> DbtCliOutput:
+    """Executes a command on the dbt CLI in a subprocess."""
+    return exhaust_cli_stream(
+        execute_cli_stream(
+            executable=executable,
+            command=command,
+            flags_dict=flags_dict,
+            log=log,
+            warn_error=warn_error,
+            ignore_handled_error=ignore_handled_error,
+            target_path=target_path,
+        )
+    )
+
+
+def exhaust_cli_stream(events: Generator[Dict[str, Any], None, DbtCliOutput]) -> DbtCliOutput:
+    """Consumes the remaining events of a dbt CLI event stream, returning the DbtCliOutput of the
+    command."""
+    while True:
+        try:
+            next(events)
+        except StopIteration as stop:
+            return stop.value
+
+
 def parse_run_results(path: str, target_path: str = DEFAULT_DBT_TARGET_PATH) -> Dict[str, Any]:
     """Parses the `target/run_results.json` artifact that is produced by a dbt process."""
     run_results_path = os.path.join(path, target_path, "run_results.json")
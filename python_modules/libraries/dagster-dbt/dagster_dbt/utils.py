@@ -109,6 +109,76 @@ def result_to_materialization(
     )
 
 
+# the names and codes of the structured dbt log events that report that a node finished running:
+# LogModelResult (PrintModelResultLine before dbt 1.4) is logged at the info level, so it is written
+# by default, while NodeFinished is logged at the debug level, so it is only written with --debug
+_NODE_FINISHED_EVENT_NAMES = {"LogModelResult", "PrintModelResultLine", "NodeFinished"}
+_NODE_FINISHED_EVENT_CODES = {"Q012", "Q025"}
+
+# the statuses that dbt reports for nodes that did not run successfully
+_UNSUCCESSFUL_NODE_STATUSES = {"error", "fail", "skipped", "runtime error"}
+
+
+def get_node_finished_info(event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Returns the node info (unique_id, node_status, etc.) of a structured dbt log event, as emitted
+    by the dbt CLI with ``--log-format json``, if the event reports that a node finished running.
+    Returns None for any other event.
+    """
+    # dbt 1.4+ nests the name and code of an event under "info", and its fields under "data"
+    info = event.get("info", event)
+    if (
+        info.get("name") not in _NODE_FINISHED_EVENT_NAMES
+        and info.get("code") not in _NODE_FINISHED_EVENT_CODES
+    ):
+        return None
+    return event.get("data", {}).get("node_info") or event.get("node_info")
+
+
+def node_finished_successfully(event: Dict[str, Any]) -> bool:
+    """
+    Returns whether a structured dbt log event reports that a node finished running successfully.
+    """
+    node_info = get_node_finished_info(event)
+    if not node_info:
+        return False
+    statuses = {node_info.get("node_status"), event.get("data", {}).get("status")}
+    return not any(
+        isinstance(status, str) and status.lower() in _UNSUCCESSFUL_NODE_STATUSES
+        for status in statuses
+    )
+
+
+def node_finished_event_to_metadata(event: Dict[str, Any]) -> List[MetadataEntry]:
+    """
+    Returns the timing metadata of a node from the structured dbt log event that reports that the
+    node finished running.
+    """
+    data = event.get("data", {})
+    run_result = data.get("run_result")
+    if run_result and "timing" in run_result:
+        return [
+            MetadataEntry("Execution Time (seconds)", value=run_result["execution_time"])
+        ] + _timing_to_metadata(run_result["timing"])
+
+    metadata = []
+    if data.get("execution_time") is not None:
+        metadata.append(MetadataEntry("Execution Time (seconds)", value=data["execution_time"]))
+
+    node_info = check.not_none(get_node_finished_info(event))
+    if node_info.get("node_started_at") and node_info.get("node_finished_at"):
+        metadata += _timing_to_metadata(
+            [
+                {
+                    "name": "execute",
+                    "started_at": node_info["node_started_at"],
+                    "completed_at": node_info["node_finished_at"],
+                }
+            ]
+        )
+    return metadata
+
+
 def generate_materializations(
     dbt_output: DbtOutput, asset_key_prefix: Optional[List[str]] = None
 ) -> Iterator[AssetMaterialization]:
@@ -1,13 +1,26 @@
 import json
+import os
+import shutil
+import stat
+import sys
+import textwrap
 from unittest.mock import MagicMock
 
 import pytest
-from dagster_dbt import dbt_cli_resource
+from dagster_dbt import DbtCliOutput, dbt_cli_resource
 from dagster_dbt.asset_defs import load_assets_from_dbt_manifest, load_assets_from_dbt_project
 from dagster_dbt.errors import DagsterDbtCliFatalRuntimeError
 from dagster_dbt.types import DbtOutput
 
-from dagster import AssetGroup, AssetKey, MetadataEntry, ResourceDefinition, repository
+from dagster import (
+    AssetGroup,
+    AssetKey,
+    IOManager,
+    MetadataEntry,
+    ResourceDefinition,
+    io_manager,
+    repository,
+)
 from dagster.core.asset_defs import build_assets_job
 from dagster.core.asset_defs.decorators import ASSET_DEPENDENCY_METADATA_KEY
 from dagster.utils import file_relative_path
@@ -35,6 +48,197 @@ def test_load_from_manifest_json():
     assert assets_job.execute_in_process().success
 
 
+def test_load_from_manifest_path():
+    dbt_assets = load_assets_from_dbt_manifest(
+        manifest_path=file_relative_path(__file__, "sample_manifest.json")
+    )
+    assert_assets_match_project(dbt_assets)
+
+
+def test_load_from_project_with_cache_dir(tmp_path, monkeypatch):
+    manifest_path = file_relative_path(__file__, "sample_manifest.json")
+    with open(manifest_path, "r") as f:
+        manifest_json = json.load(f)
+
+    project_dir = str(tmp_path / "project")
+    shutil.copytree(file_relative_path(__file__, "dagster_dbt_test_project"), project_dir)
+    cache_dir = str(tmp_path / "cache")
+
+    dbt_ls_calls = []
+
+    def _load_manifest_for_project(project_dir, profiles_dir, target_dir, select):
+        dbt_ls_calls.append(select)
+        return manifest_json, DbtCliOutput(
+            command="dbt ls",
+            return_code=0,
+            raw_output="",
+            logs=[
+                {"unique_id": unique_id}
+                for unique_id, node_info in manifest_json["nodes"].items()
+                if node_info["resource_type"] == "model"
+            ],
+            result={},
+        )
+
+    monkeypatch.setattr(
+        "dagster_dbt.asset_defs._load_manifest_for_project", _load_manifest_for_project
+    )
+
+    def _load_assets(select=None):
+        return load_assets_from_dbt_project(
+            project_dir, os.path.join(project_dir, "dbt_config"), select=select, cache_dir=cache_dir
+        )
+
+    assert_assets_match_project(_load_assets())
+    assert dbt_ls_calls == ["*"]
+
+    # the cached models are reused while the project and selection are unchanged
+    assert_assets_match_project(_load_assets())
+    assert dbt_ls_calls == ["*"]
+
+    _load_assets(select="sort_by_calories+")
+    assert dbt_ls_calls == ["*", "sort_by_calories+"]
+
+    with open(os.path.join(project_dir, "models", "sort_by_calories.sql"), "a") as f:
+        f.write("\n")
+    assert_assets_match_project(_load_assets())
+    assert dbt_ls_calls == ["*", "sort_by_calories+", "*"]
+
+    # upgrading dbt invalidates the cache
+    monkeypatch.setattr("dagster_dbt.asset_defs._get_dbt_version", lambda: "99.0.0")
+    assert_assets_match_project(_load_assets())
+    assert dbt_ls_calls == ["*", "sort_by_calories+", "*", "*"]
+
+    # failing to write to the cache does not fail loading the assets
+    unwritable_cache_dir = str(tmp_path / "not_a_directory")
+    with open(unwritable_cache_dir, "w"):
+        pass
+    assert_assets_match_project(
+        load_assets_from_dbt_project(
+            project_dir, os.path.join(project_dir, "dbt_config"), cache_dir=unwritable_cache_dir
+        )
+    )
+
+
+# a stand-in for the dbt CLI, which reports the first three models of the sample project as they
+# finish, with the events dbt writes without --debug, waiting after the first one until its output
+# has been handled, and then writes the run results of all four
+FAKE_DBT_SCRIPT = """#!{executable}
+import json, os, shutil, sys, time
+
+args = sys.argv[1:]
+with open({args_path!r}, "w") as f:
+    json.dump(args, f)
+project_dir = args[args.index("--project-dir") + 1]
+for name in ["sort_by_calories", "least_caloric", "sort_hot_cereals_by_calories"]:
+    node_info = {{
+        "unique_id": "model.dagster_dbt_test_project." + name,
+        "node_status": "success",
+        "node_started_at": "2022-01-01T00:00:00.000000Z",
+        "node_finished_at": "2022-01-01T00:00:02.500000Z",
+    }}
+    # the info-level event that dbt writes by default when a model finishes
+    print(
+        json.dumps(
+            {{
+                "code": "Q012",
+                "level": "info",
+                "msg": "OK created table model " + name,
+                "data": {{"status": "SELECT 1", "execution_time": 2.5}},
+                "node_info": node_info,
+                "type": "log_line",
+            }}
+        )
+    )
+    sys.stdout.flush()
+    if name == "sort_by_calories":
+        deadline = time.time() + 30
+        while not os.path.exists({flag_path!r}):
+            if time.time() > deadline:
+                sys.exit(2)
+            time.sleep(0.1)
+os.makedirs(os.path.join(project_dir, "target"), exist_ok=True)
+shutil.copy({run_results_path!r}, os.path.join(project_dir, "target", "run_results.json"))
+"""
+
+
+def test_stream_outputs_from_dbt_cli(tmp_path):
+    flag_path = str(tmp_path / "handled_output")
+    args_path = str(tmp_path / "dbt_args.json")
+    dbt_executable = str(tmp_path / "dbt")
+    with open(dbt_executable, "w") as f:
+        f.write(
+            FAKE_DBT_SCRIPT.format(
+                executable=sys.executable,
+                flag_path=flag_path,
+                args_path=args_path,
+                run_results_path=file_relative_path(__file__, "sample_run_results.json"),
+            )
+        )
+    os.chmod(dbt_executable, os.stat(dbt_executable).st_mode | stat.S_IEXEC)
+
+    class FlagIOManager(IOManager):
+        def handle_output(self, context, obj):
+            # the fake dbt only finishes once the output of the first model has been handled
+            with open(flag_path, "w"):
+                pass
+
+        def load_input(self, context):
+            return None
+
+    dbt_assets = load_assets_from_dbt_manifest(
+        manifest_path=file_relative_path(__file__, "sample_manifest.json"),
+        io_manager_key="flag_io_manager",
+    )
+    result = build_assets_job(
+        "assets_job",
+        dbt_assets,
+        resource_defs={
+            "dbt": dbt_cli_resource.configured(
+                {
+                    "project_dir": str(tmp_path),
+                    "dbt_executable": dbt_executable,
+                    "exclude": ["staging"],
+                }
+            ),
+            "flag_io_manager": io_manager(lambda _: FlagIOManager()),
+        },
+    ).execute_in_process()
+    assert result.success
+
+    # the flags configured on the resource are passed as they are by DbtCliResource.run
+    with open(args_path) as f:
+        dbt_args = json.load(f)
+    assert "run" in dbt_args
+    assert dbt_args[dbt_args.index("--exclude") + 1] == "staging"
+
+    materializations = {
+        event.event_specific_data.materialization.asset_key.path[-1]: (
+            event.event_specific_data.materialization
+        )
+        for event in result.events_for_node(dbt_assets[0].op.name)
+        if event.event_type_value == "ASSET_MATERIALIZATION"
+    }
+    assert set(materializations.keys()) == {
+        "sort_by_calories",
+        "least_caloric",
+        "sort_hot_cereals_by_calories",
+        "sort_cold_cereals_by_calories",
+    }
+    # the timing of the streamed models is read from the events that report they finished
+    streamed_metadata = {
+        entry.label: entry.entry_data
+        for entry in materializations["sort_by_calories"].metadata_entries
+    }
+    assert streamed_metadata["Execution Time (seconds)"].value == 2.5
+    assert streamed_metadata["Execution Duration"].value == 2.5
+    # the remaining models are read from the run results
+    assert "Execution Time (seconds)" in [
+        entry.label
+        for entry in materializations["sort_cold_cereals_by_calories"].metadata_entries
+    ]
+
+
 def test_runtime_metadata_fn():
     manifest_path = file_relative_path(__file__, "sample_manifest.json")
     with open(manifest_path, "r") as f:
@@ -1,6 +1,11 @@
 import pytest
 from dagster_dbt.types import DbtOutput
-from dagster_dbt.utils import generate_materializations
+from dagster_dbt.utils import (
+    generate_materializations,
+    get_node_finished_info,
+    node_finished_event_to_metadata,
+    node_finished_successfully,
+)
 
 from dagster import AssetKey
 
@@ -23,3 +28,77 @@ def test_generate_materializations(sample):
     mat_names = {mat.asset_key for mat in materializations}
 
     assert mat_names == {AssetKey(["model", "my_schema", f"table_{i}"]) for i in range(1, 4)}
+
+
+def test_node_finished_events():
+    node_info = {
+        "unique_id": "model.dagster_dbt_test_project.sort_by_calories",
+        "node_status": "success",
+        "node_started_at": "2022-01-01T00:00:00.000000Z",
+        "node_finished_at": "2022-01-01T00:00:01.000000Z",
+    }
+    v1_event = {"code": "Q025", "level": "debug", "node_info": node_info}
+    assert get_node_finished_info(v1_event) == node_info
+    metadata = {
+        entry.label: entry.value for entry in node_finished_event_to_metadata(v1_event)
+    }
+    assert metadata["Execution Duration"].value == 1.0
+
+    # dbt 1.4+ nests the event metadata under "info" and its fields under "data"
+    run_result = {
+        "execution_time": 2.0,
+        "timing": [
+            {
+                "name": "execute",
+                "started_at": "2022-01-01T00:00:00.000000Z",
+                "completed_at": "2022-01-01T00:00:02.000000Z",
+            }
+        ],
+    }
+    v14_event = {
+        "info": {"name": "NodeFinished", "code": "Q025"},
+        "data": {"node_info": node_info, "run_result": run_result},
+    }
+    assert get_node_finished_info(v14_event) == node_info
+    metadata = {
+        entry.label: entry.value for entry in node_finished_event_to_metadata(v14_event)
+    }
+    assert metadata["Execution Time (seconds)"].value == 2.0
+    assert metadata["Execution Duration"].value == 2.0
+
+    assert get_node_finished_info({"code": "Q024", "node_info": node_info}) is None
+    assert get_node_finished_info({"info": {"name": "NodeStart"}, "data": {}}) is None
+
+
+def test_model_result_events():
+    node_info = {
+        "unique_id": "model.dagster_dbt_test_project.sort_by_calories",
+        "node_status": "success",
+    }
+    # the info-level event that dbt writes by default, as formatted before and after dbt 1.4
+    v1_event = {
+        "code": "Q012",
+        "level": "info",
+        "data": {"status": "CREATE VIEW", "execution_time": 0.5},
+        "node_info": node_info,
+    }
+    v14_event = {
+        "info": {"name": "LogModelResult", "code": "Q012", "level": "info"},
+        "data": {"status": "CREATE VIEW", "execution_time": 0.5, "node_info": node_info},
+    }
+    for event in [v1_event, v14_event]:
+        assert get_node_finished_info(event) == node_info
+        assert node_finished_successfully(event)
+        metadata = {entry.label: entry.value for entry in node_finished_event_to_metadata(event)}
+        assert metadata["Execution Time (seconds)"].value == 0.5
+
+    error_event = {
+        "info": {"name": "LogModelResult", "code": "Q012", "level": "error"},
+        "data": {
+            "status": "error",
+            "execution_time": 0.5,
+            "node_info": {**node_info, "node_status": "error"},
+        },
+    }
+    assert get_node_finished_info(error_event)
+    assert not node_finished_successfully(error_event)
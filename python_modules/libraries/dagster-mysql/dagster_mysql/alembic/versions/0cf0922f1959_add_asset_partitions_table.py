@@ -0,0 +1,22 @@
+"""add asset partitions table
+
+Revision ID: 0cf0922f1959
+Revises: d32d1d6de793
+Create Date: 2022-04-11 14:02:17.291486
+
+"""
+from dagster.core.storage.migration.utils import create_asset_partitions_table
+
+# revision identifiers, used by Alembic.
+revision = "0cf0922f1959"
+down_revision = "d32d1d6de793"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_asset_partitions_table()
+
+
+def downgrade():
+    pass
@@ -118,11 +118,12 @@ def create_clean_storage(conn_string):
         MySQLEventLogStorage.wipe_storage(conn_string)
         return MySQLEventLogStorage(conn_string)
 
-    def store_asset_event(self, event):
+    def store_asset_event(self, event, event_id=None):
         # last_materialization_timestamp is updated upon observation, materialization, materialization_planned
         # See SqlEventLogStorage.store_asset_event method for more details
 
         values = self._get_asset_entry_values(event, self.has_secondary_index(ASSET_KEY_INDEX_COLS))
+        should_store_asset_partition = self._should_store_asset_partition(event)
 
         with self.index_connection() as conn:
             conn.execute(
@@ -136,6 +137,9 @@ def store_asset_event(self, event):
                 )
             )
 
+            if should_store_asset_partition:
+                self._store_asset_partition(conn, event, event_id)
+
     def _connect(self):
         return create_mysql_connection(self._engine, __file__, "event log")
 
@@ -3,6 +3,7 @@
 from datetime import datetime
 from functools import wraps
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
@@ -95,11 +96,19 @@ def __init__(self, constraint_name, constraint_description, expectation, actual)
 class ColumnConstraintViolationException(ConstraintViolationException):
     """Indicates that a column constraint has been violated."""
 
-    def __init__(self, constraint_name, constraint_description, column_name, offending_rows=None):
+    def __init__(
+        self,
+        constraint_name,
+        constraint_description,
+        column_name,
+        offending_rows=None,
+        num_offending_rows=None,
+    ):
         self.constraint_name = constraint_name
         self.constraint_description = constraint_description
         self.column_name = column_name
         self.offending_rows = offending_rows
+        self.num_offending_rows = num_offending_rows
         super(ColumnConstraintViolationException, self).__init__(self.construct_message())
 
     def construct_message(self):
@@ -112,6 +121,12 @@ def construct_message(self):
             base_message += "The offending (index, row values) are the following: {}".format(
                 self.offending_rows
             )
+        if self.num_offending_rows is not None and (
+            self.num_offending_rows > MAX_REPORTED_OFFENDING_ROWS
+        ):
+            base_message += " (a sample of {} of the {} offending rows)".format(
+                MAX_REPORTED_OFFENDING_ROWS, self.num_offending_rows
+            )
         return base_message
 
 
@@ -258,6 +273,8 @@ def __init__(self, column_list, enforce_ordering=False, raise_or_typecheck=True,
         self.enforce_ordering = check.bool_param(enforce_ordering, "enforce_ordering")
         self.column_list = check.list_param(column_list, "strict_column_list", of_type=str)
 
+        column_set = set(column_list)
+
         def validation_fcn(inframe):
             if list(inframe.columns) == column_list:
                 return (True, {})
@@ -266,11 +283,12 @@ def validation_fcn(inframe):
                     resdict = {"expectation": self.column_list, "actual": list(inframe.columns)}
                     return (False, resdict)
                 else:
-                    if set(inframe.columns) == set(column_list):
+                    received_column_set = set(inframe.columns)
+                    if received_column_set == column_set:
                         return (True, {})
                     else:
-                        extra = [x for x in inframe.columns if x not in set(column_list)]
-                        missing = [x for x in set(column_list) if x not in inframe.columns]
+                        extra = [x for x in inframe.columns if x not in column_set]
+                        missing = [x for x in column_set if x not in received_column_set]
                         resdict = {
                             "expectation": self.column_list,
                             "actual": {"extra_columns": extra, "missing_columns": missing},
@@ -393,6 +411,65 @@ def apply_ignore_missing_data_to_mask(mask, column):
     return mask & ~column.isnull()
 
 
+# The maximum number of offending rows reported by a failed column constraint. When more rows
+# violate the constraint, a sample of them is reported instead.
+MAX_REPORTED_OFFENDING_ROWS = 100
+
+
+def sample_offending_positions(invalid):
+    """
+    Returns the positions of the offending rows in a boolean mask of invalid rows, sampled down to
+    at most MAX_REPORTED_OFFENDING_ROWS evenly spaced positions, in row order.
+    """
+    positions = np.flatnonzero(np.asarray(invalid, dtype=bool))
+    if len(positions) > MAX_REPORTED_OFFENDING_ROWS:
+        positions = positions[
+            np.linspace(0, len(positions) - 1, MAX_REPORTED_OFFENDING_ROWS).astype(int)
+        ]
+    return positions
+
+
+def validation_mask(mask_fn):
+    """
+    decorator that attaches a vectorized equivalent to a per-value column validation function
+    Usage:
+        ``mask_fn`` takes a column (pd.Series) and returns a boolean array of which of its values
+        are valid, or None if it cannot vectorize the validation of that column, in which case
+        the validation function is applied to each value instead.
+        :py:class:'~dagster_pandas.constraints.ColumnConstraintWithMetadata' uses the vectorized
+        validation when it is available.
+    """
+
+    def _attach(validation_fn):
+        validation_fn.validation_mask_fn = mask_fn
+        return validation_fn
+
+    return _attach
+
+
+def get_validation_mask(validation_fn, column):
+    """
+    Returns a boolean array of which of the values of a column pass a per-value validation function,
+    using its vectorized equivalent where there is one.
+    """
+    mask_fn = getattr(validation_fn, "validation_mask_fn", None)
+    mask = mask_fn(column) if mask_fn is not None else None
+    if mask is None:
+        mask = column.apply(lambda x: validation_fn(x)[0])
+    return np.asarray(mask, dtype=bool)
+
+
+# the python type of the values of a column with a numpy dtype of one of these kinds, when they are
+# passed one by one to a validation function
+_PYTHON_TYPES_BY_DTYPE_KIND = {"b": bool, "i": int, "u": int, "f": float}
+
+
+def _python_type_of_values(column):
+    if not isinstance(column.dtype, np.dtype):
+        return None
+    return _PYTHON_TYPES_BY_DTYPE_KIND.get(column.dtype.kind)
+
+
 class ColumnAggregateConstraintWithMetadata(ConstraintWithMetadata):
     """
     Similar to the base class, but now your validation functions should take in columns (pd.Series) not Dataframes.
@@ -422,10 +499,14 @@ def validate(self, data, *columns, **kwargs):
             res = self.validation_fn(relevant_data[column])
             if not res[0]:
                 offending_columns.add(column)
-                if not res[1].get("actual") is None:
-                    offending_values[column] = [x.item() for x in res[1].get("actual").to_numpy()]
-                else:
-                    offending_values[column] = [x.item() for x in relevant_data[column].to_numpy()]
+                actual = res[1].get("actual")
+                if actual is None:
+                    actual = relevant_data[column]
+                offending_values[column] = (
+                    actual.iloc[sample_offending_positions(np.ones(len(actual), dtype=bool))]
+                    .to_numpy()
+                    .tolist()
+                )
         if len(offending_columns) == 0 and not self.raise_or_typecheck:
             return TypeCheck(success=True)
         elif len(offending_columns) > 0:
@@ -472,12 +553,18 @@ def validate(self, data, *columns, **kwargs):
         offending = {}
         offending_values = {}
         # TODO:  grab metadata from here
-        inverse_validation = lambda x: not self.validation_fn(x)[0]
         for column in columns:
-            results = relevant_data[relevant_data[column].apply(inverse_validation)]
-            if len(results.index.tolist()) > 0:
-                offending[column] = ["row " + str(i) for i in (results.index.tolist())]
-                offending_values[column] = results[column].tolist()
+            column_data = relevant_data[column]
+            invalid = ~get_validation_mask(self.validation_fn, column_data)
+            num_invalid = int(invalid.sum())
+            if num_invalid > 0:
+                positions = sample_offending_positions(invalid)
+                offending[column] = ["row " + str(i) for i in column_data.index[positions]]
+                if num_invalid > len(positions):
+                    offending[column].append(
+                        "and {} more rows".format(num_invalid - len(positions))
+                    )
+                offending_values[column] = column_data.iloc[positions].tolist()
         if len(offending) == 0:
             if not self.raise_or_typecheck:
                 return TypeCheck(success=True)
@@ -618,6 +705,7 @@ def __init__(
         )
 
 
+@validation_mask(lambda column: column.notna().to_numpy())
 def non_null_validation(x):
     """
     validates that a particular value in a column is not null
@@ -681,6 +769,14 @@ def nonnull(func):
             the column validator you want to error on nulls
     """
 
+    def nvalidator_mask(column):
+        mask_fn = getattr(func, "validation_mask_fn", None)
+        mask = mask_fn(column) if mask_fn is not None else None
+        if mask is None:
+            return None
+        return mask & column.notna().to_numpy()
+
+    @validation_mask(nvalidator_mask)
     @wraps(func)
     def nvalidator(val):
         origval = func(val)
@@ -740,6 +836,22 @@ def create_dataframe(_):
         else:
             maxim = sys.maxsize
 
+    def in_range_validation_mask(column):
+        # only columns of numeric numpy dtypes are compared at once, as the values of other columns
+        # may not be comparable with the bounds as a whole
+        python_type = _python_type_of_values(column)
+        if python_type is None:
+            return None
+        if not issubclass(python_type, (type(minim), type(maxim))):
+            mask = np.zeros(len(column), dtype=bool)
+        else:
+            values = column.to_numpy()
+            mask = (values <= maxim) & (values >= minim)
+        if ignore_missing_vals:
+            mask |= column.isna().to_numpy()
+        return mask
+
+    @validation_mask(in_range_validation_mask)
     def in_range_validation_fn(x):
         if ignore_missing_vals and pd.isnull(x):
             return True, {}
@@ -795,6 +907,13 @@ def create_dataframe(_):
 
     categories = set(categories)
 
+    def categorical_validation_mask(column):
+        mask = column.isin(categories).to_numpy()
+        if ignore_missing_vals:
+            mask |= column.isna().to_numpy()
+        return mask
+
+    @validation_mask(categorical_validation_mask)
     def categorical_validation_fn(x):
         if ignore_missing_vals and pd.isnull(x):
             return True, {}
@@ -848,6 +967,16 @@ def create_dataframe(_):
 
     """
 
+    def dtype_in_set_validation_mask(column):
+        python_type = _python_type_of_values(column)
+        if python_type is None:
+            return None
+        mask = np.full(len(column), issubclass(python_type, datatypes))
+        if ignore_missing_vals:
+            mask |= column.isna().to_numpy()
+        return mask
+
+    @validation_mask(dtype_in_set_validation_mask)
     def dtype_in_set_validation_fn(x):
         if ignore_missing_vals and pd.isnull(x):
             return True, {}
@@ -905,6 +1034,10 @@ def validate(self, dataframe, column_name):
     def get_offending_row_pairs(dataframe, column_name):
         return zip(dataframe.index.tolist(), dataframe[column_name].tolist())
 
+    @staticmethod
+    def get_offending_rows(dataframe, invalid):
+        return dataframe.iloc[sample_offending_positions(invalid)]
+
 
 class ColumnDTypeFnConstraint(ColumnConstraint):
     """
@@ -973,13 +1106,16 @@ def __init__(self):
         )
 
     def validate(self, dataframe, column_name):
-        rows_with_null_columns = dataframe[dataframe[column_name].isna()]
-        if not rows_with_null_columns.empty:
+        invalid = dataframe[column_name].isna()
+        if invalid.any():
             raise ColumnConstraintViolationException(
                 constraint_name=self.name,
                 constraint_description=self.error_description,
                 column_name=column_name,
-                offending_rows=self.get_offending_row_pairs(rows_with_null_columns, column_name),
+                offending_rows=self.get_offending_row_pairs(
+                    self.get_offending_rows(dataframe, invalid), column_name
+                ),
+                num_offending_rows=int(invalid.sum()),
             )
 
 
@@ -1002,13 +1138,13 @@ def validate(self, dataframe, column_name):
         invalid = dataframe[column_name].duplicated()
         if self.ignore_missing_vals:
             invalid = apply_ignore_missing_data_to_mask(invalid, dataframe[column_name])
-        rows_with_duplicated_values = dataframe[invalid]
-        if not rows_with_duplicated_values.empty:
+        if invalid.any():
             raise ColumnConstraintViolationException(
                 constraint_name=self.name,
                 constraint_description=self.error_description,
                 column_name=column_name,
-                offending_rows=rows_with_duplicated_values,
+                offending_rows=self.get_offending_rows(dataframe, invalid),
+                num_offending_rows=int(invalid.sum()),
             )
 
 
@@ -1033,13 +1169,13 @@ def validate(self, dataframe, column_name):
         invalid = ~dataframe[column_name].isin(self.categories)
         if self.ignore_missing_vals:
             invalid = apply_ignore_missing_data_to_mask(invalid, dataframe[column_name])
-        rows_with_unexpected_buckets = dataframe[invalid]
-        if not rows_with_unexpected_buckets.empty:
+        if invalid.any():
             raise ColumnConstraintViolationException(
                 constraint_name=self.name,
                 constraint_description=self.error_description,
                 column_name=column_name,
-                offending_rows=rows_with_unexpected_buckets,
+                offending_rows=self.get_offending_rows(dataframe, invalid),
+                num_offending_rows=int(invalid.sum()),
             )
 
 
@@ -1065,13 +1201,13 @@ def validate(self, dataframe, column_name):
         invalid = dataframe[column_name] < self.min_value
         if self.ignore_missing_vals:
             invalid = apply_ignore_missing_data_to_mask(invalid, dataframe[column_name])
-        out_of_bounds_rows = dataframe[invalid]
-        if not out_of_bounds_rows.empty:
+        if invalid.any():
             raise ColumnConstraintViolationException(
                 constraint_name=self.name,
                 constraint_description=self.error_description,
                 column_name=column_name,
-                offending_rows=out_of_bounds_rows,
+                offending_rows=self.get_offending_rows(dataframe, invalid),
+                num_offending_rows=int(invalid.sum()),
             )
 
 
@@ -1097,13 +1233,13 @@ def validate(self, dataframe, column_name):
         invalid = dataframe[column_name] > self.max_value
         if self.ignore_missing_vals:
             invalid = apply_ignore_missing_data_to_mask(invalid, dataframe[column_name])
-        out_of_bounds_rows = dataframe[invalid]
-        if not out_of_bounds_rows.empty:
+        if invalid.any():
             raise ColumnConstraintViolationException(
                 constraint_name=self.name,
                 constraint_description=self.error_description,
                 column_name=column_name,
-                offending_rows=out_of_bounds_rows,
+                offending_rows=self.get_offending_rows(dataframe, invalid),
+                num_offending_rows=int(invalid.sum()),
             )
 
 
@@ -1134,11 +1270,11 @@ def validate(self, dataframe, column_name):
         invalid = ~dataframe[column_name].between(self.min_value, self.max_value)
         if self.ignore_missing_vals:
             invalid = apply_ignore_missing_data_to_mask(invalid, dataframe[column_name])
-        out_of_bounds_rows = dataframe[invalid]
-        if not out_of_bounds_rows.empty:
+        if invalid.any():
             raise ColumnConstraintViolationException(
                 constraint_name=self.name,
                 constraint_description=self.error_description,
                 column_name=column_name,
-                offending_rows=out_of_bounds_rows,
+                offending_rows=self.get_offending_rows(dataframe, invalid),
+                num_offending_rows=int(invalid.sum()),
             )
@@ -0,0 +1,159 @@
+"""
+Benchmarks for the built-in column constraints of dagster_pandas, comparing the vectorized
+validation against validating the columns value by value with ``Series.apply``.
+
+Run with:
+
+    python -m dagster_pandas_tests.benchmarks.constraint_benchmarks [--num-rows N] [--iterations N]
+"""
+import argparse
+from typing import List
+
+import numpy as np
+import pandas as pd
+from dagster_pandas.constraints import (
+    ColumnAggregateConstraintWithMetadata,
+    ColumnConstraintWithMetadata,
+    ColumnWithMetadataException,
+    ConstraintWithMetadataException,
+    StrictColumnsWithMetadata,
+    all_unique_validator,
+    categorical_column_validator_factory,
+    column_range_validation_factory,
+    dtype_in_set_validation_factory,
+    non_null_validation,
+    nonnull,
+)
+from dagster_tests.benchmarks.utils import BenchmarkResult, format_results, run_benchmark
+
+from dagster import TypeCheck
+
+
+class RowwiseColumnConstraintWithMetadata(ColumnConstraintWithMetadata):
+    """Validates every value with ``Series.apply`` and reports every offending row, as column
+    constraints did before they were vectorized."""
+
+    def validate(self, data, *columns, **kwargs):
+        if len(columns) == 0:
+            columns = data.columns
+
+        columns = [column for column in columns if column in data.columns]
+        relevant_data = data[list(columns)]
+        offending = {}
+        offending_values = {}
+        inverse_validation = lambda x: not self.validation_fn(x)[0]
+        for column in columns:
+            results = relevant_data[relevant_data[column].apply(inverse_validation)]
+            if len(results.index.tolist()) > 0:
+                offending[column] = ["row " + str(i) for i in (results.index.tolist())]
+                offending_values[column] = results[column].tolist()
+        if len(offending) == 0:
+            return TypeCheck(success=True)
+        return self.resulting_exception(
+            constraint_name=self.name,
+            constraint_description=self.description,
+            expectation=self.validation_fn.__doc__,
+            actual=offending_values,
+            offending=offending,
+        ).return_as_typecheck()
+
+
+def build_dataframe(num_rows: int) -> pd.DataFrame:
+    """A dataframe with numeric, categorical and nullable columns, roughly 1% of whose values
+    violate the benchmarked constraints."""
+    rng = np.random.default_rng(0)
+    floats = rng.uniform(0, 100, num_rows)
+    floats[rng.choice(num_rows, num_rows // 100, replace=False)] = np.nan
+    categories = rng.choice(["a", "b", "c"], num_rows).astype(object)
+    categories[rng.choice(num_rows, num_rows // 100, replace=False)] = "d"
+    return pd.DataFrame(
+        {
+            "ints": rng.integers(0, 101, num_rows),
+            "floats": floats,
+            "categories": categories,
+        }
+    )
+
+
+def _column_constraint_benchmarks(
+    dataframe: pd.DataFrame, name: str, validation_fn, column: str, iterations: int
+) -> List[BenchmarkResult]:
+    results = []
+    for constraint_class, label in [
+        (ColumnConstraintWithMetadata, "vectorized"),
+        (RowwiseColumnConstraintWithMetadata, "row by row"),
+    ]:
+        constraint = constraint_class(
+            name, validation_fn, ColumnWithMetadataException, raise_or_typecheck=False
+        )
+        results.append(
+            run_benchmark(
+                f"{name} ({label})",
+                lambda constraint=constraint: constraint.validate(dataframe, column),
+                iterations,
+            )
+        )
+    return results
+
+
+def run_constraint_benchmarks(
+    num_rows: int = 1_000_000, iterations: int = 5
+) -> List[BenchmarkResult]:
+    dataframe = build_dataframe(num_rows)
+
+    unique_constraint = ColumnAggregateConstraintWithMetadata(
+        "unique", all_unique_validator, ConstraintWithMetadataException, raise_or_typecheck=False
+    )
+    strict_columns_constraint = StrictColumnsWithMetadata(
+        ["categories", "floats", "ints", "extra"], raise_or_typecheck=False
+    )
+
+    return [
+        *_column_constraint_benchmarks(
+            dataframe,
+            "range",
+            column_range_validation_factory(0, 99),
+            "ints",
+            iterations,
+        ),
+        *_column_constraint_benchmarks(
+            dataframe,
+            "range ignoring nulls",
+            column_range_validation_factory(0.0, 99.0, ignore_missing_vals=True),
+            "floats",
+            iterations,
+        ),
+        *_column_constraint_benchmarks(
+            dataframe,
+            "categorical",
+            categorical_column_validator_factory(["a", "b", "c"]),
+            "categories",
+            iterations,
+        ),
+        *_column_constraint_benchmarks(
+            dataframe, "non-null", non_null_validation, "floats", iterations
+        ),
+        *_column_constraint_benchmarks(
+            dataframe,
+            "non-null dtype",
+            nonnull(dtype_in_set_validation_factory((int, float))),
+            "floats",
+            iterations,
+        ),
+        run_benchmark("unique", lambda: unique_constraint.validate(dataframe, "ints"), iterations),
+        run_benchmark(
+            "strict columns",
+            lambda: strict_columns_constraint.validate(dataframe),
+            iterations,
+        ),
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-rows", type=int, default=1_000_000)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+    print(  # pylint: disable=print-call
+        format_results(run_constraint_benchmarks(args.num_rows, args.iterations))
+    )
@@ -0,0 +1,6 @@
+from .constraint_benchmarks import run_constraint_benchmarks
+
+
+def test_constraint_benchmarks():
+    results = run_constraint_benchmarks(num_rows=200, iterations=1)
+    assert all(result.iterations == 1 for result in results)
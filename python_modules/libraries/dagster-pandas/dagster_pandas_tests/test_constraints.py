@@ -1,5 +1,6 @@
 import pytest
 from dagster_pandas.constraints import (
+    MAX_REPORTED_OFFENDING_ROWS,
     CategoricalColumnConstraint,
     ColumnDTypeInSetConstraint,
     ConstraintViolationException,
@@ -29,6 +30,19 @@ def test_column_unique_constraint():
         UniqueColumnConstraint(ignore_missing_vals=False).validate(bad_test_dataframe, "foo")
 
 
+def test_column_constraint_reports_number_of_offending_rows():
+    num_rows = MAX_REPORTED_OFFENDING_ROWS * 3
+    test_dataframe = DataFrame({"foo": [1] * num_rows})
+    with pytest.raises(ConstraintViolationException) as exc_info:
+        UniqueColumnConstraint(ignore_missing_vals=False).validate(test_dataframe, "foo")
+
+    assert exc_info.value.num_offending_rows == num_rows - 1
+    assert len(exc_info.value.offending_rows) == MAX_REPORTED_OFFENDING_ROWS
+    assert "a sample of {} of the {} offending rows".format(
+        MAX_REPORTED_OFFENDING_ROWS, num_rows - 1
+    ) in str(exc_info.value)
+
+
 def test_column_unique_constraint_ignore_nan():
     for nullable_value in NAN_VALUES:
         test_dataframe = DataFrame({"foo": [nullable_value, "bar", "baz"]})
@@ -1,4 +1,5 @@
 from dagster_pandas.constraints import (
+    MAX_REPORTED_OFFENDING_ROWS,
     ColumnAggregateConstraintWithMetadata,
     ColumnConstraintWithMetadata,
     ColumnRangeConstraintWithMetadata,
@@ -10,6 +11,8 @@
     MultiColumnConstraintWithMetadata,
     MultiConstraintWithMetadata,
     StrictColumnsWithMetadata,
+    all_unique_validator,
+    column_range_validation_factory,
 )
 from pandas import DataFrame
 
@@ -201,3 +204,38 @@ def test_range_constraint():
     assert {"bar": [3], "baz": [4]} == val["actual"]
     range_val = ColumnRangeConstraintWithMetadata(raise_or_typecheck=False)
     assert range_val.validate(df).success
+
+
+def test_column_constraint_caps_offending_rows():
+    num_rows = MAX_REPORTED_OFFENDING_ROWS * 3
+    df = DataFrame({"foo": range(num_rows)})
+    column_val = ColumnConstraintWithMetadata(
+        "Confirms values are at most 10",
+        column_range_validation_factory(maxim=10),
+        ColumnWithMetadataException,
+        raise_or_typecheck=False,
+    )
+    val = column_val.validate(df).metadata_entries[0].entry_data.data
+    offending_rows = val["offending"]["foo"]
+    assert len(offending_rows) == MAX_REPORTED_OFFENDING_ROWS + 1
+    assert offending_rows[-1] == "and {} more rows".format(
+        num_rows - 11 - MAX_REPORTED_OFFENDING_ROWS
+    )
+    # the reported rows are a sample of the offending rows, in row order
+    sampled_rows = [int(row[len("row ") :]) for row in offending_rows[:-1]]
+    assert sampled_rows == sorted(sampled_rows)
+    assert all(row > 10 for row in sampled_rows)
+    assert val["actual"]["foo"] == sampled_rows
+    assert column_val.validate(df).metadata_entries[0].entry_data.data == val
+
+
+def test_aggregate_constraint_caps_actual_values():
+    df = DataFrame({"foo": [1] * (MAX_REPORTED_OFFENDING_ROWS * 2)})
+    aggregate_val = ColumnAggregateConstraintWithMetadata(
+        "Confirms all values are unique",
+        all_unique_validator,
+        ConstraintWithMetadataException,
+        raise_or_typecheck=False,
+    )
+    val = aggregate_val.validate(df).metadata_entries[0].entry_data.data
+    assert val["actual"] == {"foo": [1] * MAX_REPORTED_OFFENDING_ROWS}
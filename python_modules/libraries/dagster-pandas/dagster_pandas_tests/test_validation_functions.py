@@ -3,10 +3,12 @@
     categorical_column_validator_factory,
     column_range_validation_factory,
     dtype_in_set_validation_factory,
+    get_validation_mask,
     non_null_validation,
     nonnull,
 )
 from numpy import nan as NaN
+from pandas import Series
 
 
 def test_unique():
@@ -52,3 +54,27 @@ def test_categorical():
     assert testfunc("b")[0]
     assert testfunc(NaN)[0]
     assert not testfunc("c")[0]
+
+
+def test_validation_masks():
+    columns = [
+        Series([1, 5, 20, -3]),
+        Series([1.5, NaN, 20.0, 3.0]),
+        Series([True, False, True]),
+        Series(["a", "c", None, "b"]),
+        Series([1, "a", 2.5, None]),
+    ]
+    validation_fns = [
+        non_null_validation,
+        column_range_validation_factory(minim=0, maxim=10),
+        column_range_validation_factory(minim=0, maxim=10.0, ignore_missing_vals=True),
+        nonnull(dtype_in_set_validation_factory((int, float))),
+        dtype_in_set_validation_factory(float, ignore_missing_vals=True),
+        categorical_column_validator_factory(["a", "b", 1]),
+        categorical_column_validator_factory(["a"], ignore_missing_vals=True),
+    ]
+    for validation_fn in validation_fns:
+        for column in columns:
+            assert get_validation_mask(validation_fn, column).tolist() == [
+                validation_fn(x)[0] for x in column.tolist()
+            ]
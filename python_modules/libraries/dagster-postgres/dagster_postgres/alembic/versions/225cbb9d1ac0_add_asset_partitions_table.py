@@ -0,0 +1,22 @@
+"""add asset partitions table
+
+Revision ID: 225cbb9d1ac0
+Revises: b601eb913efa
+Create Date: 2022-04-11 14:02:17.291486
+
+"""
+from dagster.core.storage.migration.utils import create_asset_partitions_table
+
+# revision identifiers, used by Alembic.
+revision = "225cbb9d1ac0"
+down_revision = "b601eb913efa"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_asset_partitions_table()
+
+
+def downgrade():
+    pass
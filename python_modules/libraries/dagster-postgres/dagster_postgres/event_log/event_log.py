@@ -163,10 +163,18 @@ def store_event(self, event):
             )
             and event.dagster_event.asset_key
         ):
-            self.store_asset_event(event)
+            self.store_asset_event(event, res[1])
 
-    def store_asset_event(self, event):
+    def store_events(self, events):
+        # every stored event needs its own notification for the watchers, so skip the batched
+        # insert of the generic SQL implementation
+        check.list_param(events, "events", of_type=EventLogEntry)
+        for event in events:
+            self.store_event(event)
+
+    def store_asset_event(self, event, event_id=None):
         check.inst_param(event, "event", EventLogEntry)
+        check.opt_int_param(event_id, "event_id")
         if not event.is_dagster_event or not event.dagster_event.asset_key:
             return
 
@@ -201,6 +209,7 @@ def store_asset_event(self, event):
         # https://github.com/dagster-io/dagster/pull/7319
 
         values = self._get_asset_entry_values(event, self.has_secondary_index(ASSET_KEY_INDEX_COLS))
+        should_store_asset_partition = self._should_store_asset_partition(event)
         with self.index_connection() as conn:
             conn.execute(
                 db.dialects.postgresql.insert(AssetKeyTable)
@@ -214,6 +223,9 @@ def store_asset_event(self, event):
                 )
             )
 
+            if should_store_asset_partition:
+                self._store_asset_partition(conn, event, event_id)
+
     def _connect(self):
         return create_pg_connection(self._engine, __file__, "event log")
 
@@ -297,7 +309,7 @@ def watcher_thread(
                     ),
                 )
                 dagster_event: EventLogEntry = deserialize_json_to_dagster_namedtuple(
-                    cursor_res.scalar()
+                    cursor_res.scalar(), trusted=True
                 )
 
             for callback_with_cursor in handlers: